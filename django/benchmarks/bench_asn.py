@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the per-row overhead of AS numbers read from a large link table.
+
+Simulates loading the ASNs of both ends of every link through AsnField.from_db_value() and
+formatting them as done by create_link_update(). Run from the django directory:
+
+    python benchmarks/bench_asn.py
+"""
+
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from peering_coord.custom_fields import AsnField
+from peering_coord.scion_addr import ASN
+
+AS_COUNT = 2000
+LINK_COUNT = 100000
+REPEAT = 5
+
+
+def main():
+    rng = random.Random(0)
+    ases = [0xff0000000000 + i for i in range(AS_COUNT)]
+    rows = [(rng.choice(ases), rng.choice(ases)) for _ in range(LINK_COUNT)]
+    field = AsnField()
+
+    def load():
+        return [(field.from_db_value(a, None, None), field.from_db_value(b, None, None))
+            for a, b in rows]
+
+    def load_and_format():
+        for a, b in rows:
+            str(field.from_db_value(a, None, None))
+            str(field.from_db_value(b, None, None))
+
+    def parse():
+        for a, b in strings:
+            ASN(a)
+            ASN(b)
+
+    strings = [(str(ASN(a)), str(ASN(b))) for a, b in rows[:LINK_COUNT // 10]]
+
+    for name, func, count in [("from_db_value", load, LINK_COUNT),
+                              ("from_db_value + str", load_and_format, LINK_COUNT),
+                              ("parse str", parse, LINK_COUNT // 10)]:
+        best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print("%-20s %8.0f ns/row" % (name, 1e9 * best / count))
+
+    tracemalloc.start()
+    links = load()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("%-20s %8.0f bytes/row" % ("memory", size / len(links)))
+
+
+if __name__ == "__main__":
+    main()
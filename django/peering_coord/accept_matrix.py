@@ -0,0 +1,211 @@
+"""Vectorized evaluation of the peering policies of a whole VLAN
+
+The policy resolver evaluates the policies of one AS at a time. This module evaluates the policies
+of all members of a VLAN at once: The accept relation between N members is an N x N boolean matrix,
+which is assembled from the AS-level policies, the ASN range policies, the owner and ISD policies
+expanded by the owner and ISD membership vectors of the members, and the default policies. Mutually
+accepted peerings are then given by `A & A.T`.
+
+Requires NumPy, which is an optional dependency of the coordinator. Use `is_available()` to check
+whether NumPy is installed.
+"""
+
+from typing import Iterable, NamedTuple, Optional, Sequence, Set, Tuple
+
+from django.db.models import Q
+from django.utils import timezone
+
+from peering_coord.models.ixp import VLAN
+from peering_coord.models.policies import PeerPolicy
+from peering_coord.models.scion import AS, Link
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_AsPair = Tuple[int, int] # (AS ID, AS ID) with the smaller ID first
+
+
+class AcceptMatrix(NamedTuple):
+    """Accept relation between the members of a VLAN."""
+    # IDs of the VLAN members in ascending order. Row and column `i` of the matrices belong to the
+    # AS with ID `as_ids[i]`.
+    as_ids: 'np.ndarray'
+    # `accept[i, j]` is true if `as_ids[i]` accepts peering with `as_ids[j]`.
+    accept: 'np.ndarray'
+    # `compatible[i, j]` is true if a link between `as_ids[i]` and `as_ids[j]` can be created (see
+    # `policy_resolver._create_links()`).
+    compatible: 'np.ndarray'
+
+    def get_accepted_peers(self, asys_id: int) -> Set[int]:
+        """Returns the IDs of the members accepted by the given member."""
+        i = np.searchsorted(self.as_ids, asys_id)
+        return set(self.as_ids[self.accept[i]].tolist())
+
+    def get_peerings(self) -> Set[_AsPair]:
+        """Returns the mutually accepted pairs of ASes which can be linked."""
+        mutual = np.triu(self.accept & self.accept.T & self.compatible, 1)
+        rows, cols = np.nonzero(mutual)
+        return set(zip(self.as_ids[rows].tolist(), self.as_ids[cols].tolist()))
+
+
+class LinkChanges(NamedTuple):
+    """Difference between the peerings accepted by the policies and the links in the database."""
+    add: Set[_AsPair]
+    remove: Set[_AsPair]
+
+
+class NotAvailable(Exception):
+    """NumPy is not installed."""
+
+
+def is_available() -> bool:
+    """Check whether NumPy is installed."""
+    return np is not None
+
+
+def build_accept_matrix(vlan: VLAN) -> AcceptMatrix:
+    """Evaluate the peering policies of all members of a VLAN.
+
+    Only acceptance between members is considered. The result matches `_get_accepted_peers()`
+    restricted to the members of the VLAN.
+
+    :raises NotAvailable: NumPy is not installed.
+    """
+    if np is None:
+        raise NotAvailable("The vectorized policy evaluation requires NumPy")
+
+    members = AS.objects.filter(peering_clients__interfaces__vlan=vlan).distinct().order_by('id')
+    as_ids, asns, isd_ids, owner_ids, is_core = _to_columns(
+        members.values_list('id', 'asn', 'isd_id', 'owner_id', 'is_core'),
+        (np.int64, np.int64, np.int64, np.int64, bool))
+    n = len(as_ids)
+
+    # Dense codes of the ISDs and owners of the members
+    isds, isd_codes = np.unique(isd_ids, return_inverse=True)
+    owners, owner_codes = np.unique(owner_ids, return_inverse=True)
+
+    # All policies of the VLAN and the policies of the members for all VLANs currently in effect
+    # grouped by scope as (holder, target, accept) tuples
+    policies = {scope: [] for scope in PeerPolicy.Scope}
+    in_vlan = (Q(vlan=vlan) | Q(vlan__isnull=True, asys_id__in=members.values('id'))
+        ) & PeerPolicy.active_at(timezone.now())
+    for scope, asys_id, peer_as_id, peer_owner_id, peer_isd_id, first, last, accept in (
+            PeerPolicy.objects.filter(in_vlan).values_list('scope', 'asys_id', 'peer_as_id',
+            'peer_owner_id', 'peer_isd_id', 'peer_asn_first', 'peer_asn_last', 'accept')):
+        if scope == PeerPolicy.Scope.ASN_RANGE:
+            target = (int(first), int(last))
+        else:
+            target = peer_as_id if peer_as_id is not None else (
+                peer_owner_id if peer_owner_id is not None else peer_isd_id)
+        policies[scope].append((asys_id, target, accept))
+
+    # AS-level policies
+    as_accept, as_reject = _policy_matrices(as_ids, as_ids, policies[PeerPolicy.Scope.AS])
+
+    # ASN range policies
+    range_accept, range_reject = _range_matrices(as_ids, asns,
+        policies[PeerPolicy.Scope.ASN_RANGE])
+
+    # Owner and ISD policies as (holder x owner/ISD) matrices, expanded to (holder x member) by
+    # selecting the column of every member's owner/ISD.
+    owner_accept, owner_reject = _policy_matrices(as_ids, owners,
+        policies[PeerPolicy.Scope.OWNER])
+    isd_accept, isd_reject = _policy_matrices(as_ids, isds, policies[PeerPolicy.Scope.ISD])
+
+    # Default policies
+    default_accept = np.isin(as_ids, np.array([asys_id
+        for asys_id, _, accept in policies[PeerPolicy.Scope.DEFAULT] if accept], dtype=np.int64))
+
+    # Apply the rules in order of decreasing precedence. A rule only takes effect where no rule of
+    # higher precedence has matched.
+    accept = np.zeros((n, n), dtype=bool)
+    decided = np.zeros((n, n), dtype=bool)
+    for rule_accept, rule_reject in [
+            (as_accept, as_reject),
+            (range_accept, range_reject),
+            (owner_accept[:, owner_codes], owner_reject[:, owner_codes]),
+            (isd_accept[:, isd_codes], isd_reject[:, isd_codes])]:
+        accept |= rule_accept & ~decided
+        decided |= rule_accept | rule_reject
+    accept |= default_accept[:, np.newaxis] & ~decided
+    np.fill_diagonal(accept, False)
+
+    # Links are possible between ASes of the same type and between core and non-core ASes of the
+    # same ISD.
+    compatible = (is_core[:, np.newaxis] == is_core) | (isd_codes[:, np.newaxis] == isd_codes)
+
+    return AcceptMatrix(as_ids, accept, compatible)
+
+
+def get_link_changes(vlan: VLAN, matrix: Optional[AcceptMatrix] = None) -> LinkChanges:
+    """Compare the peerings accepted by the policies of a VLAN with the existing links.
+
+    :param matrix: Accept matrix of the VLAN. Evaluated from the policies if not given.
+    :returns: The AS pairs which should be linked but are not and the linked pairs which should not
+        be linked.
+    :raises NotAvailable: NumPy is not installed.
+    """
+    if matrix is None:
+        matrix = build_accept_matrix(vlan)
+    peerings = matrix.get_peerings()
+    linked = {tuple(sorted(pair)) for pair in Link.objects.filter(vlan=vlan).values_list(
+        'as_a_id', 'as_b_id').distinct()}
+    return LinkChanges(add=peerings - linked, remove=linked - peerings)
+
+
+def _policy_matrices(holder_ids: 'np.ndarray', target_ids: 'np.ndarray',
+        policies: Iterable[Tuple[int, int, bool]]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Build the accept and reject matrices of policies given as (holder, target, accept) tuples.
+
+    Policies of holders not in `holder_ids` or for targets not in `target_ids` are ignored.
+
+    :param holder_ids: Sorted IDs of the policy holders, corresponding to the rows.
+    :param target_ids: Sorted IDs of the targets (ASes, owners, ISDs), corresponding to the columns.
+    """
+    rows, cols, accept = _to_columns(policies, (np.int64, np.int64, bool))
+    valid = np.isin(rows, holder_ids) & np.isin(cols, target_ids)
+    rows = np.searchsorted(holder_ids, rows[valid])
+    cols = np.searchsorted(target_ids, cols[valid])
+    accept = accept[valid]
+
+    shape = (len(holder_ids), len(target_ids))
+    accept_matrix = np.zeros(shape, dtype=bool)
+    reject_matrix = np.zeros(shape, dtype=bool)
+    accept_matrix[rows[accept], cols[accept]] = True
+    reject_matrix[rows[~accept], cols[~accept]] = True
+    return accept_matrix, reject_matrix
+
+
+def _range_matrices(as_ids: 'np.ndarray', asns: 'np.ndarray',
+        policies: Iterable[Tuple[int, Tuple[int, int], bool]]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Build the accept and reject matrices of ASN range policies given as
+    (holder, (first ASN, last ASN), accept) tuples.
+
+    The members covered by a range are found by binary search in the members sorted by ASN.
+
+    :param as_ids: Sorted IDs of the members, corresponding to the rows and columns.
+    :param asns: ASNs of the members in the same order as `as_ids`.
+    """
+    by_asn = np.argsort(asns)
+    sorted_asns = asns[by_asn]
+
+    shape = (len(as_ids), len(as_ids))
+    accept_matrix = np.zeros(shape, dtype=bool)
+    reject_matrix = np.zeros(shape, dtype=bool)
+    for holder, (first, last), accept in policies:
+        row = np.searchsorted(as_ids, holder)
+        if row == len(as_ids) or as_ids[row] != holder:
+            continue
+        cols = by_asn[np.searchsorted(sorted_asns, first, side='left'):
+            np.searchsorted(sorted_asns, last, side='right')]
+        (accept_matrix if accept else reject_matrix)[row, cols] = True
+    return accept_matrix, reject_matrix
+
+
+def _to_columns(rows: Iterable[Tuple], dtypes: Sequence) -> Tuple['np.ndarray', ...]:
+    """Convert rows as returned by `values_list` to one array per column."""
+    rows = list(rows)
+    return tuple(np.array([row[i] for row in rows], dtype=dtype) for i, dtype in enumerate(dtypes))
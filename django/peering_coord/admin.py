@@ -1,11 +1,12 @@
 from django import forms
 from django.contrib import admin
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
-from peering_coord import policy_resolver
+from peering_coord import policy_analyzer, policy_resolver, resolution_queue
 from peering_coord.models.ixp import VLAN, Interface, Owner, PeeringClient
 from peering_coord.models.policies import (
-    AsPeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
+    AsPeerPolicy, AsRangePeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
 from peering_coord.models.scion import AS, ISD, VLAN, Link
 
 
@@ -97,11 +98,25 @@ class InterfaceAdmin(admin.ModelAdmin):
 admin.site.register(ISD)
 
 
+def compact_policies(modeladmin, request, queryset):
+    removed, before, after = 0, 0, 0
+    for asys in queryset.all():
+        analysis = policy_analyzer.compact_policies(asys)
+        removed += len(analysis.redundant)
+        before += analysis.evaluations_before
+        after += analysis.evaluations_after
+    modeladmin.message_user(request,
+        "Removed %d redundant policies. Policy evaluations per resolution: %d -> %d."
+        % (removed, before, after))
+compact_policies.short_description = "Remove redundant policies"
+
+
 @admin.register(AS)
 class AsAdmin(admin.ModelAdmin):
     list_display = ['name', 'asn', 'isd', 'owner', 'fmt_vlan_list', 'is_core']
     list_filter = ['isd', 'owner', 'is_core']
     inlines = [PeeringClientInline]
+    actions = [compact_policies]
 
 
 @admin.register(Link)
@@ -123,48 +138,75 @@ class LinkAdmin(admin.ModelAdmin):
 ## Policy Models ##
 ###################
 
+class RedundantPolicyFilter(admin.SimpleListFilter):
+    """Report of the policies which do not affect the accepted peers of their AS."""
+    title = "redundancy"
+    parameter_name = 'redundant'
+
+    def lookups(self, request, model_admin):
+        return [('yes', "Redundant")]
+
+    def queryset(self, request, queryset):
+        if self.value() != 'yes':
+            return queryset
+        redundant = []
+        for asys in AS.objects.filter(id__in=queryset.values('asys_id')):
+            analysis = policy_analyzer.find_redundant_policies(asys)
+            redundant.extend(policy.id for policy in analysis.redundant)
+        return queryset.filter(id__in=redundant)
+
+
 class PolicyAdmin(admin.ModelAdmin):
     def save_model(self, request, obj, form, change):
         super().save_model(request, obj, form, change)
-        policy_resolver.update_accepted_peers(obj.vlan, obj.asys)
+        resolution_queue.resolve(obj.vlan, obj.asys)
 
     def delete_model(self, request, obj):
         super().delete_model(request, obj)
-        policy_resolver.update_accepted_peers(obj.vlan, obj.asys)
+        resolution_queue.resolve(obj.vlan, obj.asys)
 
     def delete_queryset(self, request, queryset):
-        update = {(obj.vlan, obj.asys) for obj in queryset}
-        super().delete_queryset(request, queryset)
-        for vlan, asys in update:
-            policy_resolver.update_accepted_peers(vlan, asys)
+        with transaction.atomic(), resolution_queue.coalesce():
+            for obj in queryset.select_related('vlan', 'asys'):
+                resolution_queue.resolve(obj.vlan, obj.asys)
+            super().delete_queryset(request, queryset)
 
 
 @admin.register(DefaultPolicy)
 class DefaultPolicyAdmin(admin.ModelAdmin):
-    fields = ['vlan', 'asys', 'accept']
+    fields = ['vlan', 'asys', 'accept', 'valid_from', 'valid_until']
     list_display = ['vlan', 'asys', 'accept']
-    list_filter = ['vlan', 'asys', 'accept']
+    list_filter = ['vlan', 'asys', 'accept', RedundantPolicyFilter]
 
 
 @admin.register(AsPeerPolicy)
 class AsPeerPolicyAdmin(PolicyAdmin):
-    fields = ['vlan', 'asys', 'peer_as', 'accept']
+    fields = ['vlan', 'asys', 'peer_as', 'accept', 'valid_from', 'valid_until']
     list_display = ['vlan', 'asys', 'peer_as', 'get_policy_type_str']
     ordering = ['vlan', 'asys', 'accept', 'peer_as']
-    list_filter = ['vlan', 'asys']
+    list_filter = ['vlan', 'asys', RedundantPolicyFilter]
+
+
+@admin.register(AsRangePeerPolicy)
+class AsRangePeerPolicyAdmin(PolicyAdmin):
+    fields = ['vlan', 'asys', 'peer_asn_first', 'peer_asn_last', 'accept', 'valid_from',
+        'valid_until']
+    list_display = ['vlan', 'asys', 'peer_asn_range', 'get_policy_type_str']
+    ordering = ['vlan', 'asys', 'peer_asn_first']
+    list_filter = ['vlan', 'asys', RedundantPolicyFilter]
 
 
 @admin.register(IsdPeerPolicy)
 class IsdPeerPolicyAdmin(PolicyAdmin):
-    fields = ['vlan', 'asys', 'peer_isd', 'accept']
+    fields = ['vlan', 'asys', 'peer_isd', 'accept', 'valid_from', 'valid_until']
     list_display = ['vlan', 'asys', 'peer_isd', 'get_policy_type_str']
     ordering = ['vlan', 'asys', 'accept', 'peer_isd']
-    list_filter = ['vlan', 'asys']
+    list_filter = ['vlan', 'asys', RedundantPolicyFilter]
 
 
 @admin.register(OwnerPeerPolicy)
 class OwnerPeerPolicyAdmin(PolicyAdmin):
-    fields = ['vlan', 'asys', 'peer_owner', 'accept']
+    fields = ['vlan', 'asys', 'peer_owner', 'accept', 'valid_from', 'valid_until']
     list_display = ['vlan', 'asys', 'peer_owner', 'get_policy_type_str']
     ordering = ['vlan', 'asys', 'accept', 'peer_owner']
-    list_filter = ['vlan', 'asys']
+    list_filter = ['vlan', 'asys', RedundantPolicyFilter]
@@ -16,6 +16,8 @@ from collections import defaultdict
 from enum import Enum
 from typing import DefaultDict, Dict, Iterator, Optional
 
+from django.db import transaction
+
 from peering_coord.api import peering_pb2
 from peering_coord.api.authentication import get_client_from_metadata
 from peering_coord.models.ixp import Interface, Link, PeeringClient
@@ -199,7 +201,7 @@ class ClientConnections:
         with self._lock:
             if client in self._election[vlan]:
                 del self._election[vlan][client]
-            if self._primary[vlan] == client:
+            if self._primary.get(vlan) == client:
                 self._arbitrate(vlan)
 
     def remove_client(self, client: str):
@@ -293,11 +295,15 @@ class ClientRegistry:
 
     @staticmethod
     def remove_interface(asn: ASN, client: str, vlan: str):
-        ClientRegistry._ases[asn].remove_interface(client, vlan)
+        connections = ClientRegistry._ases.get(asn)
+        if connections:
+            connections.remove_interface(client, vlan)
 
     @staticmethod
     def remove_client(asn: ASN, client: str):
-        ClientRegistry._ases[asn].remove_client(client)
+        connections = ClientRegistry._ases.get(asn)
+        if connections:
+            connections.remove_client(client)
 
     @staticmethod
     def get_clients(asn: ASN) -> Optional[ClientConnections]:
@@ -309,16 +315,25 @@ class ClientRegistry:
 
     @staticmethod
     def send_link_update(asn: ASN, update: peering_pb2.LinkUpdate):
-        """Send link updates to all clients of the AS."""
-        connections = ClientRegistry._ases.get(asn)
-        if connections:
-            for conn in connections.get_connections():
-                conn.send_link_update(update)
+        """Send link updates to all clients of the AS once the current transaction commits.
+
+        Nothing is sent if the transaction is rolled back, e.g., to be retried.
+        """
+        def send():
+            connections = ClientRegistry._ases.get(asn)
+            if connections:
+                for conn in connections.get_connections():
+                    conn.send_link_update(update)
+        transaction.on_commit(send)
 
     @staticmethod
     def send_async_error(asn: ASN, error: peering_pb2.AsyncError):
-        """Send an asynchronous error report to all clients of the AS."""
-        connections = ClientRegistry._ases.get(asn)
-        if connections:
-            for conn in connections.get_connections():
-                conn.send_async_error(error)
+        """Send an asynchronous error report to all clients of the AS once the current transaction
+        commits.
+        """
+        def send():
+            connections = ClientRegistry._ases.get(asn)
+            if connections:
+                for conn in connections.get_connections():
+                    conn.send_async_error(error)
+        transaction.on_commit(send)
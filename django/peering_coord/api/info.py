@@ -6,6 +6,7 @@ from django.db import transaction
 from peering_coord.api import info_pb2
 from peering_coord.models.scion import AS
 from peering_coord.models.ixp import Owner
+from peering_coord.models.membership import VlanMembership
 from peering_coord.scion_addr import ASN
 
 
@@ -37,6 +38,7 @@ class InfoServive(Service):
         _fill_owner_protobuf(owner, buffer)
         return buffer
 
+    @VlanMembership.cached_stream
     @transaction.atomic
     def SearchOwner(self, request, context):
         """Search for AS owners matching the given criteria."""
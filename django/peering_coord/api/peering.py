@@ -4,7 +4,7 @@ import io
 import ipaddress
 import threading
 import typing
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
 
 import grpc
 from google.protobuf.empty_pb2 import Empty
@@ -14,17 +14,23 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
 from django_grpc_framework.services import Service
 
-from peering_coord import policy_resolver
+from peering_coord import policy_analyzer, policy_resolver, resolution_queue
 from peering_coord.api import peering_pb2
 from peering_coord.api.authentication import get_client_from_metadata
 from peering_coord.api.client_connection import (
     ClientConnections, ClientRegistry, create_link_update)
-from peering_coord.api.serializers import PolicyProtoSerializer
+from peering_coord.api.serializers import PolicyBatch, PolicyProtoSerializer
 from peering_coord.models.ixp import VLAN, Interface, PeeringClient
-from peering_coord.models.policies import (
-    AsPeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
+from peering_coord.models.membership import VlanMembership
+from peering_coord.models.policies import PeerPolicy
 from peering_coord.models.scion import AS
-from peering_coord.scion_addr import ASN
+from peering_coord.scion_addr import ASN, AsnRange
+
+
+# Number of ASes fetched from the database at once by ListPeeringOpportunities
+OPPORTUNITIES_CHUNK_SIZE = 100
+# Maximum number of ASes listed by a single ListPeeringOpportunities call
+OPPORTUNITIES_MAX_PAGE_SIZE = 1000
 
 
 class TransactionRollback(Exception):
@@ -97,7 +103,7 @@ class PeeringService(Service):
             ClientRegistry.destroyConnection(conn)
             listener.join()
 
-    @transaction.atomic
+    @policy_resolver.retry_transaction
     def SetPortRange(self, request, context):
         """Set the UDP port range used for SCION underlay connections."""
         asn_str, _ = get_client_from_metadata(context.invocation_metadata())
@@ -135,7 +141,7 @@ class PeeringService(Service):
 
         return peering_pb2.google_dot_protobuf_dot_empty__pb2.Empty()
 
-    @transaction.atomic
+    @VlanMembership.cached_stream
     def ListPolicies(self, request, context):
         """List policies of the AS making the request."""
         asn_str, client = get_client_from_metadata(context.invocation_metadata())
@@ -150,42 +156,43 @@ class PeeringService(Service):
         if request.WhichOneof("accept_") is not None:
             common_selection['accept'] = request.accept
 
-        # Return matching default policies
-        if request.WhichOneof('peer') is None or request.peer_everyone:
-            for policy in DefaultPolicy.objects.filter(**common_selection):
-                yield PolicyProtoSerializer(policy).message
-
-        # Return matching AS policies
-        if request.WhichOneof('peer') is None or request.peer_asn:
-            policies = AsPeerPolicy.objects.filter(**common_selection)
-            if request.peer_asn:
-                try:
-                    policies = policies.filter(peer_as__asn=ASN(request.peer_asn))
-                except ValueError:
-                    context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid ASN")
-            for policy in policies.filter(**common_selection):
-                yield PolicyProtoSerializer(policy).message
-
-        # Return matching owner policies
-        if request.WhichOneof('peer') is None or request.peer_owner:
-            policies = OwnerPeerPolicy.objects.filter(**common_selection)
-            if request.peer_owner:
-                policies = policies.filter(peer_owner__name=request.peer_owner)
-            for policy in policies.filter(**common_selection):
-                yield PolicyProtoSerializer(policy).message
-
-        # Return matching ISD policies
-        if request.WhichOneof('peer') is None or request.peer_isd:
-            policies = IsdPeerPolicy.objects.filter(**common_selection)
-            if request.peer_isd:
-                try:
-                    policies = policies.filter(peer_isd__isd_id=int(request.peer_isd))
-                except ValueError:
-                    context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid ISD")
-            for policy in policies.filter(**common_selection):
-                yield PolicyProtoSerializer(policy).message
-
-    @transaction.atomic
+        # Select the policies matching the peer filter. Policies of all types are fetched with a
+        # single query loading only the columns needed to build the response messages.
+        policies = PeerPolicy.objects.filter(**common_selection)
+        peer = request.WhichOneof('peer')
+        if peer == 'peer_everyone':
+            policies = policies.filter(scope=PeerPolicy.Scope.DEFAULT)
+        elif peer == 'peer_asn':
+            try:
+                policies = policies.filter(
+                    scope=PeerPolicy.Scope.AS, peer_as__asn=ASN(request.peer_asn))
+            except ValueError:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid ASN")
+        elif peer == 'peer_owner':
+            policies = policies.filter(
+                scope=PeerPolicy.Scope.OWNER, peer_owner__name=request.peer_owner)
+        elif peer == 'peer_isd':
+            try:
+                policies = policies.filter(
+                    scope=PeerPolicy.Scope.ISD, peer_isd__isd_id=int(request.peer_isd))
+            except ValueError:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid ISD")
+        elif peer == 'peer_asn_range':
+            try:
+                first, last = AsnRange.parse(request.peer_asn_range)
+            except ValueError:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid ASN range")
+            policies = policies.filter(scope=PeerPolicy.Scope.ASN_RANGE,
+                peer_asn_first=first, peer_asn_last=last)
+
+        asn_str = str(asn)
+        for policy in policies.order_by('scope', 'id').select_related(
+                'vlan', 'peer_as', 'peer_owner').only(
+                'scope', 'accept', 'valid_from', 'valid_until', 'vlan__name', 'peer_as__asn',
+                'peer_owner__name', 'peer_isd', 'peer_asn_first', 'peer_asn_last'):
+            yield _policy_message(policy, asn_str)
+
+    @policy_resolver.retry_transaction
     def CreatePolicy(self, request, context):
         """Create a new policy."""
         asn_str, client = get_client_from_metadata(context.invocation_metadata())
@@ -200,7 +207,7 @@ class PeeringService(Service):
             context.abort(
                 grpc.StatusCode.INVALID_ARGUMENT, _fmt_validation_errors(serializer.errors))
 
-        _assert_policy_write_permission(context, asn, client, request.vlan)
+        _assert_policy_write_permission(context, asn, client, request.vlan or None)
 
         try:
             policy = serializer.save()
@@ -209,12 +216,11 @@ class PeeringService(Service):
             context.abort(code, msg)
 
         # Update links and notify clients
-        policy_resolver.update_accepted_peers(policy.vlan, policy.asys)
-        policy_resolver.update_links(policy.vlan, policy.asys)
+        resolution_queue.resolve(policy.vlan, policy.asys)
 
         return serializer.message
 
-    @transaction.atomic
+    @policy_resolver.retry_transaction
     def DestroyPolicy(self, request, context):
         """Delete a policy."""
         asn_str, client = get_client_from_metadata(context.invocation_metadata())
@@ -233,26 +239,30 @@ class PeeringService(Service):
         except ObjectDoesNotExist:
             context.abort(grpc.StatusCode.NOT_FOUND, "Policy does not exist")
 
-        _assert_policy_write_permission(context, asn, client, request.vlan)
+        _assert_policy_write_permission(context, asn, client, request.vlan or None)
         policy.delete()
 
         # Update links and notify clients
-        policy_resolver.update_accepted_peers(policy.vlan, policy.asys)
-        policy_resolver.update_links(policy.vlan, policy.asys)
+        resolution_queue.resolve(policy.vlan, policy.asys)
 
         return Empty()
 
     def SetPolicies(self, request, context):
         """Replace existing polices in one or all VLANs."""
-        try:
-            with transaction.atomic():
+        @policy_resolver.retry_transaction
+        def set_policies():
+            with resolution_queue.coalesce():
                 rejected_policies, errors = self._set_policies(request, context)
-                if len(errors) > 0 and not request.continue_on_error:
-                    # Trigger a rollback of the transaction block, but continue processing the
-                    # request.
-                    raise TransactionRollback()
-        except TransactionRollback:
-            pass
+            if len(errors) > 0 and not request.continue_on_error:
+                # Trigger a rollback of the transaction block, but continue processing the
+                # request.
+                raise TransactionRollback(rejected_policies, errors)
+            return rejected_policies, errors
+
+        try:
+            rejected_policies, errors = set_policies()
+        except TransactionRollback as e:
+            rejected_policies, errors = e.args
 
         # Build response
         response = peering_pb2.SetPoliciesResponse()
@@ -262,73 +272,297 @@ class PeeringService(Service):
 
     def _set_policies(self, request, context) -> Tuple[
             typing.List[peering_pb2.Policy], typing.List[str]]:
-        # Delete old policies. Parse the new ones, and try saving them to the DB.
+        # Parse the new policies and replace the old ones with them in the DB.
         # Returns the unsuccessful policies and matching error descriptions.
         # context.abort() is called on fatal errors to abort the RPC and trigger a transaction
         # rollback.
         asn_str, client= get_client_from_metadata(context.invocation_metadata())
         asn = ASN(asn_str)
 
-        # Delete previous policies
-        if request.vlan:
-            try:
-                vlan_id = VLAN.objects.get(name=request.vlan).id
-            except VLAN.DoesNotExist:
-                context.abort(grpc.StatusCode.NOT_FOUND, "VLAN does not exist")
-                _assert_policy_write_permission(context, asn, client, request.vlan)
-            _delete_policies(asn, vlan_id)
-        else:
-            _assert_policy_write_permission(context, asn, client)
-            _delete_policies(asn)
+        asys = AS.objects.get(asn=asn)
+        vlan_filter = _get_policy_vlan_filter(context, asn, client, request.vlan)
 
-        # Create new policies
+        # Validate new policies
         rejected_policies = []
         errors = []
-        for policy in request.policies:
-            serializer = PolicyProtoSerializer(message=policy)
+        batch = PolicyBatch()
+        policies = {}
+        for policy, error in _add_policies(
+                batch, request.policies, asn_str, request.vlan, policies):
+            rejected_policies.append(policy)
+            errors.append(error)
+
+        # Policies for all VLANs are kept when replacing the policies of a single VLAN.
+        if vlan_filter is not None:
+            for instance, e in batch.remove_stored(exclude_vlan=vlan_filter):
+                msg, _ = _translate_validation_errors(e)
+                rejected_policies.append(policies[id(instance)])
+                errors.append(msg)
 
-            if policy.asn != asn_str:
-                rejected_policies.append(policy)
-                errors.append("Policy ASN belongs to foreign AS")
-                continue
+        if len(errors) > 0 and not request.continue_on_error:
+            return rejected_policies, errors # changes are rolled back by the caller
 
-            if request.vlan and policy.vlan != request.vlan:
-                rejected_policies.append(policy)
-                errors.append("VLAN excluded by filter")
-                continue
+        # Replace the previous policies, only touching those which have actually changed.
+        changed_vlans = batch.replace(asys, vlan_filter)
 
-            if not serializer.is_valid():
-                rejected_policies.append(policy)
-                errors.append(_fmt_validation_errors(serializer.errors))
-                continue
+        # Update links and notify clients
+        _resolve_changed_vlans(asys, changed_vlans)
+
+        return rejected_policies, errors
+
+
+    @VlanMembership.cached_stream
+    def UploadPolicies(self, request_iterator, context):
+        """Replace existing policies in one or all VLANs with policies uploaded in chunks.
+
+        Every chunk is validated as soon as it has been received, the previous policies are only
+        replaced once the upload is complete. Receiving the chunks happens outside of any
+        transaction, so a slow client cannot keep the transaction open. Policies duplicating a
+        policy from an earlier chunk are detected by the batch all chunks are added to. Conflicts
+        with the policies kept in the database are checked in the transaction replacing the
+        policies, which is rolled back if policies have been rejected and continue_on_error is
+        false.
+        """
+        asn_str, client = get_client_from_metadata(context.invocation_metadata())
+        asn = ASN(asn_str)
+
+        request = next(request_iterator, None)
+        if request is None:
+            return
+        vlan_name = request.vlan
+        continue_on_error = request.continue_on_error
+        vlan_filter = _get_policy_vlan_filter(context, asn, client, vlan_name)
+
+        # Receive and validate all chunks
+        rejected = 0
+        batch = PolicyBatch()
+        policies = {}
+        while request is not None:
+            for policy, error in _add_policies(
+                    batch, request.policies, asn_str, vlan_name, policies):
+                rejected += 1
+                yield peering_pb2.UploadPoliciesResponse(rejected_policy=policy, error=error)
+            request = next(request_iterator, None)
+
+        if rejected > 0 and not continue_on_error:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                "{} policies rejected, no changes applied".format(rejected))
+
+        @policy_resolver.retry_transaction
+        def replace_policies():
+            conflicts = []
+            with resolution_queue.coalesce():
+                # Policies for all VLANs are kept when replacing the policies of a single VLAN.
+                if vlan_filter is not None:
+                    for instance, e in batch.remove_stored(exclude_vlan=vlan_filter):
+                        msg, _ = _translate_validation_errors(e)
+                        conflicts.append(peering_pb2.UploadPoliciesResponse(
+                            rejected_policy=policies[id(instance)], error=msg))
+                if len(conflicts) > 0 and not continue_on_error:
+                    # Trigger a rollback of the transaction block.
+                    raise TransactionRollback(conflicts)
+
+                # Replace the previous policies, only touching those which have actually changed.
+                asys = AS.objects.get(asn=asn)
+                changed_vlans = batch.replace(asys, vlan_filter)
+
+                # Update links and notify clients
+                _resolve_changed_vlans(asys, changed_vlans)
+            return conflicts
+
+        try:
+            conflicts = replace_policies()
+        except TransactionRollback as e:
+            conflicts, = e.args
+        yield from conflicts
+        rejected += len(conflicts)
+
+        if rejected > 0 and not continue_on_error:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                "{} policies rejected, no changes applied".format(rejected))
+
+    @policy_resolver.retry_transaction
+    def CompactPolicies(self, request, context):
+        """Delete the redundant policies of the AS making the request in one or all VLANs."""
+        asn_str, client = get_client_from_metadata(context.invocation_metadata())
+        asn = ASN(asn_str)
+        asys = AS.objects.get(asn=asn)
 
+        if request.dry_run:
+            vlan_filter = None
+            if request.vlan:
+                try:
+                    vlan_filter = VLAN.objects.get(name=request.vlan)
+                except VLAN.DoesNotExist:
+                    context.abort(grpc.StatusCode.NOT_FOUND, "VLAN does not exist")
+            analysis = policy_analyzer.find_redundant_policies(asys, vlan_filter)
+        else:
+            vlan_filter = _get_policy_vlan_filter(context, asn, client, request.vlan)
+            analysis = policy_analyzer.compact_policies(asys, vlan_filter)
+
+        response = peering_pb2.CompactPoliciesResponse(
+            evaluations_before=analysis.evaluations_before,
+            evaluations_after=analysis.evaluations_after)
+        response.policies.extend(
+            _policy_message(policy, asn_str) for policy in analysis.redundant)
+        return response
+
+    @VlanMembership.cached_stream
+    def ListPeeringOpportunities(self, request, context):
+        """List the ASes accepting the AS making the request, which are not accepted in return."""
+        asn_str, _ = get_client_from_metadata(context.invocation_metadata())
+        asys = AS.objects.get(asn=ASN(asn_str))
+
+        try:
+            vlan = VLAN.objects.get(name=request.vlan)
+        except VLAN.DoesNotExist:
+            context.abort(grpc.StatusCode.NOT_FOUND, "VLAN does not exist")
+        after = None
+        if request.after_asn:
             try:
-                serializer.save()
-            except ValidationError as e:
-                msg, _ = _translate_validation_errors(e)
-                rejected_policies.append(policy)
-                errors.append(msg)
+                after = ASN(request.after_asn)
+            except ValueError:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid ASN")
+
+        # Stream the ASes in chunks continuing after the last ASN of the previous chunk, so the
+        # ASes of earlier chunks are not fetched and skipped again.
+        peers = asys.query_peering_opportunities(vlan).select_related('owner')
+        remaining = min(request.page_size or OPPORTUNITIES_MAX_PAGE_SIZE,
+            OPPORTUNITIES_MAX_PAGE_SIZE)
+        while remaining > 0:
+            limit = min(OPPORTUNITIES_CHUNK_SIZE, remaining)
+            remaining -= limit
+            chunk = list((peers.filter(asn__gt=after) if after is not None else peers)[:limit])
+            for peer in chunk:
+                yield peering_pb2.PeeringOpportunity(asn=str(peer.asn), name=peer.name,
+                    owner=peer.owner.name, isd=str(peer.isd_id))
+            if len(chunk) < limit:
+                break
+            after = chunk[-1].asn
+
+    def GetResolutionStatus(self, request, context):
+        """Report the progress of background resolution of the requesting AS's policy changes."""
+        asn_str, _ = get_client_from_metadata(context.invocation_metadata())
+        asys = AS.objects.get(asn=ASN(asn_str))
+
+        response = peering_pb2.ResolutionStatus(
+            background=resolution_queue.ResolutionQueue.is_active())
+        status = resolution_queue.ResolutionQueue.get_status(asys.id)
+
+        vlan_names = dict(VLAN.objects.filter(
+            id__in={job.vlan_id for job in status.jobs}).values_list('id', 'name'))
+        for job in status.jobs:
+            name = vlan_names.get(job.vlan_id)
+            if name is None or (request.vlan and name != request.vlan):
                 continue
+            response.jobs.add(vlan=name, state=(peering_pb2.ResolutionStatus.Job.RUNNING
+                if job.running else peering_pb2.ResolutionStatus.Job.PENDING))
 
-        # Update links and notify clients
-        asys = AS.objects.get(asn=asn)
-        for vlan in asys.get_connected_vlans():
-            policy_resolver.update_accepted_peers(vlan, asys)
-            policy_resolver.update_links(vlan, asys)
+        response.queue_length = status.queue_length
+        response.failed_jobs = status.failed_jobs
+        response.last_error = status.last_error
+        return response
 
-        return rejected_policies, errors
 
+def _get_policy_vlan_filter(context, asn: ASN, client: str, vlan: str) -> Optional[VLAN]:
+    """Check whether a client may replace the policies of its AS in the given VLAN or in all VLANs
+    if `vlan` is empty. Aborts the RPC if the VLAN does not exist or the client lacks permission.
 
-def _delete_policies(asn: ASN, vlan_id: Optional[int] = None):
-    """Delete all peering policies of the given AS optionally limited to a certain VLAN."""
-    filter = {'asys__asn': asn}
-    if vlan_id is not None:
-        filter['vlan__id'] = vlan_id
+    :returns: The VLAN to replace policies in or None for all VLANs.
+    """
+    if vlan:
+        try:
+            vlan_filter = VLAN.objects.get(name=vlan)
+        except VLAN.DoesNotExist:
+            context.abort(grpc.StatusCode.NOT_FOUND, "VLAN does not exist")
+        _assert_policy_write_permission(context, asn, client, vlan)
+        return vlan_filter
+    else:
+        _assert_policy_write_permission(context, asn, client)
+        return None
+
+
+def _add_policies(batch: PolicyBatch, policies: Iterable[peering_pb2.Policy], asn: str, vlan: str,
+    instances: Optional[Dict[int, peering_pb2.Policy]] = None
+    ) -> Iterator[Tuple[peering_pb2.Policy, str]]:
+    """Validate policies and add the valid ones to a batch.
+
+    :param batch: Batch to add the policies to.
+    :param policies: Policies to validate.
+    :param asn: AS the policies must belong to.
+    :param vlan: VLAN the policies must belong to. Empty to allow all VLANs.
+    :param instances: If given, filled with a mapping from the IDs of the model instances added to
+                      the batch to the policies they have been created from.
+    :returns: The rejected policies and matching error descriptions.
+    """
+    batch.resolve(policies)
+    for policy in policies:
+        if policy.asn != asn:
+            yield policy, "Policy ASN belongs to foreign AS"
+            continue
 
-    DefaultPolicy.objects.filter(**filter).delete()
-    AsPeerPolicy.objects.filter(**filter).delete()
-    OwnerPeerPolicy.objects.filter(**filter).delete()
-    IsdPeerPolicy.objects.filter(**filter).delete()
+        if vlan and policy.vlan != vlan:
+            yield policy, "VLAN excluded by filter"
+            continue
+
+        try:
+            instance = batch.add(policy)
+        except serializers.ValidationError as e:
+            yield policy, _fmt_validation_errors(e.detail)
+            continue
+        except ValidationError as e:
+            msg, _ = _translate_validation_errors(e)
+            yield policy, msg
+            continue
+
+        if instances is not None:
+            instances[id(instance)] = policy
+
+
+def _policy_message(policy: PeerPolicy, asn: str) -> peering_pb2.Policy:
+    """Convert a policy of the AS `asn` to its protobuf representation."""
+    message = peering_pb2.Policy(
+        vlan=policy.vlan.name if policy.vlan_id is not None else "", asn=asn, accept=policy.accept)
+    if policy.valid_from is not None:
+        message.valid_from.FromDatetime(policy.valid_from)
+    if policy.valid_until is not None:
+        message.valid_until.FromDatetime(policy.valid_until)
+    if policy.scope == PeerPolicy.Scope.AS:
+        message.peer_asn = str(policy.peer_as.asn)
+    elif policy.scope == PeerPolicy.Scope.ASN_RANGE:
+        message.peer_asn_range = str(policy.peer_asn_range)
+    elif policy.scope == PeerPolicy.Scope.OWNER:
+        message.peer_owner = policy.peer_owner.name
+    elif policy.scope == PeerPolicy.Scope.ISD:
+        message.peer_isd = str(policy.peer_isd_id)
+    return message
+
+
+def _delete_policies(asys: AS, vlan: Optional[VLAN] = None) -> Set[int]:
+    """Delete all peering policies of the given AS optionally limited to a certain VLAN.
+
+    :returns: IDs of the VLANs policies have been deleted from. None stands for policies applying
+              to all VLANs.
+    """
+    policies = PeerPolicy.objects.filter(asys=asys)
+    if vlan is not None:
+        policies = policies.filter(vlan=vlan)
+    vlans = set(policies.values_list('vlan_id', flat=True).distinct())
+    policies.delete()
+    return vlans
+
+
+def _resolve_changed_vlans(asys: AS, vlan_ids: Set[Optional[int]]) -> None:
+    """Resolve the policies of an AS in the VLANs in which they have changed.
+
+    :param vlan_ids: IDs of the VLANs with changed policies. None stands for the policies applying
+                     to all VLANs and resolves the AS in all VLANs it is a member of.
+    """
+    if None in vlan_ids:
+        resolution_queue.resolve(None, asys)
+        return
+    for vlan in VLAN.objects.filter(id__in=vlan_ids).order_by('id'):
+        resolution_queue.resolve(vlan, asys)
 
 
 def _fmt_validation_errors(errors: serializers.ValidationError) -> str:
@@ -354,7 +588,7 @@ def _translate_validation_errors(validation_error: ValidationError) -> Tuple[str
             codes.add(error.code)
             msg.write(" {}".format(" ".join(error.messages)))
 
-    if 'unique_together' in codes:
+    if 'unique_together' in codes or 'overlapping_range' in codes:
         code = grpc.StatusCode.ALREADY_EXISTS
     else:
         code = grpc.StatusCode.INVALID_ARGUMENT
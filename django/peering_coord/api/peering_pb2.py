@@ -12,6 +12,7 @@ _sym_db = _symbol_database.Default()
 
 
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
 DESCRIPTOR = _descriptor.FileDescriptor(
@@ -20,9 +21,9 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=b'Z6github.com/netsys-lab/scion-peering-coordinator/go/api',
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x1fpeering_coord/api/peering.proto\x12\tcoord.api\x1a\x1bgoogle/protobuf/empty.proto\"V\n\x14StreamMessageRequest\x12\x33\n\x0b\x61rbitration\x18\x01 \x01(\x0b\x32\x1c.coord.api.ArbitrationUpdateH\x00\x42\t\n\x07request\"\xae\x01\n\x15StreamMessageResponse\x12\x33\n\x0b\x61rbitration\x18\x01 \x01(\x0b\x32\x1c.coord.api.ArbitrationUpdateH\x00\x12,\n\x0blink_update\x18\x02 \x01(\x0b\x32\x15.coord.api.LinkUpdateH\x00\x12&\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x15.coord.api.AsyncErrorH\x00\x42\n\n\x08response\"\xa9\x01\n\x11\x41rbitrationUpdate\x12\x0e\n\x04vlan\x18\x01 \x01(\tH\x00\x12\x13\n\x0b\x65lection_id\x18\x02 \x01(\x03\x12\x33\n\x06status\x18\x03 \x01(\x0e\x32#.coord.api.ArbitrationUpdate.Status\"1\n\x06Status\x12\t\n\x05\x45RROR\x10\x00\x12\x0b\n\x07PRIMARY\x10\x01\x12\x0f\n\x0bNOT_PRIMARY\x10\x02\x42\x07\n\x05vlan_\"\xa4\x02\n\nLinkUpdate\x12(\n\x04type\x18\x01 \x01(\x0e\x32\x1a.coord.api.LinkUpdate.Type\x12\x31\n\tlink_type\x18\x02 \x01(\x0e\x32\x1e.coord.api.LinkUpdate.LinkType\x12\x10\n\x08peer_asn\x18\x03 \x01(\t\x12)\n\x05local\x18\x04 \x01(\x0b\x32\x1a.coord.api.UnderlayAddress\x12*\n\x06remote\x18\x05 \x01(\x0b\x32\x1a.coord.api.UnderlayAddress\"\x1f\n\x04Type\x12\n\n\x06\x43REATE\x10\x00\x12\x0b\n\x07\x44\x45STROY\x10\x01\"/\n\x08LinkType\x12\x0b\n\x07PEERING\x10\x00\x12\x08\n\x04\x43ORE\x10\x01\x12\x0c\n\x08PROVIDER\x10\x02\"z\n\nAsyncError\x12(\n\x04\x63ode\x18\x01 \x01(\x0e\x32\x1a.coord.api.AsyncError.Code\x12\x0f\n\x07message\x18\x02 \x01(\t\"1\n\x04\x43ode\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x18\n\x14LINK_CREATION_FAILED\x10\x01\"+\n\x0fUnderlayAddress\x12\n\n\x02ip\x18\x01 \x01(\t\x12\x0c\n\x04port\x18\x02 \x01(\r\"`\n\tPortRange\x12\x16\n\x0einterface_vlan\x18\x01 \x01(\t\x12\x14\n\x0cinterface_ip\x18\x02 \x01(\t\x12\x12\n\nfirst_port\x18\x03 \x01(\r\x12\x11\n\tlast_port\x18\x04 \x01(\r\"\xc2\x01\n\x11ListPolicyRequest\x12\x0c\n\x04vlan\x18\x01 \x01(\t\x12\x0b\n\x03\x61sn\x18\x02 \x01(\t\x12\x10\n\x06\x61\x63\x63\x65pt\x18\x03 \x01(\x08H\x00\x12\x12\n\x08peer_asn\x18\x04 \x01(\tH\x01\x12\x14\n\npeer_owner\x18\x05 \x01(\tH\x01\x12\x12\n\x08peer_isd\x18\x06 \x01(\tH\x01\x12/\n\rpeer_everyone\x18\x07 \x01(\x0b\x32\x16.google.protobuf.EmptyH\x01\x42\t\n\x07\x61\x63\x63\x65pt_B\x06\n\x04peer\"y\n\x06Policy\x12\x0c\n\x04vlan\x18\x01 \x01(\t\x12\x0b\n\x03\x61sn\x18\x02 \x01(\t\x12\x0e\n\x06\x61\x63\x63\x65pt\x18\x03 \x01(\x08\x12\x12\n\x08peer_asn\x18\x04 \x01(\tH\x00\x12\x14\n\npeer_owner\x18\x05 \x01(\tH\x00\x12\x12\n\x08peer_isd\x18\x06 \x01(\tH\x00\x42\x06\n\x04peer\"b\n\x12SetPoliciesRequest\x12#\n\x08policies\x18\x01 \x03(\x0b\x32\x11.coord.api.Policy\x12\x0c\n\x04vlan\x18\x02 \x01(\t\x12\x19\n\x11\x63ontinue_on_error\x18\x03 \x01(\x08\"S\n\x13SetPoliciesResponse\x12,\n\x11rejected_policies\x18\x01 \x03(\x0b\x32\x11.coord.api.Policy\x12\x0e\n\x06\x65rrors\x18\x02 \x03(\t2\xae\x03\n\x07Peering\x12X\n\rStreamChannel\x12\x1f.coord.api.StreamMessageRequest\x1a .coord.api.StreamMessageResponse\"\x00(\x01\x30\x01\x12>\n\x0cSetPortRange\x12\x14.coord.api.PortRange\x1a\x16.google.protobuf.Empty\"\x00\x12\x43\n\x0cListPolicies\x12\x1c.coord.api.ListPolicyRequest\x1a\x11.coord.api.Policy\"\x00\x30\x01\x12\x36\n\x0c\x43reatePolicy\x12\x11.coord.api.Policy\x1a\x11.coord.api.Policy\"\x00\x12<\n\rDestroyPolicy\x12\x11.coord.api.Policy\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\x0bSetPolicies\x12\x1d.coord.api.SetPoliciesRequest\x1a\x1e.coord.api.SetPoliciesResponse\"\x00\x42\x38Z6github.com/netsys-lab/scion-peering-coordinator/go/apib\x06proto3'
+  serialized_pb=b'\n\x1fpeering_coord/api/peering.proto\x12\tcoord.api\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"V\n\x14StreamMessageRequest\x12\x33\n\x0b\x61rbitration\x18\x01 \x01(\x0b\x32\x1c.coord.api.ArbitrationUpdateH\x00\x42\t\n\x07request\"\xae\x01\n\x15StreamMessageResponse\x12\x33\n\x0b\x61rbitration\x18\x01 \x01(\x0b\x32\x1c.coord.api.ArbitrationUpdateH\x00\x12,\n\x0blink_update\x18\x02 \x01(\x0b\x32\x15.coord.api.LinkUpdateH\x00\x12&\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x15.coord.api.AsyncErrorH\x00\x42\n\n\x08response\"\xa9\x01\n\x11\x41rbitrationUpdate\x12\x0e\n\x04vlan\x18\x01 \x01(\tH\x00\x12\x13\n\x0b\x65lection_id\x18\x02 \x01(\x03\x12\x33\n\x06status\x18\x03 \x01(\x0e\x32#.coord.api.ArbitrationUpdate.Status\"1\n\x06Status\x12\t\n\x05\x45RROR\x10\x00\x12\x0b\n\x07PRIMARY\x10\x01\x12\x0f\n\x0bNOT_PRIMARY\x10\x02\x42\x07\n\x05vlan_\"\xa4\x02\n\nLinkUpdate\x12(\n\x04type\x18\x01 \x01(\x0e\x32\x1a.coord.api.LinkUpdate.Type\x12\x31\n\tlink_type\x18\x02 \x01(\x0e\x32\x1e.coord.api.LinkUpdate.LinkType\x12\x10\n\x08peer_asn\x18\x03 \x01(\t\x12)\n\x05local\x18\x04 \x01(\x0b\x32\x1a.coord.api.UnderlayAddress\x12*\n\x06remote\x18\x05 \x01(\x0b\x32\x1a.coord.api.UnderlayAddress\"\x1f\n\x04Type\x12\n\n\x06\x43REATE\x10\x00\x12\x0b\n\x07\x44\x45STROY\x10\x01\"/\n\x08LinkType\x12\x0b\n\x07PEERING\x10\x00\x12\x08\n\x04\x43ORE\x10\x01\x12\x0c\n\x08PROVIDER\x10\x02\"z\n\nAsyncError\x12(\n\x04\x63ode\x18\x01 \x01(\x0e\x32\x1a.coord.api.AsyncError.Code\x12\x0f\n\x07message\x18\x02 \x01(\t\"1\n\x04\x43ode\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x18\n\x14LINK_CREATION_FAILED\x10\x01\"+\n\x0fUnderlayAddress\x12\n\n\x02ip\x18\x01 \x01(\t\x12\x0c\n\x04port\x18\x02 \x01(\r\"`\n\tPortRange\x12\x16\n\x0einterface_vlan\x18\x01 \x01(\t\x12\x14\n\x0cinterface_ip\x18\x02 \x01(\t\x12\x12\n\nfirst_port\x18\x03 \x01(\r\x12\x11\n\tlast_port\x18\x04 \x01(\r\"\xdc\x01\n\x11ListPolicyRequest\x12\x0c\n\x04vlan\x18\x01 \x01(\t\x12\x0b\n\x03\x61sn\x18\x02 \x01(\t\x12\x10\n\x06\x61\x63\x63\x65pt\x18\x03 \x01(\x08H\x00\x12\x12\n\x08peer_asn\x18\x04 \x01(\tH\x01\x12\x14\n\npeer_owner\x18\x05 \x01(\tH\x01\x12\x12\n\x08peer_isd\x18\x06 \x01(\tH\x01\x12/\n\rpeer_everyone\x18\x07 \x01(\x0b\x32\x16.google.protobuf.EmptyH\x01\x12\x18\n\x0epeer_asn_range\x18\x08 \x01(\tH\x01\x42\t\n\x07\x61\x63\x63\x65pt_B\x06\n\x04peer\"\xf4\x01\n\x06Policy\x12\x0c\n\x04vlan\x18\x01 \x01(\t\x12\x0b\n\x03\x61sn\x18\x02 \x01(\t\x12\x0e\n\x06\x61\x63\x63\x65pt\x18\x03 \x01(\x08\x12\x12\n\x08peer_asn\x18\x04 \x01(\tH\x00\x12\x14\n\npeer_owner\x18\x05 \x01(\tH\x00\x12\x12\n\x08peer_isd\x18\x06 \x01(\tH\x00\x12\x18\n\x0epeer_asn_range\x18\x07 \x01(\tH\x00\x12.\n\nvalid_from\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0bvalid_until\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x06\n\x04peer\"b\n\x12SetPoliciesRequest\x12#\n\x08policies\x18\x01 \x03(\x0b\x32\x11.coord.api.Policy\x12\x0c\n\x04vlan\x18\x02 \x01(\t\x12\x19\n\x11\x63ontinue_on_error\x18\x03 \x01(\x08\"S\n\x13SetPoliciesResponse\x12,\n\x11rejected_policies\x18\x01 \x03(\x0b\x32\x11.coord.api.Policy\x12\x0e\n\x06\x65rrors\x18\x02 \x03(\t\"e\n\x15UploadPoliciesRequest\x12#\n\x08policies\x18\x01 \x03(\x0b\x32\x11.coord.api.Policy\x12\x0c\n\x04vlan\x18\x02 \x01(\t\x12\x19\n\x11\x63ontinue_on_error\x18\x03 \x01(\x08\"S\n\x16UploadPoliciesResponse\x12*\n\x0frejected_policy\x18\x01 \x01(\x0b\x32\x11.coord.api.Policy\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"7\n\x16\x43ompactPoliciesRequest\x12\x0c\n\x04vlan\x18\x01 \x01(\t\x12\x0f\n\x07\x64ry_run\x18\x02 \x01(\x08\"u\n\x17\x43ompactPoliciesResponse\x12#\n\x08policies\x18\x01 \x03(\x0b\x32\x11.coord.api.Policy\x12\x1a\n\x12\x65valuations_before\x18\x02 \x01(\r\x12\x19\n\x11\x65valuations_after\x18\x03 \x01(\r\"Q\n\x1bPeeringOpportunitiesRequest\x12\x0c\n\x04vlan\x18\x01 \x01(\t\x12\x11\n\tafter_asn\x18\x02 \x01(\t\x12\x11\n\tpage_size\x18\x03 \x01(\r\"K\n\x12PeeringOpportunity\x12\x0b\n\x03\x61sn\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05owner\x18\x03 \x01(\t\x12\x0b\n\x03isd\x18\x04 \x01(\t\"\'\n\x17ResolutionStatusRequest\x12\x0c\n\x04vlan\x18\x01 \x01(\t\"\x82\x02\n\x10ResolutionStatus\x12\x12\n\nbackground\x18\x01 \x01(\x08\x12-\n\x04jobs\x18\x02 \x03(\x0b\x32\x1f.coord.api.ResolutionStatus.Job\x12\x14\n\x0cqueue_length\x18\x03 \x01(\r\x12\x13\n\x0b\x66\x61iled_jobs\x18\x04 \x01(\x04\x12\x12\n\nlast_error\x18\x05 \x01(\t\x1al\n\x03Job\x12\x0c\n\x04vlan\x18\x01 \x01(\t\x12\x34\n\x05state\x18\x02 \x01(\x0e\x32%.coord.api.ResolutionStatus.Job.State\"!\n\x05State\x12\x0b\n\x07PENDING\x10\x00\x12\x0b\n\x07RUNNING\x10\x01\x32\xa8\x06\n\x07Peering\x12X\n\rStreamChannel\x12\x1f.coord.api.StreamMessageRequest\x1a .coord.api.StreamMessageResponse\"\x00(\x01\x30\x01\x12>\n\x0cSetPortRange\x12\x14.coord.api.PortRange\x1a\x16.google.protobuf.Empty\"\x00\x12\x43\n\x0cListPolicies\x12\x1c.coord.api.ListPolicyRequest\x1a\x11.coord.api.Policy\"\x00\x30\x01\x12\x36\n\x0c\x43reatePolicy\x12\x11.coord.api.Policy\x1a\x11.coord.api.Policy\"\x00\x12<\n\rDestroyPolicy\x12\x11.coord.api.Policy\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\x0bSetPolicies\x12\x1d.coord.api.SetPoliciesRequest\x1a\x1e.coord.api.SetPoliciesResponse\"\x00\x12[\n\x0eUploadPolicies\x12 .coord.api.UploadPoliciesRequest\x1a!.coord.api.UploadPoliciesResponse\"\x00(\x01\x30\x01\x12Z\n\x0f\x43ompactPolicies\x12!.coord.api.CompactPoliciesRequest\x1a\".coord.api.CompactPoliciesResponse\"\x00\x12\x65\n\x18ListPeeringOpportunities\x12&.coord.api.PeeringOpportunitiesRequest\x1a\x1d.coord.api.PeeringOpportunity\"\x00\x30\x01\x12X\n\x13GetResolutionStatus\x12\".coord.api.ResolutionStatusRequest\x1a\x1b.coord.api.ResolutionStatus\"\x00\x42\x38Z6github.com/netsys-lab/scion-peering-coordinator/go/apib\x06proto3'
   ,
-  dependencies=[google_dot_protobuf_dot_empty__pb2.DESCRIPTOR,])
+  dependencies=[google_dot_protobuf_dot_empty__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,])
 
 
 
@@ -51,8 +52,8 @@ _ARBITRATIONUPDATE_STATUS = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=452,
-  serialized_end=501,
+  serialized_start=485,
+  serialized_end=534,
 )
 _sym_db.RegisterEnumDescriptor(_ARBITRATIONUPDATE_STATUS)
 
@@ -76,8 +77,8 @@ _LINKUPDATE_TYPE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=725,
-  serialized_end=756,
+  serialized_start=758,
+  serialized_end=789,
 )
 _sym_db.RegisterEnumDescriptor(_LINKUPDATE_TYPE)
 
@@ -106,8 +107,8 @@ _LINKUPDATE_LINKTYPE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=758,
-  serialized_end=805,
+  serialized_start=791,
+  serialized_end=838,
 )
 _sym_db.RegisterEnumDescriptor(_LINKUPDATE_LINKTYPE)
 
@@ -131,11 +132,36 @@ _ASYNCERROR_CODE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=880,
-  serialized_end=929,
+  serialized_start=913,
+  serialized_end=962,
 )
 _sym_db.RegisterEnumDescriptor(_ASYNCERROR_CODE)
 
+_RESOLUTIONSTATUS_JOB_STATE = _descriptor.EnumDescriptor(
+  name='State',
+  full_name='coord.api.ResolutionStatus.Job.State',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PENDING', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='RUNNING', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2553,
+  serialized_end=2586,
+)
+_sym_db.RegisterEnumDescriptor(_RESOLUTIONSTATUS_JOB_STATE)
+
 
 _STREAMMESSAGEREQUEST = _descriptor.Descriptor(
   name='StreamMessageRequest',
@@ -169,8 +195,8 @@ _STREAMMESSAGEREQUEST = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=75,
-  serialized_end=161,
+  serialized_start=108,
+  serialized_end=194,
 )
 
 
@@ -220,8 +246,8 @@ _STREAMMESSAGERESPONSE = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=164,
-  serialized_end=338,
+  serialized_start=197,
+  serialized_end=371,
 )
 
 
@@ -272,8 +298,8 @@ _ARBITRATIONUPDATE = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=341,
-  serialized_end=510,
+  serialized_start=374,
+  serialized_end=543,
 )
 
 
@@ -334,8 +360,8 @@ _LINKUPDATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=513,
-  serialized_end=805,
+  serialized_start=546,
+  serialized_end=838,
 )
 
 
@@ -374,8 +400,8 @@ _ASYNCERROR = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=807,
-  serialized_end=929,
+  serialized_start=840,
+  serialized_end=962,
 )
 
 
@@ -413,8 +439,8 @@ _UNDERLAYADDRESS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=931,
-  serialized_end=974,
+  serialized_start=964,
+  serialized_end=1007,
 )
 
 
@@ -466,8 +492,8 @@ _PORTRANGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=976,
-  serialized_end=1072,
+  serialized_start=1009,
+  serialized_end=1105,
 )
 
 
@@ -528,6 +554,13 @@ _LISTPOLICYREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='peer_asn_range', full_name='coord.api.ListPolicyRequest.peer_asn_range', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -550,8 +583,8 @@ _LISTPOLICYREQUEST = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=1075,
-  serialized_end=1269,
+  serialized_start=1108,
+  serialized_end=1328,
 )
 
 
@@ -605,6 +638,27 @@ _POLICY = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='peer_asn_range', full_name='coord.api.Policy.peer_asn_range', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='valid_from', full_name='coord.api.Policy.valid_from', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='valid_until', full_name='coord.api.Policy.valid_until', index=8,
+      number=9, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -622,8 +676,8 @@ _POLICY = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=1271,
-  serialized_end=1392,
+  serialized_start=1331,
+  serialized_end=1575,
 )
 
 
@@ -668,8 +722,8 @@ _SETPOLICIESREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1394,
-  serialized_end=1492,
+  serialized_start=1577,
+  serialized_end=1675,
 )
 
 
@@ -707,8 +761,408 @@ _SETPOLICIESRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1494,
-  serialized_end=1577,
+  serialized_start=1677,
+  serialized_end=1760,
+)
+
+
+_UPLOADPOLICIESREQUEST = _descriptor.Descriptor(
+  name='UploadPoliciesRequest',
+  full_name='coord.api.UploadPoliciesRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='policies', full_name='coord.api.UploadPoliciesRequest.policies', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='vlan', full_name='coord.api.UploadPoliciesRequest.vlan', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='continue_on_error', full_name='coord.api.UploadPoliciesRequest.continue_on_error', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1762,
+  serialized_end=1863,
+)
+
+
+_UPLOADPOLICIESRESPONSE = _descriptor.Descriptor(
+  name='UploadPoliciesResponse',
+  full_name='coord.api.UploadPoliciesResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rejected_policy', full_name='coord.api.UploadPoliciesResponse.rejected_policy', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='coord.api.UploadPoliciesResponse.error', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1865,
+  serialized_end=1948,
+)
+
+
+_COMPACTPOLICIESREQUEST = _descriptor.Descriptor(
+  name='CompactPoliciesRequest',
+  full_name='coord.api.CompactPoliciesRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='vlan', full_name='coord.api.CompactPoliciesRequest.vlan', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dry_run', full_name='coord.api.CompactPoliciesRequest.dry_run', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1950,
+  serialized_end=2005,
+)
+
+
+_COMPACTPOLICIESRESPONSE = _descriptor.Descriptor(
+  name='CompactPoliciesResponse',
+  full_name='coord.api.CompactPoliciesResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='policies', full_name='coord.api.CompactPoliciesResponse.policies', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='evaluations_before', full_name='coord.api.CompactPoliciesResponse.evaluations_before', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='evaluations_after', full_name='coord.api.CompactPoliciesResponse.evaluations_after', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2007,
+  serialized_end=2124,
+)
+
+
+_PEERINGOPPORTUNITIESREQUEST = _descriptor.Descriptor(
+  name='PeeringOpportunitiesRequest',
+  full_name='coord.api.PeeringOpportunitiesRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='vlan', full_name='coord.api.PeeringOpportunitiesRequest.vlan', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='after_asn', full_name='coord.api.PeeringOpportunitiesRequest.after_asn', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='page_size', full_name='coord.api.PeeringOpportunitiesRequest.page_size', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2126,
+  serialized_end=2207,
+)
+
+
+_PEERINGOPPORTUNITY = _descriptor.Descriptor(
+  name='PeeringOpportunity',
+  full_name='coord.api.PeeringOpportunity',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='asn', full_name='coord.api.PeeringOpportunity.asn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='coord.api.PeeringOpportunity.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='owner', full_name='coord.api.PeeringOpportunity.owner', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='isd', full_name='coord.api.PeeringOpportunity.isd', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2209,
+  serialized_end=2284,
+)
+
+
+_RESOLUTIONSTATUSREQUEST = _descriptor.Descriptor(
+  name='ResolutionStatusRequest',
+  full_name='coord.api.ResolutionStatusRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='vlan', full_name='coord.api.ResolutionStatusRequest.vlan', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2286,
+  serialized_end=2325,
+)
+
+
+_RESOLUTIONSTATUS_JOB = _descriptor.Descriptor(
+  name='Job',
+  full_name='coord.api.ResolutionStatus.Job',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='vlan', full_name='coord.api.ResolutionStatus.Job.vlan', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='coord.api.ResolutionStatus.Job.state', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _RESOLUTIONSTATUS_JOB_STATE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2478,
+  serialized_end=2586,
+)
+
+_RESOLUTIONSTATUS = _descriptor.Descriptor(
+  name='ResolutionStatus',
+  full_name='coord.api.ResolutionStatus',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='background', full_name='coord.api.ResolutionStatus.background', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='jobs', full_name='coord.api.ResolutionStatus.jobs', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='queue_length', full_name='coord.api.ResolutionStatus.queue_length', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='failed_jobs', full_name='coord.api.ResolutionStatus.failed_jobs', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='last_error', full_name='coord.api.ResolutionStatus.last_error', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_RESOLUTIONSTATUS_JOB, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2328,
+  serialized_end=2586,
 )
 
 _STREAMMESSAGEREQUEST.fields_by_name['arbitration'].message_type = _ARBITRATIONUPDATE
@@ -756,6 +1210,11 @@ _LISTPOLICYREQUEST.fields_by_name['peer_isd'].containing_oneof = _LISTPOLICYREQU
 _LISTPOLICYREQUEST.oneofs_by_name['peer'].fields.append(
   _LISTPOLICYREQUEST.fields_by_name['peer_everyone'])
 _LISTPOLICYREQUEST.fields_by_name['peer_everyone'].containing_oneof = _LISTPOLICYREQUEST.oneofs_by_name['peer']
+_LISTPOLICYREQUEST.oneofs_by_name['peer'].fields.append(
+  _LISTPOLICYREQUEST.fields_by_name['peer_asn_range'])
+_LISTPOLICYREQUEST.fields_by_name['peer_asn_range'].containing_oneof = _LISTPOLICYREQUEST.oneofs_by_name['peer']
+_POLICY.fields_by_name['valid_from'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_POLICY.fields_by_name['valid_until'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
 _POLICY.oneofs_by_name['peer'].fields.append(
   _POLICY.fields_by_name['peer_asn'])
 _POLICY.fields_by_name['peer_asn'].containing_oneof = _POLICY.oneofs_by_name['peer']
@@ -765,8 +1224,18 @@ _POLICY.fields_by_name['peer_owner'].containing_oneof = _POLICY.oneofs_by_name['
 _POLICY.oneofs_by_name['peer'].fields.append(
   _POLICY.fields_by_name['peer_isd'])
 _POLICY.fields_by_name['peer_isd'].containing_oneof = _POLICY.oneofs_by_name['peer']
+_POLICY.oneofs_by_name['peer'].fields.append(
+  _POLICY.fields_by_name['peer_asn_range'])
+_POLICY.fields_by_name['peer_asn_range'].containing_oneof = _POLICY.oneofs_by_name['peer']
 _SETPOLICIESREQUEST.fields_by_name['policies'].message_type = _POLICY
 _SETPOLICIESRESPONSE.fields_by_name['rejected_policies'].message_type = _POLICY
+_UPLOADPOLICIESREQUEST.fields_by_name['policies'].message_type = _POLICY
+_UPLOADPOLICIESRESPONSE.fields_by_name['rejected_policy'].message_type = _POLICY
+_COMPACTPOLICIESRESPONSE.fields_by_name['policies'].message_type = _POLICY
+_RESOLUTIONSTATUS_JOB.fields_by_name['state'].enum_type = _RESOLUTIONSTATUS_JOB_STATE
+_RESOLUTIONSTATUS_JOB.containing_type = _RESOLUTIONSTATUS
+_RESOLUTIONSTATUS_JOB_STATE.containing_type = _RESOLUTIONSTATUS_JOB
+_RESOLUTIONSTATUS.fields_by_name['jobs'].message_type = _RESOLUTIONSTATUS_JOB
 DESCRIPTOR.message_types_by_name['StreamMessageRequest'] = _STREAMMESSAGEREQUEST
 DESCRIPTOR.message_types_by_name['StreamMessageResponse'] = _STREAMMESSAGERESPONSE
 DESCRIPTOR.message_types_by_name['ArbitrationUpdate'] = _ARBITRATIONUPDATE
@@ -778,6 +1247,14 @@ DESCRIPTOR.message_types_by_name['ListPolicyRequest'] = _LISTPOLICYREQUEST
 DESCRIPTOR.message_types_by_name['Policy'] = _POLICY
 DESCRIPTOR.message_types_by_name['SetPoliciesRequest'] = _SETPOLICIESREQUEST
 DESCRIPTOR.message_types_by_name['SetPoliciesResponse'] = _SETPOLICIESRESPONSE
+DESCRIPTOR.message_types_by_name['UploadPoliciesRequest'] = _UPLOADPOLICIESREQUEST
+DESCRIPTOR.message_types_by_name['UploadPoliciesResponse'] = _UPLOADPOLICIESRESPONSE
+DESCRIPTOR.message_types_by_name['CompactPoliciesRequest'] = _COMPACTPOLICIESREQUEST
+DESCRIPTOR.message_types_by_name['CompactPoliciesResponse'] = _COMPACTPOLICIESRESPONSE
+DESCRIPTOR.message_types_by_name['PeeringOpportunitiesRequest'] = _PEERINGOPPORTUNITIESREQUEST
+DESCRIPTOR.message_types_by_name['PeeringOpportunity'] = _PEERINGOPPORTUNITY
+DESCRIPTOR.message_types_by_name['ResolutionStatusRequest'] = _RESOLUTIONSTATUSREQUEST
+DESCRIPTOR.message_types_by_name['ResolutionStatus'] = _RESOLUTIONSTATUS
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 StreamMessageRequest = _reflection.GeneratedProtocolMessageType('StreamMessageRequest', (_message.Message,), {
@@ -857,6 +1334,70 @@ SetPoliciesResponse = _reflection.GeneratedProtocolMessageType('SetPoliciesRespo
   })
 _sym_db.RegisterMessage(SetPoliciesResponse)
 
+UploadPoliciesRequest = _reflection.GeneratedProtocolMessageType('UploadPoliciesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _UPLOADPOLICIESREQUEST,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.UploadPoliciesRequest)
+  })
+_sym_db.RegisterMessage(UploadPoliciesRequest)
+
+UploadPoliciesResponse = _reflection.GeneratedProtocolMessageType('UploadPoliciesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _UPLOADPOLICIESRESPONSE,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.UploadPoliciesResponse)
+  })
+_sym_db.RegisterMessage(UploadPoliciesResponse)
+
+CompactPoliciesRequest = _reflection.GeneratedProtocolMessageType('CompactPoliciesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _COMPACTPOLICIESREQUEST,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.CompactPoliciesRequest)
+  })
+_sym_db.RegisterMessage(CompactPoliciesRequest)
+
+CompactPoliciesResponse = _reflection.GeneratedProtocolMessageType('CompactPoliciesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _COMPACTPOLICIESRESPONSE,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.CompactPoliciesResponse)
+  })
+_sym_db.RegisterMessage(CompactPoliciesResponse)
+
+PeeringOpportunitiesRequest = _reflection.GeneratedProtocolMessageType('PeeringOpportunitiesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PEERINGOPPORTUNITIESREQUEST,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.PeeringOpportunitiesRequest)
+  })
+_sym_db.RegisterMessage(PeeringOpportunitiesRequest)
+
+PeeringOpportunity = _reflection.GeneratedProtocolMessageType('PeeringOpportunity', (_message.Message,), {
+  'DESCRIPTOR' : _PEERINGOPPORTUNITY,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.PeeringOpportunity)
+  })
+_sym_db.RegisterMessage(PeeringOpportunity)
+
+ResolutionStatusRequest = _reflection.GeneratedProtocolMessageType('ResolutionStatusRequest', (_message.Message,), {
+  'DESCRIPTOR' : _RESOLUTIONSTATUSREQUEST,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.ResolutionStatusRequest)
+  })
+_sym_db.RegisterMessage(ResolutionStatusRequest)
+
+ResolutionStatus = _reflection.GeneratedProtocolMessageType('ResolutionStatus', (_message.Message,), {
+
+  'Job' : _reflection.GeneratedProtocolMessageType('Job', (_message.Message,), {
+    'DESCRIPTOR' : _RESOLUTIONSTATUS_JOB,
+    '__module__' : 'peering_coord.api.peering_pb2'
+    # @@protoc_insertion_point(class_scope:coord.api.ResolutionStatus.Job)
+    })
+  ,
+  'DESCRIPTOR' : _RESOLUTIONSTATUS,
+  '__module__' : 'peering_coord.api.peering_pb2'
+  # @@protoc_insertion_point(class_scope:coord.api.ResolutionStatus)
+  })
+_sym_db.RegisterMessage(ResolutionStatus)
+_sym_db.RegisterMessage(ResolutionStatus.Job)
+
 
 DESCRIPTOR._options = None
 
@@ -867,8 +1408,8 @@ _PEERING = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=1580,
-  serialized_end=2010,
+  serialized_start=2589,
+  serialized_end=3397,
   methods=[
   _descriptor.MethodDescriptor(
     name='StreamChannel',
@@ -930,6 +1471,46 @@ _PEERING = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='UploadPolicies',
+    full_name='coord.api.Peering.UploadPolicies',
+    index=6,
+    containing_service=None,
+    input_type=_UPLOADPOLICIESREQUEST,
+    output_type=_UPLOADPOLICIESRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='CompactPolicies',
+    full_name='coord.api.Peering.CompactPolicies',
+    index=7,
+    containing_service=None,
+    input_type=_COMPACTPOLICIESREQUEST,
+    output_type=_COMPACTPOLICIESRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ListPeeringOpportunities',
+    full_name='coord.api.Peering.ListPeeringOpportunities',
+    index=8,
+    containing_service=None,
+    input_type=_PEERINGOPPORTUNITIESREQUEST,
+    output_type=_PEERINGOPPORTUNITY,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetResolutionStatus',
+    full_name='coord.api.Peering.GetResolutionStatus',
+    index=9,
+    containing_service=None,
+    input_type=_RESOLUTIONSTATUSREQUEST,
+    output_type=_RESOLUTIONSTATUS,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_PEERING)
 
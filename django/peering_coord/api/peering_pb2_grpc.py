@@ -46,6 +46,26 @@ class PeeringStub(object):
                 request_serializer=peering__coord_dot_api_dot_peering__pb2.SetPoliciesRequest.SerializeToString,
                 response_deserializer=peering__coord_dot_api_dot_peering__pb2.SetPoliciesResponse.FromString,
                 )
+        self.UploadPolicies = channel.stream_stream(
+                '/coord.api.Peering/UploadPolicies',
+                request_serializer=peering__coord_dot_api_dot_peering__pb2.UploadPoliciesRequest.SerializeToString,
+                response_deserializer=peering__coord_dot_api_dot_peering__pb2.UploadPoliciesResponse.FromString,
+                )
+        self.CompactPolicies = channel.unary_unary(
+                '/coord.api.Peering/CompactPolicies',
+                request_serializer=peering__coord_dot_api_dot_peering__pb2.CompactPoliciesRequest.SerializeToString,
+                response_deserializer=peering__coord_dot_api_dot_peering__pb2.CompactPoliciesResponse.FromString,
+                )
+        self.ListPeeringOpportunities = channel.unary_stream(
+                '/coord.api.Peering/ListPeeringOpportunities',
+                request_serializer=peering__coord_dot_api_dot_peering__pb2.PeeringOpportunitiesRequest.SerializeToString,
+                response_deserializer=peering__coord_dot_api_dot_peering__pb2.PeeringOpportunity.FromString,
+                )
+        self.GetResolutionStatus = channel.unary_unary(
+                '/coord.api.Peering/GetResolutionStatus',
+                request_serializer=peering__coord_dot_api_dot_peering__pb2.ResolutionStatusRequest.SerializeToString,
+                response_deserializer=peering__coord_dot_api_dot_peering__pb2.ResolutionStatus.FromString,
+                )
 
 
 class PeeringServicer(object):
@@ -97,6 +117,42 @@ class PeeringServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UploadPolicies(self, request_iterator, context):
+        """Replace existing policies in one or all VLANs like SetPolicies, but upload the policies in a
+        stream of chunks. Rejected policies are streamed back while the upload is in progress. All
+        changes are committed at the end of the upload. If some of the policies are rejected, the RPC
+        fails with status INVALID_ARGUMENT and has no effect unless continue_on_error is true.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CompactPolicies(self, request, context):
+        """Delete the policies of the AS making the request which have no effect on the peers it
+        accepts, e.g., AS policies deciding the same as the owner or ISD policy matching the peer.
+        All redundant policies are deleted in a single transaction.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListPeeringOpportunities(self, request, context):
+        """List the ASes in a VLAN which accept the AS making the request as peer, but are not accepted
+        by it in return. The ASes are streamed in the order of their ASNs.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetResolutionStatus(self, request, context):
+        """Report the progress of resolving policy changes of the AS making the request into links.
+        Only meaningful if the coordinator resolves policy changes in the background. Otherwise, all
+        changes have been resolved by the time the policy RPCs return.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_PeeringServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -130,6 +186,26 @@ def add_PeeringServicer_to_server(servicer, server):
                     request_deserializer=peering__coord_dot_api_dot_peering__pb2.SetPoliciesRequest.FromString,
                     response_serializer=peering__coord_dot_api_dot_peering__pb2.SetPoliciesResponse.SerializeToString,
             ),
+            'UploadPolicies': grpc.stream_stream_rpc_method_handler(
+                    servicer.UploadPolicies,
+                    request_deserializer=peering__coord_dot_api_dot_peering__pb2.UploadPoliciesRequest.FromString,
+                    response_serializer=peering__coord_dot_api_dot_peering__pb2.UploadPoliciesResponse.SerializeToString,
+            ),
+            'CompactPolicies': grpc.unary_unary_rpc_method_handler(
+                    servicer.CompactPolicies,
+                    request_deserializer=peering__coord_dot_api_dot_peering__pb2.CompactPoliciesRequest.FromString,
+                    response_serializer=peering__coord_dot_api_dot_peering__pb2.CompactPoliciesResponse.SerializeToString,
+            ),
+            'ListPeeringOpportunities': grpc.unary_stream_rpc_method_handler(
+                    servicer.ListPeeringOpportunities,
+                    request_deserializer=peering__coord_dot_api_dot_peering__pb2.PeeringOpportunitiesRequest.FromString,
+                    response_serializer=peering__coord_dot_api_dot_peering__pb2.PeeringOpportunity.SerializeToString,
+            ),
+            'GetResolutionStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetResolutionStatus,
+                    request_deserializer=peering__coord_dot_api_dot_peering__pb2.ResolutionStatusRequest.FromString,
+                    response_serializer=peering__coord_dot_api_dot_peering__pb2.ResolutionStatus.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'coord.api.Peering', rpc_method_handlers)
@@ -242,3 +318,71 @@ class Peering(object):
             peering__coord_dot_api_dot_peering__pb2.SetPoliciesResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def UploadPolicies(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/coord.api.Peering/UploadPolicies',
+            peering__coord_dot_api_dot_peering__pb2.UploadPoliciesRequest.SerializeToString,
+            peering__coord_dot_api_dot_peering__pb2.UploadPoliciesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def CompactPolicies(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/coord.api.Peering/CompactPolicies',
+            peering__coord_dot_api_dot_peering__pb2.CompactPoliciesRequest.SerializeToString,
+            peering__coord_dot_api_dot_peering__pb2.CompactPoliciesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ListPeeringOpportunities(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/coord.api.Peering/ListPeeringOpportunities',
+            peering__coord_dot_api_dot_peering__pb2.PeeringOpportunitiesRequest.SerializeToString,
+            peering__coord_dot_api_dot_peering__pb2.PeeringOpportunity.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetResolutionStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/coord.api.Peering/GetResolutionStatus',
+            peering__coord_dot_api_dot_peering__pb2.ResolutionStatusRequest.SerializeToString,
+            peering__coord_dot_api_dot_peering__pb2.ResolutionStatus.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
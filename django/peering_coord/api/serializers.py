@@ -1,14 +1,18 @@
 """Serializers for the gRPC APIs"""
 
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
 from rest_framework import serializers
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.utils import timezone
 from django_grpc_framework import proto_serializers
 
 from peering_coord.api import peering_pb2
 from peering_coord.models.ixp import VLAN, Owner
 from peering_coord.models.scion import AS, ISD
 from peering_coord.models.policies import (
-    AsPeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
-from peering_coord.scion_addr import ASN
+    AsPeerPolicy, AsRangePeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy, PeerPolicy)
+from peering_coord.scion_addr import ASN, AsnRange, AsnRangeIndex
 
 
 class VlanRelatedField(serializers.RelatedField):
@@ -71,6 +75,17 @@ class IsdRelatedField(serializers.RelatedField):
         return ISD.objects.get_queryset()
 
 
+class AsnRangeField(serializers.Field):
+    def to_representation(self, value):
+        return str(value)
+
+    def to_internal_value(self, data):
+        try:
+            return AsnRange.parse(data)
+        except ValueError:
+            raise serializers.ValidationError("Invalid ASN range.")
+
+
 class PolicyProtoSerializer(proto_serializers.ProtoSerializer):
     """Django REST/gRPC framework serializer for policies. Creates the correct policy ORM model
     depending on policy type in the protocol buffer representation.
@@ -78,17 +93,24 @@ class PolicyProtoSerializer(proto_serializers.ProtoSerializer):
     class Meta:
         proto_class = peering_pb2.Policy
 
-    vlan = VlanRelatedField()
+    vlan = VlanRelatedField(allow_null=True)
     asn = AsRelatedField(source='asys')
     accept = serializers.BooleanField()
 
     peer_asn = AsRelatedField(source='peer_as', required=False)
     peer_owner = OwnerRelatedField(required=False)
     peer_isd = IsdRelatedField(required=False)
+    peer_asn_range = AsnRangeField(required=False)
+
+    valid_from = serializers.DateTimeField(required=False, allow_null=True)
+    valid_until = serializers.DateTimeField(required=False, allow_null=True)
 
     def create(self, validated_data):
+        validated_data = self._expand_asn_range(validated_data)
         if 'peer_as' in validated_data:
             return AsPeerPolicy.objects.create(**validated_data)
+        elif 'peer_asn_first' in validated_data:
+            return AsRangePeerPolicy.objects.create(**validated_data)
         elif 'peer_owner' in validated_data:
             return OwnerPeerPolicy.objects.create(**validated_data)
         elif 'peer_isd' in validated_data:
@@ -97,12 +119,361 @@ class PolicyProtoSerializer(proto_serializers.ProtoSerializer):
             return DefaultPolicy.objects.create(**validated_data)
 
     def get(self):
-        """Get an existing policy from the DB."""
-        if 'peer_as' in self.validated_data:
-            return AsPeerPolicy.objects.get(**self.validated_data)
-        elif 'peer_owner' in self.validated_data:
-            return OwnerPeerPolicy.objects.get(**self.validated_data)
-        elif 'peer_isd' in self.validated_data:
-            return IsdPeerPolicy.objects.get(**self.validated_data)
+        """Get an existing policy from the DB. The validity period is not compared."""
+        validated_data = self._expand_asn_range(self.validated_data)
+        validated_data = {name: value for name, value in validated_data.items()
+            if name not in ('valid_from', 'valid_until')}
+        if 'peer_as' in validated_data:
+            return AsPeerPolicy.objects.get(**validated_data)
+        elif 'peer_asn_first' in validated_data:
+            return AsRangePeerPolicy.objects.get(**validated_data)
+        elif 'peer_owner' in validated_data:
+            return OwnerPeerPolicy.objects.get(**validated_data)
+        elif 'peer_isd' in validated_data:
+            return IsdPeerPolicy.objects.get(**validated_data)
         else:
-            return DefaultPolicy.objects.get(**self.validated_data)
+            return DefaultPolicy.objects.get(**validated_data)
+
+    @staticmethod
+    def _expand_asn_range(validated_data):
+        """Replace the ASN range by the model fields holding its bounds."""
+        if 'peer_asn_range' not in validated_data:
+            return validated_data
+        validated_data = dict(validated_data)
+        asn_range = validated_data.pop('peer_asn_range')
+        validated_data['peer_asn_first'] = asn_range.first
+        validated_data['peer_asn_last'] = asn_range.last
+        return validated_data
+
+
+class PolicyBatch:
+    """Bulk alternative to PolicyProtoSerializer for validating and creating many policies at once.
+
+    All VLANs, ASes, owners and ISDs referenced by a batch of policies are resolved with a single
+    query per model (see `resolve()`). Policies are then validated in memory one by one and finally
+    inserted with one `bulk_create()` per policy type. Validation reports the same errors as
+    PolicyProtoSerializer and the model validation of the policies would. The ASN ranges of every
+    AS and VLAN are tracked in an AsnRangeIndex to detect overlapping range policies.
+
+    Policies in the batch are checked for uniqueness among themselves, but not against policies
+    already in the database. Callers are expected to remove conflicting policies beforehand or
+    use `remove_stored()`. A policy for all VLANs conflicts with the policies for the same peers in
+    every single VLAN.
+    """
+    POLICY_TYPES = [DefaultPolicy, AsPeerPolicy, AsRangePeerPolicy, OwnerPeerPolicy, IsdPeerPolicy]
+    # Attributes stored by a policy in addition to its VLAN, AS and peer(s)
+    VALUE_FIELDS = ('accept', 'valid_from', 'valid_until')
+    # Maximum number of IDs passed to a single query.
+    MAX_QUERY_IDS = 500
+
+    def __init__(self):
+        self._vlans: Dict[str, Optional[VLAN]] = {}
+        self._ases: Dict[str, Optional[AS]] = {}
+        self._owners: Dict[str, Optional[Owner]] = {}
+        self._isds: Dict[str, Optional[ISD]] = {}
+        # VLAN IDs of the policies in the batch by policy type, AS and peer
+        self._keys: Dict[Tuple, Set[Optional[int]]] = {}
+        # ASN ranges of the range policies in the batch by AS and VLAN
+        self._ranges: Dict[int, Dict[Optional[int], AsnRangeIndex]] = {}
+        self.policies: Dict[type, List[PeerPolicy]] = {
+            policy_type: [] for policy_type in self.POLICY_TYPES}
+
+    def __len__(self):
+        return sum(len(policies) for policies in self.policies.values())
+
+    def resolve(self, messages: Iterable[peering_pb2.Policy]) -> None:
+        """Fetch all objects referenced by the given policies which have not been resolved by an
+        earlier call yet.
+        """
+        vlans, asns, owners, isds = set(), set(), set(), set()
+        for msg in messages:
+            if msg.vlan:
+                vlans.add(msg.vlan)
+            asns.add(msg.asn)
+            peer = msg.WhichOneof('peer')
+            if peer == 'peer_asn':
+                asns.add(msg.peer_asn)
+            elif peer == 'peer_owner':
+                owners.add(msg.peer_owner)
+            elif peer == 'peer_isd':
+                isds.add(msg.peer_isd)
+
+        vlans.difference_update(self._vlans)
+        if vlans:
+            self._vlans.update(dict.fromkeys(vlans))
+            for names in self._chunks(list(vlans)):
+                self._vlans.update(
+                    (vlan.name, vlan) for vlan in VLAN.objects.filter(name__in=names))
+
+        asns.difference_update(self._ases)
+        if asns:
+            self._ases.update(dict.fromkeys(asns))
+            parsed = {}
+            for asn in asns:
+                try:
+                    parsed[ASN(asn)] = asn
+                except ValueError:
+                    pass
+            for parsed_asns in self._chunks(list(parsed)):
+                for asys in AS.objects.filter(asn__in=parsed_asns).select_related('isd'):
+                    self._ases[parsed[asys.asn]] = asys
+
+        owners.difference_update(self._owners)
+        if owners:
+            self._owners.update(dict.fromkeys(owners))
+            for names in self._chunks(list(owners)):
+                self._owners.update(
+                    (owner.name, owner) for owner in Owner.objects.filter(name__in=names))
+
+        isds.difference_update(self._isds)
+        if isds:
+            self._isds.update(dict.fromkeys(isds))
+            parsed = {}
+            for isd in isds:
+                try:
+                    parsed[int(isd)] = isd
+                except ValueError:
+                    pass
+            for isd_ids in self._chunks(list(parsed)):
+                for isd in ISD.objects.filter(isd_id__in=isd_ids):
+                    self._isds[parsed[isd.isd_id]] = isd
+
+    def add(self, msg: peering_pb2.Policy) -> PeerPolicy:
+        """Validate a policy and add it to the batch. The policy's references must have been
+        resolved by `resolve()` before.
+
+        :returns: The unsaved policy model instance.
+        :raises serializers.ValidationError: Policy references invalid or non-existent objects.
+        :raises ValidationError: Model validation failed.
+        """
+        errors = {}
+        fields = {'accept': msg.accept}
+        for name in ('valid_from', 'valid_until'):
+            if msg.HasField(name):
+                fields[name] = getattr(msg, name).ToDatetime(tzinfo=timezone.utc)
+
+        fields['vlan'] = self._vlans.get(msg.vlan) if msg.vlan else None
+        if msg.vlan and fields['vlan'] is None:
+            errors['vlan'] = ["VLAN does not exist."]
+        fields['asys'] = self._lookup_as(msg.asn, 'asn', errors)
+
+        peer = msg.WhichOneof('peer')
+        if peer == 'peer_asn':
+            policy_type = AsPeerPolicy
+            fields['peer_as'] = self._lookup_as(msg.peer_asn, 'peer_asn', errors)
+        elif peer == 'peer_owner':
+            policy_type = OwnerPeerPolicy
+            fields['peer_owner'] = self._owners.get(msg.peer_owner)
+            if fields['peer_owner'] is None:
+                errors['peer_owner'] = ["Owner does not exist."]
+        elif peer == 'peer_asn_range':
+            policy_type = AsRangePeerPolicy
+            try:
+                asn_range = AsnRange.parse(msg.peer_asn_range)
+            except ValueError:
+                errors['peer_asn_range'] = ["Invalid ASN range."]
+            else:
+                fields['peer_asn_first'], fields['peer_asn_last'] = asn_range
+        elif peer == 'peer_isd':
+            policy_type = IsdPeerPolicy
+            fields['peer_isd'] = self._isds.get(msg.peer_isd)
+            if fields['peer_isd'] is None:
+                try:
+                    int(msg.peer_isd)
+                    errors['peer_isd'] = ["ISD does not exist."]
+                except ValueError:
+                    errors['peer_isd'] = ["Invalid ISD."]
+        else:
+            policy_type = DefaultPolicy
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        policy = policy_type(**fields)
+        # Foreign keys have been resolved above, validating them again would query the database.
+        policy.full_clean(exclude=[name for name in fields if name not in self.VALUE_FIELDS],
+            validate_unique=False)
+
+        vlan_ids = self._keys.setdefault((policy_type, policy.asys_id) + tuple(
+            getattr(policy, name) for name in self._peer_fields(policy_type)), set())
+        if any(self._share_vlan(policy.vlan_id, vlan_id) for vlan_id in vlan_ids):
+            raise self._unique_error(policy)
+        if policy_type is AsRangePeerPolicy:
+            ranges = self._ranges.setdefault(policy.asys_id, {})
+            overlapping = self._find_overlapping(ranges, policy)
+            if overlapping is not None:
+                raise policy.overlap_error(overlapping[0])
+            ranges.setdefault(policy.vlan_id, AsnRangeIndex()).add(policy.peer_asn_range, policy)
+        vlan_ids.add(policy.vlan_id)
+
+        self.policies[policy_type].append(policy)
+        return policy
+
+    def bulk_create(self) -> None:
+        """Insert all policies of the batch into the database."""
+        for policy_type, policies in self.policies.items():
+            policy_type.objects.bulk_create(policies)
+
+    def remove_stored(self, exclude_vlan: Optional[VLAN] = None
+            ) -> List[Tuple[PeerPolicy, ValidationError]]:
+        """Remove the policies which conflict with policies in the database from the batch.
+
+        :param exclude_vlan: Ignore the stored policies of this VLAN, e.g., because the batch is
+                             going to replace them.
+        :returns: The removed policies paired with an error describing the conflict.
+        """
+        removed = []
+        for policy_type, policies in self.policies.items():
+            if not policies:
+                continue
+            peer_fields = self._peer_fields(policy_type)
+            # Stored ASN ranges are only selected by AS.
+            selected_fields = peer_fields if policy_type is not AsRangePeerPolicy else ()
+
+            # VLANs of the stored policies by AS and peer and stored ASN ranges by AS and VLAN
+            stored_keys: Dict[Tuple, Set[Optional[int]]] = {}
+            stored_ranges: Dict[int, Dict[Optional[int], AsnRangeIndex]] = {}
+            fetched: Set[int] = set()
+            for chunk in self._chunks(policies, self.MAX_QUERY_IDS // (1 + len(selected_fields))):
+                selection = {'asys_id__in': {policy.asys_id for policy in chunk}}
+                for peer_field in selected_fields:
+                    selection[peer_field + '__in'] = {
+                        getattr(policy, peer_field) for policy in chunk}
+                stored = policy_type.objects.filter(**selection)
+                if exclude_vlan is not None:
+                    stored = stored.exclude(vlan=exclude_vlan)
+
+                for policy_id, vlan_id, asys_id, *peer in stored.values_list(
+                        'id', 'vlan_id', 'asys_id', *peer_fields):
+                    # Chunks can select the same policies.
+                    if policy_id in fetched:
+                        continue
+                    fetched.add(policy_id)
+                    stored_keys.setdefault((asys_id, *peer), set()).add(vlan_id)
+                    if policy_type is AsRangePeerPolicy:
+                        stored_ranges.setdefault(asys_id, {}).setdefault(
+                            vlan_id, AsnRangeIndex()).add(AsnRange(*peer), None)
+
+            remaining = []
+            for policy in policies:
+                vlan_ids = stored_keys.get((policy.asys_id,) + tuple(
+                    getattr(policy, name) for name in peer_fields), ())
+                overlapping = None
+                if policy.asys_id in stored_ranges:
+                    overlapping = self._find_overlapping(stored_ranges[policy.asys_id], policy)
+                if any(self._share_vlan(policy.vlan_id, vlan_id) for vlan_id in vlan_ids):
+                    removed.append((policy, self._unique_error(policy)))
+                elif overlapping is not None:
+                    removed.append((policy, policy.overlap_error(overlapping[0])))
+                else:
+                    remaining.append(policy)
+            self.policies[policy_type] = remaining
+
+        return removed
+
+    def replace(self, asys: AS, vlan: Optional[VLAN] = None) -> Set[int]:
+        """Replace the policies of an AS in the database with the policies in the batch.
+
+        Only rows that actually differ are touched: Stored policies missing from the batch are
+        deleted, policies whose accept flag or validity period differs are updated and new policies
+        are inserted.
+
+        :param asys: AS whose policies are replaced. The batch must only contain policies of this
+                     AS.
+        :param vlan: If given, only policies in this VLAN are replaced. The batch must only contain
+                     policies for this VLAN.
+        :returns: IDs of the VLANs in which policies have changed. None stands for policies applying
+                  to all VLANs.
+        """
+        changed_vlans = set()
+
+        for policy_type, policies in self.policies.items():
+            peer_fields = self._peer_fields(policy_type)
+            stored = policy_type.objects.filter(asys=asys)
+            if vlan is not None:
+                stored = stored.filter(vlan=vlan)
+            values = len(self.VALUE_FIELDS)
+            stored = {
+                tuple(row[1:-values]): (row[0], tuple(row[-values:]))
+                for row in stored.values_list(
+                    'id', 'vlan_id', *peer_fields, *self.VALUE_FIELDS)
+            }
+
+            create = []
+            # Values -> IDs of the stored policies to update to them
+            update: Dict[Tuple, List[int]] = {}
+            for policy in policies:
+                key = (policy.vlan_id,) + tuple(getattr(policy, name) for name in peer_fields)
+                new_values = tuple(getattr(policy, name) for name in self.VALUE_FIELDS)
+                try:
+                    policy_id, old_values = stored.pop(key)
+                except KeyError:
+                    create.append(policy)
+                    changed_vlans.add(policy.vlan_id)
+                else:
+                    if old_values != new_values:
+                        update.setdefault(new_values, []).append(policy_id)
+                        changed_vlans.add(policy.vlan_id)
+
+            delete = []
+            for (vlan_id, *_), (policy_id, _) in stored.items():
+                delete.append(policy_id)
+                changed_vlans.add(vlan_id)
+
+            for ids in self._chunks(delete):
+                policy_type.objects.filter(id__in=ids).delete()
+            for new_values, policy_ids in update.items():
+                for ids in self._chunks(policy_ids):
+                    policy_type.objects.filter(id__in=ids).update(
+                        **dict(zip(self.VALUE_FIELDS, new_values)))
+            policy_type.objects.bulk_create(create)
+
+        return changed_vlans
+
+    @staticmethod
+    def _share_vlan(vlan_id: Optional[int], other_vlan_id: Optional[int]) -> bool:
+        """Check whether policies of the given VLANs (None for all VLANs) apply to a common VLAN."""
+        return vlan_id is None or other_vlan_id is None or vlan_id == other_vlan_id
+
+    @classmethod
+    def _find_overlapping(cls, ranges: Dict[Optional[int], AsnRangeIndex],
+            policy: AsRangePeerPolicy) -> Optional[Tuple[AsnRange, Any]]:
+        """Find a range overlapping the range of `policy` in the ranges of its AS by VLAN."""
+        for vlan_id, index in ranges.items():
+            if cls._share_vlan(policy.vlan_id, vlan_id):
+                overlapping = index.find_overlapping(policy.peer_asn_range)
+                if overlapping is not None:
+                    return overlapping
+        return None
+
+    @classmethod
+    def _unique_error(cls, policy: PeerPolicy) -> ValidationError:
+        unique_check = ['vlan', 'asys']
+        unique_check.extend(PeerPolicy.PEER_FIELDS[policy.scope])
+        return ValidationError({NON_FIELD_ERRORS: [
+            policy.unique_error_message(type(policy), unique_check)]})
+
+    @staticmethod
+    def _peer_fields(policy_type: type) -> Tuple[str, ...]:
+        """Attribute names of the fields identifying the peer(s) of a policy type (see
+        `PeerPolicy.PEER_FIELDS`).
+        """
+        return tuple(policy_type._meta.get_field(name).attname
+            for name in PeerPolicy.PEER_FIELDS[policy_type.SCOPE])
+
+    @classmethod
+    def _chunks(cls, items: List, size: Optional[int] = None) -> Iterable[List]:
+        size = size or cls.MAX_QUERY_IDS
+        for i in range(0, len(items), size):
+            yield items[i:i + size]
+
+    def _lookup_as(self, asn: str, field: str, errors: Dict[str, List[str]]) -> Optional[AS]:
+        asys = self._ases.get(asn)
+        if asys is None:
+            try:
+                ASN(asn)
+            except ValueError:
+                errors[field] = ["Invalid ASN."]
+            else:
+                errors[field] = ["AS does not exist."]
+        return asys
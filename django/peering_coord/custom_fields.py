@@ -7,7 +7,7 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from django.forms import CharField
 
-from peering_coord.scion_addr import ASN
+from peering_coord.scion_addr import ASN, intern_asn
 
 
 IpAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
@@ -29,9 +29,11 @@ class AsnField(models.Field):
     def from_db_value(self, value: Optional[int], expression, connection) -> Optional[ASN]:
         if value is None:
             return value
-        return ASN(value)
+        return intern_asn(value)
 
-    def get_prep_value(self, value: ASN) -> int:
+    def get_prep_value(self, value: Optional[ASN]) -> Optional[int]:
+        if value is None:
+            return value
         return int(value)
 
     def to_python(self, value: Union[None, int, str, ASN]) -> Optional[ASN]:
@@ -46,31 +48,67 @@ class AsnField(models.Field):
                 code='invalid_asn', params={'value': value, 'msg': str(e)})
 
 
+# Prefix of IPv4-mapped IPv6 addresses
+_IPV4_MAPPED_PREFIX = bytes(10) + b"\xff\xff"
+
+
+def _pack_ip_address(ip: IpAddress) -> bytes:
+    """Returns the 16 byte binary representation of an IP address. IPv4 addresses are mapped into
+    the IPv6 address space (::ffff:0:0/96), so the binary representation of all addresses in a
+    subnet sorts in the same order as the addresses themselves.
+    """
+    if ip.version == 4:
+        return _IPV4_MAPPED_PREFIX + ip.packed
+    else:
+        return ip.packed
+
+
+def _unpack_ip_address(data: bytes) -> IpAddress:
+    """Inverse of _pack_ip_address()."""
+    ip = ipaddress.IPv6Address(bytes(data[:16]))
+    return ip.ipv4_mapped or ip
+
+
 class IpAddressField(models.Field):
     """IPv4/6 address as ipaddress.IPv4Address or ipaddress.IPv6Address.
-    Stored in the DB as char(39).
+    Stored in the DB as inet on PostgreSQL and as a 16 byte blob on other databases (see
+    _pack_ip_address()).
     """
     description = "IP address"
 
     def db_type(self, connection):
-        return 'char(39)'
+        if connection.vendor == 'postgresql':
+            return 'inet'
+        else:
+            return 'blob'
 
     def formfield(self, **kwargs):
         defaults = {'form_class': CharField}
         defaults.update(kwargs)
         return super().formfield(**defaults)
 
-    def from_db_value(self, value: Optional[str], expression, connection) -> Optional[IpAddress]:
+    def from_db_value(self, value, expression, connection) -> Optional[IpAddress]:
         if value is None:
             return value
-        # FIXME: rstrip is required to make this work with Postgres for some reason
-        return ipaddress.ip_address(value.rstrip())
+        if isinstance(value, str):
+            return ipaddress.ip_address(value)
+        return _unpack_ip_address(value)
 
-    def get_prep_value(self, value: IpAddress) -> str:
-        return value.exploded
+    def get_prep_value(self, value: Union[None, str, IpAddress]) -> Optional[IpAddress]:
+        return self.to_python(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None:
+            return value
+        if connection.vendor == 'postgresql':
+            return str(value)
+        else:
+            return _pack_ip_address(value)
 
     def value_to_string(self, obj) -> str:
-        return self.get_prep_value(self.value_from_object(obj))
+        return self.value_from_object(obj).exploded
 
     def to_python(self, value: Union[None, str, IpAddress]) -> Optional[IpAddress]:
         if isinstance(value, ipaddress.IPv4Address) or isinstance(value, ipaddress.IPv6Address):
@@ -84,33 +122,70 @@ class IpAddressField(models.Field):
                 code='invalid_ip', params={'value': value, 'msg': str(e)})
 
 
+@IpAddressField.register_lookup
+class InNetwork(models.Lookup):
+    """Lookup for IP addresses from a certain subnet.
+
+    Example: `Interface.objects.filter(public_ip__in_network=vlan.ip_network)`
+    """
+    lookup_name = 'in_network'
+    prepare_rhs = False
+
+    def get_prep_lookup(self):
+        return ipaddress.ip_network(self.rhs)
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        if connection.vendor == 'postgresql':
+            return "%s <<= %%s::cidr" % lhs, lhs_params + [str(self.rhs)]
+        else:
+            params = [_pack_ip_address(self.rhs.network_address),
+                      _pack_ip_address(self.rhs.broadcast_address)]
+            return "%s BETWEEN %%s AND %%s" % lhs, lhs_params + params
+
+
 class IpNetworkField(models.Field):
     """IPv4/6 network definition as ipaddress.IPv4Network or ipaddress.IPv6Network.
-    Stored in the DB as char(48).
+    Stored in the DB as cidr on PostgreSQL and as a 17 byte blob (network address as returned by
+    _pack_ip_address() followed by the prefix length) on other databases.
     """
     description = "IP network"
 
     def db_type(self, connection):
-        return 'char(48)'
+        if connection.vendor == 'postgresql':
+            return 'cidr'
+        else:
+            return 'blob'
 
     def formfield(self, **kwargs):
         defaults = {'form_class': CharField}
         defaults.update(kwargs)
         return super().formfield(**defaults)
 
-    def from_db_value(self, value: Optional[str], expression, connection) -> Optional[IpNetwork]:
+    def from_db_value(self, value, expression, connection) -> Optional[IpNetwork]:
         if value is None:
             return value
-        # FIXME: rstrip is required to make this work with Postgres for some reason
-        return ipaddress.ip_network(value.rstrip())
+        if isinstance(value, str):
+            return ipaddress.ip_network(value)
+        return ipaddress.ip_network((_unpack_ip_address(value), value[16]))
+
+    def get_prep_value(self, value: Union[None, str, IpNetwork]) -> Optional[IpNetwork]:
+        return self.to_python(value)
 
-    def get_prep_value(self, value: IpNetwork) -> str:
-        return value.exploded
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None:
+            return value
+        if connection.vendor == 'postgresql':
+            return str(value)
+        else:
+            return _pack_ip_address(value.network_address) + bytes([value.prefixlen])
 
     def value_to_string(self, obj) -> str:
-        return self.get_prep_value(self.value_from_object(obj))
+        return self.value_from_object(obj).exploded
 
-    def to_python(self, value: Union[None, str, IpAddress]) -> Optional[IpNetwork]:
+    def to_python(self, value: Union[None, str, IpNetwork]) -> Optional[IpNetwork]:
         if isinstance(value, ipaddress.IPv4Network) or isinstance(value, ipaddress.IPv6Network):
             return value
         if value is None:
@@ -0,0 +1,46 @@
+"""grpcrunserver with optional background resolution of policy changes and the policy scheduler"""
+
+from django_grpc_framework.management.commands import grpcrunserver
+
+from peering_coord.policy_scheduler import PolicyScheduler
+from peering_coord.resolution_queue import ResolutionQueue
+
+
+class Command(grpcrunserver.Command):
+    help = ('Starts a gRPC server, optionally resolving policy changes in the background. '
+        'Time-limited policies are activated and expired by the policy scheduler.')
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--resolver-workers', type=int, default=0, dest='resolver_workers',
+            help=(
+                'Number of threads resolving policy changes in the background. If 0 (the '
+                'default), policy RPCs resolve changes before they return.'
+            )
+        )
+        parser.add_argument(
+            '--scheduler-tick', type=float, default=1.0, dest='scheduler_tick',
+            help=(
+                'Resolution in seconds of the scheduler activating and expiring time-limited '
+                'policies. 0 disables the scheduler.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        self.resolver_workers = options['resolver_workers']
+        self.scheduler_tick = options['scheduler_tick']
+        super().handle(*args, **options)
+
+    def _serve(self):
+        if self.resolver_workers > 0:
+            ResolutionQueue.start(self.resolver_workers)
+        if self.scheduler_tick > 0:
+            PolicyScheduler.start(self.scheduler_tick)
+        try:
+            super()._serve()
+        finally:
+            if self.scheduler_tick > 0:
+                PolicyScheduler.stop()
+            if self.resolver_workers > 0:
+                ResolutionQueue.stop()
@@ -0,0 +1,41 @@
+# Generated by Django 3.2.7 on 2026-10-19 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='acceptedpeer',
+            index=models.Index(fields=['vlan', 'asys', 'peer'], name='accepted_peer_by_asys'),
+        ),
+        migrations.AddIndex(
+            model_name='acceptedpeer',
+            index=models.Index(fields=['vlan', 'peer', 'asys'], name='accepted_peer_by_peer'),
+        ),
+        migrations.AddIndex(
+            model_name='aspeerpolicy',
+            index=models.Index(fields=['vlan', 'asys', 'accept'], name='aspeerpolicy_by_asys'),
+        ),
+        migrations.AddIndex(
+            model_name='defaultpolicy',
+            index=models.Index(fields=['vlan', 'asys', 'accept'], name='defaultpolicy_by_asys'),
+        ),
+        migrations.AddIndex(
+            model_name='isdpeerpolicy',
+            index=models.Index(fields=['vlan', 'asys', 'accept'], name='isdpeerpolicy_by_asys'),
+        ),
+        migrations.AddIndex(
+            model_name='link',
+            index=models.Index(fields=['interface_b', 'interface_a'], name='link_by_interface_b'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerpeerpolicy',
+            index=models.Index(fields=['vlan', 'asys', 'accept'], name='ownerpeerpolicy_by_asys'),
+        ),
+    ]
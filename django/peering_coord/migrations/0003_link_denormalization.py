@@ -0,0 +1,64 @@
+# Generated by Django 3.2.7 on 2026-10-19 07:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_link_columns(apps, schema_editor):
+    """Copy VLAN and ASes of existing links from their interfaces."""
+    Link = apps.get_model('peering_coord', 'Link')
+    for link in Link.objects.select_related(
+            'interface_a__peering_client', 'interface_b__peering_client').all():
+        link.vlan_id = link.interface_a.vlan_id
+        link.as_a_id = link.interface_a.peering_client.asys_id
+        link.as_b_id = link.interface_b.peering_client.asys_id
+        link.save(update_fields=['vlan', 'as_a', 'as_b'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0002_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='link',
+            name='as_a',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as', verbose_name='AS A'),
+        ),
+        migrations.AddField(
+            model_name='link',
+            name='as_b',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as', verbose_name='AS B'),
+        ),
+        migrations.AddField(
+            model_name='link',
+            name='vlan',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='links', to='peering_coord.vlan', verbose_name='VLAN'),
+        ),
+        migrations.RunPython(fill_link_columns, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='link',
+            name='as_a',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as', verbose_name='AS A'),
+        ),
+        migrations.AlterField(
+            model_name='link',
+            name='as_b',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as', verbose_name='AS B'),
+        ),
+        migrations.AlterField(
+            model_name='link',
+            name='vlan',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='links', to='peering_coord.vlan', verbose_name='VLAN'),
+        ),
+        migrations.AddIndex(
+            model_name='link',
+            index=models.Index(fields=['as_a', 'vlan', 'as_b'], name='link_by_as_a'),
+        ),
+        migrations.AddIndex(
+            model_name='link',
+            index=models.Index(fields=['as_b', 'vlan', 'as_a'], name='link_by_as_b'),
+        ),
+    ]
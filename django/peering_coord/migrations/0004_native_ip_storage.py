@@ -0,0 +1,97 @@
+# Generated by Django 3.2.7 on 2026-10-19 07:19
+
+from django.db import migrations, models
+import peering_coord.custom_fields
+
+
+IP_COLUMNS = [
+    ('interface', 'public_ip', peering_coord.custom_fields.IpAddressField),
+    ('vlan', 'ip_network', peering_coord.custom_fields.IpNetworkField),
+]
+
+
+def _ip_columns(apps, schema_editor):
+    qn = schema_editor.quote_name
+    for model_name, field_name, field_class in IP_COLUMNS:
+        model = apps.get_model('peering_coord', model_name)
+        column = model._meta.get_field(field_name).column
+        yield qn(model._meta.db_table), qn(column), field_class(name=field_name)
+
+
+def strip_char_padding(apps, schema_editor):
+    """PostgreSQL pads char(n) columns with spaces, which cannot be cast to inet/cidr directly."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column, _ in _ip_columns(apps, schema_editor):
+        schema_editor.execute("ALTER TABLE %s ALTER COLUMN %s TYPE varchar USING rtrim(%s::text)"
+            % (table, column, column))
+
+
+def pack_addresses(apps, schema_editor):
+    """Convert IP addresses stored as text to the binary representation used by databases without
+    native IP types.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for table, column, field in _ip_columns(apps, schema_editor):
+            cursor.execute("SELECT id, %s FROM %s" % (column, table))
+            for pk, value in cursor.fetchall():
+                # Skip NULL and addresses which are already stored in binary.
+                if not isinstance(value, str):
+                    continue
+                value = field.get_db_prep_value(value.rstrip(), connection)
+                cursor.execute("UPDATE %s SET %s = %%s WHERE id = %%s" % (table, column),
+                    [value, pk])
+
+
+def unpack_addresses(apps, schema_editor):
+    """Inverse of pack_addresses()."""
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for table, column, field in _ip_columns(apps, schema_editor):
+            cursor.execute("SELECT id, %s FROM %s" % (column, table))
+            for pk, value in cursor.fetchall():
+                value = field.from_db_value(value, None, connection).exploded
+                cursor.execute("UPDATE %s SET %s = %%s WHERE id = %%s" % (table, column),
+                    [value, pk])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0003_link_denormalization'),
+    ]
+
+    operations = [
+        # Until now, the IP fields stored their values as char(n) columns. The fields keep their
+        # classes, so describe the existing columns as CharFields to make the following
+        # AlterFields change the column types.
+        migrations.SeparateDatabaseAndState(state_operations=[
+            migrations.AlterField(
+                model_name='interface',
+                name='public_ip',
+                field=models.CharField(max_length=39, verbose_name='IP Address'),
+            ),
+            migrations.AlterField(
+                model_name='vlan',
+                name='ip_network',
+                field=models.CharField(help_text='IP subnet used by the SCION underlay.', max_length=48, verbose_name='IP Network'),
+            ),
+        ]),
+        migrations.RunPython(strip_char_padding, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='interface',
+            name='public_ip',
+            field=peering_coord.custom_fields.IpAddressField(verbose_name='IP Address'),
+        ),
+        migrations.AlterField(
+            model_name='vlan',
+            name='ip_network',
+            field=peering_coord.custom_fields.IpNetworkField(help_text='IP subnet used by the SCION underlay.', verbose_name='IP Network'),
+        ),
+        migrations.RunPython(pack_addresses, unpack_addresses),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.7 on 2026-10-19 07:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0004_native_ip_storage'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aspeerpolicy',
+            index=models.Index(fields=['vlan', 'peer_as', 'asys'], name='aspeerpolicy_by_peer'),
+        ),
+        migrations.AddIndex(
+            model_name='isdpeerpolicy',
+            index=models.Index(fields=['vlan', 'peer_isd', 'asys'], name='isdpeerpolicy_by_peer'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerpeerpolicy',
+            index=models.Index(fields=['vlan', 'peer_owner', 'asys'], name='ownerpeerpolicy_by_peer'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 3.2.7 on 2026-10-19 07:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def _get_members(apps, vlan_id):
+    Interface = apps.get_model('peering_coord', 'Interface')
+    return set(Interface.objects.filter(vlan_id=vlan_id).values_list(
+        'peering_client__asys_id', flat=True))
+
+
+def compact_accepted_peers(apps, schema_editor):
+    """Replace the accepted VLAN members of ASes with a default accept policy by the members they
+    reject."""
+    AcceptedPeer = apps.get_model('peering_coord', 'AcceptedPeer')
+    AcceptAll = apps.get_model('peering_coord', 'AcceptAll')
+    DefaultPolicy = apps.get_model('peering_coord', 'DefaultPolicy')
+    RejectedPeer = apps.get_model('peering_coord', 'RejectedPeer')
+    for policy in DefaultPolicy.objects.filter(accept=True):
+        members = _get_members(apps, policy.vlan_id) - {policy.asys_id}
+        accepted = AcceptedPeer.objects.filter(vlan_id=policy.vlan_id, asys_id=policy.asys_id)
+        rejected = members - set(accepted.values_list('peer_id', flat=True))
+        AcceptAll.objects.create(vlan_id=policy.vlan_id, asys_id=policy.asys_id)
+        RejectedPeer.objects.bulk_create(
+            RejectedPeer(vlan_id=policy.vlan_id, asys_id=policy.asys_id, peer_id=peer)
+            for peer in rejected)
+        accepted.filter(peer_id__in=members).delete()
+
+
+def expand_accepted_peers(apps, schema_editor):
+    """Inverse of compact_accepted_peers()."""
+    AcceptedPeer = apps.get_model('peering_coord', 'AcceptedPeer')
+    AcceptAll = apps.get_model('peering_coord', 'AcceptAll')
+    RejectedPeer = apps.get_model('peering_coord', 'RejectedPeer')
+    for accept_all in AcceptAll.objects.all():
+        members = _get_members(apps, accept_all.vlan_id) - {accept_all.asys_id}
+        rejected = set(RejectedPeer.objects.filter(vlan_id=accept_all.vlan_id,
+            asys_id=accept_all.asys_id).values_list('peer_id', flat=True))
+        AcceptedPeer.objects.bulk_create(
+            AcceptedPeer(vlan_id=accept_all.vlan_id, asys_id=accept_all.asys_id, peer_id=peer)
+            for peer in members - rejected)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0005_reverse_policy_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RejectedPeer',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asys', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as')),
+                ('peer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as')),
+                ('vlan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='peering_coord.vlan', verbose_name='VLAN')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AcceptAll',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asys', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as')),
+                ('vlan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='peering_coord.vlan', verbose_name='VLAN')),
+            ],
+            options={
+                'verbose_name': 'Accept All',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='rejectedpeer',
+            index=models.Index(fields=['vlan', 'asys', 'peer'], name='rejected_peer_by_asys'),
+        ),
+        migrations.AddIndex(
+            model_name='rejectedpeer',
+            index=models.Index(fields=['vlan', 'peer', 'asys'], name='rejected_peer_by_peer'),
+        ),
+        migrations.AddConstraint(
+            model_name='rejectedpeer',
+            constraint=models.UniqueConstraint(fields=('asys', 'peer', 'vlan'), name='unique_rejection'),
+        ),
+        migrations.AddConstraint(
+            model_name='acceptall',
+            constraint=models.UniqueConstraint(fields=('vlan', 'asys'), name='unique_accept_all'),
+        ),
+        migrations.RunPython(compact_accepted_peers, expand_accepted_peers),
+    ]
@@ -0,0 +1,164 @@
+# Generated by Django 3.2.7 on 2026-10-19 07:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Policy models stored in separate tables before this migration by scope and the name of their
+# peer column
+_OLD_MODELS = [
+    (0, 'DefaultPolicy', None),
+    (1, 'AsPeerPolicy', 'peer_as_id'),
+    (2, 'OwnerPeerPolicy', 'peer_owner_id'),
+    (3, 'IsdPeerPolicy', 'peer_isd_id'),
+]
+
+
+def merge_policies(apps, schema_editor):
+    """Copy the policies from the per-type tables to the unified table."""
+    PeerPolicy = apps.get_model('peering_coord', 'PeerPolicy')
+    for scope, model_name, peer_field in _OLD_MODELS:
+        model = apps.get_model('peering_coord', model_name)
+        PeerPolicy.objects.bulk_create(
+            PeerPolicy(vlan_id=policy.vlan_id, asys_id=policy.asys_id, accept=policy.accept,
+                scope=scope, **({peer_field: getattr(policy, peer_field)} if peer_field else {}))
+            for policy in model.objects.all())
+
+
+def split_policies(apps, schema_editor):
+    """Inverse of merge_policies()."""
+    PeerPolicy = apps.get_model('peering_coord', 'PeerPolicy')
+    for scope, model_name, peer_field in _OLD_MODELS:
+        model = apps.get_model('peering_coord', model_name)
+        model.objects.bulk_create(
+            model(vlan_id=policy.vlan_id, asys_id=policy.asys_id, accept=policy.accept,
+                **({peer_field: getattr(policy, peer_field)} if peer_field else {}))
+            for policy in PeerPolicy.objects.filter(scope=scope))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0006_compact_accepted_peers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PeerPolicy',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('accept', models.BooleanField(default=True, help_text='Whether this rule accepts peering connection or filters them out.')),
+                ('scope', models.PositiveSmallIntegerField(choices=[(0, 'Default'), (1, 'AS'), (2, 'Owner'), (3, 'ISD')], editable=False)),
+                ('asys', models.ForeignKey(help_text='Owner of the policy.', on_delete=django.db.models.deletion.CASCADE, to='peering_coord.as', verbose_name='AS')),
+                ('peer_as', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.as', verbose_name='Peer AS')),
+                ('peer_isd', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.isd', verbose_name='Peer ISD')),
+                ('peer_owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.owner', verbose_name='Peer Owner')),
+                ('vlan', models.ForeignKey(help_text='VLAN the policy is applied to.', on_delete=django.db.models.deletion.CASCADE, to='peering_coord.vlan', verbose_name='VLAN')),
+            ],
+            options={
+                'verbose_name': 'Peering Policy',
+                'verbose_name_plural': 'Peering Policies',
+            },
+        ),
+        migrations.RunPython(merge_policies, split_policies),
+        migrations.DeleteModel(
+            name='AsPeerPolicy',
+        ),
+        migrations.DeleteModel(
+            name='DefaultPolicy',
+        ),
+        migrations.DeleteModel(
+            name='IsdPeerPolicy',
+        ),
+        migrations.DeleteModel(
+            name='OwnerPeerPolicy',
+        ),
+        migrations.AddIndex(
+            model_name='peerpolicy',
+            index=models.Index(fields=['vlan', 'asys', 'scope', 'accept'], name='peerpolicy_by_asys'),
+        ),
+        migrations.AddIndex(
+            model_name='peerpolicy',
+            index=models.Index(fields=['vlan', 'peer_as', 'asys'], name='peerpolicy_by_peer_as'),
+        ),
+        migrations.AddIndex(
+            model_name='peerpolicy',
+            index=models.Index(fields=['vlan', 'peer_owner', 'asys'], name='peerpolicy_by_peer_owner'),
+        ),
+        migrations.AddIndex(
+            model_name='peerpolicy',
+            index=models.Index(fields=['vlan', 'peer_isd', 'asys'], name='peerpolicy_by_peer_isd'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 0)), fields=('vlan', 'asys'), name='unique_default_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 1)), fields=('vlan', 'asys', 'peer_as'), name='unique_as_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 2)), fields=('vlan', 'asys', 'peer_owner'), name='unique_org_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 3)), fields=('vlan', 'asys', 'peer_isd'), name='unique_isd_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('peer_as__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 0)), models.Q(('peer_as__isnull', False), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 1)), models.Q(('peer_as__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', False), ('scope', 2)), models.Q(('peer_as__isnull', True), ('peer_isd__isnull', False), ('peer_owner__isnull', True), ('scope', 3)), _connector='OR'), name='peerpolicy_peer_matches_scope'),
+        ),
+        migrations.CreateModel(
+            name='AsPeerPolicy',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'AS Peering Policy',
+                'verbose_name_plural': 'AS Peering Policies',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('peering_coord.peerpolicy',),
+        ),
+        migrations.CreateModel(
+            name='DefaultPolicy',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Default Policy',
+                'verbose_name_plural': 'Default Policies',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('peering_coord.peerpolicy',),
+        ),
+        migrations.CreateModel(
+            name='IsdPeerPolicy',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'ISD Peering Policy',
+                'verbose_name_plural': 'ISD Peering Policies',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('peering_coord.peerpolicy',),
+        ),
+        migrations.CreateModel(
+            name='OwnerPeerPolicy',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Owner Peering Policy',
+                'verbose_name_plural': 'Owner Peering Policies',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('peering_coord.peerpolicy',),
+        ),
+    ]
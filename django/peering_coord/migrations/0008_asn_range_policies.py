@@ -0,0 +1,59 @@
+# Generated by Django 3.2.7 on 2026-10-19 08:04
+
+from django.db import migrations, models
+import django.db.models.expressions
+import peering_coord.custom_fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0007_unified_peer_policy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AsRangePeerPolicy',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'ASN Range Peering Policy',
+                'verbose_name_plural': 'ASN Range Peering Policies',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('peering_coord.peerpolicy',),
+        ),
+        migrations.RemoveConstraint(
+            model_name='peerpolicy',
+            name='peerpolicy_peer_matches_scope',
+        ),
+        migrations.AddField(
+            model_name='peerpolicy',
+            name='peer_asn_first',
+            field=peering_coord.custom_fields.AsnField(blank=True, null=True, verbose_name='First Peer ASN'),
+        ),
+        migrations.AddField(
+            model_name='peerpolicy',
+            name='peer_asn_last',
+            field=peering_coord.custom_fields.AsnField(blank=True, null=True, verbose_name='Last Peer ASN'),
+        ),
+        migrations.AlterField(
+            model_name='peerpolicy',
+            name='scope',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Default'), (1, 'AS'), (2, 'Owner'), (3, 'ISD'), (4, 'ASN Range')], editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='peerpolicy',
+            index=models.Index(fields=['vlan', 'peer_asn_first', 'peer_asn_last'], name='peerpolicy_by_asn_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 4)), fields=('vlan', 'asys', 'peer_asn_first'), name='unique_asn_range_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('peer_as__isnull', True), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 0)), models.Q(('peer_as__isnull', False), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 1)), models.Q(('peer_as__isnull', True), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', False), ('scope', 2)), models.Q(('peer_as__isnull', True), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', False), ('peer_owner__isnull', True), ('scope', 3)), models.Q(('peer_as__isnull', True), ('peer_asn_first__lte', django.db.models.expressions.F('peer_asn_last')), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 4)), _connector='OR'), name='peerpolicy_peer_matches_scope'),
+        ),
+    ]
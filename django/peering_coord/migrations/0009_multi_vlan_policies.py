@@ -0,0 +1,39 @@
+# Generated by Django 3.2.7 on 2026-10-19 08:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0008_asn_range_policies'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='peerpolicy',
+            name='vlan',
+            field=models.ForeignKey(blank=True, help_text='VLAN the policy is applied to. Leave empty to apply the policy to all VLANs.', null=True, on_delete=django.db.models.deletion.CASCADE, to='peering_coord.vlan', verbose_name='VLAN'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 0), ('vlan__isnull', True)), fields=('asys',), name='unique_global_default_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 1), ('vlan__isnull', True)), fields=('asys', 'peer_as'), name='unique_global_as_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 2), ('vlan__isnull', True)), fields=('asys', 'peer_owner'), name='unique_global_org_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 3), ('vlan__isnull', True)), fields=('asys', 'peer_isd'), name='unique_global_isd_policy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('scope', 4), ('vlan__isnull', True)), fields=('asys', 'peer_asn_first'), name='unique_global_asn_range_policy'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.2.7 on 2026-10-19 08:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0009_multi_vlan_policies'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='peerpolicy',
+            name='valid_from',
+            field=models.DateTimeField(blank=True, help_text='Time at which the policy takes effect. Leave empty for an immediately effective policy. Cleared by the policy scheduler once the policy has been activated.', null=True, verbose_name='Valid From'),
+        ),
+        migrations.AddField(
+            model_name='peerpolicy',
+            name='valid_until',
+            field=models.DateTimeField(blank=True, help_text='Time at which the policy expires. Leave empty for a permanent policy. Expired policies are deleted by the policy scheduler.', null=True, verbose_name='Valid Until'),
+        ),
+        migrations.AddIndex(
+            model_name='peerpolicy',
+            index=models.Index(condition=models.Q(('valid_from__isnull', False)), fields=['valid_from'], name='peerpolicy_by_valid_from'),
+        ),
+        migrations.AddIndex(
+            model_name='peerpolicy',
+            index=models.Index(condition=models.Q(('valid_until__isnull', False)), fields=['valid_until'], name='peerpolicy_by_valid_until'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 3.2.7 on 2026-10-19 08:32
+
+from collections import Counter
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def count_links(apps, schema_editor):
+    """Count the existing links of every AS in every VLAN."""
+    Link = apps.get_model('peering_coord', 'Link')
+    LinkCount = apps.get_model('peering_coord', 'LinkCount')
+    counts = Counter()
+    for field in ['as_a', 'as_b']:
+        for asys_id, vlan_id, links in Link.objects.values_list(field, 'vlan').annotate(
+                models.Count('id')).order_by():
+            counts[(vlan_id, asys_id)] += links
+    LinkCount.objects.bulk_create(LinkCount(vlan_id=vlan_id, asys_id=asys_id, links=links)
+        for (vlan_id, asys_id), links in counts.items())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0010_policy_validity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LinkCount',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('links', models.PositiveIntegerField(default=0)),
+                ('asys', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='link_counts', to='peering_coord.as', verbose_name='AS')),
+                ('vlan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='peering_coord.vlan', verbose_name='VLAN')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='linkcount',
+            index=models.Index(fields=['vlan', 'links'], name='link_count_by_links'),
+        ),
+        migrations.AddConstraint(
+            model_name='linkcount',
+            constraint=models.UniqueConstraint(fields=('vlan', 'asys'), name='unique_link_count'),
+        ),
+        migrations.RunPython(count_links, migrations.RunPython.noop),
+    ]
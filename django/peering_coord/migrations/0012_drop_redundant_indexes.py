@@ -0,0 +1,25 @@
+# Generated by Django 3.2.7 on 2026-10-19 08:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0011_link_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='acceptedpeer',
+            name='accepted_peer_by_asys',
+        ),
+        migrations.RemoveIndex(
+            model_name='link',
+            name='link_by_interface_b',
+        ),
+        migrations.RemoveIndex(
+            model_name='rejectedpeer',
+            name='rejected_peer_by_asys',
+        ),
+    ]
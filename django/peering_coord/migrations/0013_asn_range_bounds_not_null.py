@@ -0,0 +1,22 @@
+# Generated by Django 3.2.7 on 2026-10-19 09:03
+
+from django.db import migrations, models
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0012_drop_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='peerpolicy',
+            name='peerpolicy_peer_matches_scope',
+        ),
+        migrations.AddConstraint(
+            model_name='peerpolicy',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('peer_as__isnull', True), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 0)), models.Q(('peer_as__isnull', False), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 1)), models.Q(('peer_as__isnull', True), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', True), ('peer_owner__isnull', False), ('scope', 2)), models.Q(('peer_as__isnull', True), ('peer_asn_first__isnull', True), ('peer_asn_last__isnull', True), ('peer_isd__isnull', False), ('peer_owner__isnull', True), ('scope', 3)), models.Q(('peer_as__isnull', True), ('peer_asn_first__isnull', False), ('peer_asn_first__lte', django.db.models.expressions.F('peer_asn_last')), ('peer_asn_last__isnull', False), ('peer_isd__isnull', True), ('peer_owner__isnull', True), ('scope', 4)), _connector='OR'), name='peerpolicy_peer_matches_scope'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.7 on 2026-10-19 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('peering_coord', '0013_asn_range_bounds_not_null'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='peerpolicy',
+            name='valid_from',
+            field=models.DateTimeField(blank=True, help_text='Time at which the policy takes effect. Leave empty for an immediately effective policy.', null=True, verbose_name='Valid From'),
+        ),
+    ]
@@ -3,11 +3,14 @@
 import ipaddress
 import itertools
 import secrets
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterable
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import F, Q
+from django.db.models import Count, F, Q, QuerySet
 from django.dispatch import receiver
 
 from peering_coord.api.peering_pb2 import LinkUpdate
@@ -99,6 +102,14 @@ class PeeringClient(models.Model):
         """Returns a list of VLANs this peering deamon is managing links in."""
         return VLAN.objects.filter(id__in=self.interfaces.values_list('vlan')).all()
 
+    def save(self, **kwargs):
+        super().save(**kwargs)
+        # Keep the AS columns of the client's links consistent.
+        with _recounting_links(Link.objects.filter(
+                Q(interface_a__peering_client=self) | Q(interface_b__peering_client=self))):
+            Link.objects.filter(interface_a__peering_client=self).update(as_a=self.asys)
+            Link.objects.filter(interface_b__peering_client=self).update(as_b=self.asys)
+
     def is_connected(self) -> bool:
         """Returns whether the client is connected to the coordinator."""
         from peering_coord.api.client_connection import ClientRegistry
@@ -111,7 +122,7 @@ class PeeringClient(models.Model):
 @receiver(models.signals.post_delete, sender=PeeringClient)
 def delete_peering_client_hook(sender, instance, using, **kwargs):
     from peering_coord.api.client_connection import ClientRegistry
-    ClientRegistry.remove_client(instance.asn.asys, instance.name)
+    ClientRegistry.remove_client(instance.asys.asn, instance.name)
 
 
 class VLAN(models.Model):
@@ -157,10 +168,16 @@ class VLAN(models.Model):
 
         :raises NoUnusedIps: There are no unused addresses available anymore.
         """
-        ips_in_use = Interface.objects.filter(vlan=self).values_list('public_ip', flat=True)
+        ips_in_use = iter(Interface.objects.filter(
+            vlan=self, public_ip__in_network=self.ip_network
+            ).order_by('public_ip').values_list('public_ip', flat=True))
 
+        # Find the first gap in the sorted sequence of used addresses.
+        next_in_use = next(ips_in_use, None)
         for ip in self.ip_network.hosts():
-            if ip not in ips_in_use:
+            while next_in_use is not None and next_in_use < ip:
+                next_in_use = next(ips_in_use, None)
+            if ip != next_in_use:
                 return ip
         else:
             raise self.NoUnusedIps(str(self))
@@ -210,7 +227,14 @@ class Interface(models.Model):
 
     def save(self, **kwargs):
         self.full_clean()
+        adding = self._state.adding
         super().save(**kwargs)
+        if not adding:
+            # Keep the VLAN and AS columns of the interface's links consistent.
+            asys = self.peering_client.asys_id
+            with _recounting_links(Link.objects.filter(Q(interface_a=self) | Q(interface_b=self))):
+                Link.objects.filter(interface_a=self).update(vlan=self.vlan, as_a=asys)
+                Link.objects.filter(interface_b=self).update(vlan=self.vlan, as_b=asys)
 
     def clean(self):
         # This runs before the fields are converted to their Python representation, so we
@@ -253,12 +277,10 @@ class Interface(models.Model):
         """
         if not self.first_port or not self.last_port:
             raise self.NoUnusedPorts(str(self))
-        asys = self.peering_client.asys
+        asys = self.peering_client.asys_id
         ports = sorted(itertools.chain(
-            (pair[0] for pair in
-                Link.objects.filter(interface_a__peering_client__asys=asys).values_list('port_a')),
-            (pair[0] for pair in
-                Link.objects.filter(interface_b__peering_client__asys=asys).values_list('port_b'))
+            Link.objects.filter(as_a=asys).values_list('port_a', flat=True),
+            Link.objects.filter(as_b=asys).values_list('port_b', flat=True)
         ))
         for i, j in itertools.zip_longest(ports, range(self.first_port, self.last_port)):
             if i != j:
@@ -277,6 +299,19 @@ def delete_interface_hook(sender, instance, using, **kwargs):
         instance.vlan.name)
 
 
+@receiver(models.signals.post_save, sender=Interface)
+def add_interface_policy_hook(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        from peering_coord import policy_resolver
+        policy_resolver.add_interface(instance)
+
+
+@receiver(models.signals.post_delete, sender=Interface)
+def remove_interface_policy_hook(sender, instance, using, **kwargs):
+    from peering_coord import policy_resolver
+    policy_resolver.remove_interface(instance)
+
+
 class LinkManager(models.Manager):
     def create(self, link_type, interface_a, interface_b, port_a, port_b, **kwargs):
         from peering_coord.api.client_connection import (ClientRegistry,
@@ -311,6 +346,10 @@ class Link(models.Model):
     Two ASes can have multiple links of the same type in the same VLAN, if they belong to different
     peering client interfaces, but a single pair of interface does not support multiple links of the
     same type.
+
+    The VLAN and the ASes of both interfaces are duplicated in the link table, so links can be
+    queried by AS without joining Interface and PeeringClient. These fields are derived from the
+    interfaces when the link is saved and kept up to date by Interface and PeeringClient.
     """
     class Type(models.IntegerChoices):
         CORE = 0, "Core Link"
@@ -340,6 +379,27 @@ class Link(models.Model):
     port_b = L4PortField(
         verbose_name="UDP Port B"
     )
+    vlan = models.ForeignKey(
+        VLAN,
+        verbose_name="VLAN",
+        related_name="links",
+        on_delete=models.CASCADE,
+        editable=False
+    )
+    as_a = models.ForeignKey(
+        'AS',
+        verbose_name="AS A",
+        related_name="+",
+        on_delete=models.CASCADE,
+        editable=False
+    )
+    as_b = models.ForeignKey(
+        'AS',
+        verbose_name="AS B",
+        related_name="+",
+        on_delete=models.CASCADE,
+        editable=False
+    )
 
     class Meta:
         constraints = [
@@ -348,6 +408,12 @@ class Link(models.Model):
             models.CheckConstraint(check=~Q(interface_a=F('interface_b')),
                 name="different_interfaces")
         ]
+        # Links are looked up by their second interface with the index of the foreign key.
+        indexes = [
+            # Peers of an AS, optionally restricted to a VLAN
+            models.Index(fields=['as_a', 'vlan', 'as_b'], name="link_by_as_a"),
+            models.Index(fields=['as_b', 'vlan', 'as_a'], name="link_by_as_b"),
+        ]
 
     objects = LinkManager()
 
@@ -360,6 +426,9 @@ class Link(models.Model):
             return "Provider Link (%s) -> (%s)" % (self.interface_a, self.interface_b)
 
     def save(self, **kwargs):
+        self.vlan_id = self.interface_a.vlan_id
+        self.as_a_id = self.interface_a.peering_client.asys_id
+        self.as_b_id = self.interface_b.peering_client.asys_id
         self.full_clean()
         super().save(**kwargs)
 
@@ -388,3 +457,95 @@ def delete_link_hook(sender, instance, using, **kwargs):
         remote_interface=instance.interface_a,
         remote_port=instance.port_a)
     ClientRegistry.send_link_update(instance.interface_b.peering_client.asys.asn, update)
+
+
+class LinkCount(models.Model):
+    """Number of links of an AS in a VLAN.
+
+    Maintained when links are created or deleted and when the VLAN or AS columns of existing links
+    change, so the members of a VLAN can be sorted by their number of links without aggregating the
+    link table. ASes without links in a VLAN have no entry.
+    """
+    vlan = models.ForeignKey(
+        VLAN,
+        verbose_name="VLAN",
+        related_name="+",
+        on_delete=models.CASCADE
+    )
+    asys = models.ForeignKey(
+        'AS',
+        verbose_name="AS",
+        related_name="link_counts",
+        on_delete=models.CASCADE
+    )
+    links = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['vlan', 'asys'], name="unique_link_count")
+        ]
+        indexes = [
+            # Members of a VLAN sorted by their number of links
+            models.Index(fields=['vlan', 'links'], name="link_count_by_links"),
+        ]
+
+    def __str__(self):
+        return "LinkCount %s: %d (%s)" % (self.asys, self.links, self.vlan)
+
+    @classmethod
+    def add(cls, vlan_id: int, asys_ids: Iterable[int], delta: int) -> None:
+        """Add `delta` to the link counts of the given ASes in a VLAN.
+
+        Counts reaching zero are deleted. Safe without holding the VLAN lock, as links are also
+        deleted by cascades: Counts are changed by atomic updates, missing counts are created by
+        `get_or_create()` and the update is repeated if a concurrent transaction has created or
+        deleted the count in the meantime.
+        """
+        for asys_id in asys_ids:
+            count = cls.objects.filter(vlan_id=vlan_id, asys_id=asys_id)
+            while not count.update(links=F('links') + delta) and delta > 0:
+                _, created = cls.objects.get_or_create(
+                    vlan_id=vlan_id, asys_id=asys_id, defaults={'links': delta})
+                if created:
+                    break
+            if delta < 0:
+                count.filter(links__lte=0).delete()
+
+    @classmethod
+    def recount(cls, asys_ids: Iterable[int]) -> None:
+        """Recompute the link counts of the given ASes in all VLANs from the link table."""
+        asys_ids = set(asys_ids)
+        counts = Counter()
+        for field in ['as_a', 'as_b']:
+            for asys_id, vlan_id, links in Link.objects.filter(**{field + '__in': asys_ids}
+                    ).values_list(field, 'vlan').annotate(Count('id')).order_by():
+                counts[(vlan_id, asys_id)] += links
+        cls.objects.filter(asys_id__in=asys_ids).delete()
+        cls.objects.bulk_create(cls(vlan_id=vlan_id, asys_id=asys_id, links=links)
+            for (vlan_id, asys_id), links in counts.items())
+
+
+@contextmanager
+def _recounting_links(links: QuerySet):
+    """Context manager recomputing the link counts of the ASes of `links` if the VLAN or AS
+    columns of the links have been changed in its body.
+    """
+    columns = ('id', 'vlan_id', 'as_a_id', 'as_b_id')
+    before = set(links.values_list(*columns))
+    yield
+    if before:
+        changed = before.symmetric_difference(links.values_list(*columns))
+        if changed:
+            LinkCount.recount(itertools.chain.from_iterable(
+                (as_a, as_b) for _, _, as_a, as_b in changed))
+
+
+@receiver(models.signals.post_save, sender=Link)
+def count_link_hook(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        LinkCount.add(instance.vlan_id, (instance.as_a_id, instance.as_b_id), 1)
+
+
+@receiver(models.signals.post_delete, sender=Link)
+def uncount_link_hook(sender, instance, using, **kwargs):
+    LinkCount.add(instance.vlan_id, (instance.as_a_id, instance.as_b_id), -1)
@@ -0,0 +1,155 @@
+"""Cached index of VLAN memberships
+
+An AS is a member of a VLAN if at least one of its peering clients has an interface in the VLAN.
+Policy validation and link resolution check memberships over and over again, e.g., once for every
+policy saved by SetPolicies. VlanMembership answers these checks from an index mapping ASes to the
+VLANs they are connected to and the connecting interfaces.
+
+The index is scoped to a request (HTTP or unary gRPC) and kept per thread, so changes made by
+other processes become visible with the next request. django_grpc_framework ends the request
+before the body of an RPC returning a stream runs, so these RPCs enter their own scope with
+`VlanMembership.cached_stream`. StreamChannel is not cached, as it lasts as long as the connection
+of the client.
+
+Saving or deleting interfaces and peering clients invalidates the index of the current thread
+immediately and the indices of the other threads of the process when the transaction commits.
+"""
+
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Dict, FrozenSet, Tuple
+
+from django.core.signals import request_finished, request_started
+from django.db import models, transaction
+from django.dispatch import receiver
+from django_grpc_framework.signals import grpc_request_finished, grpc_request_started
+
+from peering_coord.models.ixp import Interface, PeeringClient
+
+
+class VlanMembership:
+    """Static class caching the interfaces connecting ASes to VLANs.
+
+    Outside of a caching scope (see `cached()`), every lookup queries the database.
+    """
+    # Index of the current thread: AS ID -> VLAN ID -> interface IDs
+    _local = threading.local()
+    # Incremented on every invalidation. Thread-local indices built for an older generation are
+    # discarded on their next use.
+    _generation = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def begin_scope(cls) -> None:
+        """Start caching memberships in the current thread."""
+        cls._local.index = {}
+        cls._local.generation = cls._generation
+
+    @classmethod
+    def end_scope(cls) -> None:
+        """Stop caching memberships in the current thread and drop the cached index."""
+        cls._local.index = None
+
+    @classmethod
+    @contextmanager
+    def cached(cls):
+        """Context manager caching memberships for the duration of the `with` block. Nested scopes
+        share the index of the outermost scope.
+        """
+        if getattr(cls._local, 'index', None) is not None:
+            yield
+            return
+        cls.begin_scope()
+        try:
+            yield
+        finally:
+            cls.end_scope()
+
+    @staticmethod
+    def cached_stream(method):
+        """Decorator caching memberships while a gRPC method returning a stream runs."""
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with VlanMembership.cached():
+                yield from method(*args, **kwargs)
+        return wrapper
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Discard the cached indices of all threads."""
+        with cls._lock:
+            cls._generation += 1
+
+    @classmethod
+    def invalidate_local(cls) -> None:
+        """Discard the cached index of the current thread."""
+        index = getattr(cls._local, 'index', None)
+        if index is not None:
+            index.clear()
+
+    @classmethod
+    def get_vlans(cls, asys_id: int) -> Dict[int, FrozenSet[int]]:
+        """Returns a mapping from the IDs of the VLANs the AS is connected to to the IDs of the
+        connecting interfaces.
+        """
+        index = getattr(cls._local, 'index', None)
+        if index is None:
+            return cls._load(asys_id)
+
+        generation = cls._generation
+        if cls._local.generation != generation:
+            index.clear()
+            cls._local.generation = generation
+
+        try:
+            return index[asys_id]
+        except KeyError:
+            vlans = cls._load(asys_id)
+            index[asys_id] = vlans
+            return vlans
+
+    @classmethod
+    def get_vlan_ids(cls, asys_id: int) -> Tuple[int, ...]:
+        """Returns the IDs of the VLANs the AS is connected to."""
+        return tuple(cls.get_vlans(asys_id).keys())
+
+    @classmethod
+    def get_interface_ids(cls, asys_id: int, vlan_id: int) -> FrozenSet[int]:
+        """Returns the IDs of the interfaces connecting the AS to the VLAN."""
+        return cls.get_vlans(asys_id).get(vlan_id, frozenset())
+
+    @classmethod
+    def is_member(cls, asys_id: int, vlan_id: int) -> bool:
+        """Check whether there is an interface between the AS and the VLAN."""
+        return vlan_id in cls.get_vlans(asys_id)
+
+    @staticmethod
+    def _load(asys_id: int) -> Dict[int, FrozenSet[int]]:
+        vlans: Dict[int, set] = {}
+        for vlan_id, interface_id in Interface.objects.filter(
+                peering_client__asys_id=asys_id).values_list('vlan_id', 'id'):
+            vlans.setdefault(vlan_id, set()).add(interface_id)
+        return {vlan_id: frozenset(interfaces) for vlan_id, interfaces in vlans.items()}
+
+
+@receiver(request_started)
+@receiver(grpc_request_started)
+def begin_membership_scope_hook(sender, **kwargs):
+    VlanMembership.begin_scope()
+
+
+@receiver(request_finished)
+@receiver(grpc_request_finished)
+def end_membership_scope_hook(sender, **kwargs):
+    VlanMembership.end_scope()
+
+
+@receiver(models.signals.post_save, sender=Interface)
+@receiver(models.signals.post_delete, sender=Interface)
+@receiver(models.signals.post_save, sender=PeeringClient)
+@receiver(models.signals.post_delete, sender=PeeringClient)
+def invalidate_membership_hook(sender, instance, **kwargs):
+    # Other threads could reload the old memberships before the change is committed.
+    VlanMembership.invalidate_local()
+    transaction.on_commit(VlanMembership.invalidate)
@@ -1,18 +1,76 @@
 """Database models of the perring policies"""
 
+from datetime import datetime
+from typing import Optional
+
 from django.db import models
-from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 
+from peering_coord.custom_fields import AsnField
 from peering_coord.models.ixp import Owner, VLAN, Interface
 from peering_coord.models.scion import AS, ISD
+from peering_coord.scion_addr import AsnRange
+
+
+class ScopedPolicyManager(models.Manager):
+    """Manager restricting the policies of the proxy models to their scope."""
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.model.SCOPE is not None:
+            queryset = queryset.filter(scope=self.model.SCOPE)
+        return queryset
+
+
+class PeerPolicy(models.Model):
+    """Accept/reject peering policy.
+
+    Policies of all scopes are stored in this table. The scope determines which of the peer columns
+    is set. The proxy models DefaultPolicy, AsPeerPolicy, AsRangePeerPolicy, OwnerPeerPolicy and
+    IsdPeerPolicy are restricted to a single scope and fill in the scope of new policies
+    automatically.
 
+    If several policies of an AS match the same peer, the policy of the highest precedence decides:
+    AS policies take precedence over ASN range policies, followed by owner, ISD, and finally default
+    policies. The ASN ranges of an AS in a VLAN must not overlap.
+
+    Policies without a VLAN apply to all VLANs the AS is a member of. They are stored only once and
+    included in the evaluation of every VLAN the AS has joined. A policy for all VLANs conflicts
+    with a policy for the same peer(s) in a specific VLAN, just like two policies in the same VLAN
+    would.
+
+    Policies can be limited in time by `valid_from` and `valid_until`. They are ignored by the
+    policy evaluation outside of their validity period, but conflict with other policies for the
+    same peers regardless of it. The policy scheduler (see `policy_scheduler`) re-evaluates the
+    policies when they are activated or expire.
+    """
+    class Scope(models.IntegerChoices):
+        DEFAULT = 0, "Default"
+        AS = 1, "AS"
+        OWNER = 2, "Owner"
+        ISD = 3, "ISD"
+        ASN_RANGE = 4, "ASN Range"
+
+    # Scope of the proxy models, None for PeerPolicy itself.
+    SCOPE: Optional[Scope] = None
+    # Fields identifying the peer(s) a policy of a scope applies to
+    PEER_FIELDS = {
+        Scope.DEFAULT: (),
+        Scope.AS: ('peer_as',),
+        Scope.OWNER: ('peer_owner',),
+        Scope.ISD: ('peer_isd',),
+        Scope.ASN_RANGE: ('peer_asn_first', 'peer_asn_last'),
+    }
+    # Scopes in order of decreasing precedence
+    PRECEDENCE = (Scope.AS, Scope.ASN_RANGE, Scope.OWNER, Scope.ISD, Scope.DEFAULT)
 
-class PeeringPolicy(models.Model):
-    """Abstract base class for accept/reject peering policies."""
     vlan = models.ForeignKey(
         VLAN,
         verbose_name="VLAN",
-        help_text="VLAN the policy is applied to.",
+        help_text="VLAN the policy is applied to. Leave empty to apply the policy to all VLANs.",
+        null=True,
+        blank=True,
         on_delete=models.CASCADE
     )
     asys = models.ForeignKey(
@@ -25,9 +83,151 @@ class PeeringPolicy(models.Model):
         help_text="Whether this rule accepts peering connection or filters them out.",
         default=True
     )
+    scope = models.PositiveSmallIntegerField(
+        choices=Scope.choices,
+        editable=False
+    )
+    peer_as = models.ForeignKey(
+        AS,
+        verbose_name="Peer AS",
+        related_name="+",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE
+    )
+    peer_owner = models.ForeignKey(
+        Owner,
+        verbose_name="Peer Owner",
+        related_name="+",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE
+    )
+    peer_isd = models.ForeignKey(
+        ISD,
+        verbose_name="Peer ISD",
+        related_name="+",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE
+    )
+
+    peer_asn_first = AsnField(
+        verbose_name="First Peer ASN",
+        null=True,
+        blank=True
+    )
+    peer_asn_last = AsnField(
+        verbose_name="Last Peer ASN",
+        null=True,
+        blank=True
+    )
+
+    valid_from = models.DateTimeField(
+        verbose_name="Valid From",
+        help_text="Time at which the policy takes effect. Leave empty for an immediately effective"
+            " policy.",
+        null=True,
+        blank=True
+    )
+    valid_until = models.DateTimeField(
+        verbose_name="Valid Until",
+        help_text="Time at which the policy expires. Leave empty for a permanent policy. Expired"
+            " policies are deleted by the policy scheduler.",
+        null=True,
+        blank=True
+    )
+
+    objects = ScopedPolicyManager()
 
     class Meta:
-        abstract = True
+        verbose_name = 'Peering Policy'
+        verbose_name_plural = 'Peering Policies'
+        indexes = [
+            # All policies of an AS, by scope and type as queried by the policy resolver
+            models.Index(fields=['vlan', 'asys', 'scope', 'accept'], name="peerpolicy_by_asys"),
+            # Policy holders by peer (reverse lookup after membership changes)
+            models.Index(fields=['vlan', 'peer_as', 'asys'], name="peerpolicy_by_peer_as"),
+            models.Index(fields=['vlan', 'peer_owner', 'asys'], name="peerpolicy_by_peer_owner"),
+            models.Index(fields=['vlan', 'peer_isd', 'asys'], name="peerpolicy_by_peer_isd"),
+            models.Index(fields=['vlan', 'peer_asn_first', 'peer_asn_last'],
+                name="peerpolicy_by_asn_range"),
+            # Pending activations and expirations (policy scheduler)
+            models.Index(fields=['valid_from'], name="peerpolicy_by_valid_from",
+                condition=Q(valid_from__isnull=False)),
+            models.Index(fields=['valid_until'], name="peerpolicy_by_valid_until",
+                condition=Q(valid_until__isnull=False)),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['vlan', 'asys'],
+                condition=Q(scope=0), name="unique_default_policy"),
+            models.UniqueConstraint(fields=['vlan', 'asys', 'peer_as'],
+                condition=Q(scope=1), name="unique_as_policy"),
+            models.UniqueConstraint(fields=['vlan', 'asys', 'peer_owner'],
+                condition=Q(scope=2), name="unique_org_policy"),
+            models.UniqueConstraint(fields=['vlan', 'asys', 'peer_isd'],
+                condition=Q(scope=3), name="unique_isd_policy"),
+            models.UniqueConstraint(fields=['vlan', 'asys', 'peer_asn_first'],
+                condition=Q(scope=4), name="unique_asn_range_policy"),
+            # Policies for all VLANs
+            models.UniqueConstraint(fields=['asys'],
+                condition=Q(scope=0, vlan__isnull=True), name="unique_global_default_policy"),
+            models.UniqueConstraint(fields=['asys', 'peer_as'],
+                condition=Q(scope=1, vlan__isnull=True), name="unique_global_as_policy"),
+            models.UniqueConstraint(fields=['asys', 'peer_owner'],
+                condition=Q(scope=2, vlan__isnull=True), name="unique_global_org_policy"),
+            models.UniqueConstraint(fields=['asys', 'peer_isd'],
+                condition=Q(scope=3, vlan__isnull=True), name="unique_global_isd_policy"),
+            models.UniqueConstraint(fields=['asys', 'peer_asn_first'],
+                condition=Q(scope=4, vlan__isnull=True), name="unique_global_asn_range_policy"),
+            # Exactly the peer columns of the scope are set.
+            models.CheckConstraint(name="peerpolicy_peer_matches_scope", check=
+                Q(scope=0, peer_as__isnull=True, peer_owner__isnull=True, peer_isd__isnull=True,
+                    peer_asn_first__isnull=True, peer_asn_last__isnull=True)
+                | Q(scope=1, peer_as__isnull=False, peer_owner__isnull=True, peer_isd__isnull=True,
+                    peer_asn_first__isnull=True, peer_asn_last__isnull=True)
+                | Q(scope=2, peer_as__isnull=True, peer_owner__isnull=False, peer_isd__isnull=True,
+                    peer_asn_first__isnull=True, peer_asn_last__isnull=True)
+                | Q(scope=3, peer_as__isnull=True, peer_owner__isnull=True, peer_isd__isnull=False,
+                    peer_asn_first__isnull=True, peer_asn_last__isnull=True)
+                | Q(scope=4, peer_as__isnull=True, peer_owner__isnull=True, peer_isd__isnull=True,
+                    peer_asn_first__isnull=False, peer_asn_last__isnull=False,
+                    peer_asn_first__lte=models.F('peer_asn_last'))
+            ),
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.SCOPE is not None:
+            self.scope = self.SCOPE
+
+    def __str__(self):
+        vlan = self.vlan if self.vlan_id is not None else "all VLANs"
+        if self.scope == self.Scope.DEFAULT:
+            return "Default policy for %s (%s)" % (self.asys, vlan)
+        elif self.scope == self.Scope.ASN_RANGE:
+            peer = self.peer_asn_range
+        else:
+            peer = getattr(self, self.PEER_FIELDS[self.scope][0])
+        return "%s %s -> %s (%s)" % (self.get_policy_type_str(), self.asys, peer, vlan)
+
+    @property
+    def peer_asn_range(self) -> Optional[AsnRange]:
+        """ASN range of an ASN range policy or None if any of the bounds is missing."""
+        if self.peer_asn_first is None or self.peer_asn_last is None:
+            return None
+        return AsnRange(self.peer_asn_first, self.peer_asn_last)
+
+    @staticmethod
+    def active_at(time: datetime) -> Q:
+        """Returns a filter selecting the policies in effect at the given time."""
+        return ((Q(valid_from__isnull=True) | Q(valid_from__lte=time))
+            & (Q(valid_until__isnull=True) | Q(valid_until__gt=time)))
+
+    def is_active(self, time: datetime) -> bool:
+        """Check whether the policy is in effect at the given time."""
+        return ((self.valid_from is None or self.valid_from <= time)
+            and (self.valid_until is None or time < self.valid_until))
 
     def save(self, **kwargs):
         self.full_clean()
@@ -36,13 +236,78 @@ class PeeringPolicy(models.Model):
     def clean(self):
         try:
             # Make sure the AS is actually connected to the VLAN.
-            if not self.asys.is_connected_to_vlan(self.vlan):
+            if self.vlan_id is not None and not self.asys.is_connected_to_vlan(self.vlan):
                 raise ValidationError("%(asys)s is not a member of %(vlan)s.",
                     code='not_a_vlan_member',
                     params={'asys': self.asys, 'vlan': self.vlan})
         except (VLAN.DoesNotExist, AS.DoesNotExist):
             pass # vlan or asys are empty, will be caught during form validation.
 
+        # Peer columns are optional at the model level, but the columns of the scope are required.
+        peer_fields = self.PEER_FIELDS.get(self.scope, ())
+        for fields in self.PEER_FIELDS.values():
+            for field in fields:
+                if (self._get_peer_value(field) is None) == (field in peer_fields):
+                    if field in peer_fields:
+                        raise ValidationError({field: "This field is required."}, code='required')
+                    raise ValidationError({field: "Must be empty for this policy type."},
+                        code='invalid')
+
+        if self.scope == self.Scope.AS and self.asys_id == self.peer_as_id:
+            raise ValidationError("AS and peer AS are identical.", code='peer_with_self')
+
+        if (self.scope == self.Scope.ASN_RANGE
+                and int(self.peer_asn_first) > int(self.peer_asn_last)):
+            raise ValidationError({'peer_asn_last': "Must not be less than the first ASN."},
+                code='invalid')
+
+        if (self.valid_from is not None and self.valid_until is not None
+                and self.valid_from >= self.valid_until):
+            raise ValidationError({'valid_until': "Must be later than the start of validity."},
+                code='invalid')
+
+    def validate_unique(self, exclude=None):
+        super().validate_unique(exclude)
+        # The uniqueness constraints depend on the scope, so they are not checked by Django.
+        unique_check = ['vlan', 'asys']
+        unique_check.extend(self.PEER_FIELDS.get(self.scope, ()))
+        if exclude and any(field in exclude for field in unique_check):
+            return
+        # A policy for all VLANs conflicts with the policies in every single VLAN.
+        others = PeerPolicy._base_manager.filter(scope=self.scope, asys_id=self.asys_id)
+        if self.vlan_id is not None:
+            others = others.filter(Q(vlan_id=self.vlan_id) | Q(vlan__isnull=True))
+        if self.pk is not None:
+            others = others.exclude(pk=self.pk)
+        if others.filter(**{field: self._get_peer_value(field)
+                for field in unique_check[2:]}).exists():
+            raise ValidationError({NON_FIELD_ERRORS: [
+                self.unique_error_message(type(self), unique_check)]})
+
+        # The ASN ranges of an AS must be disjoint, so at most one range policy matches a peer.
+        if self.scope == self.Scope.ASN_RANGE:
+            overlapping = others.filter(peer_asn_first__lte=self.peer_asn_last,
+                peer_asn_last__gte=self.peer_asn_first).first()
+            if overlapping is not None:
+                raise self.overlap_error(overlapping.peer_asn_range)
+
+    def overlap_error(self, other: AsnRange) -> ValidationError:
+        """Error reported for an ASN range policy overlapping the range `other` of another
+        policy.
+        """
+        return ValidationError({NON_FIELD_ERRORS: [ValidationError(
+            "ASN range %(range)s overlaps the range %(other)s of another policy.",
+            code='overlapping_range', params={'range': self.peer_asn_range, 'other': other})]})
+
+    def _get_peer_value(self, field: str):
+        return getattr(self, self._meta.get_field(field).attname)
+
+    def as_scope_model(self) -> 'PeerPolicy':
+        """Returns the policy as an instance of the proxy model of its scope."""
+        if type(self).SCOPE is None:
+            self.__class__ = _SCOPE_MODELS[self.scope]
+        return self
+
     def get_policy_type_str(self) -> str:
         """String representation of the policy type (accept/reject) for the admin interface."""
         if self.accept:
@@ -53,95 +318,59 @@ class PeeringPolicy(models.Model):
     get_policy_type_str.short_description = "Type"
 
 
-class DefaultPolicy(PeeringPolicy):
+class DefaultPolicy(PeerPolicy):
     """Whether to accept peering with another AS in abscense of any other applicable rules.
     If no default peering policy is set, the default is to reject peering.
     """
+    SCOPE = PeerPolicy.Scope.DEFAULT
 
     class Meta:
+        proxy = True
         verbose_name = 'Default Policy'
         verbose_name_plural = 'Default Policies'
-        constraints = [
-            models.UniqueConstraint(fields=['vlan', 'asys'], name="unique_default_policy")
-        ]
-
-    def __str__(self):
-        return "Default policy for %s (%s)" % (self.asys, self.vlan)
 
 
-class AsPeerPolicy(PeeringPolicy):
+class AsPeerPolicy(PeerPolicy):
     """AS accept/reject policy."""
-    peer_as = models.ForeignKey(
-        AS,
-        verbose_name="Peer AS",
-        related_name="+",
-        on_delete=models.CASCADE
-    )
+    SCOPE = PeerPolicy.Scope.AS
 
     class Meta:
+        proxy = True
         verbose_name = 'AS Peering Policy'
         verbose_name_plural = 'AS Peering Policies'
-        constraints = [
-            models.UniqueConstraint(fields=['vlan', 'asys', 'peer_as'], name="unique_as_policy")
-        ]
 
-    def clean(self):
-        super().clean()
-        try:
-            if self.asys == self.peer_as:
-                raise ValidationError("AS and peer AS are identical.", code='peer_with_self')
-        except AS.DoesNotExist:
-            pass # asys or peer_as are empty, will be caught during form validation.
 
-    def __str__(self):
-        if self.accept:
-            return "Accept %s -> %s (%s)" % (self.asys, self.peer_as, self.vlan)
-        else:
-            return "Reject %s -> %s (%s)" % (self.asys, self.peer_as, self.vlan)
+class AsRangePeerPolicy(PeerPolicy):
+    """Accept/reject policy for all ASes whose ASN is in a range."""
+    SCOPE = PeerPolicy.Scope.ASN_RANGE
+
+    class Meta:
+        proxy = True
+        verbose_name = 'ASN Range Peering Policy'
+        verbose_name_plural = 'ASN Range Peering Policies'
 
 
-class IsdPeerPolicy(PeeringPolicy):
+class IsdPeerPolicy(PeerPolicy):
     """ISD accept/accept policy."""
-    peer_isd = models.ForeignKey(
-        ISD,
-        verbose_name="Peer ISD",
-        related_name="+",
-        on_delete=models.CASCADE
-    )
+    SCOPE = PeerPolicy.Scope.ISD
 
     class Meta:
+        proxy = True
         verbose_name = 'ISD Peering Policy'
         verbose_name_plural = 'ISD Peering Policies'
-        constraints = [
-            models.UniqueConstraint(fields=['vlan', 'asys', 'peer_isd'], name="unique_isd_policy")
-        ]
-
-    def __str__(self):
-        if self.accept:
-            return "Accept %s -> %s (%s)" % (self.asys, self.peer_isd, self.vlan)
-        else:
-            return "Reject %s -> %s (%s)" % (self.asys, self.peer_isd, self.vlan)
 
 
-class OwnerPeerPolicy(PeeringPolicy):
+class OwnerPeerPolicy(PeerPolicy):
     """Owner accept/reject policy."""
-    peer_owner = models.ForeignKey(
-        Owner,
-        verbose_name="Peer Owner",
-        related_name="+",
-        on_delete=models.CASCADE
-    )
+    SCOPE = PeerPolicy.Scope.OWNER
 
     class Meta:
+        proxy = True
         verbose_name = 'Owner Peering Policy'
         verbose_name_plural = 'Owner Peering Policies'
-        constraints = [
-            models.UniqueConstraint(
-                fields=['vlan', 'asys', 'peer_owner'], name="unique_org_policy")
-        ]
 
-    def __str__(self):
-        if self.accept:
-            return "Accept %s -> %s (%s)" % (self.asys, self.peer_owner, self.vlan)
-        else:
-            return "Reject %s -> %s (%s)" % (self.asys, self.peer_owner, self.vlan)
+
+_SCOPE_MODELS = {
+    model.SCOPE: model for model in [
+        DefaultPolicy, AsPeerPolicy, AsRangePeerPolicy, OwnerPeerPolicy, IsdPeerPolicy]
+}
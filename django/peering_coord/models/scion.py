@@ -1,15 +1,17 @@
 """Database models of SCION objects"""
 
-import itertools
-from typing import Optional
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import F, Q
+from django.dispatch import receiver
 
 from peering_coord.custom_fields import AsnField, L4PortField
 from peering_coord.models.ixp import Interface, Owner, VLAN, Link
 from peering_coord.models.limits import MAX_LONG_NAME_LENGTH
+from peering_coord.models.membership import VlanMembership
 
 
 class ISD(models.Model):
@@ -67,6 +69,10 @@ class AS(models.Model):
         through="AcceptedPeer"
     )
 
+    # Maximum number of AS IDs passed to a single query. Every ID is passed twice, once for each link
+    # direction, which keeps the queries below the parameter limit of SQLite.
+    MAX_QUERY_IDS = 250
+
     class Meta:
         verbose_name = "AS"
         verbose_name_plural = "ASes"
@@ -81,15 +87,11 @@ class AS(models.Model):
 
     def is_connected_to_vlan(self, vlan: VLAN) -> bool:
         """Check wheather there is an interface between this AS and the given vlan."""
-        for pc in self.peering_clients.all():
-            if vlan in pc.get_connected_vlans():
-                return True
-        return False
+        return VlanMembership.is_member(self.id, vlan.id)
 
     def get_connected_vlans(self):
-        """Returns a list of VLANs this AS is connected to."""
-        return itertools.chain.from_iterable(
-            pc.get_connected_vlans() for pc in self.peering_clients.all())
+        """Returns a queryset of VLANs this AS is connected to."""
+        return VLAN.objects.filter(id__in=VlanMembership.get_vlan_ids(self.id))
 
     def query_interfaces(self):
         """Returns a queryset containing all interfaces of this AS."""
@@ -100,23 +102,91 @@ class AS(models.Model):
 
         :param vlan: Output is restricted to this VLAN.
         """
-        interfaces = self.query_interfaces()
+        peers1 = Link.objects.filter(as_a=self)
+        peers2 = Link.objects.filter(as_b=self)
         if vlan:
-            interfaces = interfaces.filter(vlan=vlan)
-        peers1 = Link.objects.filter(interface_a__in=interfaces).values_list(
-            'interface_b__peering_client__asys')
-        peers2 = Link.objects.filter(interface_b__in=interfaces).values_list(
-            'interface_a__peering_client__asys')
-        return peers1.union(peers2)
+            peers1 = peers1.filter(vlan=vlan)
+            peers2 = peers2.filter(vlan=vlan)
+        return peers1.values_list('as_b').union(peers2.values_list('as_a'))
+
+    @staticmethod
+    def count_connected_peers(asys_ids: Iterable[int]) -> Dict[Tuple[int, int], int]:
+        """Count the connected peers of several ASes in all VLANs.
+
+        Instead of running `query_connected_peers()` for every AS and VLAN, the peers of both link
+        directions are fetched by a single query per `MAX_QUERY_IDS` ASes and counted.
+
+        :param asys_ids: IDs of the ASes whose peers are counted.
+        :returns: Mapping from (AS ID, VLAN ID) to the number of peers. Pairs without peers are
+                  omitted.
+        """
+        asys_ids = list(asys_ids)
+        peers: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+        for i in range(0, len(asys_ids), AS.MAX_QUERY_IDS):
+            chunk = asys_ids[i:i + AS.MAX_QUERY_IDS]
+            links = Link.objects.filter(as_a_id__in=chunk).values_list(
+                'as_a_id', 'vlan_id', 'as_b_id').union(
+                Link.objects.filter(as_b_id__in=chunk).values_list(
+                    'as_b_id', 'vlan_id', 'as_a_id'))
+            for asys_id, vlan_id, peer_id in links:
+                peers[(asys_id, vlan_id)].add(peer_id)
+        return {key: len(peer_ids) for key, peer_ids in peers.items()}
+
+    def query_accepted_peers(self, vlan: VLAN):
+        """Returns a queryset containing the IDs of all peers accepted by this AS.
+
+        Combines the peers stored in AcceptedPeer with the VLAN members accepted through AcceptAll.
+
+        :param vlan: Output is restricted to this vlan.
+        """
+        accepted = AcceptedPeer.objects.filter(vlan=vlan, asys=self).values_list('peer')
+        if AcceptAll.objects.filter(vlan=vlan, asys=self).exists():
+            members = Interface.objects.filter(vlan=vlan).exclude(
+                peering_client__asys=self).values_list('peering_client__asys')
+            rejected = RejectedPeer.objects.filter(vlan=vlan, asys=self).values_list('peer')
+            accepted = accepted.union(members.difference(rejected))
+        return accepted
+
+    def query_accepting_peers(self, vlan: VLAN):
+        """Returns a queryset containing the IDs of all ASes accepting this AS as peer.
+
+        :param vlan: Output is restricted to this vlan.
+        """
+        accepting = AcceptedPeer.objects.filter(vlan=vlan, peer=self).values_list('asys')
+        if Interface.objects.filter(vlan=vlan, peering_client__asys=self).exists():
+            accept_all = AcceptAll.objects.filter(vlan=vlan).exclude(asys=self).values_list('asys')
+            rejecting = RejectedPeer.objects.filter(vlan=vlan, peer=self).values_list('asys')
+            accepting = accepting.union(accept_all.difference(rejecting))
+        return accepting
 
     def query_mutually_accepted_peers(self, vlan: VLAN):
         """Returns a queryset containing the IDs of all mutually accepted peers.
 
         :param vlan: Output is restricted to this vlan.
         """
-        my_acpted = AcceptedPeer.objects.filter(vlan=vlan, asys=self).values_list('peer')
-        mutually_acpted= AcceptedPeer.objects.filter(vlan=vlan, asys__in=my_acpted.all(), peer=self)
-        return mutually_acpted.values_list('asys')
+        return self.query_accepted_peers(vlan).intersection(self.query_accepting_peers(vlan))
+
+    def query_peering_opportunities(self, vlan: VLAN):
+        """Returns a queryset of the members of the VLAN accepting this AS as peer which are not
+        accepted by this AS in return, ordered by ASN.
+
+        In contrast to the union queries above, the result is a plain filter on AS, so it can be
+        paginated by ASN (e.g., `filter(asn__gt=last_asn)[:page_size]`). The accepting ASes are
+        looked up through the reverse indexes on AcceptedPeer and RejectedPeer.
+
+        :param vlan: Output is restricted to this vlan.
+        """
+        members = Interface.objects.filter(vlan=vlan).values('peering_client__asys')
+        accepting = Q(id__in=AcceptedPeer.objects.filter(vlan=vlan, peer=self).values('asys'))
+        if VlanMembership.is_member(self.id, vlan.id):
+            accepting |= (Q(id__in=AcceptAll.objects.filter(vlan=vlan).values('asys'))
+                & ~Q(id__in=RejectedPeer.objects.filter(vlan=vlan, peer=self).values('asys')))
+        # All candidates are members of the VLAN, so AcceptAll accepts those not rejected.
+        accepted = Q(id__in=AcceptedPeer.objects.filter(vlan=vlan, asys=self).values('peer'))
+        if AcceptAll.objects.filter(vlan=vlan, asys=self).exists():
+            accepted |= ~Q(id__in=RejectedPeer.objects.filter(vlan=vlan, asys=self).values('peer'))
+        return AS.objects.filter(accepting, id__in=members).exclude(accepted).exclude(
+            id=self.id).order_by('asn')
 
     def count_connected_clients(self) -> int:
         """Returns the number of active peering clients."""
@@ -125,7 +195,11 @@ class AS(models.Model):
 
 
 class AcceptedPeer(models.Model):
-    """Recursive relation between ASes marking the other ASes an AS would accept peering with."""
+    """Recursive relation between ASes marking the other ASes an AS would accept peering with.
+
+    ASes with a default accept policy do not store the VLAN members they accept here, see AcceptAll.
+    Use `AS.query_accepted_peers()` to get all peers accepted by an AS.
+    """
     asys = models.ForeignKey(AS, related_name="+", on_delete=models.CASCADE)
     peer = models.ForeignKey(AS, related_name="+", on_delete=models.CASCADE)
     vlan = models.ForeignKey(
@@ -138,6 +212,93 @@ class AcceptedPeer(models.Model):
         constraints = [
             models.UniqueConstraint(fields=['asys', 'peer', 'vlan'], name="unique_peer_relation")
         ]
+        # Peers accepted by an AS (resolver, link updates) are looked up with the index of the
+        # unique constraint.
+        indexes = [
+            # ASes accepting a peer (mutual acceptance check)
+            models.Index(fields=['vlan', 'peer', 'asys'], name="accepted_peer_by_peer"),
+        ]
 
     def __str__(self):
         return "AcceptedPeer %s -> %s (%s)" % (self.asys, self.peer, self.vlan)
+
+
+class AcceptAll(models.Model):
+    """Marks an AS accepting all members of a VLAN except itself and the peers listed in
+    RejectedPeer.
+
+    Compact representation of the peers accepted by ASes with a default accept policy. Such ASes
+    only store the non-members they accept in AcceptedPeer, so ASes joining or leaving the VLAN do
+    not have to be added to or removed from the accepted peers of every other member.
+    """
+    asys = models.ForeignKey(AS, related_name="+", on_delete=models.CASCADE)
+    vlan = models.ForeignKey(
+        "VLAN",
+        verbose_name="VLAN",
+        on_delete=models.CASCADE
+    )
+
+    class Meta:
+        verbose_name = "Accept All"
+        constraints = [
+            models.UniqueConstraint(fields=['vlan', 'asys'], name="unique_accept_all")
+        ]
+
+    def __str__(self):
+        return "AcceptAll %s (%s)" % (self.asys, self.vlan)
+
+
+class RejectedPeer(models.Model):
+    """VLAN members rejected by an AS which otherwise accepts all members (see AcceptAll)."""
+    asys = models.ForeignKey(AS, related_name="+", on_delete=models.CASCADE)
+    peer = models.ForeignKey(AS, related_name="+", on_delete=models.CASCADE)
+    vlan = models.ForeignKey(
+        "VLAN",
+        verbose_name="VLAN",
+        on_delete=models.CASCADE
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['asys', 'peer', 'vlan'], name="unique_rejection")
+        ]
+        indexes = [
+            models.Index(fields=['vlan', 'peer', 'asys'], name="rejected_peer_by_peer"),
+        ]
+
+    def __str__(self):
+        return "RejectedPeer %s -> %s (%s)" % (self.asys, self.peer, self.vlan)
+
+
+@receiver(models.signals.pre_save, sender=AS)
+def track_as_groups_hook(sender, instance, raw, **kwargs):
+    # Remember the previous ISD, owner and ASN to re-evaluate the policies matching them after
+    # saving.
+    instance._old_groups = None
+    if instance.pk is not None and not raw:
+        instance._old_groups = AS.objects.filter(pk=instance.pk).values_list(
+            'isd_id', 'owner_id', 'asn').first()
+
+
+@receiver(models.signals.post_save, sender=AS)
+def update_as_groups_hook(sender, instance, raw, **kwargs):
+    old_groups = getattr(instance, '_old_groups', None)
+    if old_groups is not None and old_groups != (instance.isd_id, instance.owner_id, instance.asn):
+        from peering_coord import policy_resolver
+        policy_resolver.update_groups(instance, *old_groups)
+
+
+# ASes deleted on their own or together with their ISD or owner are removed from the accepted
+# peers and links of other ASes by cascading deletes. Skip re-evaluating the policies matching them
+# when their interfaces are deleted.
+
+@receiver(models.signals.pre_delete, sender=AS)
+def begin_as_deletion_hook(sender, instance, **kwargs):
+    from peering_coord import policy_resolver
+    policy_resolver.begin_as_deletion(instance)
+
+
+@receiver(models.signals.post_delete, sender=AS)
+def end_as_deletion_hook(sender, instance, **kwargs):
+    from peering_coord import policy_resolver
+    policy_resolver.end_as_deletion(instance)
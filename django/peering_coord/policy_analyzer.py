@@ -0,0 +1,150 @@
+"""Detection and removal of redundant policies
+
+A policy is redundant if deleting it does not change the peers accepted by its AS. The analysis
+follows the precedence of the policy evaluation in `policy_resolver`: A peer is decided by the
+matching policy of the highest precedence (see `PeerPolicy.PRECEDENCE`), so a policy is redundant
+if the policies of lower precedence reach the same decision without it. The following policies are
+detected:
+
+- Default reject policies. Peers not matched by any policy are rejected anyway.
+- ASN range, owner, and ISD reject policies of ASes without accepting policies of lower precedence.
+  Every peer matched by such a policy would be rejected without it as well.
+- AS policies whose peer is decided the same way by the ASN range, owner, ISD, or default policies.
+  This depends on the current ASN, owner, ISD, and VLAN memberships of the peer, so such a policy
+  can become relevant again when they change.
+
+All redundant policies can be deleted together: AS policies fall back to accepting policies, which
+are never redundant, or to reject policies, which are only redundant if the policies below them
+reject as well.
+
+Policies for all VLANs are only redundant if they are redundant in every VLAN the AS is a member
+of. Policies limited in time are not analyzed, and neither are the other policies of the AS in the
+VLANs time-limited policies apply to, as their decisions change over time.
+
+All policies in effect in a VLAN are read whenever the AS is resolved in that VLAN. The evaluation
+cost of the policies of an AS is therefore reported as the number of policies read when resolving
+the AS in all of its VLANs once.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from django.db import transaction
+from django.db.models import Q
+
+from peering_coord.models.ixp import VLAN
+from peering_coord.models.membership import VlanMembership
+from peering_coord.models.policies import PeerPolicy
+from peering_coord.models.scion import AS
+from peering_coord.scion_addr import AsnRangeIndex
+
+
+class PolicyAnalysis(NamedTuple):
+    """Redundant policies of an AS as reported by `find_redundant_policies()`."""
+    redundant: List[PeerPolicy]
+    # Number of policies read when resolving the AS in all of its VLANs once, before and after
+    # deleting the redundant policies
+    evaluations_before: int
+    evaluations_after: int
+
+    @property
+    def saved_evaluations(self) -> int:
+        return self.evaluations_before - self.evaluations_after
+
+
+def find_redundant_policies(asys: AS, vlan: Optional[VLAN] = None) -> PolicyAnalysis:
+    """Find the policies of an AS which do not affect its accepted peers.
+
+    :param asys: AS whose policies are analyzed.
+    :param vlan: If given, only the policies of this VLAN are analyzed and the evaluation cost is
+                 computed for this VLAN only. Policies for all VLANs are not reported in this
+                 case.
+    :returns: The redundant policies ordered by ID and the evaluation cost.
+    """
+    member_vlans = set(VlanMembership.get_vlan_ids(asys.id))
+    policies = PeerPolicy.objects.filter(asys=asys).select_related(
+        'vlan', 'peer_as', 'peer_owner').order_by('id')
+    if vlan is not None:
+        policies = list(policies.filter(Q(vlan=vlan) | Q(vlan__isnull=True)))
+        vlan_ids = {vlan.id}
+    else:
+        policies = list(policies)
+        vlan_ids = member_vlans.union(
+            policy.vlan_id for policy in policies if policy.vlan_id is not None)
+
+    def applies_to(policy: PeerPolicy) -> Set[int]:
+        # VLANs in which the policy is evaluated
+        if policy.vlan_id is None:
+            return member_vlans.intersection(vlan_ids)
+        return {policy.vlan_id}
+
+    policies_in_vlan: Dict[int, List[PeerPolicy]] = {vlan_id: [] for vlan_id in vlan_ids}
+    for policy in policies:
+        for vlan_id in applies_to(policy):
+            policies_in_vlan[vlan_id].append(policy)
+
+    redundant_in_vlan = {vlan_id: _find_redundant_in_vlan(vlan_id, policies_in_vlan[vlan_id])
+        for vlan_id in vlan_ids}
+    redundant = [policy for policy in policies
+        if (vlan is None or policy.vlan_id == vlan.id)
+        and applies_to(policy)
+        and all(policy.id in redundant_in_vlan[vlan_id] for vlan_id in applies_to(policy))]
+
+    evaluations = sum(len(policies_in_vlan[vlan_id]) for vlan_id in vlan_ids & member_vlans)
+    saved = sum(len(applies_to(policy) & member_vlans) for policy in redundant)
+    return PolicyAnalysis(redundant, evaluations, evaluations - saved)
+
+
+def _find_redundant_in_vlan(vlan_id: int, policies: Iterable[PeerPolicy]) -> Set[int]:
+    """Returns the IDs of the policies which do not affect the accepted peers in a VLAN.
+
+    :param vlan_id: VLAN the policies are evaluated in.
+    :param policies: All policies of a single AS in effect in the VLAN.
+    """
+    policies = list(policies)
+    if any(policy.valid_from is not None or policy.valid_until is not None
+            for policy in policies):
+        return set()
+
+    ranges = AsnRangeIndex((policy.peer_asn_range, policy.accept)
+        for policy in policies if policy.scope == PeerPolicy.Scope.ASN_RANGE)
+    owners = {policy.peer_owner_id: policy.accept
+        for policy in policies if policy.scope == PeerPolicy.Scope.OWNER}
+    isds = {policy.peer_isd_id: policy.accept
+        for policy in policies if policy.scope == PeerPolicy.Scope.ISD}
+    default_accept = any(policy.accept
+        for policy in policies if policy.scope == PeerPolicy.Scope.DEFAULT)
+    accepting_scopes = {policy.scope for policy in policies if policy.accept}
+
+    def fallback(peer: AS) -> bool:
+        # Decision of the policies below the AS policies, see policy_resolver.update_peer()
+        for accept in (ranges.get(peer.asn), owners.get(peer.owner_id), isds.get(peer.isd_id)):
+            if accept is not None:
+                return accept
+        return default_accept and VlanMembership.is_member(peer.id, vlan_id)
+
+    redundant = set()
+    for policy in policies:
+        if policy.scope == PeerPolicy.Scope.AS:
+            if fallback(policy.peer_as) == policy.accept:
+                redundant.add(policy.id)
+        elif not policy.accept:
+            lower = PeerPolicy.PRECEDENCE[PeerPolicy.PRECEDENCE.index(policy.scope) + 1:]
+            if accepting_scopes.isdisjoint(lower):
+                redundant.add(policy.id)
+    return redundant
+
+
+def compact_policies(asys: AS, vlan: Optional[VLAN] = None) -> PolicyAnalysis:
+    """Delete the redundant policies of an AS in a single transaction.
+
+    Since the accepted peers of the AS do not change, the AS does not have to be resolved again.
+
+    :param asys: AS whose policies are compacted.
+    :param vlan: If given, only the policies of this VLAN are compacted.
+    :returns: The deleted policies and the evaluation cost before and after the compaction.
+    """
+    with transaction.atomic():
+        analysis = find_redundant_policies(asys, vlan)
+        if analysis.redundant:
+            PeerPolicy.objects.filter(id__in=[policy.id for policy in analysis.redundant]).delete()
+    return analysis
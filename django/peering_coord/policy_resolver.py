@@ -1,36 +1,186 @@
 """Functions for updating links according to peering policies"""
 
-from django.db import transaction
+import functools
+import operator
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional, Set
+
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
 from django.db.models import Q, QuerySet
+from django.utils import timezone
 
+from peering_coord import sql_resolver
 from peering_coord.api.client_connection import ClientRegistry
 from peering_coord.api.peering_pb2 import AsyncError
 from peering_coord.models.ixp import VLAN, Interface, Owner
+from peering_coord.models.membership import VlanMembership
 from peering_coord.models.policies import (
-    AsPeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
-from peering_coord.models.scion import AS, AcceptedPeer, Link
+    AsPeerPolicy, AsRangePeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy, PeerPolicy)
+from peering_coord.models.scion import AS, AcceptAll, AcceptedPeer, Link, RejectedPeer
+from peering_coord.scion_addr import ASN, AsnRange, AsnRangeIndex
+
+
+# First key of the PostgreSQL advisory locks protecting VLANs, the second key is the VLAN ID.
+ADVISORY_LOCK_NAMESPACE = 0x5C10
+# Maximum number of attempts of transactions run by retry_transaction().
+TRANSACTION_ATTEMPTS = 5
+# Base delay in seconds before retrying a transaction. Doubled with every attempt.
+TRANSACTION_RETRY_DELAY = 0.02
+# Maximum number of AS pairs whose links are deleted by a single query in update_vlan()
+UPDATE_VLAN_CHUNK_SIZE = 100
+
+# SQLSTATEs of transaction failures which can be resolved by retrying the transaction:
+# serialization_failure, deadlock_detected
+_TRANSIENT_PG_ERRORS = {'40001', '40P01'}
+
+# In-process VLAN locks for databases without advisory locks
+_vlan_locks = defaultdict(threading.RLock)
+_vlan_locks_guard = threading.Lock()
+
+# Thread-local state of the model signal handlers
+_local = threading.local()
+
+
+@contextmanager
+def lock_vlan(vlan: VLAN):
+    """Context manager serializing changes to the accepted peers and links in a VLAN.
+
+    Opens a transaction (or a savepoint, if already in a transaction) and acquires an exclusive
+    per-VLAN lock. On PostgreSQL, this is a transaction-level advisory lock which is held until the
+    outermost transaction ends, so it protects other coordinator processes as well. On other
+    databases an in-process lock held until the end of the `with` block is used instead. SQLite
+    serializes write transactions of different processes anyway.
+
+    Acquire locks of multiple VLANs in the order of their IDs to avoid deadlocks.
+    """
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s, %s)",
+                    [ADVISORY_LOCK_NAMESPACE, vlan.id])
+            yield
+        else:
+            with _vlan_locks_guard:
+                lock = _vlan_locks[vlan.id]
+            with lock:
+                yield
+
+
+def _with_vlan_lock(func):
+    """Decorator for resolver functions taking the VLAN as first argument. Runs the function while
+    holding the VLAN lock.
+    """
+    @functools.wraps(func)
+    def wrapper(vlan: VLAN, *args, **kwargs):
+        with lock_vlan(vlan):
+            return func(vlan, *args, **kwargs)
+    return wrapper
+
+
+def _is_transient_error(error: OperationalError) -> bool:
+    """Check whether a transaction failed due to a conflict with a concurrent transaction."""
+    pgcode = getattr(error.__cause__, 'pgcode', None)
+    if pgcode is not None:
+        return pgcode in _TRANSIENT_PG_ERRORS
+    # SQLite: database locked by another connection or table locked in shared-cache mode
+    return any(msg in str(error) for msg in ('database is locked', 'database table is locked'))
+
 
+def retry_transaction(func):
+    """Decorator running a function in a transaction. If the transaction fails due to a
+    serialization failure or deadlock, it is retried up to TRANSACTION_ATTEMPTS times with
+    exponential backoff.
 
-@transaction.atomic
+    Only outermost transactions are retried. If the function is called in an already open
+    transaction, it runs in a savepoint and errors are passed on to the enclosing transaction.
+    Link updates and errors are only sent to the peering clients when the transaction commits, so
+    failed attempts do not notify the clients. Other side effects outside of the database are
+    repeated when the transaction is retried.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if connection.in_atomic_block:
+            with transaction.atomic():
+                return func(*args, **kwargs)
+
+        for attempt in range(TRANSACTION_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return func(*args, **kwargs)
+            except OperationalError as e:
+                if attempt + 1 >= TRANSACTION_ATTEMPTS or not _is_transient_error(e):
+                    raise
+            time.sleep(TRANSACTION_RETRY_DELAY * (2 ** attempt) * random.uniform(0.5, 1.5))
+    return wrapper
+
+
+@_with_vlan_lock
 def update_accepted_peers(vlan: VLAN, asys: AS) -> None:
-    """Update the AcceptedPeer relation of ASes accepted for peering.
+    """Update the relations of ASes accepted for peering.
+
+    If `asys` has a default accept policy, it is marked in AcceptAll and only the VLAN members it
+    rejects are stored (in RejectedPeer), as well as the non-members it accepts (in AcceptedPeer).
+    Otherwise, all accepted peers are stored in AcceptedPeer.
 
     :param vlan: Peering VLAN to update.
     :param asys: AS whose accepted peers are updated.
     """
-    old = AcceptedPeer.objects.filter(vlan=vlan, asys=asys).values_list('peer_id')
+    if _use_sql_backend():
+        sql_resolver.update_accepted_peers(vlan, asys)
+        return
+
     new = _get_accepted_peers(vlan, asys)
 
+    if DefaultPolicy.objects.filter(_vlan_policies(vlan), asys=asys, accept=True).exists():
+        AcceptAll.objects.get_or_create(vlan=vlan, asys=asys)
+        members = vlan.members.values_list('asys').filter(~Q(asys=asys.id))
+        _update_peer_relation(RejectedPeer, vlan, asys, members.difference(new))
+        _update_peer_relation(AcceptedPeer, vlan, asys, new.difference(members))
+    else:
+        AcceptAll.objects.filter(vlan=vlan, asys=asys).delete()
+        RejectedPeer.objects.filter(vlan=vlan, asys=asys).delete()
+        _update_peer_relation(AcceptedPeer, vlan, asys, new)
+
+
+def _update_peer_relation(model, vlan: VLAN, asys: AS, new: QuerySet) -> None:
+    """Replace the peers of `asys` in the AcceptedPeer or RejectedPeer relation with `new`.
+
+    :param new: `QuerySet` of AS primary keys as returned by `values_list`.
+    """
+    old = model.objects.filter(vlan=vlan, asys=asys).values_list('peer_id')
+
     # Calculate which peers to add/remove.
     remove = old.difference(new)
     add = new.difference(old)
 
-    # Remove peers which are no longer accepted.
-    AcceptedPeer.objects.filter(vlan=vlan, asys=asys, peer_id__in=remove).delete()
+    # Remove peers which are no longer in the relation.
+    model.objects.filter(vlan=vlan, asys=asys, peer_id__in=remove).delete()
+
+    # Add peers which are not in the relation at the moment.
+    model.objects.bulk_create(model(vlan=vlan, asys=asys, peer_id=peer[0]) for peer in add)
 
-    # Add peers which are not accepted at the moment.
-    AcceptedPeer.objects.bulk_create(
-        AcceptedPeer(vlan=vlan, asys=asys, peer_id=peer[0]) for peer in add)
+
+def _vlan_policies(vlan: VLAN) -> Q:
+    """Returns a filter selecting the policies currently in effect in `vlan`.
+
+    These are the policies of the VLAN itself and the policies for all VLANs of the ASes which are
+    members of the VLAN. Policies for all VLANs are not stored per VLAN, but expanded by this
+    filter whenever the policies of a VLAN are evaluated. Policies outside of their validity period
+    are excluded.
+    """
+    return (Q(vlan=vlan) | Q(vlan__isnull=True,
+        asys_id__in=Interface.objects.filter(vlan=vlan).values('peering_client__asys'))
+        ) & PeerPolicy.active_at(timezone.now())
+
+
+def _use_sql_backend() -> bool:
+    """Check whether the accepted peers are evaluated by the SQL backend (see sql_resolver)."""
+    return getattr(settings, 'POLICY_RESOLVER_BACKEND', 'python') == 'sql'
 
 
 def _get_accepted_peers(vlan: VLAN, asys: AS) -> QuerySet:
@@ -40,25 +190,36 @@ def _get_accepted_peers(vlan: VLAN, asys: AS) -> QuerySet:
     :param asys: AS whose potential peers are retrieved.
     :returns: A `QuerySet` of AS primary keys as returned by `values_list`.
     """
+    in_vlan = _vlan_policies(vlan)
+
     # AS-level policies
     as_accept = AsPeerPolicy.objects.filter(
-        vlan=vlan, asys=asys, accept=True).values_list('peer_as_id')
+        in_vlan, asys=asys, accept=True).values_list('peer_as_id')
     as_reject = AsPeerPolicy.objects.filter(
-        vlan=vlan, asys=asys, accept=False).values_list('peer_as_id')
+        in_vlan, asys=asys, accept=False).values_list('peer_as_id')
+
+    # ASN range policies, coalesced into as few ranges as possible by the range index
+    ranges = AsnRangeIndex(
+        (AsnRange(first, last), accept) for first, last, accept in AsRangePeerPolicy.objects.filter(
+            in_vlan, asys=asys).values_list('peer_asn_first', 'peer_asn_last', 'accept'))
+    range_accept = AS.objects.filter(
+        _asn_ranges_q(ranges.coalesce(True)) & ~Q(id=asys.id)).values_list('id')
+    range_reject = AS.objects.filter(
+        _asn_ranges_q(ranges.coalesce(False)) & ~Q(id=asys.id)).values_list('id')
 
     # Owner-level policies
     org_accept = Owner.objects.filter(
         id__in=OwnerPeerPolicy.objects.filter(
-            vlan=vlan, asys=asys, accept=True).values_list('peer_owner_id'))
+            in_vlan, asys=asys, accept=True).values_list('peer_owner_id'))
     org_reject = Owner.objects.filter(
         id__in=OwnerPeerPolicy.objects.filter(
-            vlan=vlan, asys=asys, accept=False).values_list('peer_owner_id'))
+            in_vlan, asys=asys, accept=False).values_list('peer_owner_id'))
 
     # ISD-level policies
     isd_accept = IsdPeerPolicy.objects.filter(
-        vlan=vlan, asys=asys, accept=True).values_list('peer_isd_id')
+        in_vlan, asys=asys, accept=True).values_list('peer_isd_id')
     isd_reject = IsdPeerPolicy.objects.filter(
-        vlan=vlan, asys=asys, accept=False).values_list('peer_isd_id')
+        in_vlan, asys=asys, accept=False).values_list('peer_isd_id')
 
     # Put it all together
     # Note: The same AS/Owner/ISD cannot be accepted *and* rejected at the same time.
@@ -69,27 +230,35 @@ def _get_accepted_peers(vlan: VLAN, asys: AS) -> QuerySet:
     as_accepted_by_isd = AS.objects.filter(
         Q(isd_id__in=isd_accept) & ~Q(id=asys.id)).values_list('id')
     accept = as_accept.union(
-        as_accepted_by_org.difference(as_reject),
-        as_accepted_by_isd.difference(as_rejected_by_org, as_reject)
+        range_accept.difference(as_reject),
+        as_accepted_by_org.difference(range_reject, as_reject),
+        as_accepted_by_isd.difference(as_rejected_by_org, range_reject, as_reject)
     )
 
     # Handle default accept policy
-    if DefaultPolicy.objects.filter(vlan=vlan, asys=asys, accept=True).exists():
+    if DefaultPolicy.objects.filter(in_vlan, asys=asys, accept=True).exists():
         as_rejected_by_isd = AS.objects.filter(
             Q(isd_id__in=isd_reject) & ~Q(id=asys.id)).values_list('id')
         as_all = vlan.members.values_list('asys', flat=True).filter(~Q(asys=asys.id)).distinct()
-        accept = accept.union(as_all.difference(as_rejected_by_isd, as_rejected_by_org, as_reject))
+        accept = accept.union(as_all.difference(
+            as_rejected_by_isd, as_rejected_by_org, range_reject, as_reject))
 
     return accept
 
 
-@transaction.atomic
+def _asn_ranges_q(ranges: Iterable[AsnRange]) -> Q:
+    """Returns a filter selecting the ASes whose ASN is in any of the given ranges."""
+    return functools.reduce(operator.or_,
+        (Q(asn__range=(first, last)) for first, last in ranges), Q(pk__in=[]))
+
+
+@_with_vlan_lock
 def update_links(vlan: VLAN, asys: AS) -> None:
     """Create and delete links of the given AS to reflect the peering accepted by it and its peers.
 
-    Uses accepted peerings from AcceptedPeer relation instead of evaluating the peering policies
-    directly. update_accepted_peers() must be called on every ASes whose policies have changed for
-    this function to get up-to-date data.
+    Uses the stored accepted peerings (see AS.query_accepted_peers()) instead of evaluating the
+    peering policies directly. update_accepted_peers() must be called on every AS whose policies
+    have changed for this function to get up-to-date data.
 
     :param vlan: Peering VLAN to update.
     :param asys: AS whose links are updated.
@@ -106,9 +275,7 @@ def update_links(vlan: VLAN, asys: AS) -> None:
 
     # Remove old links.
     Link.objects.filter(
-        Q(interface_a__vlan=vlan) # both interfaces are always in the same VLAN
-        & (Q(interface_a__peering_client__asys=asys, interface_b__peering_client__asys__in=remove)
-         | Q(interface_a__peering_client__asys__in=remove, interface_b__peering_client__asys=asys))
+        Q(vlan=vlan) & (Q(as_a=asys, as_b__in=remove) | Q(as_a__in=remove, as_b=asys))
         ).delete()
 
     # Add new links.
@@ -117,10 +284,249 @@ def update_links(vlan: VLAN, asys: AS) -> None:
         _create_links(vlan, asys, peer)
 
 
-def _create_links(vlan: VLAN, as_a: AS, as_b: AS):
+@_with_vlan_lock
+def update_vlan(vlan: VLAN, asys_ids: Iterable[int]) -> None:
+    """Update the accepted peers and links of multiple ASes in a single pass.
+
+    Equivalent to calling update_accepted_peers() on every AS followed by update_links() on every
+    AS, but the links of all ASes are updated together, so a link between two of the ASes is only
+    considered once.
+
+    :param vlan: Peering VLAN to update.
+    :param asys_ids: IDs of the ASes whose policies have changed.
+    """
+    asys_ids = set(asys_ids)
+    ases = list(AS.objects.filter(id__in=asys_ids).order_by('id'))
+    if _use_sql_backend():
+        sql_resolver.update_accepted_peers(vlan)
+    else:
+        for asys in ases:
+            update_accepted_peers(vlan, asys)
+
+    # Get mutually accepted peerings. Pairs are oriented such that an AS from `asys_ids` comes
+    # first.
+    peers_new = {}
+    for asys in ases:
+        for peer_id, in asys.query_mutually_accepted_peers(vlan):
+            peers_new.setdefault(frozenset((asys.id, peer_id)), (asys.id, peer_id))
+
+    # Get currently connected ASes.
+    peers_old = {frozenset(pair) for pair in Link.objects.filter(
+        Q(vlan=vlan) & (Q(as_a_id__in=asys_ids) | Q(as_b_id__in=asys_ids))
+        ).values_list('as_a_id', 'as_b_id').distinct()}
+
+    # Remove old links.
+    remove = [tuple(pair) for pair in peers_old.difference(peers_new)]
+    for i in range(0, len(remove), UPDATE_VLAN_CHUNK_SIZE):
+        Link.objects.filter(vlan=vlan).filter(functools.reduce(operator.or_, (
+            Q(as_a_id=a, as_b_id=b) | Q(as_a_id=b, as_b_id=a)
+            for a, b in remove[i:i+UPDATE_VLAN_CHUNK_SIZE]))).delete()
+
+    # Add new links.
+    add = [peers_new[pair] for pair in peers_new.keys() - peers_old]
+    ases = AS.objects.in_bulk({asys_id for pair in add for asys_id in pair})
+    for asys_id, peer_id in sorted(add):
+        _create_links(vlan, ases[asys_id], ases[peer_id])
+
+
+def _matching_policies(peer: AS) -> Q:
+    """Returns a filter selecting the policies whose peer selection matches `peer`."""
+    return (Q(scope=PeerPolicy.Scope.AS, peer_as=peer)
+        | Q(scope=PeerPolicy.Scope.ASN_RANGE, peer_asn_first__lte=peer.asn,
+            peer_asn_last__gte=peer.asn)
+        | Q(scope=PeerPolicy.Scope.OWNER, peer_owner_id=peer.owner_id)
+        | Q(scope=PeerPolicy.Scope.ISD, peer_isd_id=peer.isd_id)
+        | Q(scope=PeerPolicy.Scope.DEFAULT))
+
+
+def get_policy_holders(vlan: VLAN, peer: AS) -> Set[int]:
+    """Get the ASes whose policies in `vlan` can match `peer`.
+
+    These are the ASes with an AS policy for `peer`, an ASN range policy covering `peer`, an owner
+    or ISD policy for the owner or ISD of `peer`, or a default accept policy. The lookup is served
+    by the reverse indexes on the peer columns of the policies.
+
+    :returns: IDs of the policy holders, not including `peer` itself.
+    """
+    holders = PeerPolicy.objects.filter(_vlan_policies(vlan)).filter(
+        _matching_policies(peer)).exclude(
+        scope=PeerPolicy.Scope.DEFAULT, accept=False).values_list('asys_id').distinct()
+    return {asys_id for asys_id, in holders if asys_id != peer.id}
+
+
+@_with_vlan_lock
+def update_peer(vlan: VLAN, peer: AS, holder_ids: Iterable[int]) -> None:
+    """Re-evaluate whether the given ASes accept `peer` and create or delete the links between them
+    and `peer` accordingly.
+
+    In contrast to update_accepted_peers(), only the policies matching `peer` are evaluated. Use
+    get_policy_holders() to find the ASes which have to be re-evaluated after `peer` has changed.
+    The accepted peers of `peer` itself must be up to date.
+
+    :param vlan: Peering VLAN to update.
+    :param peer: AS whose acceptance by the policy holders is re-evaluated.
+    :param holder_ids: IDs of the ASes whose policies are evaluated.
+    """
+    holder_ids = set(holder_ids)
+    holder_ids.discard(peer.id)
+    if not holder_ids:
+        return
+
+    # Policies of the holders matching the peer in order of decreasing precedence
+    # Default policies only apply to members of the VLAN.
+    is_member = Interface.objects.filter(vlan=vlan, peering_client__asys=peer).exists()
+    precedence = [scope for scope in PeerPolicy.PRECEDENCE
+        if is_member or scope != PeerPolicy.Scope.DEFAULT]
+    rules = {scope: {} for scope in precedence}
+    for asys_id, scope, accept in PeerPolicy.objects.filter(
+            _vlan_policies(vlan), asys_id__in=holder_ids).filter(
+            _matching_policies(peer)).values_list('asys_id', 'scope', 'accept'):
+        if scope in rules:
+            rules[scope][asys_id] = accept
+    rules = [rules[scope] for scope in precedence]
+
+    accepting = set()
+    for holder in holder_ids:
+        for rule in rules:
+            accept = rule.get(holder)
+            if accept is not None:
+                if accept:
+                    accepting.add(holder)
+                break
+
+    # Update the accepted peers of the holders. Holders marked in AcceptAll accept the peer
+    # implicitly if it is a member of the VLAN and store a rejection otherwise.
+    accept_all = set()
+    if is_member:
+        accept_all = set(AcceptAll.objects.filter(
+            vlan=vlan, asys_id__in=holder_ids).values_list('asys_id', flat=True))
+    _update_holder_relation(AcceptedPeer, vlan, peer, holder_ids, accepting - accept_all)
+    _update_holder_relation(RejectedPeer, vlan, peer, holder_ids, accept_all - accepting)
+
+    # Update the links between the holders and the peer.
+    peers_new = accepting.intersection(
+        accepted for accepted, in peer.query_accepted_peers(vlan))
+    peers_old = set(Link.objects.filter(
+        vlan=vlan, as_a=peer, as_b_id__in=holder_ids).values_list('as_b_id', flat=True))
+    peers_old.update(Link.objects.filter(
+        vlan=vlan, as_b=peer, as_a_id__in=holder_ids).values_list('as_a_id', flat=True))
+
+    remove = peers_old - peers_new
+    if remove:
+        Link.objects.filter(
+            Q(vlan=vlan) & (Q(as_a=peer, as_b_id__in=remove) | Q(as_a_id__in=remove, as_b=peer))
+            ).delete()
+    for holder in AS.objects.filter(id__in=peers_new - peers_old).order_by('id'):
+        _create_links(vlan, holder, peer)
+
+
+def _update_holder_relation(model, vlan: VLAN, peer: AS, holder_ids: Set[int], new: Set[int]
+        ) -> None:
+    """Make `new` the ASes among `holder_ids` which have `peer` in the AcceptedPeer or RejectedPeer
+    relation.
+    """
+    old = set(model.objects.filter(
+        vlan=vlan, asys_id__in=holder_ids, peer=peer).values_list('asys_id', flat=True))
+    model.objects.filter(vlan=vlan, asys_id__in=old - new, peer=peer).delete()
+    model.objects.bulk_create(model(vlan=vlan, asys_id=holder, peer=peer) for holder in new - old)
+
+
+def get_group_policy_holders(isd_ids: Iterable[int], owner_ids: Iterable[int],
+        asns: Iterable[ASN] = ()) -> Dict[int, Set[int]]:
+    """Get the ASes with ISD policies for any of the given ISDs, owner policies for any of the
+    given owners or ASN range policies covering any of the given ASNs.
+
+    Policies for all VLANs are expanded to the VLANs their holders are members of.
+
+    :returns: Mapping from VLAN IDs to the IDs of the policy holders in the VLAN.
+    """
+    selection = (Q(scope=PeerPolicy.Scope.ISD, peer_isd_id__in=isd_ids)
+        | Q(scope=PeerPolicy.Scope.OWNER, peer_owner_id__in=owner_ids))
+    for asn in asns:
+        selection |= Q(scope=PeerPolicy.Scope.ASN_RANGE,
+            peer_asn_first__lte=asn, peer_asn_last__gte=asn)
+    holders = PeerPolicy.objects.filter(selection).values_list('vlan_id', 'asys_id').distinct()
+    vlans: Dict[int, Set[int]] = {}
+    for vlan_id, asys_id in holders:
+        if vlan_id is None:
+            for member_vlan_id in VlanMembership.get_vlan_ids(asys_id):
+                vlans.setdefault(member_vlan_id, set()).add(asys_id)
+        else:
+            vlans.setdefault(vlan_id, set()).add(asys_id)
+    return vlans
+
+
+def update_groups(asys: AS, old_isd_id: int, old_owner_id: int, old_asn: ASN) -> None:
+    """Re-evaluate the policies matching an AS after its ISD, owner or ASN has changed.
+
+    Only ASes with ISD, owner or ASN range policies matching the old or new ISD, owner or ASN of
+    `asys` are re-evaluated, and only with respect to `asys`.
+    """
+    holders = get_group_policy_holders(
+        {old_isd_id, asys.isd_id}, {old_owner_id, asys.owner_id}, {old_asn, asys.asn})
+    for vlan in VLAN.objects.filter(id__in=holders.keys()).order_by('id'):
+        update_peer(vlan, asys, holders[vlan.id])
+
+
+def begin_as_deletion(asys: AS) -> None:
+    """Mark an AS as about to be deleted. Deleting its interfaces will not trigger any updates,
+    since the AS disappears from the accepted peers and links of all other ASes anyway.
+    """
+    deleting = getattr(_local, 'deleting_ases', None)
+    if deleting is None:
+        deleting = _local.deleting_ases = set()
+    deleting.add(asys.id)
+
+
+def end_as_deletion(asys: AS) -> None:
+    """Counterpart of begin_as_deletion()."""
+    getattr(_local, 'deleting_ases', set()).discard(asys.id)
+
+
+def add_interface(interface: Interface) -> None:
+    """Update the accepted peers and links after an interface has been created.
+
+    If the interface is the first one connecting its AS to the VLAN, the AS has joined the VLAN and
+    the ASes whose policies can match it are re-evaluated. Otherwise, the new interface is linked
+    to the interfaces of the AS's current peers.
+    """
+    vlan = interface.vlan
+    asys = interface.peering_client.asys
+    with lock_vlan(vlan):
+        if Interface.objects.filter(
+                vlan=vlan, peering_client__asys=asys).exclude(id=interface.id).exists():
+            peers = {peer for peer, in asys.query_connected_peers(vlan=vlan)}
+            for peer in AS.objects.filter(id__in=peers).order_by('id'):
+                _create_links(vlan, asys, peer, interface)
+        else:
+            update_accepted_peers(vlan, asys)
+            update_peer(vlan, asys, get_policy_holders(vlan, asys))
+
+
+def remove_interface(interface: Interface) -> None:
+    """Update the accepted peers after an interface has been deleted.
+
+    The links of the interface are deleted together with it. If the interface was the last one
+    connecting its AS to the VLAN, the AS has left the VLAN and is no longer accepted by default
+    policies.
+    """
+    try:
+        vlan = VLAN.objects.get(id=interface.vlan_id)
+        asys = AS.objects.get(peering_clients__id=interface.peering_client_id)
+    except (VLAN.DoesNotExist, AS.DoesNotExist):
+        return # deleted together with the interface
+    if asys.id in getattr(_local, 'deleting_ases', ()):
+        return
+    if not Interface.objects.filter(vlan=vlan, peering_client__asys=asys).exists():
+        update_peer(vlan, asys, get_policy_holders(vlan, asys))
+
+
+def _create_links(vlan: VLAN, as_a: AS, as_b: AS, interface: Optional[Interface] = None):
     """Create links between all interfaces of `as_a` and `as_b` in `vlan`.
 
     The link type is determined from the AS types.
+
+    :param interface: If given, only links of this interface of `as_a` or `as_b` are created.
     """
     # Figure out which link type to use.
     if as_a.is_core and as_b.is_core:
@@ -141,8 +547,16 @@ def _create_links(vlan: VLAN, as_a: AS, as_b: AS):
         ClientRegistry.send_async_error(as_b.asn, error)
         return
 
-    for interface_a in as_a.query_interfaces().filter(vlan=vlan).all():
-        for interface_b in as_b.query_interfaces().filter(vlan=vlan).all():
+    interfaces_a = as_a.query_interfaces().filter(vlan=vlan)
+    interfaces_b = as_b.query_interfaces().filter(vlan=vlan)
+    if interface is not None:
+        if interface.peering_client.asys_id == as_a.id:
+            interfaces_a = interfaces_a.filter(id=interface.id)
+        else:
+            interfaces_b = interfaces_b.filter(id=interface.id)
+
+    for interface_a in interfaces_a.all():
+        for interface_b in interfaces_b.all():
             port_a = port_b = None
 
             try:
@@ -0,0 +1,140 @@
+"""Activation and expiration of time-limited policies
+
+Policies can be limited in time by `valid_from` and `valid_until`. The policy evaluation ignores
+policies outside of their validity period, but the accepted peers and links of an AS only change
+when its policies are resolved again. The policy scheduler runs in the gRPC server process (see
+`grpcrunserver --scheduler-tick`) and resolves the policies as soon as they are activated or
+expire.
+
+The scheduler thread polls the database once per tick for policies whose activation or expiration
+time has passed since the previous tick. The query is answered from the partial indexes on
+`valid_from` and `valid_until`, so polling is cheap even with many policies. Since the transitions
+are read from the database, policies saved by other processes, e.g., in the admin interface, are
+picked up within one tick as well.
+
+Due transitions are processed together by `process_transitions()`: Expired policies are deleted and
+the affected ASes are resolved in a single `resolution_queue.coalesce()` block, i.e., with one
+resolution pass per VLAN. Activated policies keep their `valid_from`, the scheduler remembers up to
+which time activations have been processed instead. A policy can become visible only after the pass
+covering its activation time has run, if the transaction saving it commits late. Therefore,
+consecutive passes overlap by `ACTIVATION_OVERLAP` and activations within the overlap are resolved
+again, which does not change the outcome. Since the watermark is not persisted, the ASes of all
+policies activated in the past are resolved once when the scheduler starts. Expired policies are
+always processed on start.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from peering_coord import policy_resolver, resolution_queue
+from peering_coord.models.ixp import VLAN
+from peering_coord.models.policies import PeerPolicy
+from peering_coord.models.scion import AS
+
+
+logger = logging.getLogger(__name__)
+
+# Activations this long before the previous pass are processed again.
+ACTIVATION_OVERLAP = timedelta(seconds=5)
+
+
+class PolicyScheduler:
+    """Static class managing the thread processing policy transitions."""
+    _lock = threading.Lock()
+    _thread: Optional[threading.Thread] = None
+    _stop_event = threading.Event()
+    _tick = 1.0
+
+    @classmethod
+    def start(cls, tick: float = 1.0) -> None:
+        """Start the scheduler thread.
+
+        :param tick: Resolution of the scheduler in seconds.
+        :raises RuntimeError: The scheduler is already running.
+        """
+        with cls._lock:
+            if cls._thread is not None:
+                raise RuntimeError("The policy scheduler is already running")
+            cls._tick = tick
+            cls._stop_event.clear()
+            cls._thread = threading.Thread(
+                target=cls._run, name="policy-scheduler", daemon=True)
+        cls._thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Stop the scheduler thread."""
+        with cls._lock:
+            thread = cls._thread
+            cls._stop_event.set()
+        if thread is not None:
+            thread.join()
+        with cls._lock:
+            cls._thread = None
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """Check whether the scheduler is running."""
+        return cls._thread is not None and not cls._stop_event.is_set()
+
+    @classmethod
+    def _run(cls) -> None:
+        # Activations up to this time have been processed, None before the first pass.
+        since = None
+        try:
+            while True:
+                now = timezone.now()
+                try:
+                    process_transitions(now, since)
+                    since = now
+                except Exception:
+                    logger.exception("Processing policy transitions failed")
+                if cls._stop_event.wait(cls._tick):
+                    break
+        finally:
+            connection.close()
+
+
+@policy_resolver.retry_transaction
+def process_transitions(now: Optional[datetime] = None, since: Optional[datetime] = None) -> int:
+    """Activate and expire all policies whose activation or expiration time has passed.
+
+    Expired policies are deleted. The policies of the ASes with activated or expired policies are
+    resolved with a single pass per VLAN.
+
+    :param now: Current time, defaults to the actual time.
+    :param since: Time of the previous pass. Activations up to `ACTIVATION_OVERLAP` before this
+                  time have already been processed. If None, the ASes of all policies activated
+                  before `now` are resolved.
+    :returns: Number of activated and expired policies.
+    """
+    if now is None:
+        now = timezone.now()
+    activated = Q(valid_from__lte=now)
+    if since is not None:
+        activated &= Q(valid_from__gt=since - ACTIVATION_OVERLAP)
+
+    with resolution_queue.coalesce():
+        due = list(PeerPolicy.objects.filter(
+            activated | Q(valid_until__lte=now)).values_list('vlan_id', 'asys_id'))
+        if not due:
+            return 0
+        PeerPolicy.objects.filter(valid_until__lte=now).delete()
+
+        vlans = VLAN.objects.in_bulk({vlan_id for vlan_id, _ in due if vlan_id is not None})
+        ases = AS.objects.in_bulk({asys_id for _, asys_id in due})
+        for vlan_id, asys_id in set(due):
+            # Skip VLANs and ASes deleted since the policies were read.
+            vlan = vlans.get(vlan_id) if vlan_id is not None else None
+            asys = ases.get(asys_id)
+            if (vlan_id is not None and vlan is None) or asys is None:
+                continue
+            resolution_queue.resolve(vlan, asys)
+
+    return len(due)
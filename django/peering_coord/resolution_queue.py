@@ -0,0 +1,237 @@
+"""Background resolution of policy changes
+
+By default, policy RPCs update the accepted peers and links of the AS whose policies have changed
+before they return. When the gRPC server is started with `--resolver-workers N`, the RPCs only
+commit the policy change and queue a resolution job, which is picked up by one of N worker threads
+running in the server process. Jobs are keyed by (VLAN, AS): A job queued while an identical job is
+still waiting is merged into the waiting job, so a burst of policy changes is resolved only once.
+Workers take all waiting jobs of a VLAN at once and resolve them in a single pass.
+
+Independently of the queue, `coalesce()` collects the resolutions requested by a bulk operation and
+runs them on exit, again with a single pass per VLAN.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from django.db import close_old_connections, connection, transaction
+
+from peering_coord import policy_resolver
+from peering_coord.models.ixp import VLAN
+from peering_coord.models.membership import VlanMembership
+from peering_coord.models.scion import AS
+
+
+logger = logging.getLogger(__name__)
+
+_JobKey = Tuple[int, int] # (VLAN ID, AS ID)
+
+# (VLAN ID, AS ID) pairs collected by the outermost active coalesce() block of the thread
+_local = threading.local()
+
+
+class JobStatus(NamedTuple):
+    """Outstanding resolution job as reported by `ResolutionQueue.get_status()`."""
+    vlan_id: int
+    running: bool
+
+
+class AsResolutionStatus(NamedTuple):
+    """Resolution progress of a single AS."""
+    jobs: List[JobStatus]
+    queue_length: int
+    failed_jobs: int
+    last_error: str
+
+
+class ResolutionQueue:
+    """Static class managing the queue of resolution jobs and the worker threads processing them."""
+    _cond = threading.Condition()
+    # Jobs waiting for a worker in the order they have been queued
+    _pending: 'OrderedDict[_JobKey, None]' = OrderedDict()
+    # Jobs currently processed by a worker
+    _running = set()
+    # AS ID -> (number of failed jobs, error message of the last failure)
+    _failures: Dict[int, Tuple[int, str]] = {}
+    _workers: List[threading.Thread] = []
+    _stopping = False
+
+    @classmethod
+    def start(cls, workers: int) -> None:
+        """Start the given number of worker threads.
+
+        :raises RuntimeError: The workers are already running.
+        """
+        with cls._cond:
+            if cls._workers:
+                raise RuntimeError("Resolution workers are already running")
+            cls._stopping = False
+            cls._workers = [
+                threading.Thread(target=cls._work, name="resolver-{}".format(i), daemon=True)
+                for i in range(workers)
+            ]
+        for worker in cls._workers:
+            worker.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Process all remaining jobs and stop the worker threads."""
+        with cls._cond:
+            workers = cls._workers
+            cls._stopping = True
+            cls._cond.notify_all()
+        for worker in workers:
+            worker.join()
+        with cls._cond:
+            cls._workers = []
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """Check whether policy changes are resolved in the background."""
+        return len(cls._workers) > 0 and not cls._stopping
+
+    @classmethod
+    def enqueue(cls, vlan_id: int, asys_id: int) -> None:
+        """Queue resolution of the policies of an AS in a VLAN.
+
+        If the same job is already waiting, the new job is merged into it. Jobs which are already
+        running are queued again, since they might have missed the latest changes.
+        """
+        with cls._cond:
+            key = (vlan_id, asys_id)
+            if key not in cls._pending:
+                cls._pending[key] = None
+                cls._cond.notify()
+
+    @classmethod
+    def wait_until_idle(cls, timeout: Optional[float] = None) -> bool:
+        """Block until there are no more pending or running jobs.
+
+        :returns: False if the timeout expired, True otherwise.
+        """
+        with cls._cond:
+            return cls._cond.wait_for(lambda: not cls._pending and not cls._running, timeout)
+
+    @classmethod
+    def get_status(cls, asys_id: int) -> AsResolutionStatus:
+        """Returns the outstanding jobs and the failure statistics of an AS."""
+        with cls._cond:
+            jobs = [JobStatus(vlan_id, True)
+                for vlan_id, job_asys in cls._running if job_asys == asys_id]
+            jobs.extend(JobStatus(vlan_id, False)
+                for vlan_id, job_asys in cls._pending if job_asys == asys_id)
+            failed_jobs, last_error = cls._failures.get(asys_id, (0, ""))
+            return AsResolutionStatus(jobs, len(cls._pending), failed_jobs, last_error)
+
+    @classmethod
+    def _next_jobs(cls) -> Optional[List[_JobKey]]:
+        # Take the oldest pending job which is not running in another worker already, together
+        # with all other such jobs in the same VLAN.
+        # Must be called with _cond held.
+        vlan_id = next((key[0] for key in cls._pending if key not in cls._running), None)
+        if vlan_id is None:
+            return None
+        keys = [key for key in cls._pending if key[0] == vlan_id and key not in cls._running]
+        for key in keys:
+            del cls._pending[key]
+            cls._running.add(key)
+        return keys
+
+    @classmethod
+    def _work(cls) -> None:
+        try:
+            while True:
+                with cls._cond:
+                    keys = cls._next_jobs()
+                    while keys is None:
+                        if cls._stopping and not cls._pending:
+                            return
+                        cls._cond.wait()
+                        keys = cls._next_jobs()
+                vlan_id = keys[0][0]
+                asys_ids = [asys_id for _, asys_id in keys]
+                try:
+                    close_old_connections()
+                    try:
+                        vlan = VLAN.objects.get(id=vlan_id)
+                    except VLAN.DoesNotExist:
+                        continue # deleted in the meantime, nothing to resolve
+                    resolve_now(vlan, asys_ids)
+                except Exception as e:
+                    logger.exception("Resolution of ASes %s in VLAN %d failed", asys_ids, vlan_id)
+                    with cls._cond:
+                        for asys_id in asys_ids:
+                            failed_jobs, _ = cls._failures.get(asys_id, (0, ""))
+                            cls._failures[asys_id] = (failed_jobs + 1, str(e))
+                finally:
+                    with cls._cond:
+                        cls._running.difference_update(keys)
+                        cls._cond.notify_all()
+        finally:
+            connection.close()
+
+
+@policy_resolver.retry_transaction
+def resolve_now(vlan: VLAN, asys_ids: Iterable[int]) -> None:
+    """Update the accepted peers and links of ASes in a VLAN in a single transaction."""
+    policy_resolver.update_vlan(vlan, asys_ids)
+
+
+def resolve(vlan: Optional[VLAN], asys: AS) -> None:
+    """Bring the accepted peers and links of an AS in a VLAN up to date after its policies have
+    changed.
+
+    Within a `coalesce()` block, resolution is deferred to the end of the block. Otherwise, if
+    background resolution is active, a job is queued once the current transaction commits. If
+    neither is the case, the policies are resolved immediately.
+
+    :param vlan: VLAN whose policies have changed. None if policies applying to all VLANs have
+        changed, in which case the AS is resolved in every VLAN it is a member of.
+    """
+    if vlan is None:
+        pairs = {(vlan_id, asys.id) for vlan_id in VlanMembership.get_vlan_ids(asys.id)}
+    else:
+        pairs = {(vlan.id, asys.id)}
+    dirty = getattr(_local, 'dirty', None)
+    if dirty is not None:
+        dirty.update(pairs)
+    else:
+        _resolve_all(pairs)
+
+
+@contextmanager
+def coalesce():
+    """Context manager collecting the resolutions requested by `resolve()` in the `with` block.
+
+    On exit, every (VLAN, AS) pair is resolved once, with a single pass per VLAN. Nested blocks
+    are merged into the outermost block. If the block raises an exception, nothing is resolved.
+    Use inside the transaction making the policy changes, so a failed resolution rolls them back.
+    """
+    if getattr(_local, 'dirty', None) is not None:
+        yield
+        return
+    _local.dirty = set()
+    try:
+        yield
+        dirty, _local.dirty = _local.dirty, None
+        _resolve_all(dirty)
+    finally:
+        _local.dirty = None
+
+
+def _resolve_all(dirty: Set[_JobKey]) -> None:
+    if ResolutionQueue.is_active():
+        def enqueue():
+            for vlan_id, asys_id in sorted(dirty):
+                ResolutionQueue.enqueue(vlan_id, asys_id)
+        transaction.on_commit(enqueue)
+        return
+
+    vlans: Dict[int, Set[int]] = {}
+    for vlan_id, asys_id in dirty:
+        vlans.setdefault(vlan_id, set()).add(asys_id)
+    for vlan in VLAN.objects.filter(id__in=vlans.keys()).order_by('id'):
+        resolve_now(vlan, vlans[vlan.id])
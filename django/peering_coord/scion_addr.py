@@ -1,59 +1,91 @@
-from typing import Union
+import bisect
+import functools
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 
 class ASN:
-    """Represents an AS number (without the ISD part)."""
+    """Represents an AS number (without the ISD part).
+
+    ASN objects are immutable and interned: Constructing an ASN from a value that is still in the
+    (bounded) intern cache returns the existing instance instead of allocating a new one. The string
+    representation is computed once and cached in the instance.
+    """
     BITS = 48
     MAX_VALUE = (1 << BITS) - 1
     BGP_ASN_BITS = 32
     MAX_BGP_ASN = (1 << BGP_ASN_BITS) - 1
     GROUP_BITS = 16
     GROUP_MAX_VALUE = (1 << GROUP_BITS) - 1
+    INTERN_CACHE_SIZE = 1 << 16
+
+    __slots__ = ('asn_int', '_str')
 
-    def __init__(self, initializer: Union[int, str]):
+    def __new__(cls, initializer: Union[int, str]):
         """Initialize from an ASN string or a numerical representation.
 
         :raises: ValueError: Initializer not recognized as a valid ASN.
         """
         if isinstance(initializer, int):
-            if initializer < 0 or initializer > self.MAX_VALUE:
+            if initializer < 0 or initializer > cls.MAX_VALUE:
                 raise ValueError("Invalid ASN. (Out of range)")
-            self.asn_int = initializer
+            return intern_asn(initializer)
         elif isinstance(initializer, str):
-            parts = initializer.split(":")
-            if len(parts) == 1:
-                # Expect decimal AS number (BGP style)
-                self.asn_int = int(parts[0])
-                if self.asn_int < 0 or self.asn_int > self.MAX_BGP_ASN:
-                    raise ValueError("Invalid decimal ASN.")
-            elif len(parts) == 3:
-                # Hexadecimal AS number in three 16 bit groups
-                self.asn_int = 0
-                for group in parts:
-                    self.asn_int <<= self.GROUP_BITS
-                    group_value = int(group, base=16)
-                    if group_value < 0 or group_value > self.GROUP_MAX_VALUE:
-                        raise ValueError("Invalid hexadecimal ASN. (Invalid group value)")
-                    self.asn_int |= group_value
-            else:
-                raise ValueError("Invalid ASN. (Wrong number of colon-separated groups)")
+            return intern_asn(cls.parse(initializer))
         else:
             raise ValueError("Invalid initializer type for ASN.")
 
+    @classmethod
+    def parse(cls, string: str) -> int:
+        """Parse an ASN string to its numerical representation.
+
+        :raises: ValueError: String not recognized as a valid ASN.
+        """
+        parts = string.split(":")
+        if len(parts) == 1:
+            # Expect decimal AS number (BGP style)
+            asn_int = int(string)
+            if asn_int < 0 or asn_int > cls.MAX_BGP_ASN:
+                raise ValueError("Invalid decimal ASN.")
+            return asn_int
+        elif len(parts) == 3:
+            # Hexadecimal AS number in three 16 bit groups
+            high, mid, low = int(parts[0], 16), int(parts[1], 16), int(parts[2], 16)
+            if (high < 0 or high > cls.GROUP_MAX_VALUE or mid < 0 or mid > cls.GROUP_MAX_VALUE
+                    or low < 0 or low > cls.GROUP_MAX_VALUE):
+                raise ValueError("Invalid hexadecimal ASN. (Invalid group value)")
+            return (high << 2 * cls.GROUP_BITS) | (mid << cls.GROUP_BITS) | low
+        else:
+            raise ValueError("Invalid ASN. (Wrong number of colon-separated groups)")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ASN objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ASN objects are immutable")
+
+    def __reduce__(self):
+        return (ASN, (self.asn_int,))
+
     def __int__(self):
         return self.asn_int
 
     def __str__(self):
+        try:
+            return self._str
+        except AttributeError:
+            pass
         if self.asn_int <= self.MAX_BGP_ASN:
             # BGP style ASN
-            return str(self.asn_int)
+            string = str(self.asn_int)
         else:
             # SCION style hexadecimal ASN in three groups
-            return "%x:%x:%x" % (
+            string = "%x:%x:%x" % (
                 (self.asn_int >> 2 * self.GROUP_BITS) & self.GROUP_MAX_VALUE,
                 (self.asn_int >> self.GROUP_BITS) & self.GROUP_MAX_VALUE,
                 (self.asn_int) & self.GROUP_MAX_VALUE
             )
+        object.__setattr__(self, '_str', string)
+        return string
 
     def __repr__(self):
         return 'ASN("%s")' % self.__str__()
@@ -66,6 +98,8 @@ class ASN:
         return self.asn_int.to_bytes(self.BITS // 8, byteorder='big')
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if type(self) != type(other):
             return False
         else:
@@ -73,3 +107,146 @@ class ASN:
 
     def __hash__(self):
         return hash(self.asn_int)
+
+
+@functools.lru_cache(maxsize=ASN.INTERN_CACHE_SIZE)
+def intern_asn(asn_int: int) -> ASN:
+    """Returns the ASN instance for a numerical ASN without range checks. Intended for ASNs that
+    are known to be valid, e.g., because they have been read from the database.
+    """
+    asn = object.__new__(ASN)
+    object.__setattr__(asn, 'asn_int', asn_int)
+    return asn
+
+
+class AsnRange(NamedTuple):
+    """Inclusive range of AS numbers.
+
+    The string representation is either a pair of ASNs separated by a dash ("ff00:0:100-ff00:0:1ff")
+    or an ASN in hexadecimal notation with wildcards in place of the trailing groups ("ff00:0:*"). A
+    single "*" stands for all ASNs, "0:*:*" covers exactly the BGP-style ASNs.
+    """
+    first: ASN
+    last: ASN
+
+    WILDCARD = "*"
+
+    @classmethod
+    def parse(cls, string: str) -> 'AsnRange':
+        """Parse an ASN range or wildcard. A single ASN is parsed as a range of one ASN.
+
+        :raises: ValueError: String not recognized as a valid ASN range.
+        """
+        if string == cls.WILDCARD:
+            return cls(ASN(0), ASN(ASN.MAX_VALUE))
+
+        if "-" in string:
+            first, _, last = string.partition("-")
+            asn_range = cls(ASN(first), ASN(last))
+            if asn_range.first.asn_int > asn_range.last.asn_int:
+                raise ValueError("Invalid ASN range. (First ASN greater than last ASN)")
+            return asn_range
+
+        parts = string.split(":")
+        if len(parts) != 3 or cls.WILDCARD not in parts:
+            asn = ASN(string)
+            return cls(asn, asn)
+        wildcards = 0
+        while wildcards < 3 and parts[-wildcards - 1] == cls.WILDCARD:
+            wildcards += 1
+        if wildcards == 0 or cls.WILDCARD in parts[:3 - wildcards]:
+            raise ValueError("Invalid ASN range. (Wildcards must replace trailing groups)")
+        if wildcards == 3:
+            return cls(ASN(0), ASN(ASN.MAX_VALUE))
+        prefix = ":".join(parts[:3 - wildcards] + ["0"] * wildcards)
+        first = ASN(prefix)
+        mask = (1 << wildcards * ASN.GROUP_BITS) - 1
+        return cls(first, ASN(first.asn_int | mask))
+
+    def __str__(self):
+        first, last = self.first.asn_int, self.last.asn_int
+        if first == last:
+            return str(self.first)
+        if first == 0 and last == ASN.MAX_VALUE:
+            return self.WILDCARD
+        for wildcards in (1, 2):
+            mask = (1 << wildcards * ASN.GROUP_BITS) - 1
+            if first & mask == 0 and last == first | mask:
+                groups = ["%x" % ((first >> (2 - i) * ASN.GROUP_BITS) & ASN.GROUP_MAX_VALUE)
+                    for i in range(3 - wildcards)]
+                return ":".join(groups + [self.WILDCARD] * wildcards)
+        return "%s-%s" % (self.first, self.last)
+
+    def __repr__(self):
+        return 'AsnRange("%s")' % self.__str__()
+
+    def contains(self, asn: ASN) -> bool:
+        return self.first.asn_int <= asn.asn_int <= self.last.asn_int
+
+    def overlaps(self, other: 'AsnRange') -> bool:
+        return (self.first.asn_int <= other.last.asn_int
+            and other.first.asn_int <= self.last.asn_int)
+
+
+class AsnRangeIndex:
+    """Sorted index of non-overlapping ASN ranges, each of which is associated with a value.
+
+    Ranges are kept sorted by their first ASN, so the range containing an ASN or overlapping another
+    range is found by binary search.
+    """
+
+    def __init__(self, items: Iterable[Tuple[AsnRange, Any]] = ()):
+        """Build the index from (range, value) pairs in any order.
+
+        :raises: ValueError: Some of the ranges overlap.
+        """
+        self._items: List[Tuple[AsnRange, Any]] = sorted(
+            items, key=lambda item: item[0].first.asn_int)
+        for (prev, _), (asn_range, _) in zip(self._items, self._items[1:]):
+            if prev.last.asn_int >= asn_range.first.asn_int:
+                raise ValueError("ASN ranges %s and %s overlap" % (prev, asn_range))
+        self._firsts = [asn_range.first.asn_int for asn_range, _ in self._items]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Tuple[AsnRange, Any]]:
+        return iter(self._items)
+
+    def add(self, asn_range: AsnRange, value: Any) -> None:
+        """Insert a range into the index.
+
+        :raises: ValueError: The range overlaps a range already in the index.
+        """
+        overlapping = self.find_overlapping(asn_range)
+        if overlapping is not None:
+            raise ValueError("ASN ranges %s and %s overlap" % (overlapping[0], asn_range))
+        i = bisect.bisect_right(self._firsts, asn_range.first.asn_int)
+        self._firsts.insert(i, asn_range.first.asn_int)
+        self._items.insert(i, (asn_range, value))
+
+    def find_overlapping(self, asn_range: AsnRange) -> Optional[Tuple[AsnRange, Any]]:
+        """Returns a (range, value) pair from the index overlapping `asn_range` or None."""
+        # Since the ranges are disjoint, the range with the greatest first ASN not past the end of
+        # `asn_range` also has the greatest last ASN among all candidates.
+        i = bisect.bisect_right(self._firsts, asn_range.last.asn_int)
+        if i > 0 and self._items[i - 1][0].last.asn_int >= asn_range.first.asn_int:
+            return self._items[i - 1]
+        return None
+
+    def get(self, asn: ASN, default: Any = None) -> Any:
+        """Returns the value of the range containing `asn` or `default`."""
+        item = self.find_overlapping(AsnRange(asn, asn))
+        return default if item is None else item[1]
+
+    def coalesce(self, value: Any) -> List[AsnRange]:
+        """Returns the ranges associated with `value`, merging adjacent ranges."""
+        ranges: List[AsnRange] = []
+        for asn_range, item_value in self._items:
+            if item_value != value:
+                continue
+            if ranges and ranges[-1].last.asn_int + 1 == asn_range.first.asn_int:
+                ranges[-1] = AsnRange(ranges[-1].first, asn_range.last)
+            else:
+                ranges.append(asn_range)
+        return ranges
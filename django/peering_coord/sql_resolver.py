@@ -0,0 +1,174 @@
+"""SQL backend of the policy resolver
+
+Evaluates the peering policies of all ASes in a VLAN with a single SQL statement built from common
+table expressions, instead of evaluating the policies of one AS at a time with ORM queries (see
+`policy_resolver._get_accepted_peers()`). The accepted peers are written with INSERT ... SELECT and
+DELETE ... WHERE NOT EXISTS statements, so they never have to be loaded into Python.
+
+Enabled by setting POLICY_RESOLVER_BACKEND to 'sql', which applies to the resolution of whole VLANs
+as well as of single ASes. Supports SQLite and PostgreSQL.
+"""
+
+from typing import List, Optional, Sequence, Set, Tuple
+
+from django.db import connection
+from django.utils import timezone
+
+from peering_coord.models.ixp import VLAN, Interface, PeeringClient
+from peering_coord.models.policies import PeerPolicy
+from peering_coord.models.scion import AS, AcceptAll, AcceptedPeer, RejectedPeer
+
+
+def _tables():
+    qn = connection.ops.quote_name
+    names = {name: qn(model._meta.db_table) for name, model in [
+        ('interface', Interface),
+        ('peering_client', PeeringClient),
+        ('as', AS),
+        ('policy', PeerPolicy),
+        ('accepted_peer', AcceptedPeer),
+        ('accept_all', AcceptAll),
+        ('rejected_peer', RejectedPeer),
+    ]}
+    names.update(('scope_' + scope.name.lower(), int(scope)) for scope in PeerPolicy.Scope)
+    return names
+
+
+# Common table expressions evaluating the policies of a VLAN. The parameters are the VLAN ID twice
+# followed by the current time twice and the AS ID if the policies are restricted to a single AS.
+#
+# members:  ASes with an interface in the VLAN
+# policies: Policies currently in effect in the VLAN: The policies of the VLAN itself and the
+#           policies for all VLANs of the members (see `policy_resolver._vlan_policies()`),
+#           optionally restricted to the policies of a single AS
+# rules:    Every (AS, peer) pair matched by a policy with the policy's decision and precedence
+#           (1 = AS, 2 = ASN range, 3 = owner, 4 = ISD, 5 = default). A pair is matched by at most
+#           one policy of each precedence.
+# accepted: Pairs whose matching policy of highest precedence accepts the peer
+# accept_all, rejected, explicit:
+#           Compact representation of `accepted` as stored in AcceptAll, RejectedPeer and
+#           AcceptedPeer.
+_POLICY_CTES = """
+members (asys_id) AS (
+    SELECT DISTINCT c.asys_id FROM {interface} i
+    JOIN {peering_client} c ON c.id = i.peering_client_id
+    WHERE i.vlan_id = %s
+),
+policies AS (
+    SELECT p.* FROM {policy} p
+    WHERE (p.vlan_id = %s
+        OR (p.vlan_id IS NULL AND p.asys_id IN (SELECT asys_id FROM members)))
+    AND (p.valid_from IS NULL OR p.valid_from <= %s)
+    AND (p.valid_until IS NULL OR p.valid_until > %s)
+    {asys_filter}
+),
+rules (asys_id, peer_id, accept, precedence) AS (
+    SELECT p.asys_id, p.peer_as_id, p.accept, 1 FROM policies p
+    WHERE p.scope = {scope_as}
+    UNION ALL
+    SELECT p.asys_id, a.id, p.accept, 2 FROM policies p
+    JOIN {as} a ON a.asn BETWEEN p.peer_asn_first AND p.peer_asn_last AND a.id <> p.asys_id
+    WHERE p.scope = {scope_asn_range}
+    UNION ALL
+    SELECT p.asys_id, a.id, p.accept, 3 FROM policies p
+    JOIN {as} a ON a.owner_id = p.peer_owner_id AND a.id <> p.asys_id
+    WHERE p.scope = {scope_owner}
+    UNION ALL
+    SELECT p.asys_id, a.id, p.accept, 4 FROM policies p
+    JOIN {as} a ON a.isd_id = p.peer_isd_id AND a.id <> p.asys_id
+    WHERE p.scope = {scope_isd}
+    UNION ALL
+    SELECT p.asys_id, m.asys_id, p.accept, 5 FROM policies p
+    JOIN members m ON m.asys_id <> p.asys_id
+    WHERE p.scope = {scope_default}
+),
+accepted (asys_id, peer_id) AS (
+    SELECT r.asys_id, r.peer_id FROM rules r
+    WHERE r.accept AND NOT EXISTS (
+        SELECT 1 FROM rules s
+        WHERE s.asys_id = r.asys_id AND s.peer_id = r.peer_id AND s.precedence < r.precedence)
+),
+accept_all (asys_id) AS (
+    SELECT p.asys_id FROM policies p
+    WHERE p.scope = {scope_default} AND p.accept
+),
+rejected (asys_id, peer_id) AS (
+    SELECT aa.asys_id, m.asys_id FROM accept_all aa
+    JOIN members m ON m.asys_id <> aa.asys_id
+    WHERE NOT EXISTS (
+        SELECT 1 FROM accepted a WHERE a.asys_id = aa.asys_id AND a.peer_id = m.asys_id)
+),
+explicit (asys_id, peer_id) AS (
+    SELECT a.asys_id, a.peer_id FROM accepted a
+    WHERE NOT EXISTS (SELECT 1 FROM accept_all aa WHERE aa.asys_id = a.asys_id)
+    OR NOT EXISTS (SELECT 1 FROM members m WHERE m.asys_id = a.peer_id)
+)
+"""
+
+
+def _with(vlan: VLAN, statement: str, params: Sequence = (), asys: Optional[AS] = None
+        ) -> Tuple[str, List]:
+    """Prefix `statement` with the policy CTEs of `vlan`.
+
+    :param asys: If given, only the policies of this AS are evaluated.
+    """
+    tables = _tables()
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    cte_params = [vlan.id, vlan.id, now, now]
+    asys_filter = ""
+    if asys is not None:
+        asys_filter = "AND p.asys_id = %s"
+        cte_params.append(asys.id)
+    sql = ("WITH " + _POLICY_CTES.format(asys_filter=asys_filter, **tables)
+        + statement.format(**tables))
+    return sql, cte_params + list(params)
+
+
+def get_accepted_pairs(vlan: VLAN) -> Set[Tuple[int, int]]:
+    """Evaluate the policies of all ASes in a VLAN.
+
+    :returns: The set of (AS ID, peer ID) pairs of peers accepted by the ASes. Equivalent to the
+        result of `policy_resolver._get_accepted_peers()` for every AS with policies in `vlan`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(*_with(vlan, "SELECT asys_id, peer_id FROM accepted"))
+        return set(cursor.fetchall())
+
+
+def update_accepted_peers(vlan: VLAN, asys: Optional[AS] = None) -> None:
+    """Update the accepted peers of all ASes in a VLAN.
+
+    Brings AcceptAll, RejectedPeer and AcceptedPeer in line with the policies of `vlan` without
+    transferring any rows to Python. Must be called while holding the VLAN lock.
+
+    :param asys: If given, only the accepted peers of this AS are updated.
+    """
+    # Restricts the deletions to the rows of `asys`
+    target, target_params = ("AND asys_id = %s", [asys.id]) if asys is not None else ("", [])
+    statements = [
+        # AcceptAll
+        ("""DELETE FROM {accept_all} WHERE vlan_id = %s """ + target + """ AND NOT EXISTS (
+            SELECT 1 FROM accept_all aa WHERE aa.asys_id = {accept_all}.asys_id)""",
+            [vlan.id] + target_params),
+        ("""INSERT INTO {accept_all} (vlan_id, asys_id) SELECT %s, aa.asys_id FROM accept_all aa
+            WHERE NOT EXISTS (SELECT 1 FROM {accept_all} t
+                WHERE t.vlan_id = %s AND t.asys_id = aa.asys_id)""",
+            [vlan.id, vlan.id]),
+    ]
+    for table, cte in [('rejected_peer', 'rejected'), ('accepted_peer', 'explicit')]:
+        statements += [
+            ("""DELETE FROM {%s} WHERE vlan_id = %%s %s AND NOT EXISTS (
+                SELECT 1 FROM %s d
+                WHERE d.asys_id = {%s}.asys_id AND d.peer_id = {%s}.peer_id)"""
+                % (table, target, cte, table, table),
+                [vlan.id] + target_params),
+            ("""INSERT INTO {%s} (vlan_id, asys_id, peer_id) SELECT %%s, d.asys_id, d.peer_id
+                FROM %s d WHERE NOT EXISTS (SELECT 1 FROM {%s} t
+                    WHERE t.vlan_id = %%s AND t.asys_id = d.asys_id AND t.peer_id = d.peer_id)"""
+                % (table, cte, table),
+                [vlan.id, vlan.id]),
+        ]
+
+    with connection.cursor() as cursor:
+        for statement, params in statements:
+            cursor.execute(*_with(vlan, statement, params, asys))
@@ -13,13 +13,6 @@ def url_format_asn(asn):
     return str(asn).replace(":", "-")
 
 
-@register.filter
-def count_peers(asys, vlan):
-    """Gets the number of peers connected to an AS in a certain VLAN."""
-    # TODO: Cache
-    return asys.query_connected_peers(vlan=vlan).count()
-
-
 @register.filter
 def has_access(user, asys):
     """Returns true, if the user has access to the configuration of the given AS."""
@@ -0,0 +1,96 @@
+import ipaddress
+import unittest
+
+from django.test import TestCase
+
+from peering_coord import accept_matrix
+from peering_coord.models.ixp import Owner, VLAN, PeeringClient, Interface
+from peering_coord.models.scion import ISD, AS
+from peering_coord.models.policies import (
+    AsPeerPolicy, AsRangePeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
+from peering_coord.policy_resolver import _get_accepted_peers, update_vlan
+from peering_coord.scion_addr import ASN
+
+
+@unittest.skipUnless(accept_matrix.is_available(), "NumPy is not installed")
+class AcceptMatrixTest(TestCase):
+    """Compare the vectorized policy evaluation with the policy resolver."""
+    AS_COUNT = 30
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vlan = VLAN.objects.create(name="prod", long_name="Production",
+            ip_network=ipaddress.IPv4Network("10.0.0.0/16"))
+        cls.owner = [
+            Owner.objects.create(name="owner%d" % i, long_name="Owner %d" % i) for i in range(4)
+        ]
+        cls.isd = [
+            ISD.objects.create(isd_id=i + 1, name="Region %d" % (i + 1)) for i in range(3)
+        ]
+
+        # The last AS is not a member of the VLAN.
+        cls.asys = []
+        for i in range(cls.AS_COUNT + 1):
+            asys = AS.objects.create(asn=ASN(0xff0000000000 + i), isd=cls.isd[i % len(cls.isd)],
+                name="AS %d" % i, owner=cls.owner[i % len(cls.owner)], is_core=(i % 7 == 0))
+            cls.asys.append(asys)
+            if i < cls.AS_COUNT:
+                client = PeeringClient.objects.create(asys=asys, name="default")
+                Interface.objects.create(peering_client=client, vlan=cls.vlan,
+                    public_ip=cls.vlan.ip_network[i + 1], first_port=50000, last_port=51000)
+
+        for i, asys in enumerate(cls.asys[:cls.AS_COUNT]):
+            if i % 2 == 0:
+                DefaultPolicy.objects.create(vlan=cls.vlan, asys=asys, accept=True)
+            else:
+                # Policies for all VLANs
+                DefaultPolicy.objects.create(vlan=None, asys=asys, accept=(i % 4 == 1))
+                AsPeerPolicy.objects.create(vlan=None, asys=asys,
+                    peer_as=cls.asys[(i + 5) % len(cls.asys)], accept=(i % 3 == 0))
+            IsdPeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_isd=cls.isd[i % len(cls.isd)], accept=(i % 3 != 0))
+            OwnerPeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_owner=cls.owner[(i + 1) % len(cls.owner)], accept=(i % 4 != 0))
+            AsPeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_as=cls.asys[i - 1], accept=(i % 5 != 0))
+            AsPeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_as=cls.asys[(i + 2) % len(cls.asys)], accept=(i % 3 == 0))
+            AsRangePeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_asn_first=cls.asys[(i + 3) % len(cls.asys)].asn,
+                peer_asn_last=ASN(int(cls.asys[(i + 3) % len(cls.asys)].asn) + 4),
+                accept=(i % 3 == 1))
+
+    def test_accepted_peers(self):
+        matrix = accept_matrix.build_accept_matrix(self.vlan)
+        members = set(matrix.as_ids.tolist())
+        self.assertEqual(members, {asys.id for asys in self.asys[:self.AS_COUNT]})
+        for asys in self.asys[:self.AS_COUNT]:
+            with self.subTest(asys=str(asys)):
+                expected = {peer for peer, in _get_accepted_peers(self.vlan, asys)} & members
+                self.assertEqual(matrix.get_accepted_peers(asys.id), expected)
+
+    def test_link_changes(self):
+        changes = accept_matrix.get_link_changes(self.vlan)
+        self.assertGreater(len(changes.add), 0)
+        self.assertEqual(changes.remove, set())
+
+        update_vlan(self.vlan, [asys.id for asys in self.asys])
+        changes = accept_matrix.get_link_changes(self.vlan)
+        self.assertEqual(changes.add, set())
+        self.assertEqual(changes.remove, set())
+
+        # Reject a linked peer
+        as_a, as_b = sorted(accept_matrix.build_accept_matrix(self.vlan).get_peerings())[0]
+        AsPeerPolicy.objects.update_or_create(vlan=self.vlan, asys_id=as_a, peer_as_id=as_b,
+            defaults={'accept': False})
+        changes = accept_matrix.get_link_changes(self.vlan)
+        self.assertEqual(changes.add, set())
+        self.assertEqual(changes.remove, {(as_a, as_b)})
+
+    def test_empty_vlan(self):
+        vlan = VLAN.objects.create(name="test", long_name="Testing",
+            ip_network=ipaddress.IPv4Network("10.1.0.0/16"))
+        matrix = accept_matrix.build_accept_matrix(vlan)
+        self.assertEqual(matrix.accept.shape, (0, 0))
+        self.assertEqual(accept_matrix.get_link_changes(vlan, matrix),
+            accept_matrix.LinkChanges(set(), set()))
@@ -1,14 +1,23 @@
 import ipaddress
 import queue
+from datetime import timedelta
+from unittest import mock
 
 import grpc
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from rest_framework import serializers
 from django_grpc_framework.test import RPCTestCase
 from google.protobuf.empty_pb2 import Empty
-from peering_coord.api import info_pb2, info_pb2_grpc, peering_pb2, peering_pb2_grpc
+from peering_coord import policy_resolver
+from peering_coord.api import info_pb2, info_pb2_grpc, peering, peering_pb2, peering_pb2_grpc
 from peering_coord.api.authentication import ASN_HEADER_KEY, CLIENT_NAME_HEADER_KEY
 from peering_coord.api.client_connection import ClientRegistry
-from peering_coord.api.serializers import PolicyProtoSerializer
+from peering_coord.api.serializers import PolicyBatch, PolicyProtoSerializer
 from peering_coord.models.ixp import VLAN, Interface, Owner, PeeringClient
+from peering_coord.models.membership import VlanMembership
+from peering_coord.models.policies import (
+    AsPeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
 from peering_coord.models.scion import AS, ISD
 from peering_coord.scion_addr import ASN
 
@@ -197,7 +206,9 @@ class PeeringServiceTest(RPCTestCase):
         stub = peering_pb2_grpc.PeeringStub(self.channel)
         call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
 
-        response = list(stub.ListPolicies(peering_pb2.ListPolicyRequest(), metadata=call_cred))
+        # A single query, regardless of the number of policies
+        with self.assertNumQueries(1):
+            response = list(stub.ListPolicies(peering_pb2.ListPolicyRequest(), metadata=call_cred))
         self.assertEqual(len(response), len(self.all_policies) + 1)
         for policy in self.all_policies:
             self.assertTrue(policy in response)
@@ -368,6 +379,444 @@ class PeeringServiceTest(RPCTestCase):
             self.assertTrue(False, "Unexpected response")
 
 
+    def test_set_diff(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        # Obtain write access
+        request_queue = queue.Queue()
+        channel = stub.StreamChannel(iter(request_queue.get, None), metadata=call_cred)
+        request = peering_pb2.StreamMessageRequest()
+        request.arbitration.election_id = 0
+        request_queue.put(request)
+        next(channel)
+        next(channel)
+
+        def stored_policies():
+            return {(model.__name__, policy.id, policy.accept)
+                for model in [DefaultPolicy, AsPeerPolicy, IsdPeerPolicy, OwnerPeerPolicy]
+                for policy in model.objects.filter(asys=self.asys[0])}
+        before = stored_policies()
+
+        # Setting the current policies again does not change anything.
+        policies = self.all_policies + [self.other_vlan_policy]
+        with mock.patch.object(policy_resolver, 'update_accepted_peers') as update:
+            response = stub.SetPolicies(
+                peering_pb2.SetPoliciesRequest(policies=policies), metadata=call_cred)
+        self.assertEqual(len(response.rejected_policies), 0)
+        self.assertEqual(stored_policies(), before)
+        update.assert_not_called()
+
+        # Flip one policy and drop another one in the same VLAN.
+        flipped = peering_pb2.Policy()
+        flipped.CopyFrom(self.as_polices[0])
+        flipped.accept = not flipped.accept
+        policies = [flipped] + self.all_policies[1:-1] + [self.other_vlan_policy]
+        dropped = IsdPeerPolicy.objects.get(asys=self.asys[0])
+        with mock.patch.object(policy_resolver, 'update_accepted_peers') as update:
+            response = stub.SetPolicies(
+                peering_pb2.SetPoliciesRequest(policies=policies), metadata=call_cred)
+        self.assertEqual(len(response.rejected_policies), 0)
+        update.assert_called_once_with(self.vlan[0], self.asys[0])
+
+        after = stored_policies()
+        self.assertEqual(len(before - after), 2)
+        self.assertEqual(len(after - before), 1)
+        kept = {(model, policy_id) for model, policy_id, _ in before}
+        kept.remove(("IsdPeerPolicy", dropped.id))
+        self.assertEqual({(model, policy_id) for model, policy_id, _ in after}, kept)
+
+        response = list(stub.ListPolicies(peering_pb2.ListPolicyRequest(), metadata=call_cred))
+        self.assertEqual(len(response), len(policies))
+        for policy in policies:
+            self.assertTrue(policy in response)
+
+        # Close persistent channel
+        request_queue.put(None)
+        for response in channel:
+            self.assertTrue(False, "Unexpected response")
+
+    def test_upload(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        # Obtain write access
+        request_queue = queue.Queue()
+        channel = stub.StreamChannel(iter(request_queue.get, None), metadata=call_cred)
+        request = peering_pb2.StreamMessageRequest()
+        request.arbitration.election_id = 0
+        request_queue.put(request)
+        next(channel)
+        next(channel)
+
+        valid = [
+            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:0", peer_asn="ff00:0:1"),
+            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:0", peer_owner="owner2"),
+            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:0", peer_asn_range="ff00:0:2-ff00:0:3"),
+            peering_pb2.Policy(vlan="prod", accept=False, asn="ff00:0:0", peer_isd="2"),
+        ]
+        invalid = [
+            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:0", peer_asn="ff00:0:0"),
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:0", peer_asn="ff00:0:1"),
+            # Duplicate of a policy from the first chunk
+            peering_pb2.Policy(vlan="prod", accept=False, asn="ff00:0:0", peer_asn="ff00:0:1"),
+            # Overlaps a range from the first chunk
+            peering_pb2.Policy(vlan="prod", accept=False, asn="ff00:0:0", peer_asn_range="ff00:0:3-ff00:0:4"),
+        ]
+        def chunks(continue_on_error):
+            yield peering_pb2.UploadPoliciesRequest(
+                policies=valid[:3] + invalid[:1], vlan="prod", continue_on_error=continue_on_error)
+            yield peering_pb2.UploadPoliciesRequest(policies=invalid[1:])
+            yield peering_pb2.UploadPoliciesRequest(policies=valid[3:])
+
+        # Invalid policies with rollback
+        responses = stub.UploadPolicies(chunks(False), metadata=call_cred)
+        rejected = []
+        with self.assertRaises(grpc.RpcError) as cm:
+            for response in responses:
+                rejected.append(response.rejected_policy)
+                self.assertNotEqual(response.error, "")
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        self.assertEqual(rejected, invalid)
+
+        response = list(stub.ListPolicies(peering_pb2.ListPolicyRequest(), metadata=call_cred))
+        self.assertEqual(len(response), len(self.all_policies) + 1)
+        for policy in self.all_policies:
+            self.assertTrue(policy in response)
+
+        # Replace policies in one VLAN despite errors
+        responses = list(stub.UploadPolicies(chunks(True), metadata=call_cred))
+        self.assertEqual([response.rejected_policy for response in responses], invalid)
+
+        response = list(stub.ListPolicies(peering_pb2.ListPolicyRequest(), metadata=call_cred))
+        self.assertEqual(len(response), len(valid) + 1)
+        for policy in valid:
+            self.assertTrue(policy in response)
+        self.assertTrue(self.other_vlan_policy in response)
+
+        # Conflicts with the kept policies for all VLANs are checked when replacing the policies.
+        all_vlans = self._create(peering_pb2.Policy(
+            vlan="", accept=True, asn="ff00:0:0", peer_asn="ff00:0:2"))
+        conflicting = [
+            peering_pb2.Policy(vlan="prod", accept=False, asn="ff00:0:0", peer_asn="ff00:0:2")]
+        request = peering_pb2.UploadPoliciesRequest(policies=conflicting, vlan="prod")
+        responses = stub.UploadPolicies(iter([request]), metadata=call_cred)
+        rejected = []
+        with self.assertRaises(grpc.RpcError) as cm:
+            for response in responses:
+                rejected.append(response.rejected_policy)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        self.assertEqual(rejected, conflicting)
+
+        response = list(stub.ListPolicies(peering_pb2.ListPolicyRequest(), metadata=call_cred))
+        self.assertEqual(len(response), len(valid) + 2)
+        for policy in valid + [all_vlans]:
+            self.assertTrue(policy in response)
+
+        # Close persistent channel
+        request_queue.put(None)
+        for response in channel:
+            self.assertTrue(False, "Unexpected response")
+
+    def test_asn_range(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        # Obtain write access
+        request_queue = queue.Queue()
+        channel = stub.StreamChannel(iter(request_queue.get, None), metadata=call_cred)
+        request = peering_pb2.StreamMessageRequest()
+        request.arbitration.election_id = 0
+        request_queue.put(request)
+        next(channel)
+        next(channel)
+
+        # Create policy
+        policy = peering_pb2.Policy(vlan="test", asn="ff00:0:0", accept=True, peer_asn_range="ff00:0:*")
+        response = stub.CreatePolicy(policy, metadata=call_cred)
+        self.assertEqual(policy, response)
+
+        request = peering_pb2.ListPolicyRequest(vlan="test", peer_asn_range="ff00:0:0-ff00:0:ffff")
+        self.assertEqual(list(stub.ListPolicies(request, metadata=call_cred)), [policy])
+
+        with self.assertRaises(grpc.RpcError) as cm:
+            request = peering_pb2.Policy(vlan="test", asn="ff00:0:0", accept=False, peer_asn_range="ff00:0:1-ff00:0:2")
+            stub.CreatePolicy(request, metadata=call_cred)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.ALREADY_EXISTS)
+
+        with self.assertRaises(grpc.RpcError) as cm:
+            request = peering_pb2.Policy(vlan="test", asn="ff00:0:0", accept=False, peer_asn_range="ff00:0:2-ff00:0:1")
+            stub.CreatePolicy(request, metadata=call_cred)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+        # Destroy policy
+        stub.DestroyPolicy(policy, metadata=call_cred)
+        request = peering_pb2.ListPolicyRequest(vlan="test", peer_asn_range="ff00:0:*")
+        self.assertEqual(list(stub.ListPolicies(request, metadata=call_cred)), [])
+
+        # Overlapping ranges in one request
+        policies = [
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:0", peer_asn_range="0:*:*"),
+            peering_pb2.Policy(vlan="test", accept=False, asn="ff00:0:0", peer_asn_range="ff00:0:1-ff00:0:5"),
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:0", peer_asn_range="ff00:0:5-ff00:0:7"),
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:0", peer_asn_range="invalid"),
+        ]
+        request = peering_pb2.SetPoliciesRequest(policies=policies, vlan="test", continue_on_error=True)
+        response = stub.SetPolicies(request, metadata=call_cred)
+        self.assertEqual(list(response.rejected_policies), policies[2:])
+
+        response = list(stub.ListPolicies(peering_pb2.ListPolicyRequest(vlan="test"), metadata=call_cred))
+        self.assertEqual(response, policies[:2])
+
+        # Close persistent channel
+        request_queue.put(None)
+        for response in channel:
+            self.assertTrue(False, "Unexpected response")
+
+    def test_all_vlans(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        # Obtain write access
+        request_queue = queue.Queue()
+        channel = stub.StreamChannel(iter(request_queue.get, None), metadata=call_cred)
+        request = peering_pb2.StreamMessageRequest()
+        request.arbitration.election_id = 0
+        request_queue.put(request)
+        next(channel)
+        next(channel)
+
+        # Create a policy for all VLANs
+        policy = peering_pb2.Policy(vlan="", asn="ff00:0:0", accept=True, peer_asn="ff00:0:2")
+        response = stub.CreatePolicy(policy, metadata=call_cred)
+        self.assertEqual(policy, response)
+        self.assertTrue(AsPeerPolicy.objects.filter(vlan__isnull=True, asys=self.asys[0]).exists())
+
+        request = peering_pb2.ListPolicyRequest(peer_asn="ff00:0:2")
+        self.assertEqual(list(stub.ListPolicies(request, metadata=call_cred)), [policy])
+        request = peering_pb2.ListPolicyRequest(vlan="prod", peer_asn="ff00:0:2")
+        self.assertEqual(list(stub.ListPolicies(request, metadata=call_cred)), [])
+
+        # Policies for a single VLAN conflict with the policy for all VLANs.
+        with self.assertRaises(grpc.RpcError) as cm:
+            request = peering_pb2.Policy(vlan="prod", asn="ff00:0:0", accept=False, peer_asn="ff00:0:2")
+            stub.CreatePolicy(request, metadata=call_cred)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.ALREADY_EXISTS)
+
+        # Replacing the policies of a single VLAN keeps the policy for all VLANs.
+        policies = [
+            peering_pb2.Policy(vlan="prod", accept=False, asn="ff00:0:0", peer_asn="ff00:0:2"),
+            peering_pb2.Policy(vlan="prod", accept=False, asn="ff00:0:0", peer_asn="ff00:0:3"),
+        ]
+        request = peering_pb2.SetPoliciesRequest(policies=policies, vlan="prod", continue_on_error=True)
+        response = stub.SetPolicies(request, metadata=call_cred)
+        self.assertEqual(list(response.rejected_policies), policies[:1])
+        request = peering_pb2.ListPolicyRequest(peer_asn="ff00:0:2")
+        self.assertEqual(list(stub.ListPolicies(request, metadata=call_cred)), [policy])
+
+        # Destroy policy
+        stub.DestroyPolicy(policy, metadata=call_cred)
+        self.assertEqual(list(stub.ListPolicies(request, metadata=call_cred)), [])
+
+        # Close persistent channel
+        request_queue.put(None)
+        for response in channel:
+            self.assertTrue(False, "Unexpected response")
+
+    def test_validity(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        # Obtain write access
+        request_queue = queue.Queue()
+        channel = stub.StreamChannel(iter(request_queue.get, None), metadata=call_cred)
+        request = peering_pb2.StreamMessageRequest()
+        request.arbitration.election_id = 0
+        request_queue.put(request)
+        next(channel)
+        next(channel)
+
+        # Create a time-limited policy
+        start = timezone.now().replace(microsecond=0) + timedelta(hours=1)
+        policy = peering_pb2.Policy(vlan="test", asn="ff00:0:0", accept=False, peer_asn="ff00:0:2")
+        policy.valid_from.FromDatetime(start)
+        policy.valid_until.FromDatetime(start + timedelta(hours=1))
+        response = stub.CreatePolicy(policy, metadata=call_cred)
+        self.assertEqual(policy, response)
+
+        request = peering_pb2.ListPolicyRequest(vlan="test", peer_asn="ff00:0:2")
+        self.assertEqual(list(stub.ListPolicies(request, metadata=call_cred)), [policy])
+
+        # Changing the validity period updates the stored policy.
+        policy.valid_until.FromDatetime(start + timedelta(hours=2))
+        request = peering_pb2.SetPoliciesRequest(policies=[policy], vlan="test")
+        self.assertEqual(stub.SetPolicies(request, metadata=call_cred),
+            peering_pb2.SetPoliciesResponse())
+        self.assertEqual(AsPeerPolicy.objects.get(vlan__name="test").valid_until,
+            start + timedelta(hours=2))
+
+        with self.assertRaises(grpc.RpcError) as cm:
+            request = peering_pb2.Policy(vlan="test", asn="ff00:0:0", accept=True, peer_asn="ff00:0:3")
+            request.valid_from.FromDatetime(start)
+            request.valid_until.FromDatetime(start - timedelta(hours=1))
+            stub.CreatePolicy(request, metadata=call_cred)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+        # Policies are destroyed regardless of their validity period.
+        request = peering_pb2.Policy(vlan="test", asn="ff00:0:0", accept=False, peer_asn="ff00:0:2")
+        stub.DestroyPolicy(request, metadata=call_cred)
+        self.assertFalse(AsPeerPolicy.objects.filter(vlan__name="test").exists())
+
+        # Close persistent channel
+        request_queue.put(None)
+        for response in channel:
+            self.assertTrue(False, "Unexpected response")
+
+    def test_compact(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        # The ISD policy rejects peers which would be rejected anyway.
+        request = peering_pb2.CompactPoliciesRequest(dry_run=True)
+        response = stub.CompactPolicies(request, metadata=call_cred)
+        self.assertEqual(list(response.policies), self.isd_policies)
+        self.assertEqual((response.evaluations_before, response.evaluations_after), (7, 6))
+
+        request = peering_pb2.CompactPoliciesRequest(vlan="test", dry_run=True)
+        response = stub.CompactPolicies(request, metadata=call_cred)
+        self.assertEqual(len(response.policies), 0)
+        self.assertEqual((response.evaluations_before, response.evaluations_after), (1, 1))
+
+        with self.assertRaises(grpc.RpcError) as cm:
+            stub.CompactPolicies(peering_pb2.CompactPoliciesRequest(), metadata=call_cred)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.PERMISSION_DENIED)
+
+        # Obtain write access
+        request_queue = queue.Queue()
+        channel = stub.StreamChannel(iter(request_queue.get, None), metadata=call_cred)
+        request = peering_pb2.StreamMessageRequest()
+        request.arbitration.election_id = 0
+        request_queue.put(request)
+        next(channel)
+        next(channel)
+
+        request = peering_pb2.CompactPoliciesRequest(vlan="prod")
+        response = stub.CompactPolicies(request, metadata=call_cred)
+        self.assertEqual(list(response.policies), self.isd_policies)
+        self.assertEqual((response.evaluations_before, response.evaluations_after), (6, 5))
+        self.assertFalse(IsdPeerPolicy.objects.exists())
+
+        # Close persistent channel
+        request_queue.put(None)
+        for response in channel:
+            self.assertTrue(False, "Unexpected response")
+
+    def test_opportunities(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        DefaultPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[2])
+        DefaultPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[3])
+        for asys in self.asys:
+            policy_resolver.update_accepted_peers(self.vlan[0], asys)
+
+        # ff00:0:1 accepts ff00:0:0 explicitly, ff00:0:2 and ff00:0:3 accept everyone, but only
+        # ff00:0:2 is accepted by ff00:0:0 in return.
+        expected = [
+            peering_pb2.PeeringOpportunity(asn="ff00:0:1", name="AS 1", owner="owner1", isd="1"),
+            peering_pb2.PeeringOpportunity(asn="ff00:0:3", name="AS 3", owner="owner2", isd="1"),
+        ]
+        with mock.patch.object(peering, 'OPPORTUNITIES_CHUNK_SIZE', 1):
+            request = peering_pb2.PeeringOpportunitiesRequest(vlan="prod")
+            self.assertEqual(
+                list(stub.ListPeeringOpportunities(request, metadata=call_cred)), expected)
+
+        request = peering_pb2.PeeringOpportunitiesRequest(vlan="prod", page_size=1)
+        self.assertEqual(
+            list(stub.ListPeeringOpportunities(request, metadata=call_cred)), expected[:1])
+        request.after_asn = "ff00:0:1"
+        self.assertEqual(
+            list(stub.ListPeeringOpportunities(request, metadata=call_cred)), expected[1:])
+
+        # Page sizes are clamped to the server's limit.
+        with mock.patch.object(peering, 'OPPORTUNITIES_MAX_PAGE_SIZE', 1):
+            for page_size in [0, 5]:
+                request = peering_pb2.PeeringOpportunitiesRequest(vlan="prod", page_size=page_size)
+                self.assertEqual(
+                    list(stub.ListPeeringOpportunities(request, metadata=call_cred)), expected[:1])
+
+        request = peering_pb2.PeeringOpportunitiesRequest(vlan="test")
+        self.assertEqual(list(stub.ListPeeringOpportunities(request, metadata=call_cred)), [])
+
+        with self.assertRaises(grpc.RpcError) as cm:
+            request = peering_pb2.PeeringOpportunitiesRequest(vlan="none")
+            list(stub.ListPeeringOpportunities(request, metadata=call_cred))
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.NOT_FOUND)
+
+    def test_policy_batch(self):
+        valid = [
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:1"),
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:1", peer_asn="ff00:0:2"),
+            peering_pb2.Policy(vlan="test", accept=False, asn="ff00:0:1", peer_asn="ff00:0:3"),
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:1", peer_owner="owner2"),
+            peering_pb2.Policy(vlan="test", accept=False, asn="ff00:0:1", peer_isd="2"),
+        ]
+        invalid = [
+            (peering_pb2.Policy(vlan="none", accept=True, asn="ff00:0:1"), {'vlan'}),
+            (peering_pb2.Policy(vlan="test", accept=True, asn="invalid"), {'asn'}),
+            (peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:1", peer_asn="ff00:0:9"),
+                {'peer_asn'}),
+            (peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:1", peer_owner="none"),
+                {'peer_owner'}),
+            (peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:1", peer_isd="x"),
+                {'peer_isd'}),
+            (peering_pb2.Policy(vlan="none", accept=True, asn="ff00:0:9", peer_isd="3"),
+                {'vlan', 'asn', 'peer_isd'}),
+        ]
+        model_invalid = [
+            peering_pb2.Policy(vlan="test", accept=True, asn="ff00:0:1", peer_asn="ff00:0:1"),
+            peering_pb2.Policy(vlan="test", accept=False, asn="ff00:0:1", peer_asn="ff00:0:2"),
+        ]
+
+        batch = PolicyBatch()
+        with self.assertNumQueries(4):
+            batch.resolve(valid + [msg for msg, _ in invalid] + model_invalid)
+
+        with VlanMembership.cached(), self.assertNumQueries(1):
+            for msg in valid:
+                batch.add(msg)
+            for msg, fields in invalid:
+                with self.assertRaises(serializers.ValidationError) as cm:
+                    batch.add(msg)
+                self.assertEqual(set(cm.exception.detail.keys()), fields)
+            for msg in model_invalid:
+                with self.assertRaises(ValidationError):
+                    batch.add(msg)
+        self.assertEqual(len(batch), len(valid))
+
+        with self.assertNumQueries(4):
+            batch.bulk_create()
+        self.assertEqual(DefaultPolicy.objects.filter(asys=self.asys[1]).count(), 1)
+        self.assertEqual(AsPeerPolicy.objects.filter(asys=self.asys[1], vlan__name="test").count(),
+            2)
+        self.assertEqual(OwnerPeerPolicy.objects.filter(asys=self.asys[1]).count(), 1)
+        self.assertEqual(IsdPeerPolicy.objects.filter(asys=self.asys[1]).count(), 1)
+
+        # Lookups are split into queries of at most MAX_QUERY_IDS parameters.
+        with mock.patch.object(PolicyBatch, 'MAX_QUERY_IDS', 2):
+            batch = PolicyBatch()
+            batch.resolve(valid + [msg for msg, _ in invalid])
+            with VlanMembership.cached():
+                for msg in valid:
+                    batch.add(msg)
+            for msg, fields in invalid:
+                with self.assertRaises(serializers.ValidationError) as cm:
+                    batch.add(msg)
+                self.assertEqual(set(cm.exception.detail.keys()), fields)
+            self.assertEqual(len(batch.remove_stored()), len(valid))
+        self.assertEqual(len(batch), 0)
+
+
 class PersistentConnectionTest(RPCTestCase):
     """Test the persistent gRPC stream and related functions."""
 
@@ -512,22 +961,23 @@ class PersistentConnectionTest(RPCTestCase):
         next(as2_channel)
         next(as4_channel)
 
-        # Create peering policies
-        policies = [
-            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:1", peer_asn="ff00:0:2"),
-            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:1", peer_asn="ff00:0:4")]
-        request = peering_pb2.SetPoliciesRequest(policies=policies, continue_on_error=False)
-        stub.SetPolicies(request, metadata=as1_call_cred)
-        policies = [
-            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:2", peer_asn="ff00:0:1"),
-            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:2", peer_asn="ff00:0:4")]
-        request = peering_pb2.SetPoliciesRequest(policies=policies, continue_on_error=False)
-        stub.SetPolicies(request, metadata=as2_call_cred)
-        policies = [
-            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:4", peer_asn="ff00:0:1"),
-            peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:4", peer_asn="ff00:0:2")]
-        request = peering_pb2.SetPoliciesRequest(policies=policies, continue_on_error=False)
-        stub.SetPolicies(request, metadata=as4_call_cred)
+        # Create peering policies. Clients are notified when the changes are committed.
+        with self.captureOnCommitCallbacks(execute=True):
+            policies = [
+                peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:1", peer_asn="ff00:0:2"),
+                peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:1", peer_asn="ff00:0:4")]
+            request = peering_pb2.SetPoliciesRequest(policies=policies, continue_on_error=False)
+            stub.SetPolicies(request, metadata=as1_call_cred)
+            policies = [
+                peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:2", peer_asn="ff00:0:1"),
+                peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:2", peer_asn="ff00:0:4")]
+            request = peering_pb2.SetPoliciesRequest(policies=policies, continue_on_error=False)
+            stub.SetPolicies(request, metadata=as2_call_cred)
+            policies = [
+                peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:4", peer_asn="ff00:0:1"),
+                peering_pb2.Policy(vlan="prod", accept=True, asn="ff00:0:4", peer_asn="ff00:0:2")]
+            request = peering_pb2.SetPoliciesRequest(policies=policies, continue_on_error=False)
+            stub.SetPolicies(request, metadata=as4_call_cred)
 
         # Check async errors
         for channel in [as1_channel, as2_channel, as4_channel]:
@@ -537,15 +987,16 @@ class PersistentConnectionTest(RPCTestCase):
                 self.assertEqual(response.error.code, peering_pb2.AsyncError.Code.LINK_CREATION_FAILED)
 
         # Set port ranges
-        request = peering_pb2.PortRange(interface_vlan="prod", interface_ip="10.0.0.2",
-            first_port=10000, last_port=11000)
-        stub.SetPortRange(request, metadata=as1_call_cred)
-        request = peering_pb2.PortRange(interface_vlan="prod", interface_ip="10.0.0.3",
-            first_port=20000, last_port=21000)
-        stub.SetPortRange(request, metadata=as2_call_cred)
-        request = peering_pb2.PortRange(interface_vlan="prod", interface_ip="10.0.0.5",
-            first_port=40000, last_port=41000)
-        stub.SetPortRange(request, metadata=as4_call_cred)
+        with self.captureOnCommitCallbacks(execute=True):
+            request = peering_pb2.PortRange(interface_vlan="prod", interface_ip="10.0.0.2",
+                first_port=10000, last_port=11000)
+            stub.SetPortRange(request, metadata=as1_call_cred)
+            request = peering_pb2.PortRange(interface_vlan="prod", interface_ip="10.0.0.3",
+                first_port=20000, last_port=21000)
+            stub.SetPortRange(request, metadata=as2_call_cred)
+            request = peering_pb2.PortRange(interface_vlan="prod", interface_ip="10.0.0.5",
+                first_port=40000, last_port=41000)
+            stub.SetPortRange(request, metadata=as4_call_cred)
 
         # Check async errors
         for i, channel in enumerate([as2_channel, as4_channel]):
@@ -608,7 +1059,8 @@ class PersistentConnectionTest(RPCTestCase):
         self.assertTrue(next(as2_channel).HasField("arbitration"))
 
         request = peering_pb2.Policy(vlan="prod", asn="ff00:0:2", accept=True, peer_asn="ff00:0:1")
-        stub.DestroyPolicy(request, metadata=as2_call_cred)
+        with self.captureOnCommitCallbacks(execute=True):
+            stub.DestroyPolicy(request, metadata=as2_call_cred)
 
         response = next(as1_channel)
         self.assertTrue(response.HasField("link_update"))
@@ -626,7 +1078,8 @@ class PersistentConnectionTest(RPCTestCase):
 
         request = peering_pb2.PortRange(interface_vlan="prod", interface_ip="10.0.0.2",
             first_port=50000, last_port=51000)
-        stub.SetPortRange(request, metadata=as1_call_cred)
+        with self.captureOnCommitCallbacks(execute=True):
+            stub.SetPortRange(request, metadata=as1_call_cred)
 
         response = next(as1_channel)
         self.assertTrue(response.HasField("link_update"))
@@ -0,0 +1,76 @@
+import ipaddress
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from peering_coord.models.ixp import Owner, VLAN, PeeringClient, Interface
+from peering_coord.models.scion import ISD, AS
+from peering_coord.scion_addr import ASN
+
+
+class IpFieldTest(TestCase):
+    """Test storage and lookups of IP address and network fields."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vlan = [
+            VLAN.objects.create(name="ipv4", long_name="IPv4",
+                ip_network=ipaddress.IPv4Network("10.0.0.0/24")),
+            VLAN.objects.create(name="ipv6", long_name="IPv6",
+                ip_network=ipaddress.IPv6Network("fd00:ab::/64")),
+        ]
+        owner = Owner.objects.create(name="owner", long_name="Owner")
+        isd = ISD.objects.create(isd_id=1, name="Region 1")
+        cls.asys = AS.objects.create(
+            asn=ASN("ff00:0:1"), isd=isd, name="AS 1", owner=owner, is_core=False)
+        cls.peering_client = PeeringClient.objects.create(asys=cls.asys, name="default")
+
+    def _create_interface(self, vlan, ip):
+        return Interface.objects.create(peering_client=self.peering_client, vlan=vlan, public_ip=ip)
+
+    def test_round_trip(self):
+        for vlan, ip in [(self.vlan[0], "10.0.0.1"), (self.vlan[1], "fd00:ab::ffff:1")]:
+            with self.subTest(ip=ip):
+                interface = self._create_interface(vlan, ip)
+                interface = Interface.objects.get(id=interface.id)
+                self.assertEqual(interface.public_ip, ipaddress.ip_address(ip))
+                self.assertEqual(Interface.objects.get(vlan=vlan, public_ip=ip), interface)
+
+        self.assertEqual(VLAN.objects.get(name="ipv4").ip_network, self.vlan[0].ip_network)
+        self.assertEqual(VLAN.objects.get(name="ipv6").ip_network, self.vlan[1].ip_network)
+
+    def test_in_network(self):
+        self._create_interface(self.vlan[0], "10.0.0.1")
+        self._create_interface(self.vlan[0], "10.0.0.200")
+        self._create_interface(self.vlan[1], "fd00:ab::1")
+
+        query = Interface.objects.filter(public_ip__in_network="10.0.0.0/25")
+        self.assertEqual([str(ip) for ip in query.values_list('public_ip', flat=True)],
+            ["10.0.0.1"])
+        query = Interface.objects.filter(public_ip__in_network=self.vlan[0].ip_network)
+        self.assertEqual(query.count(), 2)
+        query = Interface.objects.filter(public_ip__in_network=self.vlan[1].ip_network)
+        self.assertEqual(query.count(), 1)
+        query = Interface.objects.filter(public_ip__in_network="10.1.0.0/16")
+        self.assertEqual(query.count(), 0)
+
+    def test_get_unused_ip(self):
+        vlan = self.vlan[0]
+        self.assertEqual(vlan.get_unused_ip(), ipaddress.ip_address("10.0.0.1"))
+        self._create_interface(vlan, "10.0.0.1")
+        self._create_interface(vlan, "10.0.0.2")
+        self._create_interface(vlan, "10.0.0.4")
+        self.assertEqual(vlan.get_unused_ip(), ipaddress.ip_address("10.0.0.3"))
+        self._create_interface(vlan, "10.0.0.3")
+        self.assertEqual(vlan.get_unused_ip(), ipaddress.ip_address("10.0.0.5"))
+
+        vlan = self.vlan[1]
+        self._create_interface(vlan, "fd00:ab::1")
+        self.assertEqual(vlan.get_unused_ip(), ipaddress.ip_address("fd00:ab::2"))
+
+    def test_ip_in_use(self):
+        self._create_interface(self.vlan[0], "10.0.0.1")
+        with self.assertRaises(ValidationError):
+            self._create_interface(self.vlan[0], "10.0.0.1")
+        with self.assertRaises(ValidationError):
+            self._create_interface(self.vlan[0], "10.1.0.1")
@@ -0,0 +1,169 @@
+import ipaddress
+import re
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test import TestCase
+
+from peering_coord.models.ixp import Owner, VLAN, PeeringClient, Interface, Link
+from peering_coord.models.scion import ISD, AS, AcceptedPeer, RejectedPeer
+from peering_coord.models.policies import (
+    AsPeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy, PeerPolicy)
+from peering_coord.policy_resolver import _get_accepted_peers, update_accepted_peers, update_links
+from peering_coord.scion_addr import ASN
+
+
+# Patterns matching a full table scan in the output of QuerySet.explain().
+# SQLite prints "SCAN <table or alias>" for full scans, while scans of materialized subqueries
+# ("SCAN (subquery-1)") and constants are harmless.
+_SEQ_SCAN_PATTERNS = {
+    'sqlite': re.compile(r"\bSCAN (?!\(|CONSTANT ROW)(\S+)"),
+    'postgresql': re.compile(r"\bSeq Scan on (\S+)"),
+}
+
+
+@contextmanager
+def _dropped_index(model, name):
+    """Drop an index of `model` for the duration of the `with` block."""
+    index = next(index for index in model._meta.indexes if index.name == name)
+    schema_editor = connection.schema_editor()
+    with connection.cursor() as cursor:
+        cursor.execute(str(index.remove_sql(model, schema_editor)))
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(str(index.create_sql(model, schema_editor)))
+
+
+def _explain(queryset, comment):
+    """Returns the query plan of `queryset` like `QuerySet.explain()`.
+
+    The comment makes the statement unique, so that SQLite prepares it again instead of returning
+    the plan of a cached statement explained before an index was dropped.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute("%s %s /* %s */" % (connection.ops.explain_query_prefix(), sql, comment),
+            params)
+        return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+
+
+class QueryPlanTest(TestCase):
+    """Make sure the queries issued by the policy resolver and the link management functions are
+    answered from indexes instead of sequential table scans.
+    """
+    AS_COUNT = 40
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vlan = [
+            VLAN.objects.create(name="prod", long_name="Production",
+                ip_network=ipaddress.IPv4Network("10.0.0.0/16")),
+            VLAN.objects.create(name="test", long_name="Testing",
+                ip_network=ipaddress.IPv4Network("10.1.0.0/16")),
+        ]
+        cls.owner = [
+            Owner.objects.create(name="owner%d" % i, long_name="Owner %d" % i) for i in range(4)
+        ]
+        cls.isd = [
+            ISD.objects.create(isd_id=i + 1, name="Region %d" % (i + 1)) for i in range(3)
+        ]
+
+        cls.asys = []
+        for i in range(cls.AS_COUNT):
+            asys = AS.objects.create(asn=ASN(0xff0000000000 + i), isd=cls.isd[i % len(cls.isd)],
+                name="AS %d" % i, owner=cls.owner[i % len(cls.owner)], is_core=False)
+            cls.asys.append(asys)
+            client = PeeringClient.objects.create(asys=asys, name="default")
+            for vlan in cls.vlan:
+                Interface.objects.create(peering_client=client, vlan=vlan,
+                    public_ip=vlan.ip_network[i + 1], first_port=50000, last_port=51000)
+
+        # Mix of all policy types, so every branch of the resolver has data to work on.
+        vlan = cls.vlan[0]
+        for i, asys in enumerate(cls.asys):
+            if i % 2 == 0:
+                DefaultPolicy.objects.create(vlan=vlan, asys=asys, accept=True)
+            IsdPeerPolicy.objects.create(
+                vlan=vlan, asys=asys, peer_isd=cls.isd[i % len(cls.isd)], accept=(i % 3 != 0))
+            OwnerPeerPolicy.objects.create(
+                vlan=vlan, asys=asys, peer_owner=cls.owner[(i + 1) % len(cls.owner)],
+                accept=(i % 4 != 0))
+            AsPeerPolicy.objects.create(
+                vlan=vlan, asys=asys, peer_as=cls.asys[i - 1], accept=(i % 5 != 0))
+
+        for asys in cls.asys:
+            update_accepted_peers(vlan, asys)
+        for asys in cls.asys:
+            update_links(vlan, asys)
+
+    def setUp(self):
+        if connection.vendor not in _SEQ_SCAN_PATTERNS:
+            self.skipTest("Query plan format of %s is not supported." % connection.vendor)
+        if connection.vendor == 'postgresql':
+            # Tables in the test data set are small enough for the planner to prefer sequential
+            # scans regardless of the available indexes.
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = off")
+
+    def assertNoSeqScan(self, queryset):
+        """Fail if the query plan of `queryset` contains a sequential table scan."""
+        plan = queryset.explain()
+        scans = _SEQ_SCAN_PATTERNS[connection.vendor].findall(plan)
+        self.assertEqual(scans, [], "Sequential scan in query plan:\n%s" % plan)
+
+    def test_data_set(self):
+        """Sanity check the generated data set actually exercises the queries."""
+        self.assertGreater(AcceptedPeer.objects.count(), self.AS_COUNT)
+        self.assertGreater(RejectedPeer.objects.count(), 0)
+        self.assertGreater(Link.objects.count(), 0)
+
+    def test_accepted_peer_queries(self):
+        vlan, asys = self.vlan[0], self.asys[0]
+        self.assertNoSeqScan(AcceptedPeer.objects.filter(vlan=vlan, asys=asys).values_list('peer'))
+        self.assertNoSeqScan(AcceptedPeer.objects.filter(vlan=vlan, peer=asys).values_list('asys'))
+        self.assertNoSeqScan(asys.query_mutually_accepted_peers(vlan))
+        self.assertNoSeqScan(self.asys[1].query_mutually_accepted_peers(vlan))
+        self.assertNoSeqScan(RejectedPeer.objects.filter(vlan=vlan, asys=asys).values_list('peer'))
+        self.assertNoSeqScan(RejectedPeer.objects.filter(vlan=vlan, peer=asys).values_list('asys'))
+        self.assertNoSeqScan(asys.query_peering_opportunities(vlan))
+        self.assertNoSeqScan(self.asys[1].query_peering_opportunities(vlan))
+
+    def test_policy_queries(self):
+        vlan, asys = self.vlan[0], self.asys[0]
+        for model in [DefaultPolicy, AsPeerPolicy, IsdPeerPolicy, OwnerPeerPolicy]:
+            with self.subTest(model=model.__name__):
+                for accept in [True, False]:
+                    self.assertNoSeqScan(model.objects.filter(vlan=vlan, asys=asys, accept=accept))
+
+    def test_resolver_queries(self):
+        for asys in self.asys[:4]:
+            with self.subTest(asys=str(asys)):
+                self.assertNoSeqScan(_get_accepted_peers(self.vlan[0], asys))
+
+    def test_link_queries(self):
+        interfaces = self.asys[0].query_interfaces().values_list('id')
+        self.assertNoSeqScan(Link.objects.filter(interface_a__in=interfaces))
+        self.assertNoSeqScan(Link.objects.filter(interface_b__in=interfaces))
+        self.assertNoSeqScan(self.asys[0].query_connected_peers(vlan=self.vlan[0]))
+
+    def test_index_effect(self):
+        """Compare the query plans with and without the indexes added for these queries."""
+        vlan, asys = self.vlan[0], self.asys[0]
+        queries = [
+            (AcceptedPeer, "accepted_peer_by_peer",
+                AcceptedPeer.objects.filter(vlan=vlan, peer=asys).values_list('asys')),
+            (RejectedPeer, "rejected_peer_by_peer",
+                RejectedPeer.objects.filter(vlan=vlan, peer=asys).values_list('asys')),
+            (PeerPolicy, "peerpolicy_by_asys",
+                PeerPolicy.objects.filter(vlan=vlan, asys=asys, accept=True)),
+        ]
+        for model, name, queryset in queries:
+            with self.subTest(index=name):
+                with _dropped_index(model, name):
+                    before = _explain(queryset, "without index")
+                after = _explain(queryset, "with index")
+                self.assertNotIn(name, before)
+                self.assertIn(name, after)
+                self.assertNoSeqScan(queryset)
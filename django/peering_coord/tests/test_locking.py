@@ -0,0 +1,167 @@
+import ipaddress
+import threading
+from collections import Counter
+from unittest import mock
+
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+
+from peering_coord import policy_resolver
+from peering_coord.api.client_connection import ClientRegistry
+from peering_coord.models.ixp import VLAN, Interface, Link, Owner, PeeringClient
+from peering_coord.models.policies import DefaultPolicy
+from peering_coord.models.scion import AS, ISD
+from peering_coord.scion_addr import ASN
+
+
+class VlanLockTest(TransactionTestCase):
+    """Test the VLAN locks and transaction retries protecting the policy resolver."""
+
+    def setUp(self):
+        self.vlan = [
+            VLAN.objects.create(name="prod", long_name="Production",
+                ip_network=ipaddress.IPv4Network("10.0.0.0/16")),
+            VLAN.objects.create(name="test", long_name="Testing",
+                ip_network=ipaddress.IPv4Network("10.1.0.0/16")),
+        ]
+
+    def test_lock_vlan(self):
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            try:
+                with policy_resolver.lock_vlan(self.vlan[0]):
+                    locked.set()
+                    release.wait(5)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        try:
+            self.assertTrue(locked.wait(5))
+
+            # Locks are per VLAN
+            with policy_resolver.lock_vlan(self.vlan[1]):
+                pass
+
+            if connection.vendor != 'postgresql':
+                # The in-process lock is reentrant, but blocks other threads.
+                lock = policy_resolver._vlan_locks[self.vlan[0].id]
+                self.assertFalse(lock.acquire(blocking=False))
+        finally:
+            release.set()
+            thread.join()
+
+        with policy_resolver.lock_vlan(self.vlan[0]):
+            with policy_resolver.lock_vlan(self.vlan[0]):
+                pass
+
+    def test_retry_transaction(self):
+        attempts = []
+
+        @policy_resolver.retry_transaction
+        def conflicting(failures, error="database is locked"):
+            attempts.append(connection.in_atomic_block)
+            if len(attempts) <= failures:
+                raise OperationalError(error)
+            return len(attempts)
+
+        # Transient errors are retried
+        self.assertEqual(conflicting(2), 3)
+        self.assertEqual(attempts, [True, True, True])
+
+        # Retries are bounded
+        attempts.clear()
+        with self.assertRaises(OperationalError):
+            conflicting(policy_resolver.TRANSACTION_ATTEMPTS)
+        self.assertEqual(len(attempts), policy_resolver.TRANSACTION_ATTEMPTS)
+
+        # Other errors are passed on immediately
+        attempts.clear()
+        with self.assertRaises(OperationalError):
+            conflicting(1, "no such table")
+        self.assertEqual(len(attempts), 1)
+
+    def test_concurrent_resolution(self):
+        """Resolve the ASes of a VLAN in two threads at once. All links must be created exactly
+        once and every port must be assigned to a single link only.
+        """
+        vlan = self.vlan[0]
+        owner = Owner.objects.create(name="owner1", long_name="Owner 1", contact="")
+        isd = ISD.objects.create(isd_id=1, name="Region 1")
+        ases = []
+        for i in range(8):
+            asys = AS.objects.create(asn=ASN("ff00:0:{}".format(i)), isd=isd,
+                name="AS {}".format(i), owner=owner, is_core=False)
+            client = PeeringClient.objects.create(asys=asys, name="default")
+            Interface.objects.create(peering_client=client, vlan=vlan,
+                public_ip=vlan.ip_network[i + 1], first_port=50000, last_port=50010)
+            DefaultPolicy.objects.create(vlan=vlan, asys=asys, accept=True)
+            ases.append(asys)
+        self.assertFalse(Link.objects.exists())
+
+        @policy_resolver.retry_transaction
+        def resolve(asys):
+            policy_resolver.update_accepted_peers(vlan, asys)
+            policy_resolver.update_links(vlan, asys)
+
+        errors = []
+        def run(ases):
+            try:
+                for asys in ases:
+                    resolve(asys)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=(ases[i::2],)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+        links = list(Link.objects.values_list(
+            'as_a_id', 'as_b_id', 'interface_a_id', 'port_a', 'interface_b_id', 'port_b'))
+        pairs = Counter(frozenset((as_a, as_b)) for as_a, as_b, *_ in links)
+        self.assertEqual(len(pairs), len(ases) * (len(ases) - 1) // 2)
+        self.assertEqual(set(pairs.values()), {1})
+        ports = Counter()
+        for _, _, interface_a, port_a, interface_b, port_b in links:
+            ports[(interface_a, port_a)] += 1
+            ports[(interface_b, port_b)] += 1
+        self.assertEqual(set(ports.values()), {1})
+
+    def test_retry_notifications(self):
+        """Clients are only notified of the links of the committed attempt."""
+        vlan = self.vlan[0]
+        owner = Owner.objects.create(name="owner1", long_name="Owner 1", contact="")
+        isd = ISD.objects.create(isd_id=1, name="Region 1")
+        interfaces = []
+        for i in range(2):
+            asys = AS.objects.create(asn=ASN("ff00:0:{}".format(i)), isd=isd,
+                name="AS {}".format(i), owner=owner, is_core=False)
+            client = PeeringClient.objects.create(asys=asys, name="default")
+            interfaces.append(Interface.objects.create(peering_client=client, vlan=vlan,
+                public_ip=vlan.ip_network[i + 1], first_port=50000, last_port=50010))
+
+        attempts = []
+
+        @policy_resolver.retry_transaction
+        def create_link():
+            attempts.append(None)
+            Link.objects.create(Link.Type.PEERING, interface_a=interfaces[0],
+                interface_b=interfaces[1], port_a=50000, port_b=50000)
+            if len(attempts) == 1:
+                raise OperationalError("database is locked")
+
+        conn = mock.Mock()
+        connections = mock.Mock(**{'get_connections.return_value': [conn]})
+        with mock.patch.dict(ClientRegistry._ases, {ASN("ff00:0:0"): connections}):
+            create_link()
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(conn.send_link_update.call_count, 1)
+        self.assertEqual(Link.objects.count(), 1)
@@ -1,14 +1,19 @@
 import ipaddress
+from unittest import mock
 
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.db.models import Count, Sum, Q
 from django.test import TestCase
 
-from peering_coord.models.ixp import Owner, VLAN, PeeringClient, Interface
-from peering_coord.models.scion import ISD, AS, Link
-from peering_coord.models.policies import (DefaultPolicy, AsPeerPolicy, DefaultPolicy,
-    IsdPeerPolicy, OwnerPeerPolicy)
-from peering_coord.policy_resolver import update_accepted_peers, update_links
-from peering_coord.scion_addr import ASN
+from peering_coord.models.ixp import Owner, VLAN, PeeringClient, Interface, LinkCount
+from peering_coord.models.membership import VlanMembership
+from peering_coord.models.scion import ISD, AS, AcceptAll, AcceptedPeer, Link, RejectedPeer
+from peering_coord.models.policies import (DefaultPolicy, AsPeerPolicy, AsRangePeerPolicy,
+    DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy, PeerPolicy)
+from peering_coord import policy_resolver, resolution_queue
+from peering_coord.policy_resolver import _get_accepted_peers, update_accepted_peers, update_links
+from peering_coord.scion_addr import ASN, AsnRange
 
 
 def _add_as_policy(vlan, asys, peer_as, accept):
@@ -21,6 +26,18 @@ def _add_as_policy(vlan, asys, peer_as, accept):
     update_links(vlan, asys)
     return policy
 
+def _add_range_policy(vlan, asys, peer_asn_range, accept):
+    """Add an ASN range peering policy and apply it.
+
+    :returns: The newly created policy instance.
+    """
+    first, last = AsnRange.parse(peer_asn_range)
+    policy = AsRangePeerPolicy.objects.create(vlan=vlan, asys=asys,
+        peer_asn_first=first, peer_asn_last=last, accept=accept)
+    update_accepted_peers(vlan, asys)
+    update_links(vlan, asys)
+    return policy
+
 def _add_owner_policy(vlan, asys, peer_owner, accept):
     """Add an Owner peering policy and apply it.
 
@@ -192,28 +209,40 @@ class PeeringPoliciesTest(TestCase):
         # 1-ff00:0:2 -> Accept all
         # 1-ff00:0:4 -> Accept all
         _add_default_policy(self.vlan[0], self.asys[0], True)
-        self.assertEqual(self.asys[0].accept.count(), 5)
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 5)
         _add_default_policy(self.vlan[0], self.asys[1], True)
-        self.assertEqual(self.asys[0].accept.count(), 5)
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 5)
         _add_default_policy(self.vlan[0], self.asys[2], True)
-        self.assertEqual(self.asys[0].accept.count(), 5)
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 5)
         _add_default_policy(self.vlan[0], self.asys[4], True)
-        self.assertEqual(self.asys[0].accept.count(), 5)
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 5)
         self.assertEqual(Link.objects.count(), 4)
+        # Accepted members are not stored individually.
+        self.assertEqual(AcceptAll.objects.count(), 4)
+        self.assertEqual(AcceptedPeer.objects.count(), 0)
 
         # Reject 1-ff00:0:0 -> ISD 2
         _add_isd_policy(self.vlan[0], self.asys[0], self.isd[1], False)
-        self.assertEqual(self.asys[0].accept.count(), 3)
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 3)
         self.assertEqual(Link.objects.count(), 4)
 
         # Reject 1-ff00:0:0 -> Owner 2
         _add_owner_policy(self.vlan[0], self.asys[0], self.owner[1], False)
-        self.assertEqual(self.asys[0].accept.count(), 2)
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 2)
         self.assertEqual(Link.objects.count(), 3)
 
         # Reject 1-ff00:0:0 -> 1-ff00:0:1
         _add_as_policy(self.vlan[0], self.asys[0], self.asys[1], False)
-        self.assertEqual(self.asys[0].accept.count(), 1)
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 1)
+        self.assertEqual(Link.objects.count(), 2)
+        self.assertEqual(RejectedPeer.objects.filter(asys=self.asys[0]).count(), 4)
+        self.assertEqual(AcceptedPeer.objects.count(), 0)
+
+        # Remove 1-ff00:0:0 -> Accept all
+        _delete_policy(DefaultPolicy.objects.get(vlan=self.vlan[0], asys=self.asys[0]))
+        self.assertFalse(AcceptAll.objects.filter(asys=self.asys[0]).exists())
+        self.assertFalse(RejectedPeer.objects.filter(asys=self.asys[0]).exists())
+        self.assertEqual(self.asys[0].query_accepted_peers(self.vlan[0]).count(), 0)
         self.assertEqual(Link.objects.count(), 2)
 
     def test_vlan_isolation(self):
@@ -231,6 +260,37 @@ class PeeringPoliciesTest(TestCase):
         self.assertEqual(Link.objects.count(), 1)
         self.assertTrue(_links_exists(self, self.vlan[0], Link.Type.CORE, self.asys[0], self.asys[2]))
 
+    def test_policy_scopes(self):
+        """Test storing policies of all scopes in a single table."""
+        as_policy = AsPeerPolicy.objects.create(
+            vlan=self.vlan[0], asys=self.asys[0], peer_as=self.asys[1], accept=True)
+        isd_policy = IsdPeerPolicy.objects.create(
+            vlan=self.vlan[0], asys=self.asys[0], peer_isd=self.isd[1], accept=False)
+        DefaultPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[0], accept=True)
+        self.assertEqual(as_policy.scope, PeerPolicy.Scope.AS)
+        self.assertEqual(PeerPolicy.objects.count(), 3)
+        self.assertEqual(AsPeerPolicy.objects.get(), as_policy)
+        self.assertEqual(IsdPeerPolicy.objects.get(), isd_policy)
+        self.assertFalse(OwnerPeerPolicy.objects.exists())
+        self.assertIsInstance(PeerPolicy.objects.get(id=isd_policy.id).as_scope_model(),
+            IsdPeerPolicy)
+
+        # Only the peer column of the scope may be set.
+        with self.assertRaises(ValidationError):
+            AsPeerPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[0], accept=True)
+        with self.assertRaises(ValidationError):
+            AsPeerPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[0],
+                peer_as=self.asys[2], peer_isd=self.isd[0], accept=True)
+
+        # Uniqueness is enforced per scope.
+        with self.assertRaises(ValidationError):
+            AsPeerPolicy.objects.create(
+                vlan=self.vlan[0], asys=self.asys[0], peer_as=self.asys[1], accept=False)
+        with self.assertRaises(ValidationError):
+            DefaultPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[0], accept=False)
+        OwnerPeerPolicy.objects.create(
+            vlan=self.vlan[0], asys=self.asys[0], peer_owner=self.owner[1], accept=True)
+
     def test_isd_policies(self):
         """Test ISD peering policies and their interaction with AS policies."""
         vlan = self.vlan[0]
@@ -321,6 +381,193 @@ class PeeringPoliciesTest(TestCase):
         self.assertEqual(self.asys[1].accept.count(), 0)
         self.assertEqual(_count_links(self.asys[1]), 0)
 
+    def test_asn_range_policies(self):
+        """Test ASN range policies and their precedence over owner-level policies."""
+        vlan = self.vlan[0]
+
+        # Accept 1-ff00:0:3 -> 1-ff00:0:1
+        # Accept 2-ff00:0:4 -> 1-ff00:0:1
+        # Accept 2-ff00:0:5 -> 1-ff00:0:1
+        for asys in self.asys[3:6]:
+            _add_as_policy(vlan, asys, self.asys[1], True)
+
+        # 1-ff00:0:1 -> Reject Owner 3, accept ff00:0:3-ff00:0:5
+        _add_owner_policy(vlan, self.asys[1], self.owner[2], False)
+        self.assertEqual(Link.objects.count(), 0)
+        _add_range_policy(vlan, self.asys[1], "ff00:0:3-ff00:0:5", True)
+        self.assertEqual(_count_links(self.asys[1]), 3)
+
+        # AS-level policies take precedence over ASN ranges.
+        _add_as_policy(vlan, self.asys[1], self.asys[4], False)
+        self.assertEqual(_count_links(self.asys[1]), 2)
+        self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys[1], self.asys[3]))
+        self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys[1], self.asys[5]))
+
+        # The ranges of an AS must not overlap.
+        with self.assertRaises(ValidationError):
+            _add_range_policy(vlan, self.asys[1], "ff00:0:5-ff00:0:6", False)
+        with self.assertRaises(ValidationError):
+            _add_range_policy(vlan, self.asys[1], "ff00:0:*", False)
+        _add_range_policy(vlan, self.asys[1], "0:*:*", False)
+        _add_range_policy(self.vlan[1], self.asys[1], "ff00:0:*", False)
+
+        # The database requires both bounds of a range.
+        policy = AsRangePeerPolicy.objects.get(vlan=self.vlan[1], asys=self.asys[1])
+        for bound in ['peer_asn_first', 'peer_asn_last']:
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                AsRangePeerPolicy.objects.filter(id=policy.id).update(**{bound: None})
+
+        # Moving an AS out of the range re-evaluates the policies.
+        asys = AS.objects.get(id=self.asys[5].id)
+        asys.asn = ASN("ff00:0:10")
+        asys.save()
+        self.assertEqual(_count_links(self.asys[1]), 1)
+        self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys[1], self.asys[3]))
+        self._assert_accepted_peers_consistent(vlan)
+
+    def test_all_vlan_policies(self):
+        """Test policies applying to all VLANs an AS is a member of."""
+        # All VLANs: Accept 2-ff00:0:4 <-> 2-ff00:0:5
+        DefaultPolicy.objects.create(vlan=None, asys=self.asys[4], accept=True)
+        AsPeerPolicy.objects.create(vlan=None, asys=self.asys[5], peer_as=self.asys[4],
+            accept=True)
+        with resolution_queue.coalesce():
+            resolution_queue.resolve(None, self.asys[4])
+            resolution_queue.resolve(None, self.asys[5])
+        for vlan in self.vlan:
+            self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING,
+                self.asys[4], self.asys[5]))
+        self.assertEqual(Link.objects.count(), 2)
+
+        # Policies for all VLANs and for a single VLAN must not conflict.
+        with self.assertRaises(ValidationError):
+            AsPeerPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[5],
+                peer_as=self.asys[4], accept=False)
+        with self.assertRaises(ValidationError):
+            DefaultPolicy.objects.create(vlan=None, asys=self.asys[4], accept=False)
+        _add_range_policy(self.vlan[1], self.asys[4], "ff00:0:0-ff00:0:2", False)
+        with self.assertRaises(ValidationError):
+            AsRangePeerPolicy.objects.create(vlan=None, asys=self.asys[4],
+                peer_asn_first=ASN("ff00:0:2"), peer_asn_last=ASN("ff00:0:3"), accept=True)
+
+        # Policies of a single VLAN take precedence according to their scope.
+        _add_as_policy(self.vlan[1], self.asys[4], self.asys[5], False)
+        self.assertEqual(Link.objects.count(), 1)
+        self.assertTrue(_links_exists(self, self.vlan[0], Link.Type.PEERING,
+            self.asys[4], self.asys[5]))
+        for vlan in self.vlan:
+            self._assert_accepted_peers_consistent(vlan)
+
+    def test_peering_opportunities(self):
+        """Test listing the ASes accepting an AS which are not accepted in return."""
+        vlan = self.vlan[0]
+        _add_default_policy(vlan, self.asys[1], True)
+        _add_as_policy(vlan, self.asys[2], self.asys[0], True)
+        _add_as_policy(vlan, self.asys[0], self.asys[2], True)
+        _add_default_policy(vlan, self.asys[3], True)
+        _add_as_policy(vlan, self.asys[3], self.asys[0], False)
+        _add_owner_policy(vlan, self.asys[4], self.owner[0], True)
+        self.assertEqual(list(self.asys[0].query_peering_opportunities(vlan)),
+            [self.asys[1], self.asys[4]])
+        self.assertEqual(list(self.asys[0].query_peering_opportunities(vlan).filter(
+            asn__gt=self.asys[1].asn)), [self.asys[4]])
+        self.assertEqual(list(self.asys[1].query_peering_opportunities(vlan)), [])
+        self.assertEqual(list(self.asys[0].query_peering_opportunities(self.vlan[1])), [])
+
+        # Accept everyone except 2-ff00:0:4
+        _add_default_policy(vlan, self.asys[0], True)
+        _add_as_policy(vlan, self.asys[0], self.asys[4], False)
+        self.assertEqual(list(self.asys[0].query_peering_opportunities(vlan)), [self.asys[4]])
+        self.assertEqual(list(self.asys[5].query_peering_opportunities(vlan)),
+            [self.asys[0], self.asys[1], self.asys[3]])
+
+    def _assert_accepted_peers_consistent(self, vlan):
+        for asys in AS.objects.all():
+            accepted = {peer for peer, in asys.query_accepted_peers(vlan)}
+            self.assertEqual(accepted, {peer for peer, in _get_accepted_peers(vlan, asys)}, asys)
+
+    def test_membership_changes(self):
+        """Test updating accepted peers and links when ASes join or leave a VLAN."""
+        vlan = self.vlan[0]
+
+        # 1-ff00:0:0 -> Accept all
+        # 1-ff00:0:2 -> Accept all, reject Owner 4
+        # 1-ff00:0:3 -> Reject ISD 1
+        _add_default_policy(vlan, self.asys[0], True)
+        _add_default_policy(vlan, self.asys[2], True)
+        _add_owner_policy(vlan, self.asys[2], self.owner[3], False)
+        _add_isd_policy(vlan, self.asys[3], self.isd[0], False)
+        self.assertEqual(Link.objects.count(), 1)
+
+        # New AS joins
+        new_as = AS.objects.create(asn=ASN("ff00:0:6"), isd=self.isd[0], name="AS 6",
+            owner=self.owner[3], is_core=True)
+        client = PeeringClient.objects.create(asys=new_as, name="default")
+        interface = Interface.objects.create(peering_client=client, vlan=vlan,
+            public_ip="10.0.1.1", first_port=50000, last_port=51000)
+        self.assertEqual({asys for asys, in new_as.query_accepting_peers(vlan)}, {self.asys[0].id})
+        self.assertEqual(RejectedPeer.objects.filter(vlan=vlan, peer=new_as).count(), 1)
+        self._assert_accepted_peers_consistent(vlan)
+
+        _add_default_policy(vlan, new_as, True)
+        self.assertEqual(Link.objects.count(), 2)
+        self.assertTrue(_links_exists(self, vlan, Link.Type.CORE, self.asys[0], new_as))
+
+        # Additional interfaces are linked to the existing peers.
+        client2 = PeeringClient.objects.create(asys=new_as, name="backup")
+        interface2 = Interface.objects.create(peering_client=client2, vlan=vlan,
+            public_ip="10.0.1.2", first_port=50000, last_port=51000)
+        self.assertEqual(Link.objects.count(), 3)
+        self.assertTrue(_link_exists(self, vlan, Link.Type.CORE,
+            self.asys[0].query_interfaces().get(vlan=vlan), interface2))
+        self._assert_accepted_peers_consistent(vlan)
+
+        # Leave
+        interface.delete()
+        self.assertEqual(Link.objects.count(), 2)
+        self.assertTrue(new_as.query_accepting_peers(vlan).exists())
+        interface2.delete()
+        self.assertEqual(Link.objects.count(), 1)
+        self.assertFalse(new_as.query_accepting_peers(vlan).exists())
+        self.assertFalse(RejectedPeer.objects.filter(vlan=vlan, peer=new_as).exists())
+        self._assert_accepted_peers_consistent(vlan)
+
+    def test_group_changes(self):
+        """Test updating accepted peers and links when the ISD or owner of an AS changes."""
+        vlan = self.vlan[0]
+
+        # 1-ff00:0:1 -> Accept ISD 2, reject Owner 4
+        # 2-ff00:0:4 -> Accept 1-ff00:0:1
+        # 2-ff00:0:5 -> Accept 1-ff00:0:1
+        _add_isd_policy(vlan, self.asys[1], self.isd[1], True)
+        _add_owner_policy(vlan, self.asys[1], self.owner[3], False)
+        _add_as_policy(vlan, self.asys[4], self.asys[1], True)
+        _add_as_policy(vlan, self.asys[5], self.asys[1], True)
+        self.assertEqual(Link.objects.count(), 1)
+        self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys[1], self.asys[4]))
+
+        # Move 2-ff00:0:4 to ISD 3
+        asys = AS.objects.get(id=self.asys[4].id)
+        asys.isd = self.isd[2]
+        asys.save()
+        self.assertEqual(Link.objects.count(), 0)
+        self._assert_accepted_peers_consistent(vlan)
+
+        # Move 2-ff00:0:5 from Owner 4 to Owner 3
+        asys = AS.objects.get(id=self.asys[5].id)
+        asys.owner = self.owner[2]
+        asys.save()
+        self.assertEqual(Link.objects.count(), 1)
+        self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys[1], self.asys[5]))
+        self._assert_accepted_peers_consistent(vlan)
+
+        # Deleting an ISD deletes its ASes together with their links, no re-evaluation necessary.
+        with mock.patch.object(policy_resolver, 'update_peer') as update_peer:
+            self.isd[1].delete()
+        update_peer.assert_not_called()
+        self.assertEqual(Link.objects.count(), 0)
+        self._assert_accepted_peers_consistent(vlan)
+
 
 class ExampleTopologyTest(TestCase):
     """Test a small example topology."""
@@ -367,7 +614,7 @@ class ExampleTopologyTest(TestCase):
                 Interface.objects.create(peering_client=daemon, vlan=vlan, public_ip=ip,
                     first_port=50000, last_port=51000)
 
-    def test_example(self):
+    def _create_policies(self):
         vlan = self.vlan[0]
 
         # AS-level policies
@@ -397,17 +644,58 @@ class ExampleTopologyTest(TestCase):
         # H accept ISD 2
         IsdPeerPolicy.objects.create(vlan=vlan, asys=self.asys['H'], peer_isd=self.isd[1], accept=True)
 
-        for asys in self.asys.values():
-            update_accepted_peers(vlan, asys)
-        for asys in self.asys.values():
-            update_links(vlan, asys)
-
+    def _check_links(self):
+        vlan = self.vlan[0]
         self.assertEqual(Link.objects.count(), 4)
         self.assertTrue(_links_exists(self, vlan, Link.Type.CORE, self.asys['B'], self.asys['C']))
         self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys['D'], self.asys['E']))
         self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys['F'], self.asys['G']))
         self.assertTrue(_links_exists(self, vlan, Link.Type.PEERING, self.asys['G'], self.asys['H']))
 
+    def test_example(self):
+        vlan = self.vlan[0]
+        self._create_policies()
+
+        for asys in self.asys.values():
+            update_accepted_peers(vlan, asys)
+        for asys in self.asys.values():
+            update_links(vlan, asys)
+
+        self._check_links()
+
+    def test_coalesce(self):
+        """Test coalescing resolutions into a single pass per VLAN."""
+        vlan = self.vlan[0]
+        self._create_policies()
+
+        with mock.patch.object(policy_resolver, 'update_vlan',
+                wraps=policy_resolver.update_vlan) as update_vlan:
+            with resolution_queue.coalesce():
+                for asys in self.asys.values():
+                    resolution_queue.resolve(vlan, asys)
+                    resolution_queue.resolve(vlan, asys)
+                with resolution_queue.coalesce():
+                    resolution_queue.resolve(vlan, self.asys['A'])
+                self.assertEqual(Link.objects.count(), 0)
+        update_vlan.assert_called_once()
+        self._check_links()
+
+        # Resolving all ASes at once yields the same links as resolving them one by one.
+        OwnerPeerPolicy.objects.filter(asys=self.asys['G']).delete()
+        with resolution_queue.coalesce():
+            resolution_queue.resolve(vlan, self.asys['G'])
+            resolution_queue.resolve(vlan, self.asys['H'])
+        self.assertEqual(Link.objects.count(), 3)
+        self.assertFalse(_links_exists(self, vlan, Link.Type.PEERING, self.asys['F'], self.asys['G']))
+
+        # Nothing is resolved if the block is left with an exception.
+        IsdPeerPolicy.objects.filter(asys=self.asys['H']).delete()
+        with self.assertRaises(RuntimeError):
+            with resolution_queue.coalesce():
+                resolution_queue.resolve(vlan, self.asys['H'])
+                raise RuntimeError()
+        self.assertEqual(Link.objects.count(), 3)
+
 
 class MultiClientTest(TestCase):
     """Test multiple peering clients per AS and multiple interfaces per client."""
@@ -505,3 +793,137 @@ class MultiClientTest(TestCase):
             self.interface['A-2-VLAN2'], self.interface['B-2-VLAN2']))
         self.assertTrue(_link_exists(self, self.vlan['VLAN2'], Link.Type.PEERING,
             self.interface['A-2-VLAN2'], self.interface['B-3-VLAN2']))
+
+    def test_denormalized_link_columns(self):
+        """Test that the VLAN and AS columns of links follow their interfaces."""
+        _add_as_policy(self.vlan['VLAN1'], self.asys['A'], self.asys['B'], True)
+        _add_as_policy(self.vlan['VLAN1'], self.asys['B'], self.asys['A'], True)
+
+        for link in Link.objects.all():
+            self.assertEqual(link.vlan, link.interface_a.vlan)
+            self.assertEqual(link.vlan, link.interface_b.vlan)
+            self.assertEqual(link.as_a, link.interface_a.peering_client.asys)
+            self.assertEqual(link.as_b, link.interface_b.peering_client.asys)
+
+        self.assertEqual(list(self.asys['A'].query_connected_peers(vlan=self.vlan['VLAN1'])),
+            [(self.asys['B'].id,)])
+        self.assertEqual(self.asys['A'].query_connected_peers(vlan=self.vlan['VLAN2']).count(), 0)
+
+        # Move a peering client to another AS
+        client = PeeringClient.objects.get(asys=self.asys['B'], name="1")
+        client.asys = self.asys['A']
+        client.name = "3"
+        client.save()
+        for link in Link.objects.all():
+            self.assertEqual(link.as_a, link.interface_a.peering_client.asys)
+            self.assertEqual(link.as_b, link.interface_b.peering_client.asys)
+
+    def test_count_connected_peers(self):
+        """Test counting the peers of several ASes with a single query."""
+        A, B = self.asys['A'], self.asys['B']
+        vlan1, vlan2 = self.vlan['VLAN1'], self.vlan['VLAN2']
+        _add_as_policy(vlan1, A, B, True)
+        _add_as_policy(vlan1, B, A, True)
+        # Links of the new interface are created from A to B, so links in both directions connect
+        # the same pair of ASes.
+        client = PeeringClient.objects.create(asys=A, name="3")
+        Interface.objects.create(peering_client=client, vlan=vlan1,
+            public_ip=ipaddress.IPv4Address("10.0.0.10"), first_port=50000, last_port=51000)
+        self.assertTrue(Link.objects.filter(vlan=vlan1, as_a=A).exists())
+        self.assertTrue(Link.objects.filter(vlan=vlan1, as_b=A).exists())
+
+        with self.assertNumQueries(1):
+            counts = AS.count_connected_peers([A.id, B.id])
+        self.assertEqual(counts, {(A.id, vlan1.id): 1, (B.id, vlan1.id): 1})
+        for asys in (A, B):
+            for vlan in (vlan1, vlan2):
+                self.assertEqual(counts.get((asys.id, vlan.id), 0),
+                    asys.query_connected_peers(vlan=vlan).count())
+        self.assertEqual(AS.count_connected_peers([]), {})
+
+        # Large sets of ASes are split into several queries.
+        with mock.patch.object(AS, 'MAX_QUERY_IDS', 1), self.assertNumQueries(2):
+            self.assertEqual(AS.count_connected_peers([A.id, B.id]), counts)
+
+    def test_link_counts(self):
+        """Test maintaining the number of links per AS and VLAN."""
+        A, B = self.asys['A'], self.asys['B']
+        vlan1, vlan2 = self.vlan['VLAN1'], self.vlan['VLAN2']
+
+        def expected():
+            counts = {}
+            for vlan_id, as_a, as_b in Link.objects.values_list('vlan_id', 'as_a_id', 'as_b_id'):
+                for asys_id in (as_a, as_b):
+                    counts[(vlan_id, asys_id)] = counts.get((vlan_id, asys_id), 0) + 1
+            return counts
+
+        def link_counts():
+            return {(vlan_id, asys_id): links for vlan_id, asys_id, links
+                in LinkCount.objects.values_list('vlan_id', 'asys_id', 'links')}
+
+        for vlan in (vlan1, vlan2):
+            _add_as_policy(vlan, A, B, True)
+            _add_as_policy(vlan, B, A, True)
+        self.assertTrue(link_counts())
+        self.assertEqual(link_counts(), expected())
+
+        # Moving a peering client to another AS moves its links.
+        C = AS.objects.create(asn=ASN("ff00:0:2"), isd=self.isd[0], name="AS C",
+            owner=self.owner[1], is_core=False)
+        client = PeeringClient.objects.get(asys=B, name="2")
+        client.asys = C
+        client.save()
+        self.assertTrue(LinkCount.objects.filter(asys=C).exists())
+        self.assertEqual(link_counts(), expected())
+
+        # Counts reaching zero are deleted.
+        _delete_policy(AsPeerPolicy.objects.get(vlan=vlan1, asys=A, peer_as=B))
+        self.assertFalse(LinkCount.objects.filter(vlan=vlan1).exists())
+        self.assertEqual(link_counts(), expected())
+
+        # Links deleted by cascades are uncounted as well.
+        C.delete()
+        self.assertFalse(LinkCount.objects.exists())
+
+    def test_vlan_membership(self):
+        """Test the cached VLAN membership index."""
+        asys, vlan1, vlan2 = self.asys['A'], self.vlan['VLAN1'], self.vlan['VLAN2']
+        with VlanMembership.cached():
+            with self.assertNumQueries(1):
+                self.assertTrue(asys.is_connected_to_vlan(vlan1))
+                self.assertTrue(asys.is_connected_to_vlan(vlan2))
+                self.assertEqual(VlanMembership.get_interface_ids(asys.id, vlan1.id),
+                    {self.interface['A-1-VLAN1'].id, self.interface['A-2-VLAN1'].id})
+                for _ in range(10):
+                    AsPeerPolicy(vlan=vlan1, asys=asys, peer_as=self.asys['B']).clean()
+            self.assertEqual(set(asys.get_connected_vlans()), {vlan1, vlan2})
+
+            # Adding an interface invalidates the index.
+            vlan3 = VLAN.objects.create(name="vlan3", long_name="VLAN 3",
+                ip_network=ipaddress.IPv4Network("10.2.0.0/16"))
+            self.assertFalse(asys.is_connected_to_vlan(vlan3))
+            Interface.objects.create(peering_client=self.interface['A-1-VLAN1'].peering_client,
+                vlan=vlan3, public_ip=ipaddress.IPv4Address("10.2.0.1"))
+            self.assertTrue(asys.is_connected_to_vlan(vlan3))
+            self.assertEqual(set(asys.get_connected_vlans()), {vlan1, vlan2, vlan3})
+
+        # Other threads discard their indices when the change is committed.
+        generation = VlanMembership._generation
+        with self.captureOnCommitCallbacks(execute=True):
+            Interface.objects.create(peering_client=self.interface['B-1-VLAN1'].peering_client,
+                vlan=vlan3, public_ip=ipaddress.IPv4Address("10.2.0.2"))
+            self.assertEqual(VlanMembership._generation, generation)
+        self.assertGreater(VlanMembership._generation, generation)
+
+        # Without caching scope, every check queries the database.
+        vlan3 = VLAN.objects.get(name="vlan3")
+        with self.assertNumQueries(2):
+            self.assertTrue(asys.is_connected_to_vlan(vlan3))
+            self.assertTrue(self.asys['B'].is_connected_to_vlan(vlan3))
+
+        # Streaming RPCs cache memberships while they run.
+        @VlanMembership.cached_stream
+        def stream():
+            yield VlanMembership._local.index is not None
+        self.assertEqual(list(stream()), [True])
+        self.assertIsNone(VlanMembership._local.index)
@@ -0,0 +1,103 @@
+import ipaddress
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from peering_coord import policy_resolver
+from peering_coord.models.ixp import VLAN, Interface, Owner, PeeringClient
+from peering_coord.models.policies import (
+    AsPeerPolicy, AsRangePeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy, PeerPolicy)
+from peering_coord.models.scion import AS, ISD
+from peering_coord.policy_analyzer import compact_policies, find_redundant_policies
+from peering_coord.scion_addr import ASN
+
+
+class PolicyAnalyzerTest(TestCase):
+    """Test the detection and removal of redundant policies."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vlan = [
+            VLAN.objects.create(name="prod", long_name="Production",
+                ip_network=ipaddress.IPv4Network("10.0.0.0/16")),
+            VLAN.objects.create(name="test", long_name="Testing",
+                ip_network=ipaddress.IPv4Network("10.1.0.0/16")),
+        ]
+        owner = [
+            Owner.objects.create(name="owner1", long_name="Owner 1", contact=""),
+            Owner.objects.create(name="owner2", long_name="Owner 2", contact=""),
+        ]
+        isd = [
+            ISD.objects.create(isd_id=1, name="Region 1"),
+            ISD.objects.create(isd_id=2, name="Region 2"),
+        ]
+        # (owner, ISD, VLANs)
+        ases = [(0, 0, (0, 1)), (0, 0, (0, 1)), (0, 0, (0, 1)), (1, 0, (0, 1)), (1, 1, (0, 1)),
+            (1, 1, (1,))]
+        cls.asys = []
+        for i, (owner_index, isd_index, vlans) in enumerate(ases):
+            asys = AS.objects.create(asn=ASN("ff00:0:{}".format(i)), isd=isd[isd_index],
+                name="AS {}".format(i), owner=owner[owner_index], is_core=False)
+            client = PeeringClient.objects.create(asys=asys, name="default")
+            for vlan_index in vlans:
+                vlan = cls.vlan[vlan_index]
+                Interface.objects.create(peering_client=client, vlan=vlan,
+                    public_ip=vlan.ip_network[i + 1], first_port=50000, last_port=51000)
+            cls.asys.append(asys)
+
+        asys, vlan = cls.asys[0], cls.vlan
+        cls.redundant = [
+            # Accepted by the owner policy
+            AsPeerPolicy.objects.create(vlan=vlan[0], asys=asys, peer_as=cls.asys[3]),
+            # Accepted by the default policy
+            AsPeerPolicy.objects.create(vlan=vlan[0], asys=asys, peer_as=cls.asys[1]),
+            # Accepted by the owner policy, although not a member of the VLAN
+            AsPeerPolicy.objects.create(vlan=vlan[0], asys=asys, peer_as=cls.asys[5]),
+            # Nothing of lower precedence accepts in the test VLAN.
+            AsRangePeerPolicy.objects.create(vlan=vlan[1], asys=asys,
+                peer_asn_first=ASN("ff00:0:0"), peer_asn_last=ASN("ff00:0:ff"), accept=False),
+            DefaultPolicy.objects.create(vlan=vlan[1], asys=asys, accept=False),
+        ]
+        cls.effective = [
+            OwnerPeerPolicy.objects.create(vlan=vlan[0], asys=asys, peer_owner=owner[1]),
+            AsPeerPolicy.objects.create(
+                vlan=vlan[0], asys=asys, peer_as=cls.asys[4], accept=False),
+            IsdPeerPolicy.objects.create(vlan=vlan[0], asys=asys, peer_isd=isd[1], accept=False),
+            DefaultPolicy.objects.create(vlan=vlan[0], asys=asys),
+            # Redundant in the test VLAN, but not in the production VLAN
+            AsPeerPolicy.objects.create(vlan=None, asys=asys, peer_as=cls.asys[2], accept=False),
+        ]
+
+    def test_find(self):
+        analysis = find_redundant_policies(self.asys[0])
+        self.assertEqual(analysis.redundant, sorted(self.redundant, key=lambda p: p.id))
+        self.assertEqual(analysis.evaluations_before, 11)
+        self.assertEqual(analysis.evaluations_after, 6)
+        self.assertEqual(analysis.saved_evaluations, 5)
+
+        analysis = find_redundant_policies(self.asys[0], self.vlan[1])
+        self.assertEqual(analysis.redundant, self.redundant[3:])
+        self.assertEqual((analysis.evaluations_before, analysis.evaluations_after), (3, 1))
+
+        self.assertEqual(find_redundant_policies(self.asys[1]), ([], 0, 0))
+
+    def test_time_limited(self):
+        # Time-limited policies prevent the analysis of the VLANs they apply to.
+        OwnerPeerPolicy.objects.create(vlan=self.vlan[1], asys=self.asys[0],
+            peer_owner=self.asys[0].owner, valid_until=timezone.now() + timedelta(hours=1))
+        analysis = find_redundant_policies(self.asys[0])
+        self.assertEqual(analysis.redundant, sorted(self.redundant[:3], key=lambda p: p.id))
+
+    def test_compact(self):
+        accepted = {vlan.id: set(policy_resolver._get_accepted_peers(vlan, self.asys[0]))
+            for vlan in self.vlan}
+
+        analysis = compact_policies(self.asys[0])
+        self.assertEqual(len(analysis.redundant), len(self.redundant))
+        self.assertEqual(set(PeerPolicy.objects.all()), set(self.effective))
+        self.assertEqual(find_redundant_policies(self.asys[0]), ([], 6, 6))
+
+        for vlan in self.vlan:
+            self.assertEqual(
+                set(policy_resolver._get_accepted_peers(vlan, self.asys[0])), accepted[vlan.id])
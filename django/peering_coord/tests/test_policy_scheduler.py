@@ -0,0 +1,160 @@
+import ipaddress
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from peering_coord import policy_resolver
+from peering_coord.models.ixp import VLAN, Interface, Owner, PeeringClient
+from peering_coord.models.policies import AsPeerPolicy, DefaultPolicy, PeerPolicy
+from peering_coord.models.scion import AS, ISD, Link
+from peering_coord.policy_scheduler import (
+    ACTIVATION_OVERLAP, PolicyScheduler, process_transitions)
+from peering_coord.scion_addr import ASN
+
+
+def _create_ases():
+    """Create two VLANs and three ASes connected to both of them."""
+    vlans = [
+        VLAN.objects.create(name="prod", long_name="Production",
+            ip_network=ipaddress.IPv4Network("10.0.0.0/16")),
+        VLAN.objects.create(name="test", long_name="Testing",
+            ip_network=ipaddress.IPv4Network("10.1.0.0/16")),
+    ]
+    owner = Owner.objects.create(name="owner1", long_name="Owner 1", contact="")
+    isd = ISD.objects.create(isd_id=1, name="Region 1")
+    ases = []
+    for i in range(3):
+        asys = AS.objects.create(asn=ASN("ff00:0:{}".format(i)), isd=isd,
+            name="AS {}".format(i), owner=owner, is_core=False)
+        client = PeeringClient.objects.create(asys=asys, name="default")
+        for vlan in vlans:
+            Interface.objects.create(peering_client=client, vlan=vlan,
+                public_ip=vlan.ip_network[i + 1], first_port=50000, last_port=51000)
+        ases.append(asys)
+    return vlans, ases
+
+
+class PolicySchedulerTest(TestCase):
+    """Test activation and expiration of time-limited policies."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vlan, cls.asys = _create_ases()
+
+    def test_validity(self):
+        now = timezone.now()
+        policy = AsPeerPolicy(vlan=self.vlan[0], asys=self.asys[0], peer_as=self.asys[1],
+            valid_from=now, valid_until=now)
+        with self.assertRaises(ValidationError):
+            policy.save()
+        policy.valid_until = now + timedelta(hours=1)
+        self.assertTrue(policy.is_active(now))
+        self.assertFalse(policy.is_active(now - timedelta(seconds=1)))
+        self.assertFalse(policy.is_active(policy.valid_until))
+        policy.save()
+        self.assertEqual(list(PeerPolicy.objects.filter(PeerPolicy.active_at(now))), [policy])
+        self.assertFalse(PeerPolicy.objects.filter(PeerPolicy.active_at(now + timedelta(hours=1))))
+
+    def test_transitions(self):
+        now = timezone.now()
+        later = now + timedelta(hours=1)
+
+        # Trial peering between AS 0 and AS 1 in all VLANs starting later
+        for a, b in [(0, 1), (1, 0)]:
+            AsPeerPolicy.objects.create(vlan=None, asys=self.asys[a], peer_as=self.asys[b],
+                valid_from=later)
+        # AS 2 accepts everyone in VLAN 0 until later
+        DefaultPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[2], valid_until=later)
+        AsPeerPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[0], peer_as=self.asys[2])
+        for asys in self.asys:
+            for vlan in self.vlan:
+                policy_resolver.update_accepted_peers(vlan, asys)
+                policy_resolver.update_links(vlan, asys)
+        self.assertEqual(self._peerings(), {(self.vlan[0].id, self.asys[0].id, self.asys[2].id)})
+
+        # Nothing is due yet.
+        self.assertEqual(process_transitions(), 0)
+
+        # All transitions due at the same time are resolved in a single pass per VLAN.
+        with mock.patch.object(policy_resolver, 'update_vlan',
+                wraps=policy_resolver.update_vlan) as update_vlan, \
+                mock.patch.object(timezone, 'now', return_value=later):
+            self.assertEqual(process_transitions(), 3)
+        self.assertEqual(update_vlan.call_count, len(self.vlan))
+
+        # Activated policies keep their start time, expired policies are deleted.
+        self.assertEqual(AsPeerPolicy.objects.filter(valid_from=later).count(), 2)
+        self.assertFalse(DefaultPolicy.objects.exists())
+        self.assertEqual(self._peerings(),
+            {(vlan.id, self.asys[0].id, self.asys[1].id) for vlan in self.vlan})
+
+        # Activations are processed again only while they are within the overlap of two passes.
+        peerings = self._peerings()
+        with mock.patch.object(timezone, 'now', return_value=later + timedelta(seconds=1)):
+            self.assertEqual(process_transitions(since=later), 2)
+        self.assertEqual(self._peerings(), peerings)
+        since = later + ACTIVATION_OVERLAP
+        self.assertEqual(process_transitions(since + timedelta(seconds=1), since=since), 0)
+
+    def test_late_commit(self):
+        """Policies committed after the pass covering their activation time are resolved by the
+        next pass.
+        """
+        now = timezone.now()
+        for a, b in [(0, 1), (1, 0)]:
+            AsPeerPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[a],
+                peer_as=self.asys[b], valid_from=now - timedelta(seconds=1))
+        self.assertEqual(process_transitions(now + timedelta(seconds=1), since=now), 2)
+        self.assertEqual(self._peerings(), {(self.vlan[0].id, self.asys[0].id, self.asys[1].id)})
+
+    def test_deleted_vlan(self):
+        """VLANs deleted while the transitions are processed are skipped."""
+        now = timezone.now()
+        AsPeerPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[0], peer_as=self.asys[1],
+            valid_from=now)
+        AsPeerPolicy.objects.create(vlan=self.vlan[1], asys=self.asys[0], peer_as=self.asys[1],
+            valid_from=now)
+        in_bulk = VLAN.objects.in_bulk
+        with mock.patch.object(VLAN.objects, 'in_bulk',
+                side_effect=lambda ids: in_bulk(set(ids) - {self.vlan[0].id})), \
+                mock.patch.object(policy_resolver, 'update_vlan',
+                wraps=policy_resolver.update_vlan) as update_vlan:
+            self.assertEqual(process_transitions(now), 2)
+        self.assertEqual([args[0] for args, _ in update_vlan.call_args_list], [self.vlan[1]])
+
+    @staticmethod
+    def _peerings():
+        return {(vlan_id, min(a, b), max(a, b))
+            for vlan_id, a, b in Link.objects.values_list('vlan_id', 'as_a_id', 'as_b_id')}
+
+
+class PolicySchedulerThreadTest(TransactionTestCase):
+    """Test the scheduler thread."""
+
+    def setUp(self):
+        self.vlan, self.asys = _create_ases()
+
+    def tearDown(self):
+        PolicyScheduler.stop()
+
+    def test_external_save(self):
+        """Policies saved without notifying the scheduler, e.g., by the admin interface running in
+        another process, are activated nevertheless.
+        """
+        PolicyScheduler.start(tick=0.05)
+        start = timezone.now() + timedelta(seconds=0.3)
+        for a, b in [(0, 1), (1, 0)]:
+            AsPeerPolicy.objects.create(vlan=self.vlan[0], asys=self.asys[a],
+                peer_as=self.asys[b], valid_from=start)
+        self.assertFalse(Link.objects.exists())
+
+        deadline = time.monotonic() + 10
+        while not Link.objects.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertGreaterEqual(timezone.now(), start)
+        self.assertEqual(Link.objects.filter(vlan=self.vlan[0]).count(), 1)
+        self.assertEqual(AsPeerPolicy.objects.filter(valid_from=start).count(), 2)
@@ -0,0 +1,103 @@
+import ipaddress
+
+from django.db import transaction
+from django_grpc_framework.test import RPCTransactionTestCase
+
+from peering_coord import resolution_queue
+from peering_coord.api import peering_pb2, peering_pb2_grpc
+from peering_coord.api.authentication import ASN_HEADER_KEY, CLIENT_NAME_HEADER_KEY
+from peering_coord.models.ixp import VLAN, Interface, Owner, PeeringClient
+from peering_coord.models.policies import AsPeerPolicy
+from peering_coord.models.scion import AS, ISD, Link
+from peering_coord.resolution_queue import ResolutionQueue
+from peering_coord.scion_addr import ASN
+
+
+class ResolutionQueueTest(RPCTransactionTestCase):
+    """Test background resolution of policy changes."""
+
+    def setUp(self):
+        super().setUp()
+        owner = Owner.objects.create(name="owner1", long_name="Owner 1", contact="Contact Info")
+        isd = ISD.objects.create(isd_id=1, name="Region 1")
+        self.asys = [
+            AS.objects.create(asn=ASN("ff00:0:{}".format(i)), isd=isd, name="AS {}".format(i),
+                owner=owner, is_core=False)
+            for i in range(3)
+        ]
+        self.vlan = VLAN.objects.create(name="prod", long_name="Production",
+            ip_network=ipaddress.IPv4Network("10.0.0.0/16"))
+        for asys, ip in zip(self.asys, self.vlan.ip_network.hosts()):
+            client = PeeringClient.objects.create(asys=asys, name="default")
+            Interface.objects.create(peering_client=client, vlan=self.vlan, public_ip=ip,
+                first_port=50000, last_port=51000)
+
+    def tearDown(self):
+        ResolutionQueue.stop()
+
+    def _accept(self, asys: AS, peer: AS):
+        with transaction.atomic():
+            AsPeerPolicy.objects.create(vlan=self.vlan, asys=asys, peer_as=peer, accept=True)
+            resolution_queue.resolve(self.vlan, asys)
+
+    def test_merge_jobs(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:0"), (CLIENT_NAME_HEADER_KEY, "default")]
+
+        # Without workers, policies are resolved immediately.
+        self.assertFalse(ResolutionQueue.is_active())
+        self._accept(self.asys[0], self.asys[1])
+        self._accept(self.asys[1], self.asys[0])
+        self.assertEqual(Link.objects.count(), 1)
+
+        # Identical jobs are merged while they are waiting.
+        ResolutionQueue.enqueue(self.vlan.id, self.asys[0].id)
+        ResolutionQueue.enqueue(self.vlan.id, self.asys[0].id)
+        ResolutionQueue.enqueue(self.vlan.id, self.asys[2].id)
+        status = ResolutionQueue.get_status(self.asys[0].id)
+        self.assertEqual(status.jobs, [resolution_queue.JobStatus(self.vlan.id, False)])
+        self.assertEqual(status.queue_length, 2)
+
+        response = stub.GetResolutionStatus(
+            peering_pb2.ResolutionStatusRequest(), metadata=call_cred)
+        self.assertFalse(response.background)
+        self.assertEqual(len(response.jobs), 1)
+        self.assertEqual(response.jobs[0].vlan, "prod")
+        self.assertEqual(response.jobs[0].state, peering_pb2.ResolutionStatus.Job.PENDING)
+        self.assertEqual(response.queue_length, 2)
+
+        response = stub.GetResolutionStatus(
+            peering_pb2.ResolutionStatusRequest(vlan="test"), metadata=call_cred)
+        self.assertEqual(len(response.jobs), 0)
+
+        ResolutionQueue.start(2)
+        self.assertTrue(ResolutionQueue.wait_until_idle(10))
+        self.assertEqual(ResolutionQueue.get_status(self.asys[0].id).queue_length, 0)
+
+    def test_background_resolution(self):
+        stub = peering_pb2_grpc.PeeringStub(self.channel)
+        call_cred = [(ASN_HEADER_KEY, "ff00:0:2"), (CLIENT_NAME_HEADER_KEY, "default")]
+        ResolutionQueue.start(2)
+
+        # Jobs are queued once the policy change is committed. The in-memory test database does
+        # not support concurrent writers, so wait for every job to finish.
+        for asys, peer in [(0, 2), (2, 0), (1, 2), (2, 1)]:
+            self._accept(self.asys[asys], self.asys[peer])
+            self.assertTrue(ResolutionQueue.wait_until_idle(10))
+
+        self.assertEqual(Link.objects.filter(vlan=self.vlan).count(), 2)
+        peers = {peer for peer, in self.asys[2].query_connected_peers(vlan=self.vlan)}
+        self.assertEqual(peers, {self.asys[0].id, self.asys[1].id})
+
+        response = stub.GetResolutionStatus(
+            peering_pb2.ResolutionStatusRequest(), metadata=call_cred)
+        self.assertTrue(response.background)
+        self.assertEqual(len(response.jobs), 0)
+        self.assertEqual(response.failed_jobs, 0)
+
+        # Stopping the workers finishes the remaining jobs.
+        AsPeerPolicy.objects.filter(asys=self.asys[2], peer_as=self.asys[1]).delete()
+        ResolutionQueue.enqueue(self.vlan.id, self.asys[2].id)
+        ResolutionQueue.stop()
+        self.assertFalse(ResolutionQueue.is_active())
+        self.assertEqual(Link.objects.filter(vlan=self.vlan).count(), 1)
@@ -1,6 +1,7 @@
+import pickle
 from unittest import TestCase as PythonTestCase
 
-from peering_coord.scion_addr import ASN
+from peering_coord.scion_addr import ASN, AsnRange, AsnRangeIndex
 
 
 class AsnTest(PythonTestCase):
@@ -34,3 +35,74 @@ class AsnTest(PythonTestCase):
         for string, integer in self.TEST_CASES:
             with self.subTest(string=string, integer=integer):
                 self.assertEqual(str(ASN(integer)), string)
+
+    def test_asn_interning(self):
+        for string, integer in self.TEST_CASES:
+            with self.subTest(string=string, integer=integer):
+                self.assertIs(ASN(string), ASN(integer))
+                self.assertEqual(ASN.parse(string), integer)
+                self.assertIs(str(ASN(integer)), str(ASN(integer)))
+                self.assertEqual(pickle.loads(pickle.dumps(ASN(integer))), ASN(integer))
+
+        asn = ASN("ff00:0:1")
+        with self.assertRaises(AttributeError):
+            asn.asn_int = 0
+        with self.assertRaises(AttributeError):
+            asn.other = 0
+        self.assertEqual(int(asn), 0xff0000000001)
+
+
+class AsnRangeTest(PythonTestCase):
+    """Test ASN ranges and the ASN range index."""
+    TEST_CASES = [
+        ("ff00:0:100-ff00:0:1ff", 0xff0000000100, 0xff00000001ff),
+        ("1-100", 1, 100),
+        ("ff00:0:1", 0xff0000000001, 0xff0000000001),
+        ("ff00:0:*", 0xff0000000000, 0xff000000ffff),
+        ("ff00:*:*", 0xff0000000000, 0xff00ffffffff),
+        ("0:*:*", 0, 2**32-1),
+        ("*", 0, 2**48-1),
+    ]
+
+    def test_range_parsing(self):
+        for string, first, last in self.TEST_CASES:
+            with self.subTest(string=string):
+                asn_range = AsnRange.parse(string)
+                self.assertEqual((int(asn_range.first), int(asn_range.last)), (first, last))
+                self.assertEqual(str(asn_range), string)
+
+        self.assertEqual(str(AsnRange.parse("ff00:0:0-ff00:0:ffff")), "ff00:0:*")
+        self.assertEqual(AsnRange.parse("*:*:*"), AsnRange.parse("*"))
+        with self.assertRaisesRegex(ValueError, r"First ASN greater than last ASN"):
+            AsnRange.parse("ff00:0:2-ff00:0:1")
+        with self.assertRaisesRegex(ValueError, r"Wildcards must replace trailing groups"):
+            AsnRange.parse("ff00:*:1")
+        with self.assertRaisesRegex(ValueError, r"Wildcards must replace trailing groups"):
+            AsnRange.parse("*:0:*")
+        with self.assertRaises(ValueError):
+            AsnRange.parse("ff00:0:1-")
+
+    def test_range_index(self):
+        index = AsnRangeIndex([
+            (AsnRange.parse("10-19"), True),
+            (AsnRange.parse("1-5"), False),
+            (AsnRange.parse("6-9"), False),
+        ])
+        self.assertEqual([str(asn_range) for asn_range, _ in index], ["1-5", "6-9", "10-19"])
+        self.assertIs(index.get(ASN(1)), False)
+        self.assertIs(index.get(ASN(19)), True)
+        self.assertIsNone(index.get(ASN(20)))
+        self.assertEqual(index.coalesce(False), [AsnRange.parse("1-9")])
+
+        with self.assertRaisesRegex(ValueError, r"overlap"):
+            index.add(AsnRange.parse("19-30"), True)
+        with self.assertRaisesRegex(ValueError, r"overlap"):
+            index.add(AsnRange.parse("0:*:*"), True)
+        index.add(AsnRange.parse("20-30"), True)
+        self.assertEqual(index.coalesce(True), [AsnRange.parse("10-30")])
+        self.assertIn(index.find_overlapping(AsnRange.parse("7-12")),
+            [(AsnRange.parse("6-9"), False), (AsnRange.parse("10-19"), True)])
+        self.assertIsNone(index.find_overlapping(AsnRange.parse("31-40")))
+
+        with self.assertRaisesRegex(ValueError, r"overlap"):
+            AsnRangeIndex([(AsnRange.parse("1-5"), True), (AsnRange.parse("5-6"), True)])
@@ -0,0 +1,123 @@
+import ipaddress
+
+from django.test import TestCase, override_settings
+
+from peering_coord import sql_resolver
+from peering_coord.models.ixp import Owner, VLAN, PeeringClient, Interface
+from peering_coord.models.scion import ISD, AS, AcceptAll, AcceptedPeer, Link, RejectedPeer
+from peering_coord.models.policies import (
+    AsPeerPolicy, AsRangePeerPolicy, DefaultPolicy, IsdPeerPolicy, OwnerPeerPolicy)
+from peering_coord.policy_resolver import (
+    _get_accepted_peers, update_accepted_peers, update_vlan)
+from peering_coord.scion_addr import ASN
+
+
+def _dump_accepted_peers(vlan):
+    """Returns the stored accepted peers of a VLAN in all tables of the compact representation."""
+    return (
+        set(AcceptAll.objects.filter(vlan=vlan).values_list('asys_id', flat=True)),
+        set(RejectedPeer.objects.filter(vlan=vlan).values_list('asys_id', 'peer_id')),
+        set(AcceptedPeer.objects.filter(vlan=vlan).values_list('asys_id', 'peer_id')),
+    )
+
+
+class SqlResolverTest(TestCase):
+    """Compare the SQL backend of the policy resolver with the ORM-based implementation."""
+    AS_COUNT = 20
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vlan = VLAN.objects.create(name="prod", long_name="Production",
+            ip_network=ipaddress.IPv4Network("10.0.0.0/16"))
+        cls.owner = [
+            Owner.objects.create(name="owner%d" % i, long_name="Owner %d" % i) for i in range(4)
+        ]
+        cls.isd = [
+            ISD.objects.create(isd_id=i + 1, name="Region %d" % (i + 1)) for i in range(3)
+        ]
+
+        cls.asys = []
+        cls.interfaces = []
+        for i in range(cls.AS_COUNT):
+            asys = AS.objects.create(asn=ASN(0xff0000000000 + i), isd=cls.isd[i % len(cls.isd)],
+                name="AS %d" % i, owner=cls.owner[i % len(cls.owner)], is_core=(i % 7 == 0))
+            cls.asys.append(asys)
+            client = PeeringClient.objects.create(asys=asys, name="default")
+            cls.interfaces.append(Interface.objects.create(peering_client=client, vlan=cls.vlan,
+                public_ip=cls.vlan.ip_network[i + 1], first_port=50000, last_port=51000))
+
+        for i, asys in enumerate(cls.asys):
+            if i % 2 == 0:
+                DefaultPolicy.objects.create(vlan=cls.vlan, asys=asys, accept=True)
+            else:
+                # Policies for all VLANs
+                DefaultPolicy.objects.create(vlan=None, asys=asys, accept=(i % 4 == 1))
+                AsPeerPolicy.objects.create(vlan=None, asys=asys,
+                    peer_as=cls.asys[(i + 5) % cls.AS_COUNT], accept=(i % 3 == 0))
+            IsdPeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_isd=cls.isd[i % len(cls.isd)], accept=(i % 3 != 0))
+            OwnerPeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_owner=cls.owner[(i + 1) % len(cls.owner)], accept=(i % 4 != 0))
+            AsPeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_as=cls.asys[i - 1], accept=(i % 5 != 0))
+            AsRangePeerPolicy.objects.create(vlan=cls.vlan, asys=asys,
+                peer_asn_first=cls.asys[(i + 3) % cls.AS_COUNT].asn,
+                peer_asn_last=ASN(int(cls.asys[(i + 3) % cls.AS_COUNT].asn) + 4),
+                accept=(i % 3 == 1))
+
+        # ASes which have left the VLAN keep their policies.
+        cls.interfaces[2].delete()
+        cls.interfaces[5].delete()
+
+    def test_accepted_pairs(self):
+        expected = {(asys.id, peer) for asys in self.asys
+            for peer, in _get_accepted_peers(self.vlan, asys)}
+        self.assertEqual(sql_resolver.get_accepted_pairs(self.vlan), expected)
+
+    def test_update_accepted_peers(self):
+        asys_ids = [asys.id for asys in self.asys]
+        update_vlan(self.vlan, asys_ids)
+        expected = _dump_accepted_peers(self.vlan)
+        links = set(Link.objects.values_list('as_a_id', 'as_b_id'))
+        self.assertGreater(len(expected[1]), 0)
+        self.assertGreater(len(expected[2]), 0)
+
+        # Starting from scratch
+        AcceptAll.objects.all().delete()
+        RejectedPeer.objects.all().delete()
+        AcceptedPeer.objects.all().delete()
+        Link.objects.all().delete()
+        with override_settings(POLICY_RESOLVER_BACKEND='sql'):
+            update_vlan(self.vlan, asys_ids)
+        self.assertEqual(_dump_accepted_peers(self.vlan), expected)
+        self.assertEqual(set(Link.objects.values_list('as_a_id', 'as_b_id')), links)
+
+        # Updating stale data
+        DefaultPolicy.objects.filter(asys=self.asys[0]).delete()
+        DefaultPolicy.objects.filter(asys=self.asys[3]).update(accept=True)
+        AsPeerPolicy.objects.filter(asys=self.asys[4]).update(accept=False)
+        AcceptedPeer.objects.create(vlan=self.vlan, asys=self.asys[3], peer=self.asys[9])
+        with override_settings(POLICY_RESOLVER_BACKEND='sql'):
+            update_vlan(self.vlan, [self.asys[0].id, self.asys[3].id, self.asys[4].id])
+        updated = _dump_accepted_peers(self.vlan)
+        self.assertNotEqual(updated, expected)
+        update_vlan(self.vlan, asys_ids)
+        self.assertEqual(_dump_accepted_peers(self.vlan), updated)
+
+    def test_update_single_as(self):
+        update_vlan(self.vlan, [asys.id for asys in self.asys])
+        expected = _dump_accepted_peers(self.vlan)
+
+        # Only the accepted peers of the given AS are updated.
+        DefaultPolicy.objects.filter(asys__in=self.asys[:2]).delete()
+        AcceptedPeer.objects.create(vlan=self.vlan, asys=self.asys[3], peer=self.asys[9])
+        with override_settings(POLICY_RESOLVER_BACKEND='sql'):
+            update_accepted_peers(self.vlan, self.asys[0])
+        updated = _dump_accepted_peers(self.vlan)
+        self.assertNotIn(self.asys[0].id, updated[0])
+        self.assertIn(self.asys[1].id, updated[0])
+        self.assertIn((self.asys[3].id, self.asys[9].id), updated[2])
+
+        update_accepted_peers(self.vlan, self.asys[0])
+        self.assertEqual(_dump_accepted_peers(self.vlan), updated)
+        self.assertNotEqual(updated, expected)
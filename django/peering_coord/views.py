@@ -8,13 +8,15 @@ from django.core.exceptions import PermissionDenied
 
 from django.conf import settings
 from django.http import Http404
-from django.db.models import Count, Q
+from django.db.models import OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 from rest_framework import generics
 
-from peering_coord.models.ixp import VLAN, PeeringClient, Interface, Link, Owner
+from peering_coord.models.ixp import VLAN, PeeringClient, Interface, Link, LinkCount, Owner
 from peering_coord.models.scion import AS
-from peering_coord.models.policies import DefaultPolicy, AsPeerPolicy, OwnerPeerPolicy, IsdPeerPolicy
+from peering_coord.models.policies import (DefaultPolicy, AsPeerPolicy, AsRangePeerPolicy,
+    OwnerPeerPolicy, IsdPeerPolicy)
 from peering_coord.scion_addr import ASN
 from peering_coord.serializers import LinkSerializer
 
@@ -25,23 +27,23 @@ from peering_coord.serializers import LinkSerializer
 
 @require_safe
 def index(request):
-    vlans = VLAN.objects.all()
+    vlans = list(VLAN.objects.all())
 
     context = {
         'title': settings.INSTANCE_NAME,
         'description': settings.INSTANCE_DESCRIPTION,
-        'vlans': VLAN.objects.all()
+        'vlans': vlans
     }
 
     if request.user.is_authenticated:
-        ases = AS.objects.filter(owner__in=request.user.owner_set.all())
+        ases = list(AS.objects.filter(
+            owner__in=request.user.owner_set.all()).select_related('isd', 'owner'))
 
+        # Peers of all ASes in all VLANs from a single query
+        counts = AS.count_connected_peers(asys.id for asys in ases)
         peer_count = {}
         for asys in ases:
-            peers = []
-            for vlan in vlans:
-                peers.append(asys.query_connected_peers(vlan=vlan).count())
-            peer_count[asys.id] = peers
+            peer_count[asys.id] = [counts.get((asys.id, vlan.id), 0) for vlan in vlans]
 
         context['ases'] = ases
         context['peer_count'] = peer_count
@@ -88,12 +90,15 @@ class VlanView(ListView):
     model = AS
     template_name = "peering_coord/vlan.html"
     context_object_name = "ases"
+    paginate_by = 50
 
     def get_queryset(self):
         # Filter for VLAN
         self.vlan = get_object_or_404(VLAN, name=self.kwargs['name'])
         ases = self.vlan.members.values_list('asys', flat=True).all()
-        queryset = AS.objects.filter(id__in=ases)
+        queryset = AS.objects.filter(id__in=ases).select_related('isd', 'owner').annotate(
+            link_count=Coalesce(Subquery(LinkCount.objects.filter(
+                vlan=self.vlan, asys=OuterRef('pk')).values('links')), 0))
 
         # Filter according to query string
         self.query = self.request.GET.get("query")
@@ -102,7 +107,7 @@ class VlanView(ListView):
                 try:
                     queryset = queryset.filter(asn=ASN(self.query[2:]))
                 except ValueError:
-                    queryset = AS.objects.none()
+                    queryset = queryset.none()
             else:
                 queryset = queryset.filter(
                     Q(name__icontains=self.query) | Q(owner__long_name__icontains=self.query))
@@ -112,14 +117,19 @@ class VlanView(ListView):
         validate_sort_order(self.sort_order)
 
         self.order_by = self.request.GET.get(SORT_BY_KEY)
-        if self.order_by in ["name", "asn", "owner"]:
-            queryset = queryset.order_by(self.order_by)
+        if self.order_by in ["name", "asn"]:
+            queryset = queryset.order_by(self.order_by, 'id')
+        elif self.order_by == "owner":
+            queryset = queryset.order_by("owner__long_name", 'id')
         elif self.order_by == "isd":
-            queryset = queryset.order_by("isd__isd_id")
+            queryset = queryset.order_by("isd__isd_id", 'id')
         elif self.order_by == "links":
-            queryset = queryset.annotate(link_count=Count('links'))
+            queryset = queryset.order_by("link_count", 'id')
         elif self.order_by:
             raise Http404()
+        else:
+            # Pages need a stable order.
+            queryset = queryset.order_by('id')
 
         if self.sort_order == ORDER_DESC:
             queryset = queryset.reverse()
@@ -136,6 +146,16 @@ class VlanView(ListView):
         }
         context['vlan'] = self.vlan
         context['query'] = self.query
+
+        # Peers of the ASes on the current page from a single query
+        counts = AS.count_connected_peers(asys.id for asys in context['ases'])
+        context['peer_count'] = {asys.id: counts.get((asys.id, self.vlan.id), 0)
+            for asys in context['ases']}
+
+        # Query string of the page links
+        params = self.request.GET.copy()
+        params.pop(self.page_kwarg, None)
+        context['page_query'] = params.urlencode()
         return context
 
 
@@ -190,7 +210,55 @@ class AsView(DetailView):
             as_policies = AsPeerPolicy.objects.filter(
                 asys=self.object).order_by('vlan', 'accept').all()
             context['as_policies'] = as_policies
+            asn_range_policies = AsRangePeerPolicy.objects.filter(
+                asys=self.object).order_by('vlan', 'peer_asn_first').all()
+            context['asn_range_policies'] = asn_range_policies
+
+        return context
+
+
+###############################
+## Peering Opportunities View ##
+###############################
+
+AFTER_KEY = "after"
+
+
+class PeeringOpportunitiesView(ListView):
+    """Lists the members of a VLAN accepting an AS, which are not accepted by the AS in return.
 
+    Pages start after the ASN of the last AS on the previous page instead of at an offset, so
+    neither counting the ASes nor skipping the ones of earlier pages is necessary.
+    """
+    template_name = "peering_coord/opportunities.html"
+    context_object_name = "ases"
+    page_size = 50
+
+    def get_queryset(self):
+        self.asys = get_object_or_404(AS, asn=self.kwargs['asn'])
+        user = self.request.user
+        if not (user.is_superuser or self.asys.owner.users.filter(id=user.id).exists()):
+            raise PermissionDenied
+        self.vlan = get_object_or_404(VLAN, name=self.kwargs['vlan'])
+
+        queryset = self.asys.query_peering_opportunities(self.vlan).select_related('isd', 'owner')
+        after = self.request.GET.get(AFTER_KEY)
+        if after:
+            try:
+                queryset = queryset.filter(asn__gt=ASN(after))
+            except ValueError:
+                raise Http404()
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        # Fetch one AS more than shown to find out whether there is a next page.
+        ases = list(self.object_list[:self.page_size + 1])
+        kwargs['object_list'] = ases[:self.page_size]
+        context = super().get_context_data(**kwargs)
+        context['title'] = settings.INSTANCE_NAME
+        context['asys'] = self.asys
+        context['vlan'] = self.vlan
+        context['next_after'] = ases[self.page_size - 1].asn if len(ases) > self.page_size else None
         return context
 
 
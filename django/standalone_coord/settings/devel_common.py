@@ -18,6 +18,12 @@ INSTANCE_NAME = "Demo Coordinator"
 # Description text of the coordinator instance.
 INSTANCE_DESCRIPTION = "A demo of the peering coordinator."
 
+# Evaluation of the peering policies when resolving policy changes
+# 'python': Evaluate the policies of every changed AS with ORM queries.
+# 'sql': Evaluate the policies of all ASes in the VLAN with a single SQL statement and update the
+#        accepted peers in the database without loading them.
+POLICY_RESOLVER_BACKEND = 'python'
+
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -43,9 +49,10 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'rest_framework',
+    # Must precede django_grpc_framework to override the grpcrunserver command.
+    'peering_coord',
     'django_grpc_framework',
     'macros',
-    'peering_coord',
 ]
 
 MIDDLEWARE = [
@@ -37,6 +37,8 @@ urlpatterns = [
     path('vlan/<slug:name>', views.VlanView.as_view(), name='vlan'),
     path('owner/<slug:name>', views.OwnerView.as_view(), name='owner_details'),
     path('as/<asn:asn>', views.AsView.as_view(), name='as_details'),
+    path('as/<asn:asn>/opportunities/<slug:vlan>', views.PeeringOpportunitiesView.as_view(),
+        name='peering_opportunities'),
     path('as/<asn:asn>/<slug:client>/secret', views.ClientSecretView.as_view(),
         name='client_secret'),
     path('as/<asn:asn>/<slug:client>/interface/<slug:vlan>/links', views.LinkDataView.as_view(),
@@ -1,15 +1,16 @@
 // Code generated by protoc-gen-go. DO NOT EDIT.
 // versions:
 // 	protoc-gen-go v1.26.0
-// 	protoc        v3.6.1
+// 	protoc        v3.21.12
 // source: api/peering.proto
 
 package api
 
 import (
-	empty "github.com/golang/protobuf/ptypes/empty"
 	protoreflect "google.golang.org/protobuf/reflect/protoreflect"
 	protoimpl "google.golang.org/protobuf/runtime/protoimpl"
+	emptypb "google.golang.org/protobuf/types/known/emptypb"
+	timestamppb "google.golang.org/protobuf/types/known/timestamppb"
 	reflect "reflect"
 	sync "sync"
 )
@@ -211,6 +212,52 @@ func (AsyncError_Code) EnumDescriptor() ([]byte, []int) {
 	return file_api_peering_proto_rawDescGZIP(), []int{4, 0}
 }
 
+type ResolutionStatus_Job_State int32
+
+const (
+	ResolutionStatus_Job_PENDING ResolutionStatus_Job_State = 0
+	ResolutionStatus_Job_RUNNING ResolutionStatus_Job_State = 1
+)
+
+// Enum value maps for ResolutionStatus_Job_State.
+var (
+	ResolutionStatus_Job_State_name = map[int32]string{
+		0: "PENDING",
+		1: "RUNNING",
+	}
+	ResolutionStatus_Job_State_value = map[string]int32{
+		"PENDING": 0,
+		"RUNNING": 1,
+	}
+)
+
+func (x ResolutionStatus_Job_State) Enum() *ResolutionStatus_Job_State {
+	p := new(ResolutionStatus_Job_State)
+	*p = x
+	return p
+}
+
+func (x ResolutionStatus_Job_State) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (ResolutionStatus_Job_State) Descriptor() protoreflect.EnumDescriptor {
+	return file_api_peering_proto_enumTypes[4].Descriptor()
+}
+
+func (ResolutionStatus_Job_State) Type() protoreflect.EnumType {
+	return &file_api_peering_proto_enumTypes[4]
+}
+
+func (x ResolutionStatus_Job_State) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use ResolutionStatus_Job_State.Descriptor instead.
+func (ResolutionStatus_Job_State) EnumDescriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{18, 0, 0}
+}
+
 // Client to coordinator message sent on the persistent stream channel.
 type StreamMessageRequest struct {
 	state         protoimpl.MessageState
@@ -756,13 +803,14 @@ type ListPolicyRequest struct {
 	// Types that are assignable to Accept_:
 	//	*ListPolicyRequest_Accept
 	Accept_ isListPolicyRequest_Accept_ `protobuf_oneof:"accept_"`
-	// (Optional) Filter for default rules, peer AS, owner, or ISD.
+	// (Optional) Filter for default rules, peer AS, owner, ISD, or ASN range.
 	//
 	// Types that are assignable to Peer:
 	//	*ListPolicyRequest_PeerAsn
 	//	*ListPolicyRequest_PeerOwner
 	//	*ListPolicyRequest_PeerIsd
 	//	*ListPolicyRequest_PeerEveryone
+	//	*ListPolicyRequest_PeerAsnRange
 	Peer isListPolicyRequest_Peer `protobuf_oneof:"peer"`
 }
 
@@ -854,13 +902,20 @@ func (x *ListPolicyRequest) GetPeerIsd() string {
 	return ""
 }
 
-func (x *ListPolicyRequest) GetPeerEveryone() *empty.Empty {
+func (x *ListPolicyRequest) GetPeerEveryone() *emptypb.Empty {
 	if x, ok := x.GetPeer().(*ListPolicyRequest_PeerEveryone); ok {
 		return x.PeerEveryone
 	}
 	return nil
 }
 
+func (x *ListPolicyRequest) GetPeerAsnRange() string {
+	if x, ok := x.GetPeer().(*ListPolicyRequest_PeerAsnRange); ok {
+		return x.PeerAsnRange
+	}
+	return ""
+}
+
 type isListPolicyRequest_Accept_ interface {
 	isListPolicyRequest_Accept_()
 }
@@ -888,7 +943,11 @@ type ListPolicyRequest_PeerIsd struct {
 }
 
 type ListPolicyRequest_PeerEveryone struct {
-	PeerEveryone *empty.Empty `protobuf:"bytes,7,opt,name=peer_everyone,json=peerEveryone,proto3,oneof"`
+	PeerEveryone *emptypb.Empty `protobuf:"bytes,7,opt,name=peer_everyone,json=peerEveryone,proto3,oneof"`
+}
+
+type ListPolicyRequest_PeerAsnRange struct {
+	PeerAsnRange string `protobuf:"bytes,8,opt,name=peer_asn_range,json=peerAsnRange,proto3,oneof"`
 }
 
 func (*ListPolicyRequest_PeerAsn) isListPolicyRequest_Peer() {}
@@ -899,12 +958,15 @@ func (*ListPolicyRequest_PeerIsd) isListPolicyRequest_Peer() {}
 
 func (*ListPolicyRequest_PeerEveryone) isListPolicyRequest_Peer() {}
 
+func (*ListPolicyRequest_PeerAsnRange) isListPolicyRequest_Peer() {}
+
 type Policy struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
 	unknownFields protoimpl.UnknownFields
 
-	// VLAN the policy applies to.
+	// VLAN the policy applies to. Empty for a policy applying to all VLANs the AS is a member
+	// of.
 	Vlan string `protobuf:"bytes,1,opt,name=vlan,proto3" json:"vlan,omitempty"`
 	// AS owning the policy.
 	Asn string `protobuf:"bytes,2,opt,name=asn,proto3" json:"asn,omitempty"`
@@ -916,7 +978,12 @@ type Policy struct {
 	//	*Policy_PeerAsn
 	//	*Policy_PeerOwner
 	//	*Policy_PeerIsd
+	//	*Policy_PeerAsnRange
 	Peer isPolicy_Peer `protobuf_oneof:"peer"`
+	// (Optional) Time at which the policy takes effect.
+	ValidFrom *timestamppb.Timestamp `protobuf:"bytes,8,opt,name=valid_from,json=validFrom,proto3" json:"valid_from,omitempty"`
+	// (Optional) Time at which the policy expires. Expired policies are deleted.
+	ValidUntil *timestamppb.Timestamp `protobuf:"bytes,9,opt,name=valid_until,json=validUntil,proto3" json:"valid_until,omitempty"`
 }
 
 func (x *Policy) Reset() {
@@ -1000,6 +1067,27 @@ func (x *Policy) GetPeerIsd() string {
 	return ""
 }
 
+func (x *Policy) GetPeerAsnRange() string {
+	if x, ok := x.GetPeer().(*Policy_PeerAsnRange); ok {
+		return x.PeerAsnRange
+	}
+	return ""
+}
+
+func (x *Policy) GetValidFrom() *timestamppb.Timestamp {
+	if x != nil {
+		return x.ValidFrom
+	}
+	return nil
+}
+
+func (x *Policy) GetValidUntil() *timestamppb.Timestamp {
+	if x != nil {
+		return x.ValidUntil
+	}
+	return nil
+}
+
 type isPolicy_Peer interface {
 	isPolicy_Peer()
 }
@@ -1016,12 +1104,22 @@ type Policy_PeerIsd struct {
 	PeerIsd string `protobuf:"bytes,6,opt,name=peer_isd,json=peerIsd,proto3,oneof"`
 }
 
+type Policy_PeerAsnRange struct {
+	// Inclusive range of ASNs, either "<first>-<last>" or an ASN with wildcards in place of the
+	// trailing groups, e.g., "ff00:0:100-ff00:0:1ff", "ff00:0:*", or "0:*:*" for all BGP-style
+	// ASNs. The ranges of an AS in a VLAN must not overlap. ASN range policies take precedence
+	// over owner and ISD policies, but not over policies for individual ASes.
+	PeerAsnRange string `protobuf:"bytes,7,opt,name=peer_asn_range,json=peerAsnRange,proto3,oneof"`
+}
+
 func (*Policy_PeerAsn) isPolicy_Peer() {}
 
 func (*Policy_PeerOwner) isPolicy_Peer() {}
 
 func (*Policy_PeerIsd) isPolicy_Peer() {}
 
+func (*Policy_PeerAsnRange) isPolicy_Peer() {}
+
 type SetPoliciesRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -1031,7 +1129,7 @@ type SetPoliciesRequest struct {
 	Policies []*Policy `protobuf:"bytes,1,rep,name=policies,proto3" json:"policies,omitempty"`
 	// (Optional) VLAN to replace policies in. If given, only policies in the specified VLAN are
 	// reset and subsequently replaced by the policies provided in 'policies'. Otherwise policies in
-	// all VLANs are replaced.
+	// all VLANs are replaced. Policies applying to all VLANs are only replaced if 'vlan' is empty.
 	Vlan string `protobuf:"bytes,2,opt,name=vlan,proto3" json:"vlan,omitempty"`
 	// Whether to install the policies even when some of them are invalid and have been ignored.
 	ContinueOnError bool `protobuf:"varint,3,opt,name=continue_on_error,json=continueOnError,proto3" json:"continue_on_error,omitempty"`
@@ -1147,278 +1245,988 @@ func (x *SetPoliciesResponse) GetErrors() []string {
 	return nil
 }
 
-var File_api_peering_proto protoreflect.FileDescriptor
+type UploadPoliciesRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
 
-var file_api_peering_proto_rawDesc = []byte{
-	0x0a, 0x11, 0x61, 0x70, 0x69, 0x2f, 0x70, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x2e, 0x70, 0x72,
-	0x6f, 0x74, 0x6f, 0x12, 0x09, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x1a, 0x1b,
-	0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2f, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2f,
-	0x65, 0x6d, 0x70, 0x74, 0x79, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x22, 0x63, 0x0a, 0x14, 0x53,
-	0x74, 0x72, 0x65, 0x61, 0x6d, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x71, 0x75,
-	0x65, 0x73, 0x74, 0x12, 0x40, 0x0a, 0x0b, 0x61, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69,
-	0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64,
-	0x2e, 0x61, 0x70, 0x69, 0x2e, 0x41, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e,
-	0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x48, 0x00, 0x52, 0x0b, 0x61, 0x72, 0x62, 0x69, 0x74, 0x72,
-	0x61, 0x74, 0x69, 0x6f, 0x6e, 0x42, 0x09, 0x0a, 0x07, 0x72, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
-	0x22, 0xce, 0x01, 0x0a, 0x15, 0x53, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x4d, 0x65, 0x73, 0x73, 0x61,
-	0x67, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x40, 0x0a, 0x0b, 0x61, 0x72,
-	0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0b, 0x32,
-	0x1c, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x41, 0x72, 0x62, 0x69,
-	0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x48, 0x00, 0x52,
-	0x0b, 0x61, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x38, 0x0a, 0x0b,
-	0x6c, 0x69, 0x6e, 0x6b, 0x5f, 0x75, 0x70, 0x64, 0x61, 0x74, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28,
-	0x0b, 0x32, 0x15, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x4c, 0x69,
-	0x6e, 0x6b, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x48, 0x00, 0x52, 0x0a, 0x6c, 0x69, 0x6e, 0x6b,
-	0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x12, 0x2d, 0x0a, 0x05, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18,
-	0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x15, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70,
-	0x69, 0x2e, 0x41, 0x73, 0x79, 0x6e, 0x63, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x48, 0x00, 0x52, 0x05,
-	0x65, 0x72, 0x72, 0x6f, 0x72, 0x42, 0x0a, 0x0a, 0x08, 0x72, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
-	0x65, 0x22, 0xc3, 0x01, 0x0a, 0x11, 0x41, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f,
-	0x6e, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x12, 0x14, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x18,
-	0x01, 0x20, 0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x1f, 0x0a,
-	0x0b, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20, 0x01,
-	0x28, 0x03, 0x52, 0x0a, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x49, 0x64, 0x12, 0x3b,
-	0x0a, 0x06, 0x73, 0x74, 0x61, 0x74, 0x75, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x23,
-	0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x41, 0x72, 0x62, 0x69, 0x74,
-	0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x2e, 0x53, 0x74, 0x61,
-	0x74, 0x75, 0x73, 0x52, 0x06, 0x73, 0x74, 0x61, 0x74, 0x75, 0x73, 0x22, 0x31, 0x0a, 0x06, 0x53,
-	0x74, 0x61, 0x74, 0x75, 0x73, 0x12, 0x09, 0x0a, 0x05, 0x45, 0x52, 0x52, 0x4f, 0x52, 0x10, 0x00,
-	0x12, 0x0b, 0x0a, 0x07, 0x50, 0x52, 0x49, 0x4d, 0x41, 0x52, 0x59, 0x10, 0x01, 0x12, 0x0f, 0x0a,
-	0x0b, 0x4e, 0x4f, 0x54, 0x5f, 0x50, 0x52, 0x49, 0x4d, 0x41, 0x52, 0x59, 0x10, 0x02, 0x42, 0x07,
-	0x0a, 0x05, 0x76, 0x6c, 0x61, 0x6e, 0x5f, 0x22, 0xcc, 0x02, 0x0a, 0x0a, 0x4c, 0x69, 0x6e, 0x6b,
-	0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x12, 0x2e, 0x0a, 0x04, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01,
-	0x20, 0x01, 0x28, 0x0e, 0x32, 0x1a, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69,
-	0x2e, 0x4c, 0x69, 0x6e, 0x6b, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x2e, 0x54, 0x79, 0x70, 0x65,
-	0x52, 0x04, 0x74, 0x79, 0x70, 0x65, 0x12, 0x3b, 0x0a, 0x09, 0x6c, 0x69, 0x6e, 0x6b, 0x5f, 0x74,
-	0x79, 0x70, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x1e, 0x2e, 0x63, 0x6f, 0x6f, 0x72,
-	0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x4c, 0x69, 0x6e, 0x6b, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65,
-	0x2e, 0x4c, 0x69, 0x6e, 0x6b, 0x54, 0x79, 0x70, 0x65, 0x52, 0x08, 0x6c, 0x69, 0x6e, 0x6b, 0x54,
-	0x79, 0x70, 0x65, 0x12, 0x19, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e, 0x18,
-	0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x41, 0x73, 0x6e, 0x12, 0x30,
-	0x0a, 0x05, 0x6c, 0x6f, 0x63, 0x61, 0x6c, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e,
-	0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x55, 0x6e, 0x64, 0x65, 0x72, 0x6c,
-	0x61, 0x79, 0x41, 0x64, 0x64, 0x72, 0x65, 0x73, 0x73, 0x52, 0x05, 0x6c, 0x6f, 0x63, 0x61, 0x6c,
-	0x12, 0x32, 0x0a, 0x06, 0x72, 0x65, 0x6d, 0x6f, 0x74, 0x65, 0x18, 0x05, 0x20, 0x01, 0x28, 0x0b,
-	0x32, 0x1a, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x55, 0x6e, 0x64,
-	0x65, 0x72, 0x6c, 0x61, 0x79, 0x41, 0x64, 0x64, 0x72, 0x65, 0x73, 0x73, 0x52, 0x06, 0x72, 0x65,
-	0x6d, 0x6f, 0x74, 0x65, 0x22, 0x1f, 0x0a, 0x04, 0x54, 0x79, 0x70, 0x65, 0x12, 0x0a, 0x0a, 0x06,
-	0x43, 0x52, 0x45, 0x41, 0x54, 0x45, 0x10, 0x00, 0x12, 0x0b, 0x0a, 0x07, 0x44, 0x45, 0x53, 0x54,
-	0x52, 0x4f, 0x59, 0x10, 0x01, 0x22, 0x2f, 0x0a, 0x08, 0x4c, 0x69, 0x6e, 0x6b, 0x54, 0x79, 0x70,
-	0x65, 0x12, 0x0b, 0x0a, 0x07, 0x50, 0x45, 0x45, 0x52, 0x49, 0x4e, 0x47, 0x10, 0x00, 0x12, 0x08,
-	0x0a, 0x04, 0x43, 0x4f, 0x52, 0x45, 0x10, 0x01, 0x12, 0x0c, 0x0a, 0x08, 0x50, 0x52, 0x4f, 0x56,
-	0x49, 0x44, 0x45, 0x52, 0x10, 0x02, 0x22, 0x89, 0x01, 0x0a, 0x0a, 0x41, 0x73, 0x79, 0x6e, 0x63,
-	0x45, 0x72, 0x72, 0x6f, 0x72, 0x12, 0x2e, 0x0a, 0x04, 0x63, 0x6f, 0x64, 0x65, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x0e, 0x32, 0x1a, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e,
-	0x41, 0x73, 0x79, 0x6e, 0x63, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x2e, 0x43, 0x6f, 0x64, 0x65, 0x52,
-	0x04, 0x63, 0x6f, 0x64, 0x65, 0x12, 0x18, 0x0a, 0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65,
-	0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x22,
-	0x31, 0x0a, 0x04, 0x43, 0x6f, 0x64, 0x65, 0x12, 0x0f, 0x0a, 0x0b, 0x55, 0x4e, 0x53, 0x50, 0x45,
-	0x43, 0x49, 0x46, 0x49, 0x45, 0x44, 0x10, 0x00, 0x12, 0x18, 0x0a, 0x14, 0x4c, 0x49, 0x4e, 0x4b,
-	0x5f, 0x43, 0x52, 0x45, 0x41, 0x54, 0x49, 0x4f, 0x4e, 0x5f, 0x46, 0x41, 0x49, 0x4c, 0x45, 0x44,
-	0x10, 0x01, 0x22, 0x35, 0x0a, 0x0f, 0x55, 0x6e, 0x64, 0x65, 0x72, 0x6c, 0x61, 0x79, 0x41, 0x64,
-	0x64, 0x72, 0x65, 0x73, 0x73, 0x12, 0x0e, 0x0a, 0x02, 0x69, 0x70, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x02, 0x69, 0x70, 0x12, 0x12, 0x0a, 0x04, 0x70, 0x6f, 0x72, 0x74, 0x18, 0x02, 0x20,
-	0x01, 0x28, 0x0d, 0x52, 0x04, 0x70, 0x6f, 0x72, 0x74, 0x22, 0x91, 0x01, 0x0a, 0x09, 0x50, 0x6f,
-	0x72, 0x74, 0x52, 0x61, 0x6e, 0x67, 0x65, 0x12, 0x25, 0x0a, 0x0e, 0x69, 0x6e, 0x74, 0x65, 0x72,
-	0x66, 0x61, 0x63, 0x65, 0x5f, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
-	0x0d, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x66, 0x61, 0x63, 0x65, 0x56, 0x6c, 0x61, 0x6e, 0x12, 0x21,
-	0x0a, 0x0c, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x66, 0x61, 0x63, 0x65, 0x5f, 0x69, 0x70, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x0b, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x66, 0x61, 0x63, 0x65, 0x49,
-	0x70, 0x12, 0x1d, 0x0a, 0x0a, 0x66, 0x69, 0x72, 0x73, 0x74, 0x5f, 0x70, 0x6f, 0x72, 0x74, 0x18,
-	0x03, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x09, 0x66, 0x69, 0x72, 0x73, 0x74, 0x50, 0x6f, 0x72, 0x74,
-	0x12, 0x1b, 0x0a, 0x09, 0x6c, 0x61, 0x73, 0x74, 0x5f, 0x70, 0x6f, 0x72, 0x74, 0x18, 0x04, 0x20,
-	0x01, 0x28, 0x0d, 0x52, 0x08, 0x6c, 0x61, 0x73, 0x74, 0x50, 0x6f, 0x72, 0x74, 0x22, 0x80, 0x02,
-	0x0a, 0x11, 0x4c, 0x69, 0x73, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x65, 0x71, 0x75,
-	0x65, 0x73, 0x74, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x10, 0x0a, 0x03, 0x61, 0x73, 0x6e, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x03, 0x61, 0x73, 0x6e, 0x12, 0x18, 0x0a, 0x06, 0x61, 0x63, 0x63,
-	0x65, 0x70, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x48, 0x00, 0x52, 0x06, 0x61, 0x63, 0x63,
-	0x65, 0x70, 0x74, 0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e, 0x18,
-	0x04, 0x20, 0x01, 0x28, 0x09, 0x48, 0x01, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x41, 0x73, 0x6e,
-	0x12, 0x1f, 0x0a, 0x0a, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x6f, 0x77, 0x6e, 0x65, 0x72, 0x18, 0x05,
-	0x20, 0x01, 0x28, 0x09, 0x48, 0x01, 0x52, 0x09, 0x70, 0x65, 0x65, 0x72, 0x4f, 0x77, 0x6e, 0x65,
-	0x72, 0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x69, 0x73, 0x64, 0x18, 0x06, 0x20,
-	0x01, 0x28, 0x09, 0x48, 0x01, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x49, 0x73, 0x64, 0x12, 0x3d,
-	0x0a, 0x0d, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x65, 0x76, 0x65, 0x72, 0x79, 0x6f, 0x6e, 0x65, 0x18,
-	0x07, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70,
-	0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x48, 0x01, 0x52,
-	0x0c, 0x70, 0x65, 0x65, 0x72, 0x45, 0x76, 0x65, 0x72, 0x79, 0x6f, 0x6e, 0x65, 0x42, 0x09, 0x0a,
-	0x07, 0x61, 0x63, 0x63, 0x65, 0x70, 0x74, 0x5f, 0x42, 0x06, 0x0a, 0x04, 0x70, 0x65, 0x65, 0x72,
-	0x22, 0xa9, 0x01, 0x0a, 0x06, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x12, 0x12, 0x0a, 0x04, 0x76,
-	0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12,
-	0x10, 0x0a, 0x03, 0x61, 0x73, 0x6e, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x03, 0x61, 0x73,
-	0x6e, 0x12, 0x16, 0x0a, 0x06, 0x61, 0x63, 0x63, 0x65, 0x70, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28,
-	0x08, 0x52, 0x06, 0x61, 0x63, 0x63, 0x65, 0x70, 0x74, 0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65,
-	0x72, 0x5f, 0x61, 0x73, 0x6e, 0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x07, 0x70,
-	0x65, 0x65, 0x72, 0x41, 0x73, 0x6e, 0x12, 0x1f, 0x0a, 0x0a, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x6f,
-	0x77, 0x6e, 0x65, 0x72, 0x18, 0x05, 0x20, 0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x09, 0x70, 0x65,
-	0x65, 0x72, 0x4f, 0x77, 0x6e, 0x65, 0x72, 0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f,
-	0x69, 0x73, 0x64, 0x18, 0x06, 0x20, 0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x07, 0x70, 0x65, 0x65,
-	0x72, 0x49, 0x73, 0x64, 0x42, 0x06, 0x0a, 0x04, 0x70, 0x65, 0x65, 0x72, 0x22, 0x83, 0x01, 0x0a,
-	0x12, 0x53, 0x65, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75,
-	0x65, 0x73, 0x74, 0x12, 0x2d, 0x0a, 0x08, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x18,
-	0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70,
-	0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x08, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69,
-	0x65, 0x73, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09,
-	0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x2a, 0x0a, 0x11, 0x63, 0x6f, 0x6e, 0x74, 0x69, 0x6e,
-	0x75, 0x65, 0x5f, 0x6f, 0x6e, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x03, 0x20, 0x01, 0x28,
-	0x08, 0x52, 0x0f, 0x63, 0x6f, 0x6e, 0x74, 0x69, 0x6e, 0x75, 0x65, 0x4f, 0x6e, 0x45, 0x72, 0x72,
-	0x6f, 0x72, 0x22, 0x6d, 0x0a, 0x13, 0x53, 0x65, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65,
-	0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x3e, 0x0a, 0x11, 0x72, 0x65, 0x6a,
-	0x65, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x18, 0x01,
-	0x20, 0x03, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69,
-	0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x10, 0x72, 0x65, 0x6a, 0x65, 0x63, 0x74, 0x65,
-	0x64, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x12, 0x16, 0x0a, 0x06, 0x65, 0x72, 0x72,
-	0x6f, 0x72, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x09, 0x52, 0x06, 0x65, 0x72, 0x72, 0x6f, 0x72,
-	0x73, 0x32, 0xae, 0x03, 0x0a, 0x07, 0x50, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x12, 0x58, 0x0a,
-	0x0d, 0x53, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x43, 0x68, 0x61, 0x6e, 0x6e, 0x65, 0x6c, 0x12, 0x1f,
-	0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x53, 0x74, 0x72, 0x65, 0x61,
-	0x6d, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a,
-	0x20, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x53, 0x74, 0x72, 0x65,
-	0x61, 0x6d, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
-	0x65, 0x22, 0x00, 0x28, 0x01, 0x30, 0x01, 0x12, 0x3e, 0x0a, 0x0c, 0x53, 0x65, 0x74, 0x50, 0x6f,
-	0x72, 0x74, 0x52, 0x61, 0x6e, 0x67, 0x65, 0x12, 0x14, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e,
-	0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x72, 0x74, 0x52, 0x61, 0x6e, 0x67, 0x65, 0x1a, 0x16, 0x2e,
-	0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e,
-	0x45, 0x6d, 0x70, 0x74, 0x79, 0x22, 0x00, 0x12, 0x43, 0x0a, 0x0c, 0x4c, 0x69, 0x73, 0x74, 0x50,
-	0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x12, 0x1c, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e,
-	0x61, 0x70, 0x69, 0x2e, 0x4c, 0x69, 0x73, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x65,
-	0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70,
-	0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x22, 0x00, 0x30, 0x01, 0x12, 0x36, 0x0a, 0x0c,
-	0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x12, 0x11, 0x2e, 0x63,
-	0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x1a,
-	0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69,
-	0x63, 0x79, 0x22, 0x00, 0x12, 0x3c, 0x0a, 0x0d, 0x44, 0x65, 0x73, 0x74, 0x72, 0x6f, 0x79, 0x50,
-	0x6f, 0x6c, 0x69, 0x63, 0x79, 0x12, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70,
-	0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c,
-	0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79,
-	0x22, 0x00, 0x12, 0x4e, 0x0a, 0x0b, 0x53, 0x65, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65,
-	0x73, 0x12, 0x1d, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x53, 0x65,
-	0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
-	0x1a, 0x1e, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x53, 0x65, 0x74,
-	0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65,
-	0x22, 0x00, 0x42, 0x38, 0x5a, 0x36, 0x67, 0x69, 0x74, 0x68, 0x75, 0x62, 0x2e, 0x63, 0x6f, 0x6d,
-	0x2f, 0x6e, 0x65, 0x74, 0x73, 0x79, 0x73, 0x2d, 0x6c, 0x61, 0x62, 0x2f, 0x73, 0x63, 0x69, 0x6f,
-	0x6e, 0x2d, 0x70, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x2d, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x69,
-	0x6e, 0x61, 0x74, 0x6f, 0x72, 0x2f, 0x67, 0x6f, 0x2f, 0x61, 0x70, 0x69, 0x62, 0x06, 0x70, 0x72,
-	0x6f, 0x74, 0x6f, 0x33,
+	// Next chunk of policies to install.
+	Policies []*Policy `protobuf:"bytes,1,rep,name=policies,proto3" json:"policies,omitempty"`
+	// (Optional) VLAN to replace policies in. Only evaluated in the first message of the stream.
+	// See SetPoliciesRequest.
+	Vlan string `protobuf:"bytes,2,opt,name=vlan,proto3" json:"vlan,omitempty"`
+	// Whether to install the policies even when some of them are invalid and have been ignored.
+	// Only evaluated in the first message of the stream.
+	ContinueOnError bool `protobuf:"varint,3,opt,name=continue_on_error,json=continueOnError,proto3" json:"continue_on_error,omitempty"`
 }
 
-var (
-	file_api_peering_proto_rawDescOnce sync.Once
-	file_api_peering_proto_rawDescData = file_api_peering_proto_rawDesc
-)
+func (x *UploadPoliciesRequest) Reset() {
+	*x = UploadPoliciesRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[11]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
 
-func file_api_peering_proto_rawDescGZIP() []byte {
-	file_api_peering_proto_rawDescOnce.Do(func() {
-		file_api_peering_proto_rawDescData = protoimpl.X.CompressGZIP(file_api_peering_proto_rawDescData)
-	})
-	return file_api_peering_proto_rawDescData
+func (x *UploadPoliciesRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
 }
 
-var file_api_peering_proto_enumTypes = make([]protoimpl.EnumInfo, 4)
-var file_api_peering_proto_msgTypes = make([]protoimpl.MessageInfo, 11)
-var file_api_peering_proto_goTypes = []interface{}{
-	(ArbitrationUpdate_Status)(0), // 0: coord.api.ArbitrationUpdate.Status
-	(LinkUpdate_Type)(0),          // 1: coord.api.LinkUpdate.Type
-	(LinkUpdate_LinkType)(0),      // 2: coord.api.LinkUpdate.LinkType
-	(AsyncError_Code)(0),          // 3: coord.api.AsyncError.Code
-	(*StreamMessageRequest)(nil),  // 4: coord.api.StreamMessageRequest
-	(*StreamMessageResponse)(nil), // 5: coord.api.StreamMessageResponse
-	(*ArbitrationUpdate)(nil),     // 6: coord.api.ArbitrationUpdate
-	(*LinkUpdate)(nil),            // 7: coord.api.LinkUpdate
-	(*AsyncError)(nil),            // 8: coord.api.AsyncError
-	(*UnderlayAddress)(nil),       // 9: coord.api.UnderlayAddress
-	(*PortRange)(nil),             // 10: coord.api.PortRange
-	(*ListPolicyRequest)(nil),     // 11: coord.api.ListPolicyRequest
-	(*Policy)(nil),                // 12: coord.api.Policy
-	(*SetPoliciesRequest)(nil),    // 13: coord.api.SetPoliciesRequest
-	(*SetPoliciesResponse)(nil),   // 14: coord.api.SetPoliciesResponse
-	(*empty.Empty)(nil),           // 15: google.protobuf.Empty
+func (*UploadPoliciesRequest) ProtoMessage() {}
+
+func (x *UploadPoliciesRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[11]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
 }
-var file_api_peering_proto_depIdxs = []int32{
-	6,  // 0: coord.api.StreamMessageRequest.arbitration:type_name -> coord.api.ArbitrationUpdate
-	6,  // 1: coord.api.StreamMessageResponse.arbitration:type_name -> coord.api.ArbitrationUpdate
-	7,  // 2: coord.api.StreamMessageResponse.link_update:type_name -> coord.api.LinkUpdate
-	8,  // 3: coord.api.StreamMessageResponse.error:type_name -> coord.api.AsyncError
-	0,  // 4: coord.api.ArbitrationUpdate.status:type_name -> coord.api.ArbitrationUpdate.Status
-	1,  // 5: coord.api.LinkUpdate.type:type_name -> coord.api.LinkUpdate.Type
-	2,  // 6: coord.api.LinkUpdate.link_type:type_name -> coord.api.LinkUpdate.LinkType
-	9,  // 7: coord.api.LinkUpdate.local:type_name -> coord.api.UnderlayAddress
-	9,  // 8: coord.api.LinkUpdate.remote:type_name -> coord.api.UnderlayAddress
-	3,  // 9: coord.api.AsyncError.code:type_name -> coord.api.AsyncError.Code
-	15, // 10: coord.api.ListPolicyRequest.peer_everyone:type_name -> google.protobuf.Empty
-	12, // 11: coord.api.SetPoliciesRequest.policies:type_name -> coord.api.Policy
-	12, // 12: coord.api.SetPoliciesResponse.rejected_policies:type_name -> coord.api.Policy
-	4,  // 13: coord.api.Peering.StreamChannel:input_type -> coord.api.StreamMessageRequest
-	10, // 14: coord.api.Peering.SetPortRange:input_type -> coord.api.PortRange
-	11, // 15: coord.api.Peering.ListPolicies:input_type -> coord.api.ListPolicyRequest
-	12, // 16: coord.api.Peering.CreatePolicy:input_type -> coord.api.Policy
-	12, // 17: coord.api.Peering.DestroyPolicy:input_type -> coord.api.Policy
-	13, // 18: coord.api.Peering.SetPolicies:input_type -> coord.api.SetPoliciesRequest
-	5,  // 19: coord.api.Peering.StreamChannel:output_type -> coord.api.StreamMessageResponse
-	15, // 20: coord.api.Peering.SetPortRange:output_type -> google.protobuf.Empty
-	12, // 21: coord.api.Peering.ListPolicies:output_type -> coord.api.Policy
-	12, // 22: coord.api.Peering.CreatePolicy:output_type -> coord.api.Policy
-	15, // 23: coord.api.Peering.DestroyPolicy:output_type -> google.protobuf.Empty
-	14, // 24: coord.api.Peering.SetPolicies:output_type -> coord.api.SetPoliciesResponse
-	19, // [19:25] is the sub-list for method output_type
-	13, // [13:19] is the sub-list for method input_type
-	13, // [13:13] is the sub-list for extension type_name
-	13, // [13:13] is the sub-list for extension extendee
-	0,  // [0:13] is the sub-list for field type_name
+
+// Deprecated: Use UploadPoliciesRequest.ProtoReflect.Descriptor instead.
+func (*UploadPoliciesRequest) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{11}
 }
 
-func init() { file_api_peering_proto_init() }
-func file_api_peering_proto_init() {
-	if File_api_peering_proto != nil {
-		return
+func (x *UploadPoliciesRequest) GetPolicies() []*Policy {
+	if x != nil {
+		return x.Policies
 	}
-	if !protoimpl.UnsafeEnabled {
-		file_api_peering_proto_msgTypes[0].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*StreamMessageRequest); i {
-			case 0:
-				return &v.state
-			case 1:
-				return &v.sizeCache
-			case 2:
-				return &v.unknownFields
-			default:
-				return nil
-			}
+	return nil
+}
+
+func (x *UploadPoliciesRequest) GetVlan() string {
+	if x != nil {
+		return x.Vlan
+	}
+	return ""
+}
+
+func (x *UploadPoliciesRequest) GetContinueOnError() bool {
+	if x != nil {
+		return x.ContinueOnError
+	}
+	return false
+}
+
+type UploadPoliciesResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// Policy which has failed validation.
+	RejectedPolicy *Policy `protobuf:"bytes,1,opt,name=rejected_policy,json=rejectedPolicy,proto3" json:"rejected_policy,omitempty"`
+	// Error message corresponding to the rejected policy.
+	Error string `protobuf:"bytes,2,opt,name=error,proto3" json:"error,omitempty"`
+}
+
+func (x *UploadPoliciesResponse) Reset() {
+	*x = UploadPoliciesResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[12]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *UploadPoliciesResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*UploadPoliciesResponse) ProtoMessage() {}
+
+func (x *UploadPoliciesResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[12]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
 		}
-		file_api_peering_proto_msgTypes[1].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*StreamMessageResponse); i {
-			case 0:
-				return &v.state
-			case 1:
-				return &v.sizeCache
-			case 2:
-				return &v.unknownFields
-			default:
-				return nil
-			}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use UploadPoliciesResponse.ProtoReflect.Descriptor instead.
+func (*UploadPoliciesResponse) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{12}
+}
+
+func (x *UploadPoliciesResponse) GetRejectedPolicy() *Policy {
+	if x != nil {
+		return x.RejectedPolicy
+	}
+	return nil
+}
+
+func (x *UploadPoliciesResponse) GetError() string {
+	if x != nil {
+		return x.Error
+	}
+	return ""
+}
+
+type CompactPoliciesRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// (Optional) VLAN to compact the policies of. Policies applying to all VLANs are only compacted
+	// if 'vlan' is empty.
+	Vlan string `protobuf:"bytes,1,opt,name=vlan,proto3" json:"vlan,omitempty"`
+	// Only report the redundant policies without deleting them.
+	DryRun bool `protobuf:"varint,2,opt,name=dry_run,json=dryRun,proto3" json:"dry_run,omitempty"`
+}
+
+func (x *CompactPoliciesRequest) Reset() {
+	*x = CompactPoliciesRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[13]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *CompactPoliciesRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CompactPoliciesRequest) ProtoMessage() {}
+
+func (x *CompactPoliciesRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[13]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
 		}
-		file_api_peering_proto_msgTypes[2].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*ArbitrationUpdate); i {
-			case 0:
-				return &v.state
-			case 1:
-				return &v.sizeCache
-			case 2:
-				return &v.unknownFields
-			default:
-				return nil
-			}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CompactPoliciesRequest.ProtoReflect.Descriptor instead.
+func (*CompactPoliciesRequest) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{13}
+}
+
+func (x *CompactPoliciesRequest) GetVlan() string {
+	if x != nil {
+		return x.Vlan
+	}
+	return ""
+}
+
+func (x *CompactPoliciesRequest) GetDryRun() bool {
+	if x != nil {
+		return x.DryRun
+	}
+	return false
+}
+
+type CompactPoliciesResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// Redundant policies. Deleted unless dry_run was set.
+	Policies []*Policy `protobuf:"bytes,1,rep,name=policies,proto3" json:"policies,omitempty"`
+	// Number of policies evaluated when resolving the AS in all of its VLANs (or only in 'vlan')
+	// once, before and after deleting the redundant policies.
+	EvaluationsBefore uint32 `protobuf:"varint,2,opt,name=evaluations_before,json=evaluationsBefore,proto3" json:"evaluations_before,omitempty"`
+	EvaluationsAfter  uint32 `protobuf:"varint,3,opt,name=evaluations_after,json=evaluationsAfter,proto3" json:"evaluations_after,omitempty"`
+}
+
+func (x *CompactPoliciesResponse) Reset() {
+	*x = CompactPoliciesResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[14]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *CompactPoliciesResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CompactPoliciesResponse) ProtoMessage() {}
+
+func (x *CompactPoliciesResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[14]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
 		}
-		file_api_peering_proto_msgTypes[3].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*LinkUpdate); i {
-			case 0:
-				return &v.state
-			case 1:
-				return &v.sizeCache
-			case 2:
-				return &v.unknownFields
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CompactPoliciesResponse.ProtoReflect.Descriptor instead.
+func (*CompactPoliciesResponse) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{14}
+}
+
+func (x *CompactPoliciesResponse) GetPolicies() []*Policy {
+	if x != nil {
+		return x.Policies
+	}
+	return nil
+}
+
+func (x *CompactPoliciesResponse) GetEvaluationsBefore() uint32 {
+	if x != nil {
+		return x.EvaluationsBefore
+	}
+	return 0
+}
+
+func (x *CompactPoliciesResponse) GetEvaluationsAfter() uint32 {
+	if x != nil {
+		return x.EvaluationsAfter
+	}
+	return 0
+}
+
+type PeeringOpportunitiesRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// VLAN to list the peering opportunities in.
+	Vlan string `protobuf:"bytes,1,opt,name=vlan,proto3" json:"vlan,omitempty"`
+	// (Optional) Only list ASes with a greater ASN. Set to the last ASN of the previous page to
+	// continue a paginated listing.
+	AfterAsn string `protobuf:"bytes,2,opt,name=after_asn,json=afterAsn,proto3" json:"after_asn,omitempty"`
+	// (Optional) Maximum number of ASes to list. Zero or values above the server's limit (1000)
+	// select the server's limit.
+	PageSize uint32 `protobuf:"varint,3,opt,name=page_size,json=pageSize,proto3" json:"page_size,omitempty"`
+}
+
+func (x *PeeringOpportunitiesRequest) Reset() {
+	*x = PeeringOpportunitiesRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[15]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *PeeringOpportunitiesRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*PeeringOpportunitiesRequest) ProtoMessage() {}
+
+func (x *PeeringOpportunitiesRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[15]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use PeeringOpportunitiesRequest.ProtoReflect.Descriptor instead.
+func (*PeeringOpportunitiesRequest) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{15}
+}
+
+func (x *PeeringOpportunitiesRequest) GetVlan() string {
+	if x != nil {
+		return x.Vlan
+	}
+	return ""
+}
+
+func (x *PeeringOpportunitiesRequest) GetAfterAsn() string {
+	if x != nil {
+		return x.AfterAsn
+	}
+	return ""
+}
+
+func (x *PeeringOpportunitiesRequest) GetPageSize() uint32 {
+	if x != nil {
+		return x.PageSize
+	}
+	return 0
+}
+
+type PeeringOpportunity struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// AS accepting the AS making the request.
+	Asn  string `protobuf:"bytes,1,opt,name=asn,proto3" json:"asn,omitempty"`
+	Name string `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
+	// Owner of the AS.
+	Owner string `protobuf:"bytes,3,opt,name=owner,proto3" json:"owner,omitempty"`
+	Isd   string `protobuf:"bytes,4,opt,name=isd,proto3" json:"isd,omitempty"`
+}
+
+func (x *PeeringOpportunity) Reset() {
+	*x = PeeringOpportunity{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[16]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *PeeringOpportunity) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*PeeringOpportunity) ProtoMessage() {}
+
+func (x *PeeringOpportunity) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[16]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use PeeringOpportunity.ProtoReflect.Descriptor instead.
+func (*PeeringOpportunity) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{16}
+}
+
+func (x *PeeringOpportunity) GetAsn() string {
+	if x != nil {
+		return x.Asn
+	}
+	return ""
+}
+
+func (x *PeeringOpportunity) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *PeeringOpportunity) GetOwner() string {
+	if x != nil {
+		return x.Owner
+	}
+	return ""
+}
+
+func (x *PeeringOpportunity) GetIsd() string {
+	if x != nil {
+		return x.Isd
+	}
+	return ""
+}
+
+type ResolutionStatusRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// (Optional) Filter for VLAN.
+	Vlan string `protobuf:"bytes,1,opt,name=vlan,proto3" json:"vlan,omitempty"`
+}
+
+func (x *ResolutionStatusRequest) Reset() {
+	*x = ResolutionStatusRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[17]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *ResolutionStatusRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ResolutionStatusRequest) ProtoMessage() {}
+
+func (x *ResolutionStatusRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[17]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ResolutionStatusRequest.ProtoReflect.Descriptor instead.
+func (*ResolutionStatusRequest) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{17}
+}
+
+func (x *ResolutionStatusRequest) GetVlan() string {
+	if x != nil {
+		return x.Vlan
+	}
+	return ""
+}
+
+type ResolutionStatus struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// Whether the coordinator resolves policy changes in the background.
+	Background bool `protobuf:"varint,1,opt,name=background,proto3" json:"background,omitempty"`
+	// Outstanding resolution jobs of the AS. Links in VLANs without outstanding jobs reflect the
+	// current policies.
+	Jobs []*ResolutionStatus_Job `protobuf:"bytes,2,rep,name=jobs,proto3" json:"jobs,omitempty"`
+	// Number of jobs of all ASes waiting to be processed.
+	QueueLength uint32 `protobuf:"varint,3,opt,name=queue_length,json=queueLength,proto3" json:"queue_length,omitempty"`
+	// Number of failed resolution jobs of the AS since the coordinator has been started.
+	FailedJobs uint64 `protobuf:"varint,4,opt,name=failed_jobs,json=failedJobs,proto3" json:"failed_jobs,omitempty"`
+	// Error message of the most recent failure.
+	LastError string `protobuf:"bytes,5,opt,name=last_error,json=lastError,proto3" json:"last_error,omitempty"`
+}
+
+func (x *ResolutionStatus) Reset() {
+	*x = ResolutionStatus{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[18]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *ResolutionStatus) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ResolutionStatus) ProtoMessage() {}
+
+func (x *ResolutionStatus) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[18]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ResolutionStatus.ProtoReflect.Descriptor instead.
+func (*ResolutionStatus) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{18}
+}
+
+func (x *ResolutionStatus) GetBackground() bool {
+	if x != nil {
+		return x.Background
+	}
+	return false
+}
+
+func (x *ResolutionStatus) GetJobs() []*ResolutionStatus_Job {
+	if x != nil {
+		return x.Jobs
+	}
+	return nil
+}
+
+func (x *ResolutionStatus) GetQueueLength() uint32 {
+	if x != nil {
+		return x.QueueLength
+	}
+	return 0
+}
+
+func (x *ResolutionStatus) GetFailedJobs() uint64 {
+	if x != nil {
+		return x.FailedJobs
+	}
+	return 0
+}
+
+func (x *ResolutionStatus) GetLastError() string {
+	if x != nil {
+		return x.LastError
+	}
+	return ""
+}
+
+type ResolutionStatus_Job struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	// VLAN the job applies to.
+	Vlan  string                     `protobuf:"bytes,1,opt,name=vlan,proto3" json:"vlan,omitempty"`
+	State ResolutionStatus_Job_State `protobuf:"varint,2,opt,name=state,proto3,enum=coord.api.ResolutionStatus_Job_State" json:"state,omitempty"`
+}
+
+func (x *ResolutionStatus_Job) Reset() {
+	*x = ResolutionStatus_Job{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_peering_proto_msgTypes[19]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *ResolutionStatus_Job) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ResolutionStatus_Job) ProtoMessage() {}
+
+func (x *ResolutionStatus_Job) ProtoReflect() protoreflect.Message {
+	mi := &file_api_peering_proto_msgTypes[19]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ResolutionStatus_Job.ProtoReflect.Descriptor instead.
+func (*ResolutionStatus_Job) Descriptor() ([]byte, []int) {
+	return file_api_peering_proto_rawDescGZIP(), []int{18, 0}
+}
+
+func (x *ResolutionStatus_Job) GetVlan() string {
+	if x != nil {
+		return x.Vlan
+	}
+	return ""
+}
+
+func (x *ResolutionStatus_Job) GetState() ResolutionStatus_Job_State {
+	if x != nil {
+		return x.State
+	}
+	return ResolutionStatus_Job_PENDING
+}
+
+var File_api_peering_proto protoreflect.FileDescriptor
+
+var file_api_peering_proto_rawDesc = []byte{
+	0x0a, 0x11, 0x61, 0x70, 0x69, 0x2f, 0x70, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x2e, 0x70, 0x72,
+	0x6f, 0x74, 0x6f, 0x12, 0x09, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x1a, 0x1b,
+	0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2f, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2f,
+	0x65, 0x6d, 0x70, 0x74, 0x79, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x1a, 0x1f, 0x67, 0x6f, 0x6f,
+	0x67, 0x6c, 0x65, 0x2f, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2f, 0x74, 0x69, 0x6d,
+	0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x22, 0x63, 0x0a, 0x14,
+	0x53, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x40, 0x0a, 0x0b, 0x61, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74,
+	0x69, 0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x63, 0x6f, 0x6f, 0x72,
+	0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x41, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x48, 0x00, 0x52, 0x0b, 0x61, 0x72, 0x62, 0x69, 0x74,
+	0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x42, 0x09, 0x0a, 0x07, 0x72, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x22, 0xce, 0x01, 0x0a, 0x15, 0x53, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x4d, 0x65, 0x73, 0x73,
+	0x61, 0x67, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x40, 0x0a, 0x0b, 0x61,
+	0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0b,
+	0x32, 0x1c, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x41, 0x72, 0x62,
+	0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x48, 0x00,
+	0x52, 0x0b, 0x61, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x38, 0x0a,
+	0x0b, 0x6c, 0x69, 0x6e, 0x6b, 0x5f, 0x75, 0x70, 0x64, 0x61, 0x74, 0x65, 0x18, 0x02, 0x20, 0x01,
+	0x28, 0x0b, 0x32, 0x15, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x4c,
+	0x69, 0x6e, 0x6b, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x48, 0x00, 0x52, 0x0a, 0x6c, 0x69, 0x6e,
+	0x6b, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x12, 0x2d, 0x0a, 0x05, 0x65, 0x72, 0x72, 0x6f, 0x72,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x15, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61,
+	0x70, 0x69, 0x2e, 0x41, 0x73, 0x79, 0x6e, 0x63, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x48, 0x00, 0x52,
+	0x05, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x42, 0x0a, 0x0a, 0x08, 0x72, 0x65, 0x73, 0x70, 0x6f, 0x6e,
+	0x73, 0x65, 0x22, 0xc3, 0x01, 0x0a, 0x11, 0x41, 0x72, 0x62, 0x69, 0x74, 0x72, 0x61, 0x74, 0x69,
+	0x6f, 0x6e, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x12, 0x14, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e,
+	0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x1f,
+	0x0a, 0x0b, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x69, 0x64, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x03, 0x52, 0x0a, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x49, 0x64, 0x12,
+	0x3b, 0x0a, 0x06, 0x73, 0x74, 0x61, 0x74, 0x75, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0e, 0x32,
+	0x23, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x41, 0x72, 0x62, 0x69,
+	0x74, 0x72, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x2e, 0x53, 0x74,
+	0x61, 0x74, 0x75, 0x73, 0x52, 0x06, 0x73, 0x74, 0x61, 0x74, 0x75, 0x73, 0x22, 0x31, 0x0a, 0x06,
+	0x53, 0x74, 0x61, 0x74, 0x75, 0x73, 0x12, 0x09, 0x0a, 0x05, 0x45, 0x52, 0x52, 0x4f, 0x52, 0x10,
+	0x00, 0x12, 0x0b, 0x0a, 0x07, 0x50, 0x52, 0x49, 0x4d, 0x41, 0x52, 0x59, 0x10, 0x01, 0x12, 0x0f,
+	0x0a, 0x0b, 0x4e, 0x4f, 0x54, 0x5f, 0x50, 0x52, 0x49, 0x4d, 0x41, 0x52, 0x59, 0x10, 0x02, 0x42,
+	0x07, 0x0a, 0x05, 0x76, 0x6c, 0x61, 0x6e, 0x5f, 0x22, 0xcc, 0x02, 0x0a, 0x0a, 0x4c, 0x69, 0x6e,
+	0x6b, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x12, 0x2e, 0x0a, 0x04, 0x74, 0x79, 0x70, 0x65, 0x18,
+	0x01, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x1a, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70,
+	0x69, 0x2e, 0x4c, 0x69, 0x6e, 0x6b, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x2e, 0x54, 0x79, 0x70,
+	0x65, 0x52, 0x04, 0x74, 0x79, 0x70, 0x65, 0x12, 0x3b, 0x0a, 0x09, 0x6c, 0x69, 0x6e, 0x6b, 0x5f,
+	0x74, 0x79, 0x70, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0e, 0x32, 0x1e, 0x2e, 0x63, 0x6f, 0x6f,
+	0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x4c, 0x69, 0x6e, 0x6b, 0x55, 0x70, 0x64, 0x61, 0x74,
+	0x65, 0x2e, 0x4c, 0x69, 0x6e, 0x6b, 0x54, 0x79, 0x70, 0x65, 0x52, 0x08, 0x6c, 0x69, 0x6e, 0x6b,
+	0x54, 0x79, 0x70, 0x65, 0x12, 0x19, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x41, 0x73, 0x6e, 0x12,
+	0x30, 0x0a, 0x05, 0x6c, 0x6f, 0x63, 0x61, 0x6c, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a,
+	0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x55, 0x6e, 0x64, 0x65, 0x72,
+	0x6c, 0x61, 0x79, 0x41, 0x64, 0x64, 0x72, 0x65, 0x73, 0x73, 0x52, 0x05, 0x6c, 0x6f, 0x63, 0x61,
+	0x6c, 0x12, 0x32, 0x0a, 0x06, 0x72, 0x65, 0x6d, 0x6f, 0x74, 0x65, 0x18, 0x05, 0x20, 0x01, 0x28,
+	0x0b, 0x32, 0x1a, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x55, 0x6e,
+	0x64, 0x65, 0x72, 0x6c, 0x61, 0x79, 0x41, 0x64, 0x64, 0x72, 0x65, 0x73, 0x73, 0x52, 0x06, 0x72,
+	0x65, 0x6d, 0x6f, 0x74, 0x65, 0x22, 0x1f, 0x0a, 0x04, 0x54, 0x79, 0x70, 0x65, 0x12, 0x0a, 0x0a,
+	0x06, 0x43, 0x52, 0x45, 0x41, 0x54, 0x45, 0x10, 0x00, 0x12, 0x0b, 0x0a, 0x07, 0x44, 0x45, 0x53,
+	0x54, 0x52, 0x4f, 0x59, 0x10, 0x01, 0x22, 0x2f, 0x0a, 0x08, 0x4c, 0x69, 0x6e, 0x6b, 0x54, 0x79,
+	0x70, 0x65, 0x12, 0x0b, 0x0a, 0x07, 0x50, 0x45, 0x45, 0x52, 0x49, 0x4e, 0x47, 0x10, 0x00, 0x12,
+	0x08, 0x0a, 0x04, 0x43, 0x4f, 0x52, 0x45, 0x10, 0x01, 0x12, 0x0c, 0x0a, 0x08, 0x50, 0x52, 0x4f,
+	0x56, 0x49, 0x44, 0x45, 0x52, 0x10, 0x02, 0x22, 0x89, 0x01, 0x0a, 0x0a, 0x41, 0x73, 0x79, 0x6e,
+	0x63, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x12, 0x2e, 0x0a, 0x04, 0x63, 0x6f, 0x64, 0x65, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x0e, 0x32, 0x1a, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69,
+	0x2e, 0x41, 0x73, 0x79, 0x6e, 0x63, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x2e, 0x43, 0x6f, 0x64, 0x65,
+	0x52, 0x04, 0x63, 0x6f, 0x64, 0x65, 0x12, 0x18, 0x0a, 0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67,
+	0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65,
+	0x22, 0x31, 0x0a, 0x04, 0x43, 0x6f, 0x64, 0x65, 0x12, 0x0f, 0x0a, 0x0b, 0x55, 0x4e, 0x53, 0x50,
+	0x45, 0x43, 0x49, 0x46, 0x49, 0x45, 0x44, 0x10, 0x00, 0x12, 0x18, 0x0a, 0x14, 0x4c, 0x49, 0x4e,
+	0x4b, 0x5f, 0x43, 0x52, 0x45, 0x41, 0x54, 0x49, 0x4f, 0x4e, 0x5f, 0x46, 0x41, 0x49, 0x4c, 0x45,
+	0x44, 0x10, 0x01, 0x22, 0x35, 0x0a, 0x0f, 0x55, 0x6e, 0x64, 0x65, 0x72, 0x6c, 0x61, 0x79, 0x41,
+	0x64, 0x64, 0x72, 0x65, 0x73, 0x73, 0x12, 0x0e, 0x0a, 0x02, 0x69, 0x70, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x02, 0x69, 0x70, 0x12, 0x12, 0x0a, 0x04, 0x70, 0x6f, 0x72, 0x74, 0x18, 0x02,
+	0x20, 0x01, 0x28, 0x0d, 0x52, 0x04, 0x70, 0x6f, 0x72, 0x74, 0x22, 0x91, 0x01, 0x0a, 0x09, 0x50,
+	0x6f, 0x72, 0x74, 0x52, 0x61, 0x6e, 0x67, 0x65, 0x12, 0x25, 0x0a, 0x0e, 0x69, 0x6e, 0x74, 0x65,
+	0x72, 0x66, 0x61, 0x63, 0x65, 0x5f, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09,
+	0x52, 0x0d, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x66, 0x61, 0x63, 0x65, 0x56, 0x6c, 0x61, 0x6e, 0x12,
+	0x21, 0x0a, 0x0c, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x66, 0x61, 0x63, 0x65, 0x5f, 0x69, 0x70, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0b, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x66, 0x61, 0x63, 0x65,
+	0x49, 0x70, 0x12, 0x1d, 0x0a, 0x0a, 0x66, 0x69, 0x72, 0x73, 0x74, 0x5f, 0x70, 0x6f, 0x72, 0x74,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x09, 0x66, 0x69, 0x72, 0x73, 0x74, 0x50, 0x6f, 0x72,
+	0x74, 0x12, 0x1b, 0x0a, 0x09, 0x6c, 0x61, 0x73, 0x74, 0x5f, 0x70, 0x6f, 0x72, 0x74, 0x18, 0x04,
+	0x20, 0x01, 0x28, 0x0d, 0x52, 0x08, 0x6c, 0x61, 0x73, 0x74, 0x50, 0x6f, 0x72, 0x74, 0x22, 0xa8,
+	0x02, 0x0a, 0x11, 0x4c, 0x69, 0x73, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x10, 0x0a, 0x03, 0x61, 0x73, 0x6e, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x03, 0x61, 0x73, 0x6e, 0x12, 0x18, 0x0a, 0x06, 0x61, 0x63,
+	0x63, 0x65, 0x70, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x48, 0x00, 0x52, 0x06, 0x61, 0x63,
+	0x63, 0x65, 0x70, 0x74, 0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e,
+	0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x48, 0x01, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x41, 0x73,
+	0x6e, 0x12, 0x1f, 0x0a, 0x0a, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x6f, 0x77, 0x6e, 0x65, 0x72, 0x18,
+	0x05, 0x20, 0x01, 0x28, 0x09, 0x48, 0x01, 0x52, 0x09, 0x70, 0x65, 0x65, 0x72, 0x4f, 0x77, 0x6e,
+	0x65, 0x72, 0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x69, 0x73, 0x64, 0x18, 0x06,
+	0x20, 0x01, 0x28, 0x09, 0x48, 0x01, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x49, 0x73, 0x64, 0x12,
+	0x3d, 0x0a, 0x0d, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x65, 0x76, 0x65, 0x72, 0x79, 0x6f, 0x6e, 0x65,
+	0x18, 0x07, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e,
+	0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x48, 0x01,
+	0x52, 0x0c, 0x70, 0x65, 0x65, 0x72, 0x45, 0x76, 0x65, 0x72, 0x79, 0x6f, 0x6e, 0x65, 0x12, 0x26,
+	0x0a, 0x0e, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e, 0x5f, 0x72, 0x61, 0x6e, 0x67, 0x65,
+	0x18, 0x08, 0x20, 0x01, 0x28, 0x09, 0x48, 0x01, 0x52, 0x0c, 0x70, 0x65, 0x65, 0x72, 0x41, 0x73,
+	0x6e, 0x52, 0x61, 0x6e, 0x67, 0x65, 0x42, 0x09, 0x0a, 0x07, 0x61, 0x63, 0x63, 0x65, 0x70, 0x74,
+	0x5f, 0x42, 0x06, 0x0a, 0x04, 0x70, 0x65, 0x65, 0x72, 0x22, 0xc9, 0x02, 0x0a, 0x06, 0x50, 0x6f,
+	0x6c, 0x69, 0x63, 0x79, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x10, 0x0a, 0x03, 0x61, 0x73, 0x6e, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x03, 0x61, 0x73, 0x6e, 0x12, 0x16, 0x0a, 0x06, 0x61, 0x63,
+	0x63, 0x65, 0x70, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x52, 0x06, 0x61, 0x63, 0x63, 0x65,
+	0x70, 0x74, 0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e, 0x18, 0x04,
+	0x20, 0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x41, 0x73, 0x6e, 0x12,
+	0x1f, 0x0a, 0x0a, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x6f, 0x77, 0x6e, 0x65, 0x72, 0x18, 0x05, 0x20,
+	0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x09, 0x70, 0x65, 0x65, 0x72, 0x4f, 0x77, 0x6e, 0x65, 0x72,
+	0x12, 0x1b, 0x0a, 0x08, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x69, 0x73, 0x64, 0x18, 0x06, 0x20, 0x01,
+	0x28, 0x09, 0x48, 0x00, 0x52, 0x07, 0x70, 0x65, 0x65, 0x72, 0x49, 0x73, 0x64, 0x12, 0x26, 0x0a,
+	0x0e, 0x70, 0x65, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e, 0x5f, 0x72, 0x61, 0x6e, 0x67, 0x65, 0x18,
+	0x07, 0x20, 0x01, 0x28, 0x09, 0x48, 0x00, 0x52, 0x0c, 0x70, 0x65, 0x65, 0x72, 0x41, 0x73, 0x6e,
+	0x52, 0x61, 0x6e, 0x67, 0x65, 0x12, 0x39, 0x0a, 0x0a, 0x76, 0x61, 0x6c, 0x69, 0x64, 0x5f, 0x66,
+	0x72, 0x6f, 0x6d, 0x18, 0x08, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x67, 0x6f, 0x6f, 0x67,
+	0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x54, 0x69, 0x6d, 0x65,
+	0x73, 0x74, 0x61, 0x6d, 0x70, 0x52, 0x09, 0x76, 0x61, 0x6c, 0x69, 0x64, 0x46, 0x72, 0x6f, 0x6d,
+	0x12, 0x3b, 0x0a, 0x0b, 0x76, 0x61, 0x6c, 0x69, 0x64, 0x5f, 0x75, 0x6e, 0x74, 0x69, 0x6c, 0x18,
+	0x09, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70,
+	0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d,
+	0x70, 0x52, 0x0a, 0x76, 0x61, 0x6c, 0x69, 0x64, 0x55, 0x6e, 0x74, 0x69, 0x6c, 0x42, 0x06, 0x0a,
+	0x04, 0x70, 0x65, 0x65, 0x72, 0x22, 0x83, 0x01, 0x0a, 0x12, 0x53, 0x65, 0x74, 0x50, 0x6f, 0x6c,
+	0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x2d, 0x0a, 0x08,
+	0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x11,
+	0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63,
+	0x79, 0x52, 0x08, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x12, 0x12, 0x0a, 0x04, 0x76,
+	0x6c, 0x61, 0x6e, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12,
+	0x2a, 0x0a, 0x11, 0x63, 0x6f, 0x6e, 0x74, 0x69, 0x6e, 0x75, 0x65, 0x5f, 0x6f, 0x6e, 0x5f, 0x65,
+	0x72, 0x72, 0x6f, 0x72, 0x18, 0x03, 0x20, 0x01, 0x28, 0x08, 0x52, 0x0f, 0x63, 0x6f, 0x6e, 0x74,
+	0x69, 0x6e, 0x75, 0x65, 0x4f, 0x6e, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x22, 0x6d, 0x0a, 0x13, 0x53,
+	0x65, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
+	0x73, 0x65, 0x12, 0x3e, 0x0a, 0x11, 0x72, 0x65, 0x6a, 0x65, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x70,
+	0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x11, 0x2e,
+	0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79,
+	0x52, 0x10, 0x72, 0x65, 0x6a, 0x65, 0x63, 0x74, 0x65, 0x64, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69,
+	0x65, 0x73, 0x12, 0x16, 0x0a, 0x06, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x73, 0x18, 0x02, 0x20, 0x03,
+	0x28, 0x09, 0x52, 0x06, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x73, 0x22, 0x86, 0x01, 0x0a, 0x15, 0x55,
+	0x70, 0x6c, 0x6f, 0x61, 0x64, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x2d, 0x0a, 0x08, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73,
+	0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61,
+	0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x08, 0x70, 0x6f, 0x6c, 0x69, 0x63,
+	0x69, 0x65, 0x73, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x2a, 0x0a, 0x11, 0x63, 0x6f, 0x6e, 0x74, 0x69,
+	0x6e, 0x75, 0x65, 0x5f, 0x6f, 0x6e, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x08, 0x52, 0x0f, 0x63, 0x6f, 0x6e, 0x74, 0x69, 0x6e, 0x75, 0x65, 0x4f, 0x6e, 0x45, 0x72,
+	0x72, 0x6f, 0x72, 0x22, 0x6a, 0x0a, 0x16, 0x55, 0x70, 0x6c, 0x6f, 0x61, 0x64, 0x50, 0x6f, 0x6c,
+	0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x3a, 0x0a,
+	0x0f, 0x72, 0x65, 0x6a, 0x65, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x79,
+	0x18, 0x01, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61,
+	0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x0e, 0x72, 0x65, 0x6a, 0x65, 0x63,
+	0x74, 0x65, 0x64, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x12, 0x14, 0x0a, 0x05, 0x65, 0x72, 0x72,
+	0x6f, 0x72, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x05, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x22,
+	0x45, 0x0a, 0x16, 0x43, 0x6f, 0x6d, 0x70, 0x61, 0x63, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69,
+	0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61,
+	0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x17, 0x0a,
+	0x07, 0x64, 0x72, 0x79, 0x5f, 0x72, 0x75, 0x6e, 0x18, 0x02, 0x20, 0x01, 0x28, 0x08, 0x52, 0x06,
+	0x64, 0x72, 0x79, 0x52, 0x75, 0x6e, 0x22, 0xa4, 0x01, 0x0a, 0x17, 0x43, 0x6f, 0x6d, 0x70, 0x61,
+	0x63, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
+	0x73, 0x65, 0x12, 0x2d, 0x0a, 0x08, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x18, 0x01,
+	0x20, 0x03, 0x28, 0x0b, 0x32, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69,
+	0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x52, 0x08, 0x70, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65,
+	0x73, 0x12, 0x2d, 0x0a, 0x12, 0x65, 0x76, 0x61, 0x6c, 0x75, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73,
+	0x5f, 0x62, 0x65, 0x66, 0x6f, 0x72, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x11, 0x65,
+	0x76, 0x61, 0x6c, 0x75, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x42, 0x65, 0x66, 0x6f, 0x72, 0x65,
+	0x12, 0x2b, 0x0a, 0x11, 0x65, 0x76, 0x61, 0x6c, 0x75, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x5f,
+	0x61, 0x66, 0x74, 0x65, 0x72, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x10, 0x65, 0x76, 0x61,
+	0x6c, 0x75, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x41, 0x66, 0x74, 0x65, 0x72, 0x22, 0x6b, 0x0a,
+	0x1b, 0x50, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x4f, 0x70, 0x70, 0x6f, 0x72, 0x74, 0x75, 0x6e,
+	0x69, 0x74, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x12, 0x0a, 0x04,
+	0x76, 0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e,
+	0x12, 0x1b, 0x0a, 0x09, 0x61, 0x66, 0x74, 0x65, 0x72, 0x5f, 0x61, 0x73, 0x6e, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x08, 0x61, 0x66, 0x74, 0x65, 0x72, 0x41, 0x73, 0x6e, 0x12, 0x1b, 0x0a,
+	0x09, 0x70, 0x61, 0x67, 0x65, 0x5f, 0x73, 0x69, 0x7a, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0d,
+	0x52, 0x08, 0x70, 0x61, 0x67, 0x65, 0x53, 0x69, 0x7a, 0x65, 0x22, 0x62, 0x0a, 0x12, 0x50, 0x65,
+	0x65, 0x72, 0x69, 0x6e, 0x67, 0x4f, 0x70, 0x70, 0x6f, 0x72, 0x74, 0x75, 0x6e, 0x69, 0x74, 0x79,
+	0x12, 0x10, 0x0a, 0x03, 0x61, 0x73, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x03, 0x61,
+	0x73, 0x6e, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09,
+	0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x6f, 0x77, 0x6e, 0x65, 0x72, 0x18,
+	0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x05, 0x6f, 0x77, 0x6e, 0x65, 0x72, 0x12, 0x10, 0x0a, 0x03,
+	0x69, 0x73, 0x64, 0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x52, 0x03, 0x69, 0x73, 0x64, 0x22, 0x2d,
+	0x0a, 0x17, 0x52, 0x65, 0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x74,
+	0x75, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61,
+	0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x22, 0xc5, 0x02,
+	0x0a, 0x10, 0x52, 0x65, 0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x74,
+	0x75, 0x73, 0x12, 0x1e, 0x0a, 0x0a, 0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 0x6f, 0x75, 0x6e, 0x64,
+	0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x0a, 0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 0x6f, 0x75,
+	0x6e, 0x64, 0x12, 0x33, 0x0a, 0x04, 0x6a, 0x6f, 0x62, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b,
+	0x32, 0x1f, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x52, 0x65, 0x73,
+	0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x74, 0x75, 0x73, 0x2e, 0x4a, 0x6f,
+	0x62, 0x52, 0x04, 0x6a, 0x6f, 0x62, 0x73, 0x12, 0x21, 0x0a, 0x0c, 0x71, 0x75, 0x65, 0x75, 0x65,
+	0x5f, 0x6c, 0x65, 0x6e, 0x67, 0x74, 0x68, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0d, 0x52, 0x0b, 0x71,
+	0x75, 0x65, 0x75, 0x65, 0x4c, 0x65, 0x6e, 0x67, 0x74, 0x68, 0x12, 0x1f, 0x0a, 0x0b, 0x66, 0x61,
+	0x69, 0x6c, 0x65, 0x64, 0x5f, 0x6a, 0x6f, 0x62, 0x73, 0x18, 0x04, 0x20, 0x01, 0x28, 0x04, 0x52,
+	0x0a, 0x66, 0x61, 0x69, 0x6c, 0x65, 0x64, 0x4a, 0x6f, 0x62, 0x73, 0x12, 0x1d, 0x0a, 0x0a, 0x6c,
+	0x61, 0x73, 0x74, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x05, 0x20, 0x01, 0x28, 0x09, 0x52,
+	0x09, 0x6c, 0x61, 0x73, 0x74, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x1a, 0x79, 0x0a, 0x03, 0x4a, 0x6f,
+	0x62, 0x12, 0x12, 0x0a, 0x04, 0x76, 0x6c, 0x61, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
+	0x04, 0x76, 0x6c, 0x61, 0x6e, 0x12, 0x3b, 0x0a, 0x05, 0x73, 0x74, 0x61, 0x74, 0x65, 0x18, 0x02,
+	0x20, 0x01, 0x28, 0x0e, 0x32, 0x25, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69,
+	0x2e, 0x52, 0x65, 0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x74, 0x75,
+	0x73, 0x2e, 0x4a, 0x6f, 0x62, 0x2e, 0x53, 0x74, 0x61, 0x74, 0x65, 0x52, 0x05, 0x73, 0x74, 0x61,
+	0x74, 0x65, 0x22, 0x21, 0x0a, 0x05, 0x53, 0x74, 0x61, 0x74, 0x65, 0x12, 0x0b, 0x0a, 0x07, 0x50,
+	0x45, 0x4e, 0x44, 0x49, 0x4e, 0x47, 0x10, 0x00, 0x12, 0x0b, 0x0a, 0x07, 0x52, 0x55, 0x4e, 0x4e,
+	0x49, 0x4e, 0x47, 0x10, 0x01, 0x32, 0xa8, 0x06, 0x0a, 0x07, 0x50, 0x65, 0x65, 0x72, 0x69, 0x6e,
+	0x67, 0x12, 0x58, 0x0a, 0x0d, 0x53, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x43, 0x68, 0x61, 0x6e, 0x6e,
+	0x65, 0x6c, 0x12, 0x1f, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x53,
+	0x74, 0x72, 0x65, 0x61, 0x6d, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x1a, 0x20, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e,
+	0x53, 0x74, 0x72, 0x65, 0x61, 0x6d, 0x4d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x28, 0x01, 0x30, 0x01, 0x12, 0x3e, 0x0a, 0x0c, 0x53,
+	0x65, 0x74, 0x50, 0x6f, 0x72, 0x74, 0x52, 0x61, 0x6e, 0x67, 0x65, 0x12, 0x14, 0x2e, 0x63, 0x6f,
+	0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x72, 0x74, 0x52, 0x61, 0x6e, 0x67,
+	0x65, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f,
+	0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x22, 0x00, 0x12, 0x43, 0x0a, 0x0c, 0x4c,
+	0x69, 0x73, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x12, 0x1c, 0x2e, 0x63, 0x6f,
+	0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x4c, 0x69, 0x73, 0x74, 0x50, 0x6f, 0x6c, 0x69,
+	0x63, 0x79, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72,
+	0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x22, 0x00, 0x30, 0x01,
+	0x12, 0x36, 0x0a, 0x0c, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79,
+	0x12, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c,
+	0x69, 0x63, 0x79, 0x1a, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e,
+	0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x22, 0x00, 0x12, 0x3c, 0x0a, 0x0d, 0x44, 0x65, 0x73, 0x74,
+	0x72, 0x6f, 0x79, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x12, 0x11, 0x2e, 0x63, 0x6f, 0x6f, 0x72,
+	0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x79, 0x1a, 0x16, 0x2e, 0x67,
+	0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45,
+	0x6d, 0x70, 0x74, 0x79, 0x22, 0x00, 0x12, 0x4e, 0x0a, 0x0b, 0x53, 0x65, 0x74, 0x50, 0x6f, 0x6c,
+	0x69, 0x63, 0x69, 0x65, 0x73, 0x12, 0x1d, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70,
+	0x69, 0x2e, 0x53, 0x65, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x1a, 0x1e, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69,
+	0x2e, 0x53, 0x65, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70,
+	0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x12, 0x5b, 0x0a, 0x0e, 0x55, 0x70, 0x6c, 0x6f, 0x61, 0x64,
+	0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x12, 0x20, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64,
+	0x2e, 0x61, 0x70, 0x69, 0x2e, 0x55, 0x70, 0x6c, 0x6f, 0x61, 0x64, 0x50, 0x6f, 0x6c, 0x69, 0x63,
+	0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x21, 0x2e, 0x63, 0x6f, 0x6f,
+	0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x55, 0x70, 0x6c, 0x6f, 0x61, 0x64, 0x50, 0x6f, 0x6c,
+	0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x28,
+	0x01, 0x30, 0x01, 0x12, 0x5a, 0x0a, 0x0f, 0x43, 0x6f, 0x6d, 0x70, 0x61, 0x63, 0x74, 0x50, 0x6f,
+	0x6c, 0x69, 0x63, 0x69, 0x65, 0x73, 0x12, 0x21, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61,
+	0x70, 0x69, 0x2e, 0x43, 0x6f, 0x6d, 0x70, 0x61, 0x63, 0x74, 0x50, 0x6f, 0x6c, 0x69, 0x63, 0x69,
+	0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x22, 0x2e, 0x63, 0x6f, 0x6f, 0x72,
+	0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x43, 0x6f, 0x6d, 0x70, 0x61, 0x63, 0x74, 0x50, 0x6f, 0x6c,
+	0x69, 0x63, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x22, 0x00, 0x12,
+	0x65, 0x0a, 0x18, 0x4c, 0x69, 0x73, 0x74, 0x50, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x4f, 0x70,
+	0x70, 0x6f, 0x72, 0x74, 0x75, 0x6e, 0x69, 0x74, 0x69, 0x65, 0x73, 0x12, 0x26, 0x2e, 0x63, 0x6f,
+	0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x50, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x4f,
+	0x70, 0x70, 0x6f, 0x72, 0x74, 0x75, 0x6e, 0x69, 0x74, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x1a, 0x1d, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e,
+	0x50, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x4f, 0x70, 0x70, 0x6f, 0x72, 0x74, 0x75, 0x6e, 0x69,
+	0x74, 0x79, 0x22, 0x00, 0x30, 0x01, 0x12, 0x58, 0x0a, 0x13, 0x47, 0x65, 0x74, 0x52, 0x65, 0x73,
+	0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x74, 0x75, 0x73, 0x12, 0x22, 0x2e,
+	0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x52, 0x65, 0x73, 0x6f, 0x6c, 0x75,
+	0x74, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x74, 0x75, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x1a, 0x1b, 0x2e, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x2e, 0x61, 0x70, 0x69, 0x2e, 0x52, 0x65,
+	0x73, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x74, 0x61, 0x74, 0x75, 0x73, 0x22, 0x00,
+	0x42, 0x38, 0x5a, 0x36, 0x67, 0x69, 0x74, 0x68, 0x75, 0x62, 0x2e, 0x63, 0x6f, 0x6d, 0x2f, 0x6e,
+	0x65, 0x74, 0x73, 0x79, 0x73, 0x2d, 0x6c, 0x61, 0x62, 0x2f, 0x73, 0x63, 0x69, 0x6f, 0x6e, 0x2d,
+	0x70, 0x65, 0x65, 0x72, 0x69, 0x6e, 0x67, 0x2d, 0x63, 0x6f, 0x6f, 0x72, 0x64, 0x69, 0x6e, 0x61,
+	0x74, 0x6f, 0x72, 0x2f, 0x67, 0x6f, 0x2f, 0x61, 0x70, 0x69, 0x62, 0x06, 0x70, 0x72, 0x6f, 0x74,
+	0x6f, 0x33,
+}
+
+var (
+	file_api_peering_proto_rawDescOnce sync.Once
+	file_api_peering_proto_rawDescData = file_api_peering_proto_rawDesc
+)
+
+func file_api_peering_proto_rawDescGZIP() []byte {
+	file_api_peering_proto_rawDescOnce.Do(func() {
+		file_api_peering_proto_rawDescData = protoimpl.X.CompressGZIP(file_api_peering_proto_rawDescData)
+	})
+	return file_api_peering_proto_rawDescData
+}
+
+var file_api_peering_proto_enumTypes = make([]protoimpl.EnumInfo, 5)
+var file_api_peering_proto_msgTypes = make([]protoimpl.MessageInfo, 20)
+var file_api_peering_proto_goTypes = []interface{}{
+	(ArbitrationUpdate_Status)(0),       // 0: coord.api.ArbitrationUpdate.Status
+	(LinkUpdate_Type)(0),                // 1: coord.api.LinkUpdate.Type
+	(LinkUpdate_LinkType)(0),            // 2: coord.api.LinkUpdate.LinkType
+	(AsyncError_Code)(0),                // 3: coord.api.AsyncError.Code
+	(ResolutionStatus_Job_State)(0),     // 4: coord.api.ResolutionStatus.Job.State
+	(*StreamMessageRequest)(nil),        // 5: coord.api.StreamMessageRequest
+	(*StreamMessageResponse)(nil),       // 6: coord.api.StreamMessageResponse
+	(*ArbitrationUpdate)(nil),           // 7: coord.api.ArbitrationUpdate
+	(*LinkUpdate)(nil),                  // 8: coord.api.LinkUpdate
+	(*AsyncError)(nil),                  // 9: coord.api.AsyncError
+	(*UnderlayAddress)(nil),             // 10: coord.api.UnderlayAddress
+	(*PortRange)(nil),                   // 11: coord.api.PortRange
+	(*ListPolicyRequest)(nil),           // 12: coord.api.ListPolicyRequest
+	(*Policy)(nil),                      // 13: coord.api.Policy
+	(*SetPoliciesRequest)(nil),          // 14: coord.api.SetPoliciesRequest
+	(*SetPoliciesResponse)(nil),         // 15: coord.api.SetPoliciesResponse
+	(*UploadPoliciesRequest)(nil),       // 16: coord.api.UploadPoliciesRequest
+	(*UploadPoliciesResponse)(nil),      // 17: coord.api.UploadPoliciesResponse
+	(*CompactPoliciesRequest)(nil),      // 18: coord.api.CompactPoliciesRequest
+	(*CompactPoliciesResponse)(nil),     // 19: coord.api.CompactPoliciesResponse
+	(*PeeringOpportunitiesRequest)(nil), // 20: coord.api.PeeringOpportunitiesRequest
+	(*PeeringOpportunity)(nil),          // 21: coord.api.PeeringOpportunity
+	(*ResolutionStatusRequest)(nil),     // 22: coord.api.ResolutionStatusRequest
+	(*ResolutionStatus)(nil),            // 23: coord.api.ResolutionStatus
+	(*ResolutionStatus_Job)(nil),        // 24: coord.api.ResolutionStatus.Job
+	(*emptypb.Empty)(nil),               // 25: google.protobuf.Empty
+	(*timestamppb.Timestamp)(nil),       // 26: google.protobuf.Timestamp
+}
+var file_api_peering_proto_depIdxs = []int32{
+	7,  // 0: coord.api.StreamMessageRequest.arbitration:type_name -> coord.api.ArbitrationUpdate
+	7,  // 1: coord.api.StreamMessageResponse.arbitration:type_name -> coord.api.ArbitrationUpdate
+	8,  // 2: coord.api.StreamMessageResponse.link_update:type_name -> coord.api.LinkUpdate
+	9,  // 3: coord.api.StreamMessageResponse.error:type_name -> coord.api.AsyncError
+	0,  // 4: coord.api.ArbitrationUpdate.status:type_name -> coord.api.ArbitrationUpdate.Status
+	1,  // 5: coord.api.LinkUpdate.type:type_name -> coord.api.LinkUpdate.Type
+	2,  // 6: coord.api.LinkUpdate.link_type:type_name -> coord.api.LinkUpdate.LinkType
+	10, // 7: coord.api.LinkUpdate.local:type_name -> coord.api.UnderlayAddress
+	10, // 8: coord.api.LinkUpdate.remote:type_name -> coord.api.UnderlayAddress
+	3,  // 9: coord.api.AsyncError.code:type_name -> coord.api.AsyncError.Code
+	25, // 10: coord.api.ListPolicyRequest.peer_everyone:type_name -> google.protobuf.Empty
+	26, // 11: coord.api.Policy.valid_from:type_name -> google.protobuf.Timestamp
+	26, // 12: coord.api.Policy.valid_until:type_name -> google.protobuf.Timestamp
+	13, // 13: coord.api.SetPoliciesRequest.policies:type_name -> coord.api.Policy
+	13, // 14: coord.api.SetPoliciesResponse.rejected_policies:type_name -> coord.api.Policy
+	13, // 15: coord.api.UploadPoliciesRequest.policies:type_name -> coord.api.Policy
+	13, // 16: coord.api.UploadPoliciesResponse.rejected_policy:type_name -> coord.api.Policy
+	13, // 17: coord.api.CompactPoliciesResponse.policies:type_name -> coord.api.Policy
+	24, // 18: coord.api.ResolutionStatus.jobs:type_name -> coord.api.ResolutionStatus.Job
+	4,  // 19: coord.api.ResolutionStatus.Job.state:type_name -> coord.api.ResolutionStatus.Job.State
+	5,  // 20: coord.api.Peering.StreamChannel:input_type -> coord.api.StreamMessageRequest
+	11, // 21: coord.api.Peering.SetPortRange:input_type -> coord.api.PortRange
+	12, // 22: coord.api.Peering.ListPolicies:input_type -> coord.api.ListPolicyRequest
+	13, // 23: coord.api.Peering.CreatePolicy:input_type -> coord.api.Policy
+	13, // 24: coord.api.Peering.DestroyPolicy:input_type -> coord.api.Policy
+	14, // 25: coord.api.Peering.SetPolicies:input_type -> coord.api.SetPoliciesRequest
+	16, // 26: coord.api.Peering.UploadPolicies:input_type -> coord.api.UploadPoliciesRequest
+	18, // 27: coord.api.Peering.CompactPolicies:input_type -> coord.api.CompactPoliciesRequest
+	20, // 28: coord.api.Peering.ListPeeringOpportunities:input_type -> coord.api.PeeringOpportunitiesRequest
+	22, // 29: coord.api.Peering.GetResolutionStatus:input_type -> coord.api.ResolutionStatusRequest
+	6,  // 30: coord.api.Peering.StreamChannel:output_type -> coord.api.StreamMessageResponse
+	25, // 31: coord.api.Peering.SetPortRange:output_type -> google.protobuf.Empty
+	13, // 32: coord.api.Peering.ListPolicies:output_type -> coord.api.Policy
+	13, // 33: coord.api.Peering.CreatePolicy:output_type -> coord.api.Policy
+	25, // 34: coord.api.Peering.DestroyPolicy:output_type -> google.protobuf.Empty
+	15, // 35: coord.api.Peering.SetPolicies:output_type -> coord.api.SetPoliciesResponse
+	17, // 36: coord.api.Peering.UploadPolicies:output_type -> coord.api.UploadPoliciesResponse
+	19, // 37: coord.api.Peering.CompactPolicies:output_type -> coord.api.CompactPoliciesResponse
+	21, // 38: coord.api.Peering.ListPeeringOpportunities:output_type -> coord.api.PeeringOpportunity
+	23, // 39: coord.api.Peering.GetResolutionStatus:output_type -> coord.api.ResolutionStatus
+	30, // [30:40] is the sub-list for method output_type
+	20, // [20:30] is the sub-list for method input_type
+	20, // [20:20] is the sub-list for extension type_name
+	20, // [20:20] is the sub-list for extension extendee
+	0,  // [0:20] is the sub-list for field type_name
+}
+
+func init() { file_api_peering_proto_init() }
+func file_api_peering_proto_init() {
+	if File_api_peering_proto != nil {
+		return
+	}
+	if !protoimpl.UnsafeEnabled {
+		file_api_peering_proto_msgTypes[0].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*StreamMessageRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[1].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*StreamMessageResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[2].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*ArbitrationUpdate); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[3].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*LinkUpdate); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
 			default:
 				return nil
 			}
@@ -1507,6 +2315,114 @@ func file_api_peering_proto_init() {
 				return nil
 			}
 		}
+		file_api_peering_proto_msgTypes[11].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*UploadPoliciesRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[12].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*UploadPoliciesResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[13].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CompactPoliciesRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[14].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*CompactPoliciesResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[15].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*PeeringOpportunitiesRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[16].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*PeeringOpportunity); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[17].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*ResolutionStatusRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[18].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*ResolutionStatus); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_peering_proto_msgTypes[19].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*ResolutionStatus_Job); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
 	}
 	file_api_peering_proto_msgTypes[0].OneofWrappers = []interface{}{
 		(*StreamMessageRequest_Arbitration)(nil),
@@ -1525,19 +2441,21 @@ func file_api_peering_proto_init() {
 		(*ListPolicyRequest_PeerOwner)(nil),
 		(*ListPolicyRequest_PeerIsd)(nil),
 		(*ListPolicyRequest_PeerEveryone)(nil),
+		(*ListPolicyRequest_PeerAsnRange)(nil),
 	}
 	file_api_peering_proto_msgTypes[8].OneofWrappers = []interface{}{
 		(*Policy_PeerAsn)(nil),
 		(*Policy_PeerOwner)(nil),
 		(*Policy_PeerIsd)(nil),
+		(*Policy_PeerAsnRange)(nil),
 	}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: file_api_peering_proto_rawDesc,
-			NumEnums:      4,
-			NumMessages:   11,
+			NumEnums:      5,
+			NumMessages:   20,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -4,10 +4,10 @@ package api
 
 import (
 	context "context"
-	empty "github.com/golang/protobuf/ptypes/empty"
 	grpc "google.golang.org/grpc"
 	codes "google.golang.org/grpc/codes"
 	status "google.golang.org/grpc/status"
+	emptypb "google.golang.org/protobuf/types/known/emptypb"
 )
 
 // This is a compile-time assertion to ensure that this generated file
@@ -22,18 +22,34 @@ type PeeringClient interface {
 	// Persistent channel for push-notifications from the coordinator to the clients.
 	StreamChannel(ctx context.Context, opts ...grpc.CallOption) (Peering_StreamChannelClient, error)
 	// Set the UDP port range used for SCION overlay connections.
-	SetPortRange(ctx context.Context, in *PortRange, opts ...grpc.CallOption) (*empty.Empty, error)
+	SetPortRange(ctx context.Context, in *PortRange, opts ...grpc.CallOption) (*emptypb.Empty, error)
 	// List policies of the AS making the request.
 	ListPolicies(ctx context.Context, in *ListPolicyRequest, opts ...grpc.CallOption) (Peering_ListPoliciesClient, error)
 	// Create a new policy.
 	// Returns the newly create policy.
 	CreatePolicy(ctx context.Context, in *Policy, opts ...grpc.CallOption) (*Policy, error)
 	// Delete a policy.
-	DestroyPolicy(ctx context.Context, in *Policy, opts ...grpc.CallOption) (*empty.Empty, error)
+	DestroyPolicy(ctx context.Context, in *Policy, opts ...grpc.CallOption) (*emptypb.Empty, error)
 	// Replace existing polices in one or all VLANs.
 	// If some of the given policies fail validation, the RPC has no effect unless
 	// continue_on_error is true.
 	SetPolicies(ctx context.Context, in *SetPoliciesRequest, opts ...grpc.CallOption) (*SetPoliciesResponse, error)
+	// Replace existing policies in one or all VLANs like SetPolicies, but upload the policies in a
+	// stream of chunks. Rejected policies are streamed back while the upload is in progress. All
+	// changes are committed at the end of the upload. If some of the policies are rejected, the RPC
+	// fails with status INVALID_ARGUMENT and has no effect unless continue_on_error is true.
+	UploadPolicies(ctx context.Context, opts ...grpc.CallOption) (Peering_UploadPoliciesClient, error)
+	// Delete the policies of the AS making the request which have no effect on the peers it
+	// accepts, e.g., AS policies deciding the same as the owner or ISD policy matching the peer.
+	// All redundant policies are deleted in a single transaction.
+	CompactPolicies(ctx context.Context, in *CompactPoliciesRequest, opts ...grpc.CallOption) (*CompactPoliciesResponse, error)
+	// List the ASes in a VLAN which accept the AS making the request as peer, but are not accepted
+	// by it in return. The ASes are streamed in the order of their ASNs.
+	ListPeeringOpportunities(ctx context.Context, in *PeeringOpportunitiesRequest, opts ...grpc.CallOption) (Peering_ListPeeringOpportunitiesClient, error)
+	// Report the progress of resolving policy changes of the AS making the request into links.
+	// Only meaningful if the coordinator resolves policy changes in the background. Otherwise, all
+	// changes have been resolved by the time the policy RPCs return.
+	GetResolutionStatus(ctx context.Context, in *ResolutionStatusRequest, opts ...grpc.CallOption) (*ResolutionStatus, error)
 }
 
 type peeringClient struct {
@@ -75,8 +91,8 @@ func (x *peeringStreamChannelClient) Recv() (*StreamMessageResponse, error) {
 	return m, nil
 }
 
-func (c *peeringClient) SetPortRange(ctx context.Context, in *PortRange, opts ...grpc.CallOption) (*empty.Empty, error) {
-	out := new(empty.Empty)
+func (c *peeringClient) SetPortRange(ctx context.Context, in *PortRange, opts ...grpc.CallOption) (*emptypb.Empty, error) {
+	out := new(emptypb.Empty)
 	err := c.cc.Invoke(ctx, "/coord.api.Peering/SetPortRange", in, out, opts...)
 	if err != nil {
 		return nil, err
@@ -125,8 +141,8 @@ func (c *peeringClient) CreatePolicy(ctx context.Context, in *Policy, opts ...gr
 	return out, nil
 }
 
-func (c *peeringClient) DestroyPolicy(ctx context.Context, in *Policy, opts ...grpc.CallOption) (*empty.Empty, error) {
-	out := new(empty.Empty)
+func (c *peeringClient) DestroyPolicy(ctx context.Context, in *Policy, opts ...grpc.CallOption) (*emptypb.Empty, error) {
+	out := new(emptypb.Empty)
 	err := c.cc.Invoke(ctx, "/coord.api.Peering/DestroyPolicy", in, out, opts...)
 	if err != nil {
 		return nil, err
@@ -143,6 +159,87 @@ func (c *peeringClient) SetPolicies(ctx context.Context, in *SetPoliciesRequest,
 	return out, nil
 }
 
+func (c *peeringClient) UploadPolicies(ctx context.Context, opts ...grpc.CallOption) (Peering_UploadPoliciesClient, error) {
+	stream, err := c.cc.NewStream(ctx, &Peering_ServiceDesc.Streams[2], "/coord.api.Peering/UploadPolicies", opts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &peeringUploadPoliciesClient{stream}
+	return x, nil
+}
+
+type Peering_UploadPoliciesClient interface {
+	Send(*UploadPoliciesRequest) error
+	Recv() (*UploadPoliciesResponse, error)
+	grpc.ClientStream
+}
+
+type peeringUploadPoliciesClient struct {
+	grpc.ClientStream
+}
+
+func (x *peeringUploadPoliciesClient) Send(m *UploadPoliciesRequest) error {
+	return x.ClientStream.SendMsg(m)
+}
+
+func (x *peeringUploadPoliciesClient) Recv() (*UploadPoliciesResponse, error) {
+	m := new(UploadPoliciesResponse)
+	if err := x.ClientStream.RecvMsg(m); err != nil {
+		return nil, err
+	}
+	return m, nil
+}
+
+func (c *peeringClient) CompactPolicies(ctx context.Context, in *CompactPoliciesRequest, opts ...grpc.CallOption) (*CompactPoliciesResponse, error) {
+	out := new(CompactPoliciesResponse)
+	err := c.cc.Invoke(ctx, "/coord.api.Peering/CompactPolicies", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *peeringClient) ListPeeringOpportunities(ctx context.Context, in *PeeringOpportunitiesRequest, opts ...grpc.CallOption) (Peering_ListPeeringOpportunitiesClient, error) {
+	stream, err := c.cc.NewStream(ctx, &Peering_ServiceDesc.Streams[3], "/coord.api.Peering/ListPeeringOpportunities", opts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &peeringListPeeringOpportunitiesClient{stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+type Peering_ListPeeringOpportunitiesClient interface {
+	Recv() (*PeeringOpportunity, error)
+	grpc.ClientStream
+}
+
+type peeringListPeeringOpportunitiesClient struct {
+	grpc.ClientStream
+}
+
+func (x *peeringListPeeringOpportunitiesClient) Recv() (*PeeringOpportunity, error) {
+	m := new(PeeringOpportunity)
+	if err := x.ClientStream.RecvMsg(m); err != nil {
+		return nil, err
+	}
+	return m, nil
+}
+
+func (c *peeringClient) GetResolutionStatus(ctx context.Context, in *ResolutionStatusRequest, opts ...grpc.CallOption) (*ResolutionStatus, error) {
+	out := new(ResolutionStatus)
+	err := c.cc.Invoke(ctx, "/coord.api.Peering/GetResolutionStatus", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // PeeringServer is the server API for Peering service.
 // All implementations must embed UnimplementedPeeringServer
 // for forward compatibility
@@ -150,18 +247,34 @@ type PeeringServer interface {
 	// Persistent channel for push-notifications from the coordinator to the clients.
 	StreamChannel(Peering_StreamChannelServer) error
 	// Set the UDP port range used for SCION overlay connections.
-	SetPortRange(context.Context, *PortRange) (*empty.Empty, error)
+	SetPortRange(context.Context, *PortRange) (*emptypb.Empty, error)
 	// List policies of the AS making the request.
 	ListPolicies(*ListPolicyRequest, Peering_ListPoliciesServer) error
 	// Create a new policy.
 	// Returns the newly create policy.
 	CreatePolicy(context.Context, *Policy) (*Policy, error)
 	// Delete a policy.
-	DestroyPolicy(context.Context, *Policy) (*empty.Empty, error)
+	DestroyPolicy(context.Context, *Policy) (*emptypb.Empty, error)
 	// Replace existing polices in one or all VLANs.
 	// If some of the given policies fail validation, the RPC has no effect unless
 	// continue_on_error is true.
 	SetPolicies(context.Context, *SetPoliciesRequest) (*SetPoliciesResponse, error)
+	// Replace existing policies in one or all VLANs like SetPolicies, but upload the policies in a
+	// stream of chunks. Rejected policies are streamed back while the upload is in progress. All
+	// changes are committed at the end of the upload. If some of the policies are rejected, the RPC
+	// fails with status INVALID_ARGUMENT and has no effect unless continue_on_error is true.
+	UploadPolicies(Peering_UploadPoliciesServer) error
+	// Delete the policies of the AS making the request which have no effect on the peers it
+	// accepts, e.g., AS policies deciding the same as the owner or ISD policy matching the peer.
+	// All redundant policies are deleted in a single transaction.
+	CompactPolicies(context.Context, *CompactPoliciesRequest) (*CompactPoliciesResponse, error)
+	// List the ASes in a VLAN which accept the AS making the request as peer, but are not accepted
+	// by it in return. The ASes are streamed in the order of their ASNs.
+	ListPeeringOpportunities(*PeeringOpportunitiesRequest, Peering_ListPeeringOpportunitiesServer) error
+	// Report the progress of resolving policy changes of the AS making the request into links.
+	// Only meaningful if the coordinator resolves policy changes in the background. Otherwise, all
+	// changes have been resolved by the time the policy RPCs return.
+	GetResolutionStatus(context.Context, *ResolutionStatusRequest) (*ResolutionStatus, error)
 	mustEmbedUnimplementedPeeringServer()
 }
 
@@ -172,7 +285,7 @@ type UnimplementedPeeringServer struct {
 func (UnimplementedPeeringServer) StreamChannel(Peering_StreamChannelServer) error {
 	return status.Errorf(codes.Unimplemented, "method StreamChannel not implemented")
 }
-func (UnimplementedPeeringServer) SetPortRange(context.Context, *PortRange) (*empty.Empty, error) {
+func (UnimplementedPeeringServer) SetPortRange(context.Context, *PortRange) (*emptypb.Empty, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method SetPortRange not implemented")
 }
 func (UnimplementedPeeringServer) ListPolicies(*ListPolicyRequest, Peering_ListPoliciesServer) error {
@@ -181,12 +294,24 @@ func (UnimplementedPeeringServer) ListPolicies(*ListPolicyRequest, Peering_ListP
 func (UnimplementedPeeringServer) CreatePolicy(context.Context, *Policy) (*Policy, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method CreatePolicy not implemented")
 }
-func (UnimplementedPeeringServer) DestroyPolicy(context.Context, *Policy) (*empty.Empty, error) {
+func (UnimplementedPeeringServer) DestroyPolicy(context.Context, *Policy) (*emptypb.Empty, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method DestroyPolicy not implemented")
 }
 func (UnimplementedPeeringServer) SetPolicies(context.Context, *SetPoliciesRequest) (*SetPoliciesResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method SetPolicies not implemented")
 }
+func (UnimplementedPeeringServer) UploadPolicies(Peering_UploadPoliciesServer) error {
+	return status.Errorf(codes.Unimplemented, "method UploadPolicies not implemented")
+}
+func (UnimplementedPeeringServer) CompactPolicies(context.Context, *CompactPoliciesRequest) (*CompactPoliciesResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method CompactPolicies not implemented")
+}
+func (UnimplementedPeeringServer) ListPeeringOpportunities(*PeeringOpportunitiesRequest, Peering_ListPeeringOpportunitiesServer) error {
+	return status.Errorf(codes.Unimplemented, "method ListPeeringOpportunities not implemented")
+}
+func (UnimplementedPeeringServer) GetResolutionStatus(context.Context, *ResolutionStatusRequest) (*ResolutionStatus, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetResolutionStatus not implemented")
+}
 func (UnimplementedPeeringServer) mustEmbedUnimplementedPeeringServer() {}
 
 // UnsafePeeringServer may be embedded to opt out of forward compatibility for this service.
@@ -319,6 +444,89 @@ func _Peering_SetPolicies_Handler(srv interface{}, ctx context.Context, dec func
 	return interceptor(ctx, in, info, handler)
 }
 
+func _Peering_UploadPolicies_Handler(srv interface{}, stream grpc.ServerStream) error {
+	return srv.(PeeringServer).UploadPolicies(&peeringUploadPoliciesServer{stream})
+}
+
+type Peering_UploadPoliciesServer interface {
+	Send(*UploadPoliciesResponse) error
+	Recv() (*UploadPoliciesRequest, error)
+	grpc.ServerStream
+}
+
+type peeringUploadPoliciesServer struct {
+	grpc.ServerStream
+}
+
+func (x *peeringUploadPoliciesServer) Send(m *UploadPoliciesResponse) error {
+	return x.ServerStream.SendMsg(m)
+}
+
+func (x *peeringUploadPoliciesServer) Recv() (*UploadPoliciesRequest, error) {
+	m := new(UploadPoliciesRequest)
+	if err := x.ServerStream.RecvMsg(m); err != nil {
+		return nil, err
+	}
+	return m, nil
+}
+
+func _Peering_CompactPolicies_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(CompactPoliciesRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(PeeringServer).CompactPolicies(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/coord.api.Peering/CompactPolicies",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(PeeringServer).CompactPolicies(ctx, req.(*CompactPoliciesRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _Peering_ListPeeringOpportunities_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(PeeringOpportunitiesRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(PeeringServer).ListPeeringOpportunities(m, &peeringListPeeringOpportunitiesServer{stream})
+}
+
+type Peering_ListPeeringOpportunitiesServer interface {
+	Send(*PeeringOpportunity) error
+	grpc.ServerStream
+}
+
+type peeringListPeeringOpportunitiesServer struct {
+	grpc.ServerStream
+}
+
+func (x *peeringListPeeringOpportunitiesServer) Send(m *PeeringOpportunity) error {
+	return x.ServerStream.SendMsg(m)
+}
+
+func _Peering_GetResolutionStatus_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ResolutionStatusRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(PeeringServer).GetResolutionStatus(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/coord.api.Peering/GetResolutionStatus",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(PeeringServer).GetResolutionStatus(ctx, req.(*ResolutionStatusRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // Peering_ServiceDesc is the grpc.ServiceDesc for Peering service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -342,6 +550,14 @@ var Peering_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "SetPolicies",
 			Handler:    _Peering_SetPolicies_Handler,
 		},
+		{
+			MethodName: "CompactPolicies",
+			Handler:    _Peering_CompactPolicies_Handler,
+		},
+		{
+			MethodName: "GetResolutionStatus",
+			Handler:    _Peering_GetResolutionStatus_Handler,
+		},
 	},
 	Streams: []grpc.StreamDesc{
 		{
@@ -355,6 +571,17 @@ var Peering_ServiceDesc = grpc.ServiceDesc{
 			Handler:       _Peering_ListPolicies_Handler,
 			ServerStreams: true,
 		},
+		{
+			StreamName:    "UploadPolicies",
+			Handler:       _Peering_UploadPolicies_Handler,
+			ServerStreams: true,
+			ClientStreams: true,
+		},
+		{
+			StreamName:    "ListPeeringOpportunities",
+			Handler:       _Peering_ListPeeringOpportunities_Handler,
+			ServerStreams: true,
+		},
 	},
 	Metadata: "api/peering.proto",
 }
@@ -7,6 +7,7 @@ import (
 	"github.com/netsys-lab/scion-peering-coordinator/go/api"
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/metadata"
+	"google.golang.org/protobuf/types/known/timestamppb"
 )
 
 type Connection struct {
@@ -164,11 +165,19 @@ func (conn Connection) setPolicies() {
 		}
 		if policy.PeerAsn != "" {
 			api_policy.Peer = &api.Policy_PeerAsn{PeerAsn: policy.PeerAsn}
+		} else if policy.PeerAsnRange != "" {
+			api_policy.Peer = &api.Policy_PeerAsnRange{PeerAsnRange: policy.PeerAsnRange}
 		} else if policy.PeerOwner != "" {
 			api_policy.Peer = &api.Policy_PeerOwner{PeerOwner: policy.PeerOwner}
 		} else if policy.PeerIsd != "" {
 			api_policy.Peer = &api.Policy_PeerIsd{PeerIsd: policy.PeerIsd}
 		}
+		if policy.ValidFrom != nil {
+			api_policy.ValidFrom = timestamppb.New(*policy.ValidFrom)
+		}
+		if policy.ValidUntil != nil {
+			api_policy.ValidUntil = timestamppb.New(*policy.ValidUntil)
+		}
 		policies = append(policies, &api_policy)
 	}
 	response, err := client.SetPolicies(ctx, &api.SetPoliciesRequest{Policies: policies})
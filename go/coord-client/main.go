@@ -41,11 +41,14 @@ type ClientConfig struct {
 }
 
 type Policy struct {
-	Vlan      string `yaml:"vlan"`
-	Accept    bool   `yaml:"accept"`
-	PeerAsn   string `yaml:"peerAsn,omitempty"`
-	PeerOwner string `yaml:"peerOwner,omitempty"`
-	PeerIsd   string `yaml:"peerIsd,omitempty"`
+	Vlan         string     `yaml:"vlan"`
+	Accept       bool       `yaml:"accept"`
+	PeerAsn      string     `yaml:"peerAsn,omitempty"`
+	PeerAsnRange string     `yaml:"peerAsnRange,omitempty"`
+	PeerOwner    string     `yaml:"peerOwner,omitempty"`
+	PeerIsd      string     `yaml:"peerIsd,omitempty"`
+	ValidFrom    *time.Time `yaml:"validFrom,omitempty"`
+	ValidUntil   *time.Time `yaml:"validUntil,omitempty"`
 }
 
 func main() {